@@ -18,7 +18,7 @@
 # ------------------------------------------------------------------------------
 """This module contains the implementation of an autonomous economic agent (AEA)."""
 import datetime
-from asyncio import AbstractEventLoop
+from asyncio import AbstractEventLoop, Future
 from logging import Logger
 from multiprocessing.pool import AsyncResult
 from typing import (
@@ -78,7 +78,9 @@ class AEA(Agent):
         loop: Optional[AbstractEventLoop] = None,
         period: float = 0.05,
         execution_timeout: float = 0,
+        execution_timeout_mode: Optional[str] = None,
         max_reactions: int = 20,
+        batch_size: int = 0,
         error_handler_class: Optional[Type[AbstractErrorHandler]] = None,
         error_handler_config: Optional[Dict[str, Any]] = None,
         decision_maker_handler_class: Optional[Type[DecisionMakerHandler]] = None,
@@ -95,6 +97,7 @@ class AEA(Agent):
         search_service_address: str = DEFAULT_SEARCH_SERVICE_ADDRESS,
         storage_uri: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
+        task_manager_options: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -107,7 +110,9 @@ class AEA(Agent):
         :param loop: the event loop to run the connections.
         :param period: period to call agent's act
         :param execution_timeout: amount of time to limit single act/handle to execute.
+        :param execution_timeout_mode: mechanism applying the execution timeout (thread_guard, deadline_guard).
         :param max_reactions: the processing rate of envelopes per tick (i.e. single loop).
+        :param batch_size: the number of envelopes the multiplexer dispatches at once, 0 to disable batching.
         :param error_handler_class: the class implementing the error handler
         :param error_handler_config: the configuration of the error handler
         :param decision_maker_handler_class: the class implementing the decision maker handler to be used.
@@ -124,6 +129,7 @@ class AEA(Agent):
         :param search_service_address: the address of the search service used.
         :param storage_uri: optional uri to set generic storage
         :param task_manager_mode: task manager mode (threaded) to run tasks with.
+        :param task_manager_options: keyword arguments of the task manager, e.g. results_ttl.
         :param kwargs: keyword arguments to be attached in the agent context namespace.
         """
 
@@ -145,6 +151,7 @@ class AEA(Agent):
             storage_uri=storage_uri,
             logger=cast(Logger, aea_logger),
             task_manager_mode=task_manager_mode,
+            task_manager_options=task_manager_options,
         )
 
         default_routing = default_routing if default_routing is not None else {}
@@ -173,6 +180,7 @@ class AEA(Agent):
                 default_routing=default_routing,
                 default_connection=default_connection,
                 protocols=self.resources.get_all_protocols(),
+                batch_size=batch_size,
             ),
         )
 
@@ -226,6 +234,7 @@ class AEA(Agent):
             **kwargs,
         )
         self._execution_timeout = execution_timeout
+        self._execution_timeout_mode = execution_timeout_mode
         self._filter = Filter(
             self.resources, self.runtime.decision_maker.message_out_queue
         )
@@ -481,3 +490,21 @@ class AEA(Agent):
         :return: the task id to get the the result.
         """
         return self.runtime.task_manager.enqueue_task(func, args, kwargs)
+
+    def enqueue_task_async(
+        self,
+        func: Callable,
+        args: Sequence = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Future:
+        """
+        Enqueue a task with the task manager and get a future of its result.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwargs: the keyword arguments to be passed to the function.
+        :return: the future of the result of the task, bound to the agent loop.
+        """
+        return self.runtime.task_manager.enqueue_task_async(
+            func, args, kwargs, loop=self.runtime.loop
+        )
@@ -311,7 +311,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
     DEFAULT_CURRENCY_DENOMINATIONS = DEFAULT_CURRENCY_DENOMINATIONS
     DEFAULT_AGENT_ACT_PERIOD = 0.05  # seconds
     DEFAULT_EXECUTION_TIMEOUT = 0
+    DEFAULT_EXECUTION_TIMEOUT_MODE = "thread_guard"
     DEFAULT_MAX_REACTIONS = 20
+    DEFAULT_BATCH_SIZE = 0
     DEFAULT_SKILL_EXCEPTION_POLICY = ExceptionPolicyEnum.propagate
     DEFAULT_CONNECTION_EXCEPTION_POLICY = ExceptionPolicyEnum.propagate
     DEFAULT_LOOP_MODE = "async"
@@ -389,7 +391,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._context_namespace: Dict[str, Any] = {}
         self._period: Optional[float] = None
         self._execution_timeout: Optional[float] = None
+        self._execution_timeout_mode: Optional[str] = None
         self._max_reactions: Optional[int] = None
+        self._batch_size: Optional[int] = None
         self._decision_maker_handler_class: Optional[Type[DecisionMakerHandler]] = None
         self._decision_maker_handler_dotted_path: Optional[str] = None
         self._decision_maker_handler_file_path: Optional[str] = None
@@ -404,6 +408,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._loop_mode: Optional[str] = None
         self._runtime_mode: Optional[str] = None
         self._task_manager_mode: Optional[str] = None
+        self._task_manager_options: Dict[str, Any] = {}
         self._search_service_address: Optional[str] = None
         self._storage_uri: Optional[str] = None
         self._data_dir: Optional[str] = None
@@ -443,6 +448,19 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._execution_timeout = execution_timeout
         return self
 
+    def set_execution_timeout_mode(
+        self, execution_timeout_mode: Optional[str]
+    ) -> "AEABuilder":
+        """
+        Set the mechanism applying the agent execution timeout.
+
+        :param execution_timeout_mode: the execution timeout mode (thread_guard, deadline_guard)
+
+        :return: self
+        """
+        self._execution_timeout_mode = execution_timeout_mode
+        return self
+
     def set_max_reactions(self, max_reactions: Optional[int]) -> "AEABuilder":
         """
         Set agent max reaction in one react.
@@ -454,6 +472,17 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._max_reactions = max_reactions
         return self
 
+    def set_batch_size(self, batch_size: Optional[int]) -> "AEABuilder":
+        """
+        Set the number of envelopes the multiplexer dispatches at once, 0 to disable batching.
+
+        :param batch_size: int
+
+        :return: self
+        """
+        self._batch_size = batch_size
+        return self
+
     def set_decision_maker_handler_details(
         self,
         decision_maker_handler_dotted_path: str,
@@ -674,6 +703,20 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self._task_manager_mode = task_manager_mode
         return self
 
+    def set_task_manager_options(
+        self, task_manager_options: Optional[Dict[str, Any]]
+    ) -> "AEABuilder":
+        """
+        Set the task manager options.
+
+        :param task_manager_options: the task manager options (drop_results_on_retrieval, results_ttl, max_results)
+        :return: self
+        """
+        self._task_manager_options = (
+            task_manager_options if task_manager_options is not None else {}
+        )
+        return self
+
     def set_storage_uri(
         self, storage_uri: Optional[str]
     ) -> "AEABuilder":  # pragma: nocover
@@ -1363,7 +1406,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             loop=None,
             period=self._get_agent_act_period(),
             execution_timeout=self._get_execution_timeout(),
+            execution_timeout_mode=self._get_execution_timeout_mode(),
             max_reactions=self._get_max_reactions(),
+            batch_size=self._get_batch_size(),
             error_handler_class=self._load_error_handler_class(),
             error_handler_config=self._get_error_handler_config(),
             decision_maker_handler_class=self._load_decision_maker_handler_class(),
@@ -1376,6 +1421,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             loop_mode=self._get_loop_mode(),
             runtime_mode=self._get_runtime_mode(),
             task_manager_mode=self._get_task_manager_mode(),
+            task_manager_options=self._get_task_manager_options(),
             connection_ids=connection_ids,
             search_service_address=self._get_search_service_address(),
             storage_uri=self._get_storage_uri(),
@@ -1425,6 +1471,18 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             else self.DEFAULT_EXECUTION_TIMEOUT
         )
 
+    def _get_execution_timeout_mode(self) -> str:
+        """
+        Return execution timeout mode.
+
+        :return: the execution timeout mode if set else default value.
+        """
+        return (
+            self._execution_timeout_mode
+            if self._execution_timeout_mode is not None
+            else self.DEFAULT_EXECUTION_TIMEOUT_MODE
+        )
+
     def _get_max_reactions(self) -> int:
         """
         Return agent max_reaction.
@@ -1437,6 +1495,18 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             else self.DEFAULT_MAX_REACTIONS
         )
 
+    def _get_batch_size(self) -> int:
+        """
+        Return the multiplexer batch size.
+
+        :return: batch size if set else default value.
+        """
+        return (
+            self._batch_size
+            if self._batch_size is not None
+            else self.DEFAULT_BATCH_SIZE
+        )
+
     def _get_error_handler_class(self,) -> Optional[Type]:
         """
         Return the error handler class.
@@ -1557,6 +1627,14 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
             else self.DEFAULT_TASKMANAGER_MODE
         )
 
+    def _get_task_manager_options(self) -> Dict[str, Any]:
+        """
+        Return the task manager options.
+
+        :return: the task manager options
+        """
+        return deepcopy(self._task_manager_options)
+
     def _get_storage_uri(self) -> Optional[str]:
         """
         Return the storage uri.
@@ -1723,7 +1801,9 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
 
         self.set_period(agent_configuration.period)
         self.set_execution_timeout(agent_configuration.execution_timeout)
+        self.set_execution_timeout_mode(agent_configuration.execution_timeout_mode)
         self.set_max_reactions(agent_configuration.max_reactions)
+        self.set_batch_size(agent_configuration.batch_size)
 
         if agent_configuration.decision_maker_handler != {}:
             dotted_path = agent_configuration.decision_maker_handler["dotted_path"]
@@ -1747,6 +1827,7 @@ class AEABuilder(WithLogger):  # pylint: disable=too-many-public-methods
         self.set_loop_mode(agent_configuration.loop_mode)
         self.set_runtime_mode(agent_configuration.runtime_mode)
         self.set_task_manager_mode(agent_configuration.task_manager_mode)
+        self.set_task_manager_options(agent_configuration.task_manager_options)
         self.set_storage_uri(agent_configuration.storage_uri)
         self.set_data_dir(agent_configuration.data_dir)
         self.set_logging_config(agent_configuration.logging_config)
@@ -61,6 +61,7 @@ class Agent(AbstractAgent, WithLogger):
         storage_uri: Optional[str] = None,
         logger: Logger = _default_logger,
         task_manager_mode: Optional[str] = None,
+        task_manager_options: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Instantiate the agent.
@@ -72,9 +73,9 @@ class Agent(AbstractAgent, WithLogger):
         :param loop_mode: loop_mode to choose agent run loop.
         :param runtime_mode: runtime mode to up agent.
         :param storage_uri: optional uri to set generic storage
-        :param task_manager_mode: task manager mode.
         :param logger: the logger.
         :param task_manager_mode: mode of the task manager.
+        :param task_manager_options: keyword arguments of the task manager.
         """
         WithLogger.__init__(self, logger=logger)
         self._identity = identity
@@ -82,6 +83,7 @@ class Agent(AbstractAgent, WithLogger):
         self._tick = 0
         self._runtime_mode = runtime_mode or self.DEFAULT_RUNTIME
         self._task_manager_mode = task_manager_mode
+        self._task_manager_options = task_manager_options
         self._storage_uri = storage_uri
 
         runtime_class = self._get_runtime_class()
@@ -107,6 +109,7 @@ class Agent(AbstractAgent, WithLogger):
             loop=loop,
             multiplexer_options=multiplexer_options,
             task_manager_mode=self._task_manager_mode,
+            task_manager_options=self._task_manager_options,
         )
         self._inbox = InBox(self.runtime.multiplexer)
         self._outbox = OutBox(self.runtime.multiplexer)
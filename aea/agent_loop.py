@@ -27,13 +27,28 @@ from asyncio.tasks import Task
 from contextlib import suppress
 from enum import Enum
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from aea.abstract_agent import AbstractAgent
 from aea.configurations.constants import LAUNCH_SUCCEED_MESSAGE
 from aea.exceptions import AEAException
 from aea.helpers.async_utils import AsyncState, PeriodicCaller, Runnable
-from aea.helpers.exec_timeout import ExecTimeoutThreadGuard, TimeoutException
+from aea.helpers.exec_timeout import (
+    ExecTimeoutDeadlineGuard,
+    ExecTimeoutThreadGuard,
+    TimeoutException,
+)
 from aea.helpers.logging import WithLogger, get_logger
 from aea.mail.base import Envelope, EnvelopeContext
 from aea.protocols.base import Message
@@ -54,9 +69,20 @@ class AgentLoopStates(Enum):
     error = "error"
 
 
+ExecTimeoutGuardType = Union[
+    Type[ExecTimeoutThreadGuard], Type[ExecTimeoutDeadlineGuard]
+]
+
+
 class BaseAgentLoop(Runnable, WithLogger, ABC):
     """Base abstract  agent loop class."""
 
+    EXECUTION_TIMEOUT_GUARDS: Dict[str, ExecTimeoutGuardType] = {
+        "thread_guard": ExecTimeoutThreadGuard,
+        "deadline_guard": ExecTimeoutDeadlineGuard,
+    }
+    DEFAULT_EXECUTION_TIMEOUT_MODE = "thread_guard"
+
     def __init__(
         self,
         agent: AbstractAgent,
@@ -77,6 +103,7 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
         self._tasks: List[asyncio.Task] = []
         self._state: AsyncState = AsyncState(AgentLoopStates.initial)
         self._exceptions: List[Exception] = []
+        self._exec_timeout_guard: ExecTimeoutGuardType = ExecTimeoutThreadGuard
 
     @property
     def agent(self) -> AbstractAgent:  # pragma: nocover
@@ -110,15 +137,32 @@ class BaseAgentLoop(Runnable, WithLogger, ABC):
         """Set event loop and all event loop related objects."""
         self._loop: AbstractEventLoop = loop
 
-    def _setup(self) -> None:  # pylint: disable=no-self-use
+    def _get_exec_timeout_guard(self) -> ExecTimeoutGuardType:
+        """
+        Get the execution timeout guard class selected by the agent execution timeout mode.
+
+        :return: the execution timeout guard class
+        """
+        mode = (
+            getattr(self.agent, "_execution_timeout_mode", None)
+            or self.DEFAULT_EXECUTION_TIMEOUT_MODE
+        )
+        if mode not in self.EXECUTION_TIMEOUT_GUARDS:
+            raise ValueError(
+                f"Execution timeout mode `{mode}` is not supported. valid are: `{list(self.EXECUTION_TIMEOUT_GUARDS.keys())}`"
+            )
+        return self.EXECUTION_TIMEOUT_GUARDS[mode]
+
+    def _setup(self) -> None:
         """Set up agent loop before started."""
+        self._exec_timeout_guard = self._get_exec_timeout_guard()
         # start and stop methods are classmethods cause one instance shared across multiple threads
-        ExecTimeoutThreadGuard.start()
+        self._exec_timeout_guard.start()
 
-    def _teardown(self) -> None:  # pylint: disable=no-self-use
+    def _teardown(self) -> None:
         """Tear down loop on stop."""
         # start and stop methods are classmethods cause one instance shared across multiple threads
-        ExecTimeoutThreadGuard.stop()
+        self._exec_timeout_guard.stop()
 
     async def run(self) -> None:
         """Run agent loop."""
@@ -279,7 +323,7 @@ class AsyncAgentLoop(BaseAgentLoop):
         execution_timeout = getattr(self.agent, "_execution_timeout", 0)
 
         try:
-            with ExecTimeoutThreadGuard(execution_timeout):
+            with self._exec_timeout_guard(execution_timeout):
                 return fn(*(args or []), **(kwargs or {}))
         except TimeoutException:  # pragma: nocover
             self.logger.warning(
@@ -179,7 +179,9 @@ def fingerprint_package(
         raise ValueError("Package not found at path {}".format(package_dir))
 
     fingerprints_dict = _compute_fingerprint(
-        package_dir, ignore_patterns=config.fingerprint_ignore_patterns
+        package_dir,
+        ignore_patterns=config.fingerprint_ignore_patterns,
+        persist_cache=True,
     )  # type: Dict[str, str]
 
     # Load item specification yaml file and add fingerprints
@@ -198,6 +200,7 @@ def fingerprint_agent(click_context: click.Context) -> None:
         Path(ctx.cwd),
         ignore_patterns=ctx.agent_config.fingerprint_ignore_patterns,
         ignore_directories=DEFAULT_IGNORE_DIRS_AGENT_FINGERPRINT,
+        persist_cache=True,
     )  # type: Dict[str, str]
     ctx.agent_config.fingerprint = fingerprints_dict
     ctx.dump_agent_config()
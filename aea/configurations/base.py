@@ -81,7 +81,7 @@ from aea.helpers.base import (
     load_module,
     recursive_update,
 )
-from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import get_default_file_hash_cache, hash_files
 
 
 # for tests
@@ -1149,10 +1149,13 @@ class AgentConfig(PackageConfiguration):
             "loop_mode",
             "runtime_mode",
             "task_manager_mode",
+            "task_manager_options",
             "execution_timeout",
+            "execution_timeout_mode",
             "timeout",
             "period",
             "max_reactions",
+            "batch_size",
             "skill_exception_policy",
             "connection_exception_policy",
             "default_connection",
@@ -1188,7 +1191,9 @@ class AgentConfig(PackageConfiguration):
         "contracts",
         "period",
         "execution_timeout",
+        "execution_timeout_mode",
         "max_reactions",
+        "batch_size",
         "skill_exception_policy",
         "connection_exception_policy",
         "error_handler",
@@ -1216,7 +1221,9 @@ class AgentConfig(PackageConfiguration):
         logging_config: Optional[Dict] = None,
         period: Optional[float] = None,
         execution_timeout: Optional[float] = None,
+        execution_timeout_mode: Optional[str] = None,
         max_reactions: Optional[int] = None,
+        batch_size: Optional[int] = None,
         error_handler: Optional[Dict] = None,
         decision_maker_handler: Optional[Dict] = None,
         skill_exception_policy: Optional[str] = None,
@@ -1229,6 +1236,7 @@ class AgentConfig(PackageConfiguration):
         loop_mode: Optional[str] = None,
         runtime_mode: Optional[str] = None,
         task_manager_mode: Optional[str] = None,
+        task_manager_options: Optional[Dict[str, Any]] = None,
         storage_uri: Optional[str] = None,
         data_dir: Optional[str] = None,
         component_configurations: Optional[Dict[ComponentId, Dict]] = None,
@@ -1274,7 +1282,9 @@ class AgentConfig(PackageConfiguration):
 
         self.period: Optional[float] = period
         self.execution_timeout: Optional[float] = execution_timeout
+        self.execution_timeout_mode: Optional[str] = execution_timeout_mode
         self.max_reactions: Optional[int] = max_reactions
+        self.batch_size: Optional[int] = batch_size
 
         self.skill_exception_policy: Optional[str] = skill_exception_policy
         self.connection_exception_policy: Optional[str] = connection_exception_policy
@@ -1295,6 +1305,9 @@ class AgentConfig(PackageConfiguration):
         self.loop_mode = loop_mode
         self.runtime_mode = runtime_mode
         self.task_manager_mode = task_manager_mode
+        self.task_manager_options = (
+            task_manager_options if task_manager_options is not None else {}
+        )
         self.storage_uri = storage_uri
         self.data_dir = data_dir
         # this attribute will be set through the setter below
@@ -1419,8 +1432,12 @@ class AgentConfig(PackageConfiguration):
             config["period"] = self.period
         if self.execution_timeout is not None:
             config["execution_timeout"] = self.execution_timeout
+        if self.execution_timeout_mode is not None:
+            config["execution_timeout_mode"] = self.execution_timeout_mode
         if self.max_reactions is not None:
             config["max_reactions"] = self.max_reactions
+        if self.batch_size is not None:
+            config["batch_size"] = self.batch_size
         if self.error_handler != {}:
             config["error_handler"] = self.error_handler
         if self.decision_maker_handler != {}:
@@ -1435,6 +1452,8 @@ class AgentConfig(PackageConfiguration):
             config["runtime_mode"] = self.runtime_mode
         if self.task_manager_mode is not None:
             config["task_manager_mode"] = self.task_manager_mode
+        if self.task_manager_options != {}:
+            config["task_manager_options"] = self.task_manager_options
         if self.storage_uri is not None:
             config["storage_uri"] = self.storage_uri
         if self.data_dir is not None:
@@ -1465,7 +1484,9 @@ class AgentConfig(PackageConfiguration):
             logging_config=cast(Dict, obj.get("logging_config", {})),
             period=cast(float, obj.get("period")),
             execution_timeout=cast(float, obj.get("execution_timeout")),
+            execution_timeout_mode=cast(str, obj.get("execution_timeout_mode")),
             max_reactions=cast(int, obj.get("max_reactions")),
+            batch_size=cast(int, obj.get("batch_size")),
             error_handler=cast(Dict, obj.get("error_handler", {})),
             decision_maker_handler=cast(Dict, obj.get("decision_maker_handler", {})),
             skill_exception_policy=cast(str, obj.get("skill_exception_policy")),
@@ -1480,6 +1501,7 @@ class AgentConfig(PackageConfiguration):
             loop_mode=cast(str, obj.get("loop_mode")),
             runtime_mode=cast(str, obj.get("runtime_mode")),
             task_manager_mode=cast(str, obj.get("task_manager_mode")),
+            task_manager_options=cast(Dict, obj.get("task_manager_options", {})),
             storage_uri=cast(str, obj.get("storage_uri")),
             data_dir=cast(str, obj.get("data_dir")),
             component_configurations=None,
@@ -1811,11 +1833,12 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
     ignore_patterns: Optional[Collection[str]] = None,
     is_recursive: bool = True,
     ignore_directories: Optional[Collection[str]] = None,
+    use_cache: bool = True,
+    persist_cache: bool = False,
 ) -> Dict[str, str]:
     ignore_patterns = ignore_patterns if ignore_patterns is not None else []
     ignore_directories = ignore_directories if ignore_directories is not None else []
     ignore_patterns = set(ignore_patterns).union(DEFAULT_FINGERPRINT_IGNORE_PATTERNS)
-    hasher = IPFSHashOnly()
     fingerprints = {}  # type: Dict[str, str]
     # find all valid files of the package
     all_files = [
@@ -1826,8 +1849,15 @@ def _compute_fingerprint(  # pylint: disable=unsubscriptable-object
         and not (x.parts[0] in ignore_directories)
     ]
 
-    for file in all_files:
-        file_hash = hasher.get(str(file))
+    # hash only the files changed since the last fingerprint, in parallel if many
+    file_paths = [str(file) for file in all_files]
+    cache = get_default_file_hash_cache(persist_cache) if use_cache else None
+    if cache is None:
+        file_hashes = hash_files(file_paths)
+    else:
+        file_hashes = cache.get_hashes(file_paths)
+
+    for file, file_hash in zip(all_files, file_hashes):
         key = str(file.relative_to(package_directory))
         enforce(key not in fingerprints, "Key in fingerprints!")  # nosec
         # use '/' as path separator
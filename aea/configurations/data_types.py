@@ -61,6 +61,9 @@ T = TypeVar("T")
 VersionInfoClass = semver.VersionInfo
 PackageVersionLike = Union[str, semver.VersionInfo]
 
+# maximum number of public id strings whose parsing is cached
+PUBLIC_ID_CACHE_SIZE = 4096
+
 
 class JSONSerializable(ABC):
     """Interface for JSON-serializable objects."""
@@ -231,7 +234,7 @@ class PublicId(JSONSerializable):
     True
     """
 
-    __slots__ = ("_author", "_name", "_package_version")
+    __slots__ = ("_author", "_name", "_package_version", "_str", "_hash")
 
     AUTHOR_REGEX = SIMPLE_ID_REGEX
     PACKAGE_NAME_REGEX = SIMPLE_ID_REGEX
@@ -241,6 +244,8 @@ class PublicId(JSONSerializable):
     PUBLIC_ID_URI_REGEX = (
         fr"^({AUTHOR_REGEX})/({PACKAGE_NAME_REGEX})/({VERSION_REGEX})$"
     )
+    _PUBLIC_ID_PATTERN = re.compile(PUBLIC_ID_REGEX)
+    _PUBLIC_ID_URI_PATTERN = re.compile(PUBLIC_ID_URI_REGEX)
 
     ANY_VERSION = "any"
     LATEST_VERSION = "latest"
@@ -259,6 +264,9 @@ class PublicId(JSONSerializable):
             if version is not None
             else PackageVersion(self.LATEST_VERSION)
         )
+        # the public id is immutable, its string and hash are computed once
+        self._str: Optional[str] = None
+        self._hash: Optional[int] = None
 
     @property
     def author(self) -> str:
@@ -300,7 +308,7 @@ class PublicId(JSONSerializable):
         :param public_id_string: the public id in string format.
         :return: bool indicating validity
         """
-        match = re.match(cls.PUBLIC_ID_REGEX, public_id_string)
+        match = cls._PUBLIC_ID_PATTERN.match(public_id_string)
         return match is not None
 
     @classmethod
@@ -308,8 +316,12 @@ class PublicId(JSONSerializable):
         """
         Initialize the public id from the string.
 
+        The public ids parsed are interned: parsing the same string again returns the same object.
+
         >>> str(PublicId.from_str("author/package_name:0.1.0"))
         'author/package_name:0.1.0'
+        >>> PublicId.from_str("author/package_name:0.1.0") is PublicId.from_str("author/package_name:0.1.0")
+        True
 
         A bad formatted input raises value error:
         >>> PublicId.from_str("bad/formatted:input")
@@ -321,15 +333,12 @@ class PublicId(JSONSerializable):
         :return: the public id object.
         :raises ValueError: if the string in input is not well formatted.
         """
-        match = re.match(cls.PUBLIC_ID_REGEX, public_id_string)
-        if match is None:
+        public_id = _parse_public_id(public_id_string)
+        if public_id is None:
             raise ValueError(
                 "Input '{}' is not well formatted.".format(public_id_string)
             )
-        username = match.group(1)
-        package_name = match.group(2)
-        version = match.group(3)[1:] if ":" in public_id_string else None
-        return PublicId(username, package_name, version)
+        return public_id
 
     @classmethod
     def try_from_str(cls, public_id_string: str) -> Optional["PublicId"]:
@@ -339,12 +348,7 @@ class PublicId(JSONSerializable):
         :param public_id_string: the public id in string format.
         :return: the public id object or None
         """
-        result: Optional[PublicId] = None
-        try:
-            result = cls.from_str(public_id_string)
-        except ValueError:
-            pass
-        return result
+        return _parse_public_id(public_id_string)
 
     @classmethod
     def from_uri_path(cls, public_id_uri_path: str) -> "PublicId":
@@ -364,13 +368,12 @@ class PublicId(JSONSerializable):
         :return: the public id object.
         :raises ValueError: if the string in input is not well formatted.
         """
-        if not re.match(cls.PUBLIC_ID_URI_REGEX, public_id_uri_path):
+        match = cls._PUBLIC_ID_URI_PATTERN.match(public_id_uri_path)
+        if match is None:
             raise ValueError(
                 "Input '{}' is not well formatted.".format(public_id_uri_path)
             )
-        username, package_name, version = re.findall(
-            cls.PUBLIC_ID_URI_REGEX, public_id_uri_path
-        )[0][:3]
+        username, package_name, version = match.groups()[:3]
         return PublicId(username, package_name, version)
 
     @property
@@ -396,13 +399,17 @@ class PublicId(JSONSerializable):
 
     def __hash__(self) -> int:
         """Get the hash."""
-        return hash((self.author, self.name, self.version))
+        if self._hash is None:
+            self._hash = hash((self.author, self.name, self.version))
+        return self._hash
 
     def __str__(self) -> str:
         """Get the string representation."""
-        return "{author}/{name}:{version}".format(
-            author=self.author, name=self.name, version=self.version
-        )
+        if self._str is None:
+            self._str = "{author}/{name}:{version}".format(
+                author=self.author, name=self.name, version=self.version
+            )
+        return self._str
 
     def __repr__(self) -> str:
         """Get the representation."""
@@ -410,7 +417,7 @@ class PublicId(JSONSerializable):
 
     def __eq__(self, other: Any) -> bool:
         """Compare with another object."""
-        return (
+        return self is other or (
             isinstance(other, PublicId)
             and self.author == other.author
             and self.name == other.name
@@ -451,6 +458,25 @@ class PublicId(JSONSerializable):
         )
 
 
+@functools.lru_cache(maxsize=PUBLIC_ID_CACHE_SIZE)
+def _parse_public_id(public_id_string: str) -> Optional[PublicId]:
+    """
+    Parse a public id string, caching the public id as it is immutable.
+
+    :param public_id_string: the public id in string format.
+    :return: the public id object, or None if the string is not well formatted.
+    """
+    match = PublicId._PUBLIC_ID_PATTERN.match(  # pylint: disable=protected-access
+        public_id_string
+    )
+    if match is None:
+        return None
+    username = match.group(1)
+    package_name = match.group(2)
+    version = match.group(3)[1:] if ":" in public_id_string else None
+    return PublicId(username, package_name, version)
+
+
 class PackageId:
     """A package identifier."""
 
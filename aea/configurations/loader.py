@@ -17,8 +17,25 @@
 #
 # ------------------------------------------------------------------------------
 """Implementation of the parser for configuration file."""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Generic, List, TextIO, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import yaml
 
@@ -44,6 +61,13 @@ from aea.helpers.yaml_utils import yaml_dump, yaml_dump_all, yaml_load, yaml_loa
 
 
 _STARTING_INDEX_CUSTOM_CONFIGS = 1
+CONFIGURATION_CACHE_SIZE = 1024
+
+# the loaded component configurations, by package type, file path, file content
+# hash and AEA version validation, shared by the agents built in the process.
+_ConfigurationCacheKey = Tuple[PackageType, str, bytes, bool]
+_configuration_cache: "OrderedDict[_ConfigurationCacheKey, PackageConfiguration]" = OrderedDict()
+_configuration_cache_lock = threading.Lock()
 
 _ = make_jsonschema_base_uri  # for tests compatibility
 
@@ -419,11 +443,57 @@ def _load_configuration_object(
     configuration_filepath = directory / configuration_filename
     try:
         with open_file(configuration_filepath) as fp:
-            configuration_object = configuration_loader.load(fp)
+            if package_type == PackageType.AGENT:
+                return configuration_loader.load(fp)
+            content = fp.read()
     except FileNotFoundError:
         raise FileNotFoundError(
             "{} configuration not found: {}".format(
                 package_type.value.capitalize(), configuration_filepath
             )
         )
+
+    key = (
+        package_type,
+        str(configuration_filepath.absolute()),
+        hashlib.sha256(content.encode("utf-8")).digest(),
+        skip_aea_validation,
+    )
+    configuration_object = _get_cached_configuration(key)
+    if configuration_object is None:
+        configuration_object = configuration_loader.load(io.StringIO(content))
+        _cache_configuration(key, configuration_object)
     return configuration_object
+
+
+def _get_cached_configuration(
+    key: _ConfigurationCacheKey,
+) -> Optional[PackageConfiguration]:
+    """
+    Get a copy of a loaded configuration from the cache.
+
+    :param key: the cache key.
+    :return: a copy of the configuration object, or None if not in the cache.
+    """
+    with _configuration_cache_lock:
+        configuration_object = _configuration_cache.get(key)
+        if configuration_object is None:
+            return None
+        _configuration_cache.move_to_end(key)
+    return deepcopy(configuration_object)
+
+
+def _cache_configuration(
+    key: _ConfigurationCacheKey, configuration_object: PackageConfiguration
+) -> None:
+    """
+    Add a copy of a loaded configuration to the cache, dropping the least recently used.
+
+    :param key: the cache key.
+    :param configuration_object: the configuration object.
+    """
+    configuration_copy = deepcopy(configuration_object)
+    with _configuration_cache_lock:
+        _configuration_cache[key] = configuration_copy
+        if len(_configuration_cache) > CONFIGURATION_CACHE_SIZE:
+            _configuration_cache.popitem(last=False)
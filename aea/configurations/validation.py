@@ -17,9 +17,14 @@
 #
 # ------------------------------------------------------------------------------
 """Implementation of the configuration validation."""
+import hashlib
 import inspect
 import json
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple
@@ -39,12 +44,15 @@ from aea.helpers.env_vars import is_env_variable
 from aea.helpers.io import open_file
 
 
+_default_logger = logging.getLogger(__name__)
+
 _CUR_DIR = os.path.dirname(inspect.getfile(inspect.currentframe()))  # type: ignore
 _SCHEMAS_DIR = os.path.join(_CUR_DIR, "schemas")
 
 _PREFIX_BASE_CONFIGURABLE_PARTS = "base"
 _SCHEMAS_CONFIGURABLE_PARTS_DIRNAME = "configurable_parts"
 _POSTFIX_CUSTOM_CONFIG = "-custom_config.json"
+VALIDATED_DOCUMENTS_CACHE_SIZE = 4096
 
 
 def make_jsonschema_base_uri(base_uri_path: Path) -> str:
@@ -122,6 +130,107 @@ EnvVarsFriendlyDraft4Validator = extend(
 )
 
 
+class _CompiledValidator:
+    """
+    A JSON-schema validator, built once per schema and shared in the process.
+
+    It also keeps the digests of the documents it found valid, so that a document
+    already validated is not validated again.
+    """
+
+    def __init__(self, schema_filename: str, env_vars_friendly: bool) -> None:
+        """
+        Build the validator.
+
+        :param schema_filename: the path to the JSON-schema file in 'aea/configurations/schemas'.
+        :param env_vars_friendly: whether or not it is env var friendly.
+        """
+        base_uri = Path(_SCHEMAS_DIR)
+        with open_file(base_uri / schema_filename) as fp:
+            self.schema = json.load(fp)
+        root_path = make_jsonschema_base_uri(base_uri)
+        self.resolver = jsonschema.RefResolver(root_path, self.schema)
+        validator_class = (
+            EnvVarsFriendlyDraft4Validator if env_vars_friendly else OwnDraft4Validator
+        )
+        self.validator = validator_class(self.schema, resolver=self.resolver)
+        # the resolver keeps a stack of scopes while validating
+        self.lock = threading.Lock()
+        self._validated: "OrderedDict[bytes, None]" = OrderedDict()
+
+    def is_validated(self, digest: bytes) -> bool:
+        """
+        Check whether a document was found valid.
+
+        :param digest: the digest of the document.
+        :return: whether the document was found valid
+        """
+        with self.lock:
+            if digest not in self._validated:
+                return False
+            self._validated.move_to_end(digest)
+            return True
+
+    def set_validated(self, digest: bytes) -> None:
+        """
+        Remember a document was found valid.
+
+        :param digest: the digest of the document.
+        """
+        with self.lock:
+            self._validated[digest] = None
+            if len(self._validated) > VALIDATED_DOCUMENTS_CACHE_SIZE:
+                self._validated.popitem(last=False)
+
+
+_compiled_validators: Dict[Tuple[str, bool], _CompiledValidator] = {}
+_compiled_validators_lock = threading.Lock()
+
+
+def _get_compiled_validator(
+    schema_filename: str, env_vars_friendly: bool = False
+) -> _CompiledValidator:
+    """
+    Get the validator of a schema, building it on first use.
+
+    :param schema_filename: the path to the JSON-schema file in 'aea/configurations/schemas'.
+    :param env_vars_friendly: whether or not it is env var friendly.
+    :return: the validator
+    """
+    key = (schema_filename, env_vars_friendly)
+    with _compiled_validators_lock:
+        compiled_validator = _compiled_validators.get(key)
+        if compiled_validator is None:
+            compiled_validator = _CompiledValidator(schema_filename, env_vars_friendly)
+            _compiled_validators[key] = compiled_validator
+        return compiled_validator
+
+
+def _document_digest(instance: Any) -> bytes:
+    """
+    Get the digest of a document loaded from YAML.
+
+    The representation of the values YAML is loaded into is exact and tells
+    types apart, unlike a JSON dump (e.g. for integer and string keys).
+
+    :param instance: the document.
+    :return: the digest
+    """
+    return hashlib.sha256(repr(instance).encode("utf-8")).digest()
+
+
+def _describe_configuration(json_data: Dict) -> str:
+    """
+    Describe a configuration in log messages.
+
+    :param json_data: the JSON data of the configuration.
+    :return: the description
+    """
+    name = json_data.get("name", json_data.get("agent_name"))
+    public_id = json_data.get("public_id", f"{json_data.get('author')}/{name}")
+    return f"{json_data.get('type', AGENT)} {public_id}"
+
+
 class ConfigValidator:
     """Configuration validator implementation."""
 
@@ -129,23 +238,19 @@ class ConfigValidator:
         """
         Initialize the parser for configuration files.
 
+        The validators are built once per schema, and shared in the process.
+
         :param schema_filename: the path to the JSON-schema file in 'aea/configurations/schemas'.
         :param env_vars_friendly: whether or not it is env var friendly.
         """
-        base_uri = Path(_SCHEMAS_DIR)
-        with open_file(base_uri / schema_filename) as fp:
-            self._schema = json.load(fp)
-        root_path = make_jsonschema_base_uri(base_uri)
-        self._resolver = jsonschema.RefResolver(root_path, self._schema)
+        self._compiled_validator = _get_compiled_validator(
+            schema_filename, env_vars_friendly
+        )
+        self._schema = self._compiled_validator.schema
+        self._resolver = self._compiled_validator.resolver
+        self._validator = self._compiled_validator.validator
         self.env_vars_friendly = env_vars_friendly
 
-        if env_vars_friendly:
-            self._validator = EnvVarsFriendlyDraft4Validator(
-                self._schema, resolver=self._resolver
-            )
-        else:
-            self._validator = OwnDraft4Validator(self._schema, resolver=self._resolver)
-
     @staticmethod
     def split_component_id_and_config(
         component_index: int, component_configuration_json: Dict
@@ -212,6 +317,7 @@ class ConfigValidator:
 
         :param json_data: the JSON data.
         """
+        start_time = time.perf_counter()
         if json_data.get("type", AGENT) == AGENT:
             json_data_copy = deepcopy(json_data)
 
@@ -224,15 +330,24 @@ class ConfigValidator:
             self._validate(json_data_copy)
         else:
             self._validate(json_data)
+        if _default_logger.isEnabledFor(logging.DEBUG):
+            _default_logger.debug(
+                f"Validated configuration of {_describe_configuration(json_data)} in {(time.perf_counter() - start_time) * 1000:.3f}ms."
+            )
 
     def _validate(self, instance: Dict) -> None:
-        """Validate an instance using the current validator."""
-        errors: List[jsonschema.ValidationError] = list(
-            self._validator.iter_errors(instance=instance)
-        )
+        """Validate an instance using the current validator, unless already found valid."""
+        digest = _document_digest(instance)
+        if self._compiled_validator.is_validated(digest):
+            return
+        with self._compiled_validator.lock:
+            errors: List[jsonschema.ValidationError] = list(
+                self._validator.iter_errors(instance=instance)
+            )
         if len(errors) > 0:
             error_msg = self._build_message_from_errors(errors)
             raise AEAValidationError(f"{error_msg}")
+        self._compiled_validator.set_validated(digest)
 
     @staticmethod
     def _build_message_from_errors(errors: List[jsonschema.ValidationError]) -> str:
@@ -25,7 +25,17 @@ from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Generator, Optional, Set, TYPE_CHECKING, cast
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
+    cast,
+)
 
 from aea.components.base import Component, load_aea_package
 from aea.configurations.base import ComponentType, ConnectionConfig, PublicId
@@ -228,6 +238,42 @@ class Connection(Component, ABC):
         :return: the received envelope, or None if an error occurred.
         """
 
+    async def send_batch(self, envelopes: Sequence["Envelope"]) -> None:
+        """
+        Send a batch of envelopes.
+
+        The default implementation sends the envelopes one by one, in order.
+        Connections able to write several envelopes at once should override it.
+
+        :param envelopes: the envelopes to send.
+        """
+        for envelope in envelopes:
+            await self.send(envelope)
+
+    async def receive_batch(self, max_size: int) -> List["Envelope"]:
+        """
+        Receive a batch of envelopes.
+
+        Wait for at least one envelope, then return it together with the ones
+        already available, up to max_size. The default implementation
+        returns the result of a single `receive` call.
+
+        :param max_size: the maximum number of envelopes to return.
+        :return: the received envelopes, possibly empty if an error occurred.
+        """
+        envelope = await self.receive()
+        return [envelope] if envelope is not None else []
+
+    @property
+    def supports_send_batch(self) -> bool:
+        """Check whether the connection overrides the default send_batch."""
+        return type(self).send_batch is not Connection.send_batch
+
+    @property
+    def supports_receive_batch(self) -> bool:
+        """Check whether the connection overrides the default receive_batch."""
+        return type(self).receive_batch is not Connection.receive_batch
+
     @classmethod
     def from_dir(
         cls,
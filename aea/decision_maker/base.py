@@ -20,6 +20,7 @@
 
 import hashlib
 import threading
+import time
 from abc import ABC, abstractmethod
 from queue import Queue
 from threading import Thread
@@ -30,6 +31,7 @@ from uuid import uuid4
 from aea.crypto.wallet import Wallet
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.metrics import HistogramChild, decision_maker_latency
 from aea.helpers.transaction.base import Terms
 from aea.identity.base import Identity
 from aea.protocols.base import Message
@@ -309,6 +311,7 @@ class DecisionMaker(WithLogger):
         "_lock",
         "_message_out_queue",
         "_stopped",
+        "_latency_metric",
     )
 
     def __init__(self, decision_maker_handler: DecisionMakerHandler,) -> None:
@@ -327,6 +330,7 @@ class DecisionMaker(WithLogger):
         self._lock = threading.Lock()
         self._message_out_queue = decision_maker_handler.message_out_queue
         self._stopped = True
+        self._latency_metric = None  # type: Optional[HistogramChild]
 
     @property
     def agent_name(self) -> str:
@@ -400,4 +404,10 @@ class DecisionMaker(WithLogger):
 
         :param message: the internal message
         """
-        self.decision_maker_handler.handle(message)
+        start_time = time.perf_counter()
+        try:
+            self.decision_maker_handler.handle(message)
+        finally:
+            if self._latency_metric is None:
+                self._latency_metric = decision_maker_latency.labels(self.agent_name)
+            self._latency_metric.observe(time.perf_counter() - start_time)
@@ -23,12 +23,13 @@ import ctypes
 import logging
 import signal
 import threading
+import time
 from abc import ABC, abstractmethod
 from asyncio import Future
 from asyncio.events import AbstractEventLoop
 from threading import Lock
 from types import TracebackType
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type, cast
 
 
 _default_logger = logging.getLogger(__file__)
@@ -270,3 +271,142 @@ class ExecTimeoutThreadGuard(BaseExecTimeout):
         if self._future_guard_task and not self._future_guard_task.done():
             self._future_guard_task.cancel()
             self._future_guard_task = None
+
+
+class ExecTimeoutDeadlineGuard(BaseExecTimeout):
+    """
+    ExecTimeout context manager implementation using per-thread deadlines and PyThreadState_SetAsyncExc.
+
+    Support threads.
+    Entering and exiting the context manager only sets and removes the deadline of the current thread,
+    a single supervisor thread checks the deadlines every `tick_interval` seconds,
+    so timeouts are applied with a precision of `tick_interval`.
+    Requires supervisor thread start/stop to control execution time control.
+    Possible will be not accurate in case of long c functions used inside code controlled.
+    """
+
+    tick_interval: float = 0.01
+
+    _supervisor_thread: Optional[threading.Thread] = None
+    _stopped_event: Optional[threading.Event] = None
+    _start_count: int = 0
+    _lock: Lock = Lock()
+    _deadlines_lock: Lock = Lock()
+    _deadlines: Dict[int, "ExecTimeoutDeadlineGuard"] = {}
+
+    def __init__(self, timeout: float = 0.0) -> None:
+        """
+        Init ExecTimeoutDeadlineGuard variables.
+
+        :param timeout: number of seconds to execute code before interruption
+        """
+        super().__init__(timeout=timeout)
+
+        self._thread_id: Optional[int] = None
+        self._deadline: float = 0.0
+        self._previous_guard: Optional["ExecTimeoutDeadlineGuard"] = None
+        self._fired = False
+
+    @classmethod
+    def start(cls) -> None:
+        """
+        Start supervisor thread to check deadlines.
+
+        Supervisor starts once but number of start counted.
+        """
+        with cls._lock:
+            cls._start_count += 1
+
+            if cls._supervisor_thread:  # pragma: nocover
+                return
+
+            cls._stopped_event = threading.Event()
+            cls._supervisor_thread = threading.Thread(
+                target=cls._supervisor, daemon=True, name="ExecTimeoutDeadline"
+            )
+            cls._supervisor_thread.start()
+
+    @classmethod
+    def stop(cls, force: bool = False) -> None:
+        """
+        Stop supervisor thread.
+
+        Actual stop performed on force == True or if  number of stops == number of starts
+
+        :param force: force stop regardless number of start.
+        """
+        with cls._lock:
+            if not cls._supervisor_thread:  # pragma: nocover
+                return
+
+            cls._start_count -= 1
+
+            if cls._start_count <= 0 or force:
+                cls._stopped_event.set()  # type: ignore
+                if cls._supervisor_thread.is_alive():
+                    cls._supervisor_thread.join()
+                cls._supervisor_thread = None
+                cls._start_count = 0
+
+    @classmethod
+    def _supervisor(cls) -> None:
+        """Check the deadlines every tick until stopped."""
+        stopped_event = cast(threading.Event, cls._stopped_event)
+        while not stopped_event.wait(cls.tick_interval):
+            cls._check_deadlines(time.monotonic())
+
+    @classmethod
+    def _check_deadlines(cls, now: float) -> None:
+        """
+        Interrupt the threads whose deadline is passed.
+
+        :param now: the current monotonic time
+        """
+        with cls._deadlines_lock:
+            for thread_id, guard in cls._deadlines.items():
+                if guard._deadline <= now and not guard._fired:
+                    guard._fired = True
+                    ExecTimeoutThreadGuard._set_thread_exception(  # pylint: disable=protected-access
+                        thread_id, guard.exception_class  # type: ignore
+                    )
+
+    def _set_timeout_watch(self) -> None:
+        """
+        Start control over execution time.
+
+        Set the deadline of the current thread.
+        ExecTimeoutDeadlineGuard.start is required at least once in project before usage!
+        """
+        if not self._supervisor_thread:
+            _default_logger.warning(
+                "ExecTimeoutDeadlineGuard is used but not started! No timeout wil be applied!"
+            )
+            return
+
+        self._thread_id = threading.get_ident()
+        self._deadline = time.monotonic() + self.timeout
+        with self._deadlines_lock:
+            self._previous_guard = self._deadlines.get(self._thread_id)
+            self._deadlines[self._thread_id] = self
+
+    def _remove_timeout_watch(self) -> None:
+        """
+        Stop control over execution time.
+
+        Restore the deadline of the enclosing guard of the thread, if any.
+        """
+        if self._thread_id is None:
+            return
+
+        with self._deadlines_lock:
+            if self._previous_guard is None:
+                self._deadlines.pop(self._thread_id, None)
+            else:
+                self._deadlines[self._thread_id] = self._previous_guard
+            if self._fired:
+                # the code finished before the exception was raised, drop it
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_long(self._thread_id), None
+                )
+        self._thread_id = None
+        self._previous_guard = None
@@ -20,8 +20,10 @@
 import codecs
 import hashlib
 import io
-import re
-from typing import Generator, Sized, cast
+import itertools
+import locale
+import os
+from typing import BinaryIO, Generator, Iterator, Sized, cast
 
 import base58
 
@@ -46,7 +48,7 @@ def _dos2unix(file_content: bytes) -> bytes:
     :param file_content: the content of the file.
     :return: the same content but with the line terminator
     """
-    return re.sub(b"\r\n", b"\n", file_content, flags=re.M)
+    return file_content.replace(b"\r\n", b"\n")
 
 
 def _is_text(file_path: str) -> bool:
@@ -76,6 +78,81 @@ def chunks(data: Sized, size: int) -> Generator:
         yield data[i : i + size]  # type: ignore
 
 
+def _is_text_streaming(file_path: str, block_size: int) -> bool:
+    """
+    Check if a file can be read as text or not, decoding it block by block.
+
+    :param file_path: the file path.
+    :param block_size: the size of the blocks read.
+    :return: whether the file can be read as text, as with _is_text
+    """
+    # the same decoder as the one of the files opened in text mode
+    decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))()
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    try:
+        with open(file_path, "rb") as file:
+            reader = cast(io.BufferedReader, file)
+            size = reader.readinto(buffer)
+            while size:
+                decoder.decode(view[:size])
+                size = reader.readinto(buffer)
+            decoder.decode(b"", final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _read_blocks(file: BinaryIO, block_size: int, is_text: bool) -> Iterator[bytes]:
+    """
+    Read a file block by block, replacing Windows line endings if it is a text file.
+
+    A carriage return at the end of a block is kept for the next block, so that
+    line endings split across blocks are replaced as well.
+
+    :param file: the file, opened in binary mode.
+    :param block_size: the size of the blocks read.
+    :param is_text: whether the file is a text file.
+    :yield: the blocks of the file content
+    """
+    carry = b""
+    block = file.read(block_size)
+    while block:
+        if is_text:
+            if carry:
+                block = carry + block
+            carry = b"\r" if block.endswith(b"\r") else b""
+            block = _dos2unix(block[:-1] if carry else block)
+        yield block
+        block = file.read(block_size)
+    if carry:
+        yield carry
+
+
+def _rechunk(blocks: Iterator[bytes], size: int) -> Iterator[bytes]:
+    """
+    Split blocks of data into chunks of a fixed size, the last one possibly shorter.
+
+    :param blocks: the blocks of data.
+    :param size: the size of the chunks.
+    :yield: the chunks, at least one even if there is no data
+    """
+    buffer = bytearray()
+    is_empty = True
+    for block in blocks:
+        view = memoryview(block)
+        while view:
+            taken = size - len(buffer)
+            buffer += view[:taken]
+            view = view[taken:]
+            if len(buffer) == size:
+                is_empty = False
+                yield bytes(buffer)
+                buffer.clear()
+    if buffer or is_empty:
+        yield bytes(buffer)
+
+
 class IPFSHashOnly:
     """A helper class which allows construction of an IPFS hash without interacting with an IPFS daemon."""
 
@@ -86,14 +163,43 @@ class IPFSHashOnly:
         """
         Get the IPFS hash for a single file.
 
+        Files bigger than a chunk are hashed in streaming mode.
+
         :param file_path: the file path
         :return: the ipfs hash
         """
+        if os.path.getsize(file_path) > self.DEFAULT_CHUNK_SIZE:
+            return self.get_streaming(file_path)
         file_b = _read(file_path)
         file_pb = self._pb_serialize_file(file_b)
         ipfs_hash = self._generate_multihash(file_pb)
         return ipfs_hash
 
+    @classmethod
+    def get_streaming(cls, file_path: str) -> str:
+        """
+        Get the IPFS hash for a single file, reading it chunk by chunk.
+
+        The hash is the same as the one of 'get', but only a few chunks of the file
+        are kept in memory at a time.
+
+        :param file_path: the file path
+        :return: the ipfs hash
+        """
+        is_text = _is_text_streaming(file_path, cls.DEFAULT_CHUNK_SIZE)
+        with open(file_path, "rb") as file:
+            blocks = _read_blocks(file, cls.DEFAULT_CHUNK_SIZE, is_text)
+            file_chunks = _rechunk(blocks, cls.DEFAULT_CHUNK_SIZE)
+            first_chunk = next(file_chunks)
+            second_chunk = next(file_chunks, None)
+            if second_chunk is None:
+                file_pb = cls._pb_serialize_data(first_chunk)
+            else:
+                file_pb = cls._pb_serialize_chunks(
+                    itertools.chain((first_chunk, second_chunk), file_chunks)
+                )
+        return cls._generate_multihash(file_pb)
+
     @classmethod
     def _make_unixfs_pb2(cls, data: bytes) -> bytes:
         if len(data) > cls.DEFAULT_CHUNK_SIZE:  # pragma: nocover
@@ -121,22 +227,34 @@ class IPFSHashOnly:
         :return: a bytes string representing a file in protobuf serialization
         """
         if len(data) > cls.DEFAULT_CHUNK_SIZE:
-            outer_node = PBNode()  # type: ignore
-            data_pb = unixfs_pb2.Data()  # type: ignore
-            data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
-            data_pb.filesize = len(data)
-            for chunk in chunks(data, cls.DEFAULT_CHUNK_SIZE):
-                link = merkledag_pb2.PBLink()
-                block = cls._pb_serialize_data(chunk)
-                link.Hash = cls._generate_multihash_bytes(block)
-                link.Tsize = len(block)
-                link.Name = ""
-                outer_node.Links.append(link)  # type: ignore # pylint: disable=no-member
-                data_pb.blocksizes.append(len(chunk))  # type: ignore # pylint: disable=no-member
-            outer_node.Data = data_pb.SerializeToString(deterministic=True)
-            return cls._serialize(outer_node)
+            return cls._pb_serialize_chunks(chunks(data, cls.DEFAULT_CHUNK_SIZE))
         return cls._pb_serialize_data(data)
 
+    @classmethod
+    def _pb_serialize_chunks(cls, file_chunks: Iterator[bytes]) -> bytes:
+        """
+        Serialize the chunks of a file bigger than a chunk, linking them one by one.
+
+        :param file_chunks: the chunks of the file
+        :return: a bytes string representing a file in protobuf serialization
+        """
+        outer_node = PBNode()  # type: ignore
+        data_pb = unixfs_pb2.Data()  # type: ignore
+        data_pb.Type = unixfs_pb2.Data.File  # type: ignore # pylint: disable=no-member
+        filesize = 0
+        for chunk in file_chunks:
+            link = merkledag_pb2.PBLink()
+            block = cls._pb_serialize_data(chunk)
+            link.Hash = cls._generate_multihash_bytes(block)
+            link.Tsize = len(block)
+            link.Name = ""
+            outer_node.Links.append(link)  # type: ignore # pylint: disable=no-member
+            data_pb.blocksizes.append(len(chunk))  # type: ignore # pylint: disable=no-member
+            filesize += len(chunk)
+        data_pb.filesize = filesize
+        outer_node.Data = data_pb.SerializeToString(deterministic=True)
+        return cls._serialize(outer_node)
+
     @staticmethod
     def _generate_multihash_bytes(pb_data: bytes) -> bytes:
         sha256_hash = hashlib.sha256(pb_data).hexdigest()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains a cache of the IPFS hashes of files, in memory or on disk."""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+
+_default_logger = logging.getLogger(__name__)
+
+FINGERPRINT_CACHE_ENV_VAR = "AEA_FINGERPRINT_CACHE"
+CACHE_VERSION = 1
+DEFAULT_MAX_ENTRIES = 20000
+# below this total size, starting a process pool costs more than hashing the files
+PARALLEL_HASHING_MIN_SIZE = 8 * 1024 * 1024
+# files modified less than this time before being hashed are not cached,
+# as they could be modified again without their modification time changing.
+RACY_INTERVAL_NS = 2 * 10 ** 9
+# seconds after which the last use of an entry is updated, to avoid rewriting the
+# cache file when only hits are made.
+LAST_USED_RESOLUTION = 24 * 60 * 60
+
+FileStat = Tuple[int, int, int, int]
+
+
+def _hash_file(file_path: str) -> str:
+    """
+    Get the IPFS hash of a file.
+
+    :param file_path: the file path.
+    :return: the IPFS hash
+    """
+    return IPFSHashOnly().get(file_path)
+
+
+def hash_files(file_paths: Sequence[str], parallel: bool = True) -> List[str]:
+    """
+    Get the IPFS hashes of files, with a process pool if there is much data to hash.
+
+    :param file_paths: the file paths.
+    :param parallel: whether to hash much data with a process pool.
+    :return: the IPFS hashes, in the order of the file paths
+    """
+    max_workers = min(os.cpu_count() or 1, len(file_paths))
+    if (
+        parallel
+        and max_workers > 1
+        and sum(map(os.path.getsize, file_paths)) >= PARALLEL_HASHING_MIN_SIZE
+    ):
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_hash_file, file_paths))
+        except (OSError, RuntimeError) as e:  # pragma: nocover
+            _default_logger.debug(
+                f"Cannot hash files in parallel, hashing them sequentially: {e}"
+            )
+    return [_hash_file(file_path) for file_path in file_paths]
+
+
+class FileHashCache:
+    """
+    A cache of the IPFS hashes of files, in memory or on disk.
+
+    The hashes are keyed by the absolute path of the files, and are valid as long as
+    the size, the modification and change times and the inode of the files are unchanged.
+    The change time is checked too, as the modification time is preserved by copies.
+    """
+
+    def __init__(
+        self, path: Optional[str], max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param path: the path of the cache file, or None to keep the cache in memory.
+        :param max_entries: the maximum number of entries kept, the least recently used are dropped.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = {}  # type: Dict[str, list]
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        """Load the entries from the cache file, if not done yet."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            _default_logger.debug(
+                f"Ignoring invalid fingerprint cache {self.path}: {e}"
+            )
+
+    @staticmethod
+    def _stat(file_path: str) -> FileStat:
+        """
+        Get the key of a file.
+
+        :param file_path: the absolute file path.
+        :return: the size, the modification and change times and the inode of the file
+        """
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino
+
+    def get_hashes(self, file_paths: Sequence[str], parallel: bool = True) -> List[str]:
+        """
+        Get the IPFS hashes of files, hashing only the files not in the cache.
+
+        :param file_paths: the file paths.
+        :param parallel: whether to hash much data with a process pool.
+        :return: the IPFS hashes, in the order of the file paths
+        """
+        now = time.time()
+        racy_since = int(now * 10 ** 9) - RACY_INTERVAL_NS
+        hashes = [""] * len(file_paths)
+        to_hash = []  # type: List[Tuple[int, str, FileStat]]
+        with self._lock:
+            self._load()
+            for index, file_path in enumerate(file_paths):
+                absolute_path = os.path.abspath(file_path)
+                stat = self._stat(absolute_path)
+                entry = self._entries.get(absolute_path)
+                if entry is not None and tuple(entry[:4]) == stat:
+                    hashes[index] = entry[4]
+                    if now - entry[5] > LAST_USED_RESOLUTION:
+                        entry[5] = now
+                        self._dirty = True
+                else:
+                    to_hash.append((index, absolute_path, stat))
+
+        new_hashes = hash_files([path for _, path, _ in to_hash], parallel)
+
+        with self._lock:
+            for (index, absolute_path, stat), file_hash in zip(to_hash, new_hashes):
+                hashes[index] = file_hash
+                if stat[1] < racy_since:
+                    self._entries[absolute_path] = [*stat, file_hash, now]
+                    self._dirty = True
+        return hashes
+
+    def save(self) -> None:
+        """Write the cache file if the entries changed, atomically."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            if len(self._entries) > self.max_entries:
+                most_recent = sorted(
+                    self._entries.items(), key=lambda item: item[1][5], reverse=True
+                )
+                self._entries = dict(most_recent[: self.max_entries])
+            data = {"version": CACHE_VERSION, "entries": self._entries}
+            directory = os.path.dirname(self.path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+                self._dirty = False
+            except OSError as e:  # pragma: nocover
+                _default_logger.debug(
+                    f"Cannot write the fingerprint cache {self.path}: {e}"
+                )
+
+
+_default_cache = None  # type: Optional[FileHashCache]
+_default_cache_persisted = False
+_default_cache_lock = threading.Lock()
+
+
+def get_default_file_hash_cache(persist: bool = False) -> FileHashCache:
+    """
+    Get the cache of the process.
+
+    The cache is kept in memory, unless the AEA_FINGERPRINT_CACHE environment variable
+    is set to the path of a cache file, which is then loaded. The cache file is written
+    when the process exits only if the cache was requested to be persisted.
+
+    :param persist: whether to write the cache file, if set, when the process exits.
+    :return: the cache
+    """
+    global _default_cache, _default_cache_persisted  # pylint: disable=global-statement
+    path = os.environ.get(FINGERPRINT_CACHE_ENV_VAR) or None
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.path != path:
+            _default_cache = FileHashCache(path)
+            _default_cache_persisted = False
+        if persist and path is not None and not _default_cache_persisted:
+            atexit.register(_default_cache.save)
+            _default_cache_persisted = True
+        return _default_cache
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+In-process metrics of the framework.
+
+The metrics are cheap enough to be always on: counters and histograms are plain
+attribute updates on children cached by the instrumented components, and gauges
+are only computed when the metrics are rendered, in the Prometheus text format.
+"""
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Sequence, Tuple, TypeVar, cast
+
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+)
+
+LabelValues = Tuple[str, ...]
+MetricType = TypeVar("MetricType", bound="Metric")
+
+
+def _escape_label_value(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+
+    :param value: the label value.
+    :return: the escaped value
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(
+    label_names: Sequence[str], label_values: Sequence[str], extra: str = ""
+) -> str:
+    """
+    Format the labels of a sample.
+
+    :param label_names: the label names.
+    :param label_values: the label values.
+    :param extra: an extra label, already formatted.
+    :return: the labels in braces, or an empty string if there are none.
+    """
+    labels = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    ]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value.
+
+    :param value: the value.
+    :return: the formatted value
+    """
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class CounterChild:
+    """A counter for a set of label values."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increment the counter.
+
+        :param amount: the amount to add.
+        """
+        self.value += amount
+
+
+class HistogramChild:
+    """A histogram for a set of label values."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """
+        Initialize the histogram.
+
+        :param buckets: the sorted upper bounds of the buckets.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Observe a value.
+
+        :param value: the value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric(ABC):
+    """Base class of the metrics, with the children by label values."""
+
+    TYPE = ""
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str]):
+        """
+        Initialize the metric.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        """
+        Render the metric in the Prometheus text format.
+
+        :return: the lines of the metric
+        """
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.TYPE}",
+            *self._render_samples(),
+        ]
+
+    @abstractmethod
+    def _render_samples(self) -> List[str]:
+        """
+        Render the samples of the metric.
+
+        :return: the lines of the samples
+        """
+
+
+class Counter(Metric):
+    """A counter metric."""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str]):
+        """
+        Initialize the metric.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        """
+        super().__init__(name, description, label_names)
+        self._children = {}  # type: Dict[LabelValues, CounterChild]
+
+    def labels(self, *label_values: str) -> CounterChild:
+        """
+        Get the counter for the label values, to be kept by the instrumented component.
+
+        :param label_values: the label values.
+        :return: the counter
+        """
+        with self._lock:
+            return self._children.setdefault(label_values, CounterChild())
+
+    def _render_samples(self) -> List[str]:
+        """
+        Render the samples of the metric.
+
+        :return: the lines of the samples
+        """
+        with self._lock:
+            children = list(self._children.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(child.value)}"
+            for label_values, child in children
+        ]
+
+
+class Gauge(Metric):
+    """A gauge metric, with values computed by functions when rendered."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str]):
+        """
+        Initialize the metric.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        """
+        super().__init__(name, description, label_names)
+        self._functions = {}  # type: Dict[LabelValues, Callable[[], float]]
+
+    def set_function(
+        self, label_values: LabelValues, function: Callable[[], float]
+    ) -> None:
+        """
+        Set the function computing the value of the gauge for the label values.
+
+        :param label_values: the label values.
+        :param function: the function.
+        """
+        with self._lock:
+            self._functions[label_values] = function
+
+    def remove(self, label_values: LabelValues) -> None:
+        """
+        Remove the gauge for the label values.
+
+        :param label_values: the label values.
+        """
+        with self._lock:
+            self._functions.pop(label_values, None)
+
+    def _render_samples(self) -> List[str]:
+        """
+        Render the samples of the metric.
+
+        :return: the lines of the samples
+        """
+        with self._lock:
+            functions = list(self._functions.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(function())}"
+            for label_values, function in functions
+        ]
+
+
+class Histogram(Metric):
+    """A histogram metric."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        """
+        Initialize the metric.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        :param buckets: the upper bounds of the buckets.
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._children = {}  # type: Dict[LabelValues, HistogramChild]
+
+    def labels(self, *label_values: str) -> HistogramChild:
+        """
+        Get the histogram for the label values, to be kept by the instrumented component.
+
+        :param label_values: the label values.
+        :return: the histogram
+        """
+        with self._lock:
+            return self._children.setdefault(label_values, HistogramChild(self.buckets))
+
+    def _render_samples(self) -> List[str]:
+        """
+        Render the samples of the metric.
+
+        :return: the lines of the samples
+        """
+        with self._lock:
+            children = list(self._children.items())
+        lines = []
+        for label_values, child in children:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), child.counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, label_values, le)} {cumulative}"
+                )
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """A registry of metrics."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._metrics = {}  # type: Dict[str, Metric]
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, description: str, label_names: Sequence[str] = ()
+    ) -> Counter:
+        """
+        Get or create a counter.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        :return: the counter
+        """
+        return self._get_or_create(Counter, name, description, label_names)
+
+    def gauge(
+        self, name: str, description: str, label_names: Sequence[str] = ()
+    ) -> Gauge:
+        """
+        Get or create a gauge.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        :return: the gauge
+        """
+        return self._get_or_create(Gauge, name, description, label_names)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """
+        Get or create a histogram, of latencies in seconds by default.
+
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        :param buckets: the upper bounds of the buckets, if created.
+        :return: the histogram
+        """
+        return self._get_or_create(
+            Histogram, name, description, label_names, buckets=buckets
+        )
+
+    def _get_or_create(
+        self,
+        metric_class: Callable[..., MetricType],
+        name: str,
+        description: str,
+        label_names: Sequence[str],
+        **kwargs: Any,
+    ) -> MetricType:
+        """
+        Get a metric, or create it if not present.
+
+        :param metric_class: the metric class.
+        :param name: the metric name.
+        :param description: the metric description.
+        :param label_names: the label names.
+        :param kwargs: the other arguments of the metric, if created.
+        :return: the metric
+        :raises ValueError: if a metric with the same name but of another type or labels is present.
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = metric_class(name, description, label_names, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not metric_class or metric.label_names != tuple(
+                label_names
+            ):
+                raise ValueError(
+                    f"Metric {name} already registered with another type or labels."
+                )
+        return cast(MetricType, metric)
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text format.
+
+        :return: the metrics text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []  # type: List[str]
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+# the metrics of the framework, for all the agents of the process
+registry = MetricsRegistry()
+
+handler_latency = registry.histogram(
+    "aea_handler_latency_seconds",
+    "Time to handle a message by a handler.",
+    ("agent", "skill", "handler"),
+)
+behaviour_latency = registry.histogram(
+    "aea_behaviour_latency_seconds",
+    "Time of an act of a behaviour.",
+    ("agent", "skill", "behaviour"),
+)
+decision_maker_latency = registry.histogram(
+    "aea_decision_maker_latency_seconds",
+    "Time to handle a message by the decision maker.",
+    ("agent",),
+)
+multiplexer_queue_depth = registry.gauge(
+    "aea_multiplexer_queue_depth",
+    "Number of envelopes in a queue of the multiplexer.",
+    ("agent", "queue"),
+)
+connection_envelopes_sent = registry.counter(
+    "aea_connection_envelopes_sent_total",
+    "Number of envelopes sent with a connection.",
+    ("agent", "connection"),
+)
+connection_envelopes_received = registry.counter(
+    "aea_connection_envelopes_received_total",
+    "Number of envelopes received from a connection.",
+    ("agent", "connection"),
+)
@@ -20,17 +20,21 @@
 """Useful classes for the OEF search."""
 
 import logging
+import operator
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from enum import Enum
 from math import asin, cos, radians, sin, sqrt
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -41,6 +45,12 @@ import aea.helpers.search.models_pb2 as models_pb2
 from aea.exceptions import enforce
 
 
+try:
+    import numpy as np  # pylint: disable=import-outside-toplevel
+except ModuleNotFoundError:  # pragma: nocover
+    np = None  # type: ignore
+
+
 _default_logger = logging.getLogger(__name__)
 
 proto_value = {
@@ -92,6 +102,8 @@ CONSTRAINT_CATEGORIES = [
     CONSTRAINT_CATEGORY_DISTANCE,
 ]
 
+EARTH_RADIUS = 6372.8  # average earth radius
+
 
 class Location:
     """Data structure to represent locations (i.e. a pair of latitude and longitude)."""
@@ -586,6 +598,16 @@ class ConstraintTypes(Enum):
         return str(self.value)
 
 
+RELATION_OPERATORS: Dict[ConstraintTypes, Callable[[Any, Any], Any]] = {
+    ConstraintTypes.EQUAL: operator.eq,
+    ConstraintTypes.NOT_EQUAL: operator.ne,
+    ConstraintTypes.LESS_THAN: operator.lt,
+    ConstraintTypes.LESS_THAN_EQ: operator.le,
+    ConstraintTypes.GREATER_THAN: operator.gt,
+    ConstraintTypes.GREATER_THAN_EQ: operator.ge,
+}
+
+
 class ConstraintType:
     """
     Type of constraint.
@@ -811,6 +833,42 @@ class ConstraintType:
             return location.distance(value) <= distance
         raise ValueError("Constraint type not recognized.")  # pragma: nocover
 
+    def compile(self) -> Callable[[ATTRIBUTE_TYPES], bool]:
+        """
+        Compile the constraint type into a predicate over attribute values.
+
+        The dispatch on the constraint type is done once, here, instead of on every check.
+
+        :return: a predicate equivalent to the 'check' method.
+        :raises ValueError: if the constraint type is not recognized.
+        """
+        constraint_value = self.value
+        if self.type in RELATION_OPERATORS:
+            relation = RELATION_OPERATORS[self.type]
+            return lambda value: relation(value, constraint_value)
+        if self.type == ConstraintTypes.WITHIN:
+            low, high = constraint_value[0], constraint_value[1]
+            return lambda value: low <= value <= high
+        if self.type in {ConstraintTypes.IN, ConstraintTypes.NOT_IN}:
+            try:
+                members: Any = frozenset(constraint_value)
+            except TypeError:  # unhashable values, e.g. locations
+                members = constraint_value
+            if self.type == ConstraintTypes.IN:
+                return lambda value: value in members
+            return lambda value: value not in members
+        if self.type == ConstraintTypes.DISTANCE:
+            location = cast(Location, constraint_value[0])
+            distance = constraint_value[1]
+
+            def check_distance(value: ATTRIBUTE_TYPES) -> bool:
+                if not isinstance(value, Location):  # pragma: nocover
+                    raise ValueError("Value must be of type Location.")
+                return location.distance(value) <= distance
+
+            return check_distance
+        raise ValueError("Constraint type not recognized.")  # pragma: nocover
+
     def __eq__(self, other: Any) -> bool:
         """Check equality with another object."""
         return (
@@ -1070,6 +1128,14 @@ class ConstraintExpr(ABC):
         :raises AEAEnforceError: if the object does not satisfy some requirements.  # noqa: DAR402
         """
 
+    def compile(self) -> Callable[[Description], bool]:
+        """
+        Compile the constraint expression into a predicate over descriptions.
+
+        :return: a predicate equivalent to the 'check' method.
+        """
+        return self.check
+
     @staticmethod
     def _encode(expression: Any) -> models_pb2.Query.ConstraintExpr:  # type: ignore
         """
@@ -1146,6 +1212,17 @@ class And(ConstraintExpr):
         """
         return all(expression.check(description) for expression in self.constraints)
 
+    def compile(self) -> Callable[[Description], bool]:
+        """
+        Compile the 'And' constraint expression into a predicate over descriptions.
+
+        :return: a predicate equivalent to the 'check' method.
+        """
+        predicates = tuple(expression.compile() for expression in self.constraints)
+        return lambda description: all(
+            predicate(description) for predicate in predicates
+        )
+
     def is_valid(self, data_model: DataModel) -> bool:
         """
         Check whether the constraint expression is valid wrt a data model.
@@ -1222,6 +1299,17 @@ class Or(ConstraintExpr):
         """
         return any(expression.check(description) for expression in self.constraints)
 
+    def compile(self) -> Callable[[Description], bool]:
+        """
+        Compile the 'Or' constraint expression into a predicate over descriptions.
+
+        :return: a predicate equivalent to the 'check' method.
+        """
+        predicates = tuple(expression.compile() for expression in self.constraints)
+        return lambda description: any(
+            predicate(description) for predicate in predicates
+        )
+
     def is_valid(self, data_model: DataModel) -> bool:
         """
         Check whether the constraint expression is valid wrt a data model.
@@ -1297,6 +1385,15 @@ class Not(ConstraintExpr):
         """
         return not self.constraint.check(description)
 
+    def compile(self) -> Callable[[Description], bool]:
+        """
+        Compile the 'Not' constraint expression into a predicate over descriptions.
+
+        :return: a predicate equivalent to the 'check' method.
+        """
+        predicate = self.constraint.compile()
+        return lambda description: not predicate(description)
+
     def is_valid(self, data_model: DataModel) -> bool:
         """
         Check whether the constraint expression is valid wrt a data model.
@@ -1412,6 +1509,41 @@ class Constraint(ConstraintExpr):
         # dispatch the check to the right implementation for the concrete constraint type.
         return self.constraint_type.check(value)
 
+    def get_value_type(self) -> Optional[type]:
+        """
+        Get the type an attribute value must have to satisfy the constraint.
+
+        :return: the type, or None if the constraint is defined by an empty collection.
+        """
+        constraint_value = self.constraint_type.value
+        if type(constraint_value) in {list, tuple, set}:
+            if len(constraint_value) == 0:
+                return None
+            return type(next(iter(constraint_value)))
+        return type(constraint_value)
+
+    def compile(self) -> Callable[[Description], bool]:
+        """
+        Compile the constraint into a predicate over descriptions.
+
+        :return: a predicate equivalent to the 'check' method.
+        """
+        name = self.attribute_name
+        optional_value_type = self.get_value_type()
+        if optional_value_type is None:
+            return lambda description: False
+        value_type = optional_value_type
+        check: Callable[[Any], bool] = self.constraint_type.compile()
+
+        def predicate(description: Description) -> bool:
+            values = description.values
+            if name not in values:
+                return False
+            value = values[name]
+            return isinstance(value, value_type) and check(value)
+
+        return predicate
+
     def is_valid(self, data_model: DataModel) -> bool:
         """
         Check whether the constraint expression is valid wrt a data model.
@@ -1527,6 +1659,14 @@ class Query:
         """
         return all(c.check(description) for c in self.constraints)
 
+    def compile(self) -> "CompiledQuery":
+        """
+        Compile the query, so that it can be checked against many descriptions efficiently.
+
+        :return: the compiled query.
+        """
+        return CompiledQuery(self)
+
     def is_valid(self, data_model: Optional[DataModel]) -> bool:
         """
         Given a data model, check whether the query is valid for that data model.
@@ -1643,6 +1783,231 @@ class Query:
         return query
 
 
+class CompiledQuery:
+    """
+    A query compiled into predicates over descriptions.
+
+    The expression tree is walked, and the constraint types dispatched, only once at compile time.
+    If NumPy is available, 'filter' evaluates relation, range and distance constraints
+    over numeric attributes on whole columns of values at once.
+    """
+
+    __slots__ = ("query", "_predicate", "_plan")
+
+    VECTORISE_THRESHOLD = 64
+    MAX_EXACT_INTEGER = 2 ** 53
+
+    def __init__(self, query: Query) -> None:
+        """
+        Initialize a compiled query.
+
+        :param query: the query to compile.
+        """
+        self.query = query
+        predicates = tuple(c.compile() for c in query.constraints)
+        self._predicate: Callable[[Description], bool] = lambda description: all(
+            predicate(description) for predicate in predicates
+        )
+        self._plan = (
+            ("and", tuple(self._make_plan(c) for c in query.constraints))
+            if np is not None
+            else None
+        )
+
+    def check(self, description: Description) -> bool:
+        """
+        Check if a description satisfies the constraints of the query.
+
+        :param description: the description to check.
+        :return: True if the description satisfies all the constraints, False otherwise.
+        """
+        return self._predicate(description)
+
+    def __call__(self, description: Description) -> bool:
+        """
+        Check if a description satisfies the constraints of the query.
+
+        :param description: the description to check.
+        :return: True if the description satisfies all the constraints, False otherwise.
+        """
+        return self._predicate(description)
+
+    def filter(self, descriptions: Iterable[Description]) -> List[Description]:
+        """
+        Get the descriptions that satisfy the constraints of the query, preserving their order.
+
+        :param descriptions: the descriptions to check.
+        :return: the descriptions that satisfy the query.
+        """
+        descriptions = list(descriptions)
+        if self._plan is None or len(descriptions) < self.VECTORISE_THRESHOLD:
+            return [d for d in descriptions if self._predicate(d)]
+        mask = self._evaluate(self._plan, descriptions, {})
+        return [descriptions[index] for index in np.flatnonzero(mask)]
+
+    @classmethod
+    def _make_plan(cls, expression: ConstraintExpr) -> Tuple:
+        """
+        Make the plan to evaluate an expression over columns of values.
+
+        :param expression: the constraint expression.
+        :return: the plan node.
+        """
+        if isinstance(expression, (And, Or)):
+            return (
+                "and" if isinstance(expression, And) else "or",
+                tuple(cls._make_plan(c) for c in expression.constraints),
+            )
+        if isinstance(expression, Not):
+            return ("not", cls._make_plan(expression.constraint))
+        if isinstance(expression, Constraint):
+            constraint_type = expression.constraint_type
+            value_type = expression.get_value_type()
+            if (
+                constraint_type.type in RELATION_OPERATORS
+                and value_type in (int, float)
+                and cls._is_exact(constraint_type.value)
+            ):
+                return (
+                    "relation",
+                    expression.attribute_name,
+                    value_type,
+                    RELATION_OPERATORS[constraint_type.type],
+                    constraint_type.value,
+                    expression.compile(),
+                )
+            if (
+                constraint_type.type == ConstraintTypes.WITHIN
+                and value_type in (int, float)
+                and all(cls._is_exact(v) for v in constraint_type.value[:2])
+            ):
+                return (
+                    "within",
+                    expression.attribute_name,
+                    value_type,
+                    constraint_type.value[0],
+                    constraint_type.value[1],
+                    expression.compile(),
+                )
+            if constraint_type.type == ConstraintTypes.DISTANCE:
+                return (
+                    "distance",
+                    expression.attribute_name,
+                    constraint_type.value[0],
+                    constraint_type.value[1],
+                )
+        return ("predicate", expression.compile())
+
+    @classmethod
+    def _is_exact(cls, value: Any) -> bool:
+        """
+        Check whether a value is represented exactly in a float column.
+
+        :param value: the value.
+        :return: True if the value can be compared as a float without loss of precision.
+        """
+        return not isinstance(value, int) or abs(value) <= cls.MAX_EXACT_INTEGER
+
+    def _evaluate(
+        self, plan: Tuple, descriptions: Sequence[Description], columns: Dict
+    ) -> Any:
+        """
+        Evaluate a plan node over the descriptions.
+
+        :param plan: the plan node.
+        :param descriptions: the descriptions.
+        :param columns: the columns of values already extracted, by attribute name and type.
+        :return: the boolean mask of the descriptions satisfying the plan node.
+        """
+        kind = plan[0]
+        if kind in {"and", "or"}:
+            mask = np.full(len(descriptions), kind == "and")
+            for child in plan[1]:
+                if kind == "and":
+                    mask &= self._evaluate(child, descriptions, columns)
+                else:
+                    mask |= self._evaluate(child, descriptions, columns)
+            return mask
+        if kind == "not":
+            return ~self._evaluate(plan[1], descriptions, columns)
+        if kind in {"relation", "within"}:
+            column = self._get_numeric_column(plan[1], plan[2], descriptions, columns)
+            if column is not None:
+                values, valid = column
+                if kind == "relation":
+                    return valid & plan[3](values, plan[4])
+                return valid & (plan[3] <= values) & (values <= plan[4])
+        if kind == "distance":
+            values, valid = self._get_location_column(plan[1], descriptions, columns)
+            location, distance = plan[2], plan[3]
+            distances = haversine_array(
+                location.latitude, location.longitude, values[0], values[1]
+            )
+            return valid & (distances <= distance)
+        # generic constraints, or numeric columns that cannot be represented exactly
+        predicate = plan[-1]
+        return np.fromiter(
+            (predicate(d) for d in descriptions), dtype=bool, count=len(descriptions)
+        )
+
+    def _get_numeric_column(
+        self,
+        name: str,
+        value_type: type,
+        descriptions: Sequence[Description],
+        columns: Dict,
+    ) -> Optional[Tuple[Any, Any]]:
+        """
+        Get the values of a numeric attribute as a float column.
+
+        :param name: the attribute name.
+        :param value_type: the type the values must have.
+        :param descriptions: the descriptions.
+        :param columns: the columns of values already extracted.
+        :return: the values and the mask of the valid ones, or None if they cannot be represented exactly.
+        """
+        key = (name, value_type)
+        if key not in columns:
+            values = np.zeros(len(descriptions))
+            valid = np.zeros(len(descriptions), dtype=bool)
+            for index, description in enumerate(descriptions):
+                value = description.values.get(name)
+                if isinstance(value, value_type):
+                    if not self._is_exact(value):
+                        columns[key] = None
+                        break
+                    values[index] = value
+                    valid[index] = True
+            else:
+                columns[key] = (values, valid)
+        return columns[key]
+
+    @staticmethod
+    def _get_location_column(
+        name: str, descriptions: Sequence[Description], columns: Dict
+    ) -> Tuple[Any, Any]:
+        """
+        Get the values of a location attribute as latitude and longitude columns.
+
+        :param name: the attribute name.
+        :param descriptions: the descriptions.
+        :param columns: the columns of values already extracted.
+        :return: the latitudes and longitudes, and the mask of the valid ones.
+        """
+        key = (name, Location)
+        if key not in columns:
+            values = np.zeros((2, len(descriptions)))
+            valid = np.zeros(len(descriptions), dtype=bool)
+            for index, description in enumerate(descriptions):
+                value = description.values.get(name)
+                if isinstance(value, Location):
+                    values[0, index] = value.latitude
+                    values[1, index] = value.longitude
+                    valid[index] = True
+            columns[key] = (values, valid)
+        return columns[key]
+
+
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Compute the Haversine distance between two locations (i.e. two pairs of latitude and longitude).
@@ -1654,11 +2019,34 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     :return: the Haversine distance.
     """
     lat1, lon1, lat2, lon2, = map(radians, [lat1, lon1, lat2, lon2])
-    earth_radius = 6372.8  # average earth radius
     dlat = lat2 - lat1
     dlon = lon2 - lon1
     sin_lat_squared = sin(dlat * 0.5) * sin(dlat * 0.5)
     sin_lon_squared = sin(dlon * 0.5) * sin(dlon * 0.5)
     computation = asin(sqrt(sin_lat_squared + sin_lon_squared * cos(lat1) * cos(lat2)))
-    distance = 2 * earth_radius * computation
+    distance = 2 * EARTH_RADIUS * computation
     return distance
+
+
+def haversine_array(lat1: float, lon1: float, lat2: Any, lon2: Any) -> Any:
+    """
+    Compute the Haversine distance between a location and arrays of latitudes and longitudes.
+
+    Requires NumPy; the formula is the same as in 'haversine'.
+
+    :param lat1: the latitude of the first location.
+    :param lon1: the longitude of the first location.
+    :param lat2: the array of latitudes of the other locations.
+    :param lon2: the array of longitudes of the other locations.
+    :return: the array of Haversine distances.
+    """
+    lat1, lon1 = radians(lat1), radians(lon1)
+    lat2, lon2 = np.radians(lat2), np.radians(lon2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    sin_lat_squared = np.sin(dlat * 0.5) * np.sin(dlat * 0.5)
+    sin_lon_squared = np.sin(dlon * 0.5) * np.sin(dlon * 0.5)
+    computation = np.arcsin(
+        np.sqrt(sin_lat_squared + sin_lon_squared * cos(lat1) * np.cos(lat2))
+    )
+    return 2 * EARTH_RADIUS * computation
@@ -66,6 +66,16 @@ class AbstractStorageBackend(ABC):
         :return: None
         """
 
+    async def ensure_index(self, collection_name: str, field: str) -> None:
+        """
+        Create index on the object field, if not exists, to speed up find by this field.
+
+        Backends without indexes support ignore it.
+
+        :param collection_name: str.
+        :param field: field name to index: example "parent.field"
+        """
+
     @abstractmethod
     async def put(
         self, collection_name: str, object_id: str, object_body: JSON_TYPES
@@ -90,6 +100,35 @@ class AbstractStorageBackend(ABC):
         :return: dict if object exists in collection otherwise None
         """
 
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put many objects into collection.
+
+        Backends should override it to store all the objects at once.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        for object_id, object_body in objects:
+            await self.put(collection_name, object_id, object_body)
+
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[Optional[JSON_TYPES]]:
+        """
+        Get many objects from the collection.
+
+        Backends should override it to read all the objects at once.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of objects bodies, in the order of the ids, None for the objects not in collection
+        """
+        return [await self.get(collection_name, object_id) for object_id in object_ids]
+
     @abstractmethod
     async def remove(self, collection_name: str, object_id: str) -> None:
         """
@@ -123,3 +162,21 @@ class AbstractStorageBackend(ABC):
         :param collection_name: str.
         :return: Tuple of objects keys, bodies.
         """
+
+    async def list_page(
+        self, collection_name: str, after: Optional[str] = None, limit: int = 100
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List a page of objects with keys from the collection, ordered by object id.
+
+        Backends should override it to read only the objects of the page.
+
+        :param collection_name: str.
+        :param after: object id the page starts after, None for the first page.
+        :param limit: maximum number of objects in the page.
+        :return: list of object ids and bodies.
+        """
+        objects = sorted(await self.list(collection_name), key=lambda obj: obj[0])
+        if after is not None:
+            objects = [obj for obj in objects if obj[0] > after]
+        return objects[:limit]
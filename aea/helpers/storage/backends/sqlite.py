@@ -18,16 +18,19 @@
 # ------------------------------------------------------------------------------
 """This module contains sqlite storage backend implementation."""
 import asyncio
+import hashlib
 import json
+import logging
 import os
 import platform
+import re
 import sqlite3
 import sys
 import threading
 from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
 
 from aea.helpers.storage.backends.base import (
     AbstractStorageBackend,
@@ -37,18 +40,58 @@ from aea.helpers.storage.backends.base import (
 )
 
 
+_default_logger = logging.getLogger(__name__)
+
+
 class SqliteStorageBackend(AbstractStorageBackend):
-    """Sqlite storage backend."""
+    """
+    Sqlite storage backend.
+
+    Options can be set in the query part of the uri, e.g. `sqlite://./storage.db?mode=write_behind`:
+    - mode: `default` commits every statement. `write_behind` uses WAL journaling and queues
+      puts and removes, coalescing them into one transaction per flush interval or batch size.
+    - flush_interval: seconds between two flushes of the write-behind queue.
+    - batch_size: number of queued writes which triggers a flush of the write-behind queue.
+    """
+
+    MODE_DEFAULT = "default"
+    MODE_WRITE_BEHIND = "write_behind"
+    MODES = (MODE_DEFAULT, MODE_WRITE_BEHIND)
+    DEFAULT_FLUSH_INTERVAL = 0.1
+    DEFAULT_BATCH_SIZE = 100
+    MAX_SQL_VARIABLES = 500  # sqlite default limit is 999
+    VALID_JSON_PATH = re.compile(r"^\$(\.[a-zA-Z0-9_]+)+$")
 
     def __init__(self, uri: str) -> None:
         """Init backend."""
         super().__init__(uri)
         parsed = urlparse(self._uri)
         self._fname = parsed.netloc or parsed.path
+        options = dict(parse_qsl(parsed.query))
+        self._mode = options.get("mode", self.MODE_DEFAULT)
+        if self._mode not in self.MODES:
+            raise ValueError(
+                f"Invalid sqlite storage mode: {self._mode}, supported are {', '.join(self.MODES)}"
+            )
+        self._flush_interval = float(
+            options.get("flush_interval", self.DEFAULT_FLUSH_INTERVAL)
+        )
+        self._batch_size = int(options.get("batch_size", self.DEFAULT_BATCH_SIZE))
         self._connection: Optional[sqlite3.Connection] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._lock = threading.Lock()
         self._executor = ThreadPoolExecutor(max_workers=1)
+        # collection name -> object id -> json body, or None for removal
+        self._pending_writes: Dict[str, Dict[str, Optional[str]]] = {}
+        self._pending_writes_count = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_wakeup: Optional[asyncio.Future] = None
+        self._flush_stopping = False
+
+    @property
+    def is_write_behind(self) -> bool:
+        """Check whether puts and removes are queued and written in batches."""
+        return self._mode == self.MODE_WRITE_BEHIND
 
     def _execute_sql_sync(self, query: str, args: Optional[List] = None) -> List[Tuple]:
         """
@@ -66,6 +109,128 @@ class SqliteStorageBackend(AbstractStorageBackend):
             self._connection.commit()
             return result
 
+    def _write_sync(self, writes: Dict[str, Dict[str, Optional[str]]]) -> None:
+        """
+        Execute puts and removes in one transaction.
+
+        :param writes: json bodies by object id by collection name, None bodies for the objects to remove.
+        """
+        if not self._connection:  # pragma: nocover
+            raise ValueError("Not connected")
+        with self._lock:
+            try:
+                for collection_name, objects in writes.items():
+                    puts = [
+                        (i, body) for i, body in objects.items() if body is not None
+                    ]
+                    removes = [(i,) for i, body in objects.items() if body is None]
+                    if puts:
+                        sql = f"""INSERT OR REPLACE INTO {collection_name} (object_id, object_body)
+                            VALUES (?, ?);"""  # nosec
+                        self._connection.executemany(sql, puts)
+                    if removes:
+                        sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
+                        self._connection.executemany(sql, removes)
+                self._connection.commit()
+            except Exception:
+                self._connection.rollback()
+                raise
+
+    async def _write(
+        self, collection_name: str, objects: Dict[str, Optional[str]]
+    ) -> None:
+        """
+        Write puts and removes, or queue them in write-behind mode.
+
+        :param collection_name: str.
+        :param objects: json bodies by object id, None bodies for the objects to remove.
+        """
+        if not self.is_write_behind:
+            if not self._loop:  # pragma: nocover
+                raise ValueError("Not connected")
+            await self._loop.run_in_executor(
+                self._executor, self._write_sync, {collection_name: objects}
+            )
+            return
+        pending = self._pending_writes.setdefault(collection_name, {})
+        for object_id, object_body in objects.items():
+            if object_id not in pending:
+                self._pending_writes_count += 1
+            pending[object_id] = object_body
+        if self._pending_writes_count >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the queued puts and removes in one transaction."""
+        if not self._pending_writes:
+            return
+        if not self._loop:  # pragma: nocover
+            raise ValueError("Not connected")
+        writes = self._pending_writes
+        self._pending_writes = {}
+        self._pending_writes_count = 0
+        try:
+            await self._loop.run_in_executor(self._executor, self._write_sync, writes)
+        except BaseException:
+            # queue the writes again, also on cancellation, unless they were superseded in the meantime
+            for collection_name, objects in writes.items():
+                pending = self._pending_writes.setdefault(collection_name, {})
+                for object_id, object_body in objects.items():
+                    if object_id not in pending:
+                        self._pending_writes_count += 1
+                        pending[object_id] = object_body
+            raise
+
+    async def _flush_periodically(self) -> None:
+        """Flush the write-behind queue every flush interval, until stopped."""
+        loop = asyncio.get_event_loop()
+        while not self._flush_stopping:
+            self._flush_wakeup = loop.create_future()
+            handle = loop.call_later(self._flush_interval, self._wake_flush)
+            try:
+                await self._flush_wakeup
+            finally:
+                handle.cancel()
+            if self._flush_stopping:
+                break
+            try:
+                await self.flush()
+            except Exception as e:  # pylint: disable=broad-except
+                _default_logger.exception(f"Failed to flush storage writes: {e}")
+
+    def _wake_flush(self) -> None:
+        """Wake the periodic flush up."""
+        if self._flush_wakeup is not None and not self._flush_wakeup.done():
+            self._flush_wakeup.set_result(None)
+
+    async def _stop_flush_task(self) -> None:
+        """Stop the periodic flush, letting an in-flight flush complete."""
+        if self._flush_task is None:
+            return
+        self._flush_stopping = True
+        self._wake_flush()
+        try:
+            await self._flush_task
+        finally:
+            self._flush_task = None
+            self._flush_wakeup = None
+
+    def _get_pending(
+        self, collection_name: str, object_id: str
+    ) -> Tuple[bool, Optional[JSON_TYPES]]:
+        """
+        Get an object from the write-behind queue.
+
+        :param collection_name: str.
+        :param object_id: str object id
+        :return: whether the object is queued, and its body if queued and not removed.
+        """
+        pending = self._pending_writes.get(collection_name, {})
+        if object_id not in pending:
+            return False, None
+        object_body = pending[object_id]
+        return True, None if object_body is None else json.loads(object_body)
+
     async def _executute_sql(
         self, query: str, args: Optional[List] = None
     ) -> Optional[JSON_TYPES]:
@@ -87,12 +252,18 @@ class SqliteStorageBackend(AbstractStorageBackend):
         """Connect to backend."""
         self._loop = asyncio.get_event_loop()
         self._connection = await self._loop.run_in_executor(
-            self._executor, self._do_connect, self._fname
+            self._executor, self._do_connect, self._fname, self.is_write_behind
         )
+        if self.is_write_behind:
+            self._flush_stopping = False
+            self._flush_task = self._loop.create_task(self._flush_periodically())
 
     @staticmethod
-    def _do_connect(fname: str) -> sqlite3.Connection:
+    def _do_connect(fname: str, wal: bool = False) -> sqlite3.Connection:
         con = sqlite3.connect(fname)
+        if wal:
+            con.execute("PRAGMA journal_mode=WAL;")
+            con.execute("PRAGMA synchronous=NORMAL;")
         if (
             platform.system() == "Windows"
             and sys.version_info.major == 3
@@ -109,6 +280,8 @@ class SqliteStorageBackend(AbstractStorageBackend):
         """Disconnect the backend."""
         if not self._loop or not self._connection:  # pragma: nocover
             raise ValueError("Not connected")
+        await self._stop_flush_task()
+        await self.flush()
         await self._loop.run_in_executor(self._executor, self._connection.close)
         self._connection = None
         self._loop = None
@@ -126,6 +299,39 @@ class SqliteStorageBackend(AbstractStorageBackend):
         """  # nosec
         await self._executute_sql(sql)
 
+    @staticmethod
+    def _get_json_path(field: str) -> str:
+        """
+        Get the json path of an object field.
+
+        :param field: field name: example "parent.field"
+        :return: json path: example "$.parent.field"
+        """
+        if not field.startswith("$."):
+            field = f"$.{field}"
+        return field
+
+    async def ensure_index(self, collection_name: str, field: str) -> None:
+        """
+        Create expression index on the object field, if not exists, to speed up find by this field.
+
+        :param collection_name: str.
+        :param field: field name to index: example "parent.field"
+        :raises ValueError: if bad field name provided.
+        """
+        self._check_collection_name(collection_name)
+        path = self._get_json_path(field)
+        if not self.VALID_JSON_PATH.match(path):
+            raise ValueError(
+                f"Invalid index field: {field}, should be dot separated names of alpha-numeric characters and _"
+            )
+        index_name = (
+            f"{collection_name}_{hashlib.sha256(path.encode()).hexdigest()[:16]}_idx"
+        )
+        sql = f"""CREATE INDEX IF NOT EXISTS {index_name}
+            ON {collection_name} (json_extract(object_body, '{path}'));"""  # nosec
+        await self._executute_sql(sql)
+
     async def put(
         self, collection_name: str, object_id: str, object_body: JSON_TYPES
     ) -> None:
@@ -137,10 +343,22 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :param object_body: python dict, json compatible.
         """
         self._check_collection_name(collection_name)
-        sql = f"""INSERT OR REPLACE INTO {collection_name} (object_id, object_body)
-            VALUES (?, ?);
-        """  # nosec
-        await self._executute_sql(sql, [object_id, json.dumps(object_body)])
+        await self._write(collection_name, {object_id: json.dumps(object_body)})
+
+    async def put_many(
+        self, collection_name: str, objects: List[OBJECT_ID_AND_BODY]
+    ) -> None:
+        """
+        Put many objects into collection, in one transaction.
+
+        :param collection_name: str.
+        :param objects: list of object ids and bodies.
+        """
+        self._check_collection_name(collection_name)
+        await self._write(
+            collection_name,
+            {object_id: json.dumps(object_body) for object_id, object_body in objects},
+        )
 
     async def get(self, collection_name: str, object_id: str) -> Optional[JSON_TYPES]:
         """
@@ -152,6 +370,9 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :return: dict if object exists in collection otherwise None
         """
         self._check_collection_name(collection_name)
+        is_pending, object_body = self._get_pending(collection_name, object_id)
+        if is_pending:
+            return object_body
         sql = f"""SELECT object_body FROM {collection_name} WHERE object_id = ? LIMIT 1;"""  # nosec
         result = await self._executute_sql(sql, [object_id])
         if (
@@ -164,6 +385,34 @@ class SqliteStorageBackend(AbstractStorageBackend):
             return json.loads(result[0][0])
         return None
 
+    async def get_many(
+        self, collection_name: str, object_ids: List[str]
+    ) -> List[Optional[JSON_TYPES]]:
+        """
+        Get many objects from the collection.
+
+        :param collection_name: str.
+        :param object_ids: list of object ids.
+
+        :return: list of objects bodies, in the order of the ids, None for the objects not in collection
+        """
+        self._check_collection_name(collection_name)
+        found: Dict[str, Optional[JSON_TYPES]] = {}
+        to_select = []
+        for object_id in set(object_ids):
+            is_pending, object_body = self._get_pending(collection_name, object_id)
+            if is_pending:
+                found[object_id] = object_body
+            else:
+                to_select.append(object_id)
+        for start in range(0, len(to_select), self.MAX_SQL_VARIABLES):
+            chunk = to_select[start : start + self.MAX_SQL_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE object_id IN ({placeholders});"""  # nosec
+            for i in await self._executute_sql(sql, chunk):  # type: ignore
+                found[i[0]] = json.loads(i[1])
+        return [found.get(object_id) for object_id in object_ids]
+
     async def remove(self, collection_name: str, object_id: str) -> None:
         """
         Remove object from the collection.
@@ -172,8 +421,7 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :param object_id: str object id
         """
         self._check_collection_name(collection_name)
-        sql = f"""DELETE FROM {collection_name} WHERE object_id = ?;"""  # nosec
-        await self._executute_sql(sql, [object_id])
+        await self._write(collection_name, {object_id: None})
 
     async def find(
         self, collection_name: str, field: str, equals: EQUALS_TYPE
@@ -187,14 +435,33 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :return: list of object ids and body
         """
         self._check_collection_name(collection_name)
-        sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, ?) = ?;"""  # nosec
-        if not field.startswith("$."):
-            field = f"$.{field}"
+        await self.flush()
+        sql, args = self._get_find_sql(collection_name, field, equals)
         return [
             (i[0], json.loads(i[1]))
-            for i in await self._executute_sql(sql, [field, equals])  # type: ignore
+            for i in await self._executute_sql(sql, args)  # type: ignore
         ]
 
+    def _get_find_sql(
+        self, collection_name: str, field: str, equals: EQUALS_TYPE
+    ) -> Tuple[str, List]:
+        """
+        Get the sql query and its arguments to find objects by field value.
+
+        Valid json paths are put in the query literally, so that sqlite uses the expression index on the field, if any.
+
+        :param collection_name: str.
+        :param field: field name to search: example "parent.field"
+        :param equals: value field should be equal to
+        :return: sql query and its arguments
+        """
+        path = self._get_json_path(field)
+        if self.VALID_JSON_PATH.match(path):
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, '{path}') = ?;"""  # nosec
+            return sql, [equals]
+        sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE json_extract(object_body, ?) = ?;"""  # nosec
+        return sql, [path, equals]
+
     async def list(self, collection_name: str) -> List[OBJECT_ID_AND_BODY]:
         """
         List all objects with keys from the collection.
@@ -203,5 +470,32 @@ class SqliteStorageBackend(AbstractStorageBackend):
         :return: Tuple of objects keys, bodies.
         """
         self._check_collection_name(collection_name)
+        await self.flush()
         sql = f"""SELECT object_id, object_body FROM {collection_name};"""  # nosec
         return [(i[0], json.loads(i[1])) for i in await self._executute_sql(sql)]  # type: ignore
+
+    async def list_page(
+        self, collection_name: str, after: Optional[str] = None, limit: int = 100
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List a page of objects with keys from the collection, ordered by object id.
+
+        The page is selected on the object id primary key, so reading a page does not scan the previous ones.
+
+        :param collection_name: str.
+        :param after: object id the page starts after, None for the first page.
+        :param limit: maximum number of objects in the page.
+        :return: list of object ids and bodies.
+        """
+        self._check_collection_name(collection_name)
+        await self.flush()
+        if after is None:
+            sql = f"""SELECT object_id, object_body FROM {collection_name} ORDER BY object_id LIMIT ?;"""  # nosec
+            args = [limit]  # type: List
+        else:
+            sql = f"""SELECT object_id, object_body FROM {collection_name} WHERE object_id > ? ORDER BY object_id LIMIT ?;"""  # nosec
+            args = [after, limit]
+        return [
+            (i[0], json.loads(i[1]))
+            for i in await self._executute_sql(sql, args)  # type: ignore
+        ]
@@ -18,7 +18,7 @@
 # ------------------------------------------------------------------------------
 """This module contains the storage implementation."""
 import asyncio
-from typing import Any, Coroutine, List, Optional
+from typing import Any, Coroutine, Iterator, List, Optional
 from urllib.parse import urlparse
 
 from aea.helpers.async_utils import AsyncState, Runnable
@@ -49,6 +49,15 @@ class AsyncCollection:
         self._storage_backend = storage_backend
         self._collection_name = collection_name
 
+    async def ensure_index(self, field: str) -> None:
+        """
+        Create index on the object field, if not exists, to speed up find by this field.
+
+        :param field: field name to index: example "parent.field"
+        :return: None
+        """
+        return await self._storage_backend.ensure_index(self._collection_name, field)
+
     async def put(self, object_id: str, object_body: JSON_TYPES) -> None:
         """
         Put object into collection.
@@ -101,6 +110,39 @@ class AsyncCollection:
         """
         return await self._storage_backend.list(self._collection_name)
 
+    async def list_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List a page of objects with keys from the collection, ordered by object id.
+
+        :param after: object id the page starts after, None for the first page.
+        :param limit: maximum number of objects in the page.
+        :return: list of object ids and bodies.
+        """
+        return await self._storage_backend.list_page(
+            self._collection_name, after, limit
+        )
+
+    async def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put many objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        return await self._storage_backend.put_many(self._collection_name, objects)
+
+    async def get_many(self, object_ids: List[str]) -> List[Optional[JSON_TYPES]]:
+        """
+        Get many objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: list of objects bodies, in the order of the ids, None for the objects not in collection
+        """
+        return await self._storage_backend.get_many(self._collection_name, object_ids)
+
 
 class SyncCollection:
     """Async collection."""
@@ -120,6 +162,15 @@ class SyncCollection:
     def _run_sync(self, coro: Coroutine) -> Any:
         return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
+    def ensure_index(self, field: str) -> None:
+        """
+        Create index on the object field, if not exists, to speed up find by this field.
+
+        :param field: field name to index: example "parent.field"
+        :return: None
+        """
+        return self._run_sync(self._async_collection.ensure_index(field))
+
     def put(self, object_id: str, object_body: JSON_TYPES) -> None:
         """
         Put object into collection.
@@ -169,6 +220,52 @@ class SyncCollection:
         """
         return self._run_sync(self._async_collection.list())
 
+    def list_page(
+        self, after: Optional[str] = None, limit: int = 100
+    ) -> List[OBJECT_ID_AND_BODY]:
+        """
+        List a page of objects with keys from the collection, ordered by object id.
+
+        :param after: object id the page starts after, None for the first page.
+        :param limit: maximum number of objects in the page.
+        :return: list of object ids and bodies.
+        """
+        return self._run_sync(self._async_collection.list_page(after, limit))
+
+    def iter_list(self, page_size: int = 100) -> Iterator[OBJECT_ID_AND_BODY]:
+        """
+        Iterate over all objects with keys from the collection, reading them by pages.
+
+        :param page_size: number of objects read at once.
+        :yield: object ids and bodies.
+        """
+        after = None
+        while True:
+            page = self.list_page(after, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = page[-1][0]
+
+    def put_many(self, objects: List[OBJECT_ID_AND_BODY]) -> None:
+        """
+        Put many objects into collection.
+
+        :param objects: list of object ids and bodies.
+        :return: None
+        """
+        return self._run_sync(self._async_collection.put_many(objects))
+
+    def get_many(self, object_ids: List[str]) -> List[Optional[JSON_TYPES]]:
+        """
+        Get many objects from the collection.
+
+        :param object_ids: list of object ids.
+
+        :return: list of objects bodies, in the order of the ids, None for the objects not in collection
+        """
+        return self._run_sync(self._async_collection.get_many(object_ids))
+
 
 class Storage(Runnable):
     """Generic storage."""
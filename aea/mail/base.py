@@ -20,7 +20,7 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 from urllib.parse import urlparse
 
 from aea.common import Address
@@ -263,7 +263,15 @@ class Envelope:
 
     default_serializer = DefaultEnvelopeSerializer()
 
-    __slots__ = ("_to", "_sender", "_protocol_specification_id", "_message", "_context")
+    __slots__ = (
+        "_to",
+        "_sender",
+        "_protocol_specification_id",
+        "_message",
+        "_context",
+        "_to_public_id",
+        "_sender_public_id",
+    )
 
     def __init__(
         self,
@@ -296,6 +304,9 @@ class Envelope:
 
         self._to = to
         self._sender = sender
+        # the addresses parsed as public ids, False until parsed
+        self._to_public_id: Union[PublicId, None, bool] = False
+        self._sender_public_id: Union[PublicId, None, bool] = False
 
         enforce(
             self.is_to_public_id == self.is_sender_public_id,
@@ -341,6 +352,7 @@ class Envelope:
         """Set address of receiver."""
         enforce(isinstance(to, str), f"To must be string. Found '{type(to)}'")
         self._to = to
+        self._to_public_id = False
 
     @property
     def sender(self) -> Address:
@@ -354,6 +366,7 @@ class Envelope:
             isinstance(sender, str), f"Sender must be string. Found '{type(sender)}'"
         )
         self._sender = sender
+        self._sender_public_id = False
 
     @property
     def protocol_specification_id(self) -> PublicId:
@@ -385,17 +398,26 @@ class Envelope:
     @property
     def to_as_public_id(self) -> Optional[PublicId]:
         """Get to as public id."""
-        return PublicId.try_from_str(self.to)
+        if self._to_public_id is False:
+            self._to_public_id = PublicId.try_from_str(self._to)
+        return cast("Optional[PublicId]", self._to_public_id)
+
+    @property
+    def sender_as_public_id(self) -> Optional[PublicId]:
+        """Get sender as public id."""
+        if self._sender_public_id is False:
+            self._sender_public_id = PublicId.try_from_str(self._sender)
+        return cast("Optional[PublicId]", self._sender_public_id)
 
     @property
     def is_sender_public_id(self) -> bool:
         """Check if sender is a public id."""
-        return PublicId.is_valid_str(self.sender)
+        return self.sender_as_public_id is not None
 
     @property
     def is_to_public_id(self) -> bool:
         """Check if to is a public id."""
-        return PublicId.is_valid_str(self.to)
+        return self.to_as_public_id is not None
 
     @property
     def is_component_to_component_message(self) -> bool:
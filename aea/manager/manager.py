@@ -45,6 +45,7 @@ from aea.manager.utils import (
     project_install_and_build,
     run_in_venv,
 )
+from aea.skills.tasks import shutdown_warm_pools
 
 
 class ProjectNotFoundError(ValueError):
@@ -565,6 +566,7 @@ class MultiAgentManager:
 
         self._thread = None
         self._warning_message_printed_for_agent = {}
+        shutdown_warm_pools()
         return self
 
     def _cleanup(self, only_data: bool = False) -> None:
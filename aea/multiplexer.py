@@ -18,6 +18,7 @@
 # ------------------------------------------------------------------------------
 """Module for the multiplexer class and related classes."""
 import asyncio
+import logging
 import queue
 import threading
 from asyncio.events import AbstractEventLoop
@@ -45,6 +46,12 @@ from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.async_utils import AsyncState, Runnable, ThreadedAsyncRunner
 from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
+from aea.helpers.metrics import (
+    CounterChild,
+    connection_envelopes_received,
+    connection_envelopes_sent,
+    multiplexer_queue_depth,
+)
 from aea.mail.base import AEAConnectionError, Empty, Envelope, EnvelopeContext
 from aea.protocols.base import Message, Protocol
 
@@ -97,6 +104,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
         default_routing: Optional[Dict[PublicId, PublicId]] = None,
         default_connection: Optional[PublicId] = None,
         protocols: Optional[List[Union[Protocol, Message]]] = None,
+        batch_size: int = 0,
     ) -> None:
         """
         Initialize the connection multiplexer.
@@ -112,8 +120,15 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param default_routing: default routing map
         :param default_connection: default connection
         :param protocols: protocols used
+        :param batch_size: if positive, enable batched dispatch: outgoing envelopes are
+            drained from the out queue and sent per connection in batches of at most
+            batch_size envelopes, and incoming envelopes are received in batches.
         """
         self._exception_policy: ExceptionPolicyEnum = exception_policy
+        self._agent_name = agent_name
+        self._connection_counters = (
+            {}
+        )  # type: Dict[Connection, Tuple[CounterChild, CounterChild]]
         logger = get_logger(__name__, agent_name)
         WithLogger.__init__(self, logger=logger)
         Runnable.__init__(self, loop=loop, threaded=threaded)
@@ -143,6 +158,9 @@ class AsyncMultiplexer(Runnable, WithLogger):
 
         self._default_routing = {}  # type: Dict[PublicId, PublicId]
 
+        enforce(batch_size >= 0, "Batch size must be non-negative.")
+        self._batch_size = batch_size
+
         self._setup(connections or [], default_routing, default_connection)
 
         self._connection_status = MultiplexerStatus()
@@ -198,6 +216,16 @@ class AsyncMultiplexer(Runnable, WithLogger):
         """Set the default routing."""
         self._default_routing = default_routing
 
+    @property
+    def batch_size(self) -> int:
+        """Get the batch size, zero if batched dispatch is disabled."""
+        return self._batch_size
+
+    @property
+    def is_batched(self) -> bool:
+        """Check whether the batched dispatch mode is enabled."""
+        return self._batch_size > 0
+
     @property
     def connection_status(self) -> MultiplexerStatus:
         """Get the connection status."""
@@ -315,8 +343,19 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 else:  # pragma: nocover
                     raise AEAConnectionError("Failed to connect the multiplexer.")
 
-                self._recv_loop_task = self._loop.create_task(self._receiving_loop())
-                self._send_loop_task = self._loop.create_task(self._send_loop())
+                self._set_queue_depth_metrics()
+                if self.is_batched:
+                    self._recv_loop_task = self._loop.create_task(
+                        self._batched_receiving_loop()
+                    )
+                    self._send_loop_task = self._loop.create_task(
+                        self._batched_send_loop()
+                    )
+                else:
+                    self._recv_loop_task = self._loop.create_task(
+                        self._receiving_loop()
+                    )
+                    self._send_loop_task = self._loop.create_task(self._send_loop())
                 self.logger.debug("Multiplexer connected and running.")
             except (CancelledError, asyncio.CancelledError):  # pragma: nocover
                 await self._stop()
@@ -340,6 +379,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 return
             try:
                 self.connection_status.set(ConnectionStates.disconnecting)
+                self._remove_queue_depth_metrics()
                 await asyncio.wait_for(self._stop(), timeout=60)
                 self.logger.debug("Multiplexer disconnected.")
             except CancelledError:  # pragma: nocover
@@ -351,6 +391,39 @@ class AsyncMultiplexer(Runnable, WithLogger):
                     f"Failed to disconnect the multiplexer: Error: {repr(e)}"
                 ) from e
 
+    def _set_queue_depth_metrics(self) -> None:
+        """Expose the depths of the in and out queues in the framework metrics."""
+        multiplexer_queue_depth.set_function(
+            (self._agent_name, "in"), self.in_queue.qsize
+        )
+        multiplexer_queue_depth.set_function(
+            (self._agent_name, "out"), self.out_queue.qsize
+        )
+
+    def _remove_queue_depth_metrics(self) -> None:
+        """Remove the depths of the in and out queues from the framework metrics."""
+        multiplexer_queue_depth.remove((self._agent_name, "in"))
+        multiplexer_queue_depth.remove((self._agent_name, "out"))
+
+    def _get_connection_counters(
+        self, connection: Connection
+    ) -> Tuple[CounterChild, CounterChild]:
+        """
+        Get the counters of the envelopes sent and received with a connection.
+
+        :param connection: the connection.
+        :return: the counters of the envelopes sent and received.
+        """
+        counters = self._connection_counters.get(connection)
+        if counters is None:
+            labels = (self._agent_name, str(connection.connection_id))
+            counters = (
+                connection_envelopes_sent.labels(*labels),
+                connection_envelopes_received.labels(*labels),
+            )
+            self._connection_counters[connection] = counters
+        return counters
+
     async def _stop_receive_send_loops(self) -> None:
         """Stop receive and send loops."""
         self.logger.debug("Stopping receive loop...")
@@ -526,6 +599,7 @@ class AsyncMultiplexer(Runnable, WithLogger):
                     connection = task_to_connection.pop(task)
                     envelope = task.result()
                     if envelope is not None:
+                        self._get_connection_counters(connection)[1].inc()
                         self._update_routing_helper(envelope, connection)
                         self.in_queue.put_nowait(envelope)
 
@@ -546,11 +620,114 @@ class AsyncMultiplexer(Runnable, WithLogger):
                 t.cancel()
             self.logger.debug("Receiving loop terminated.")
 
-    async def _send(self, envelope: Envelope) -> None:
+    async def _batched_send_loop(self) -> None:
         """
-        Send an envelope.
+        Process the outgoing envelopes in batches.
+
+        Every iteration waits for one envelope, then drains the out queue
+        without blocking, up to the batch size, and dispatches the batch.
+        """
+        if not self.is_connected:
+            self.logger.debug(
+                "Sending loop not started. The multiplexer is not connected."
+            )
+            return
+
+        try:
+            while self.is_connected:
+                self.logger.debug("Waiting for outgoing envelopes...")
+                envelope = await self.out_queue.get()
+                if envelope is None:  # pragma: nocover
+                    self.logger.debug(
+                        "Received empty envelope. Quitting the sending loop..."
+                    )
+                    return None
+
+                envelopes = [envelope]
+                stop = False
+                while len(envelopes) < self._batch_size:
+                    try:
+                        envelope = self.out_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if envelope is None:  # pragma: nocover
+                        stop = True
+                        break
+                    envelopes.append(envelope)
+
+                self.logger.debug(f"Sending batch of {len(envelopes)} envelopes")
+                await self._send_batch(envelopes)
+
+                if stop:  # pragma: nocover
+                    self.logger.debug(
+                        "Received empty envelope. Quitting the sending loop..."
+                    )
+                    return None
+
+        except asyncio.CancelledError:
+            self.logger.debug("Sending loop cancelled.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+            self.logger.exception("Error in the sending loop: {}".format(str(e)))
+            raise
+
+    async def _batched_receiving_loop(self) -> None:
+        """
+        Process incoming envelopes in batches.
+
+        A single long-lived task per connection is used, instead of a new task per envelope.
+        """
+        self.logger.debug("Starting batched receiving loop...")
+        tasks = [
+            asyncio.ensure_future(self._receive_from_connection(conn))
+            for conn in self.connections
+        ]
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_EXCEPTION
+                )
+                for task in done:
+                    task.result()
+
+        except asyncio.CancelledError:  # pragma: nocover
+            self.logger.debug("Receiving loop cancelled.")
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.exception("Error in the receiving loop: {}".format(str(e)))
+            raise
+        finally:
+            # cancel all the receiving tasks.
+            for t in tasks:
+                t.cancel()
+            self.logger.debug("Receiving loop terminated.")
+
+    async def _receive_from_connection(self, connection: Connection) -> None:
+        """
+        Receive envelopes from one connection until it, or the multiplexer, disconnects.
+
+        :param connection: the connection to receive from.
+        """
+        while self.connection_status.is_connected and connection.is_connected:
+            if connection.supports_receive_batch:
+                envelopes = await connection.receive_batch(self._batch_size)
+            else:
+                envelope = await connection.receive()
+                envelopes = [envelope] if envelope is not None else []
+
+            self._get_connection_counters(connection)[1].inc(len(envelopes))
+            for envelope in envelopes:
+                self._update_routing_helper(envelope, connection)
+                self.in_queue.put_nowait(envelope)
+
+    def _get_connection_for_envelope(self, envelope: Envelope) -> Optional[Connection]:
+        """
+        Get the connection to send an envelope with.
 
         :param envelope: the envelope to send.
+        :return: the connection, or None if the envelope has to be dropped.
         """
         envelope_protocol_id = self._get_protocol_id_for_envelope(envelope)
         connection_id = self._get_connection_id_from_envelope(
@@ -566,16 +743,67 @@ class AsyncMultiplexer(Runnable, WithLogger):
             self.logger.warning(
                 f"Dropping envelope, no connection available for sending: {envelope}"
             )
-            return
+            return None
 
         if not self._is_connection_supported_protocol(connection, envelope_protocol_id):
+            return None
+
+        return connection
+
+    async def _send(self, envelope: Envelope) -> None:
+        """
+        Send an envelope.
+
+        :param envelope: the envelope to send.
+        """
+        connection = self._get_connection_for_envelope(envelope)
+        if connection is None:
             return
 
         try:
             await asyncio.wait_for(connection.send(envelope), timeout=self.SEND_TIMEOUT)
+            self._get_connection_counters(connection)[0].inc()
         except Exception as e:  # pylint: disable=broad-except
             self._handle_exception(self._send, e)
 
+    async def _send_batch(self, envelopes: List[Envelope]) -> None:
+        """
+        Send a batch of envelopes.
+
+        Envelopes are grouped by connection, keeping their order. Connections that
+        do not implement `send_batch` get one `send` call per envelope.
+
+        :param envelopes: the envelopes to send.
+        """
+        batches: Dict[PublicId, List[Envelope]] = {}
+        for envelope in envelopes:
+            connection = self._get_connection_for_envelope(envelope)
+            if connection is None:
+                continue
+            batches.setdefault(connection.connection_id, []).append(envelope)
+
+        for connection_id, batch in batches.items():
+            connection = self._id_to_connection[connection_id]
+            sent_counter = self._get_connection_counters(connection)[0]
+            if not connection.supports_send_batch:
+                for envelope in batch:
+                    try:
+                        await asyncio.wait_for(
+                            connection.send(envelope), timeout=self.SEND_TIMEOUT
+                        )
+                        sent_counter.inc()
+                    except Exception as e:  # pylint: disable=broad-except
+                        self._handle_exception(self._send_batch, e)
+                continue
+
+            try:
+                await asyncio.wait_for(
+                    connection.send_batch(batch), timeout=self.SEND_TIMEOUT
+                )
+                sent_counter.inc(len(batch))
+            except Exception as e:  # pylint: disable=broad-except
+                self._handle_exception(self._send_batch, e)
+
     def _get_connection_id_from_envelope(
         self, envelope: Envelope, envelope_protocol_id: PublicId
     ) -> Optional[PublicId]:
@@ -594,7 +822,8 @@ class AsyncMultiplexer(Runnable, WithLogger):
         :param envelope_protocol_id: the protocol id of the message contained in the envelope
         :return: public id if found
         """
-        self.logger.debug(f"Routing envelope: {envelope}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Routing envelope: {envelope}")
         # component to component messages are routed by their component id
         if envelope.is_component_to_component_message:
             connection_id = envelope.to_as_public_id
@@ -23,23 +23,30 @@ This module contains the classes required for dialogue management.
 - Dialogue: The dialogue class maintains state of a dialogue and manages it.
 - Dialogues: The dialogues class keeps track of all dialogues.
 """
+import heapq
 import inspect
 import secrets
 import sys
-from collections import defaultdict, namedtuple
+import time
+from array import array
+from collections import OrderedDict, deque, namedtuple
 from enum import Enum
 from inspect import signature
+from itertools import count
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
     Tuple,
     Type,
+    Union,
     cast,
 )
 
@@ -69,6 +76,126 @@ else:
     )
 
 
+class CompactMessageList:
+    """
+    Compact history of the messages of a dialogue in one direction (incoming or outgoing).
+
+    Targets and performatives are kept in arrays, for the dialogue validation.
+    Only the last messages are kept as full objects, the older ones are kept encoded and decoded on access.
+    """
+
+    __slots__ = (
+        "_message_class",
+        "_sender",
+        "_to",
+        "_retained_messages_number",
+        "_performatives",
+        "_performative_codes",
+        "_targets",
+        "_codes",
+        "_encoded_messages",
+        "_messages",
+    )
+
+    def __init__(
+        self,
+        message_class: Type[Message],
+        sender: Address,
+        to: Address,
+        retained_messages_number: int,
+    ) -> None:
+        """
+        Initialize a compact list of messages.
+
+        :param message_class: the message class used
+        :param sender: the sender of the messages
+        :param to: the receiver of the messages
+        :param retained_messages_number: the number of last messages kept as full objects
+        """
+        enforce(
+            retained_messages_number > 0,
+            "Number of retained messages must be positive.",
+        )
+        self._message_class = message_class
+        self._sender = sender
+        self._to = to
+        self._retained_messages_number = retained_messages_number
+        self._performatives = list(message_class.Performative)
+        self._performative_codes = {p: i for i, p in enumerate(self._performatives)}
+        self._targets = array("q")
+        self._codes = array("H")
+        self._encoded_messages: List[bytes] = []
+        self._messages: Deque[Message] = deque()
+
+    def append(self, message: Message) -> None:
+        """
+        Append a message.
+
+        :param message: the message
+        """
+        self._targets.append(message.target)
+        self._codes.append(self._performative_codes[message.performative])
+        self._messages.append(message)
+        if len(self._messages) > self._retained_messages_number:
+            self._encoded_messages.append(self._messages.popleft().encode())
+
+    def get_target(self, index: int) -> int:
+        """
+        Get the target of a message, without decoding it.
+
+        :param index: the message index
+        :return: the message target
+        """
+        return self._targets[index]
+
+    def get_performative(self, index: int) -> Message.Performative:
+        """
+        Get the performative of a message, without decoding it.
+
+        :param index: the message index
+        :return: the message performative
+        """
+        return self._performatives[self._codes[index]]
+
+    def __len__(self) -> int:
+        """Get the number of messages."""
+        return len(self._targets)
+
+    def __getitem__(self, index: int) -> Message:
+        """
+        Get a message, decoding it if it is not retained as a full object.
+
+        :param index: the message index
+        :return: the message
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        encoded_number = len(self._encoded_messages)
+        if index >= encoded_number:
+            return self._messages[index - encoded_number]
+        message = self._message_class.decode(self._encoded_messages[index])
+        message.sender = self._sender
+        message.to = self._to
+        return message
+
+    def __iter__(self) -> Iterator[Message]:
+        """Iterate over the messages."""
+        return (self[index] for index in range(len(self)))
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another list of messages."""
+        if not isinstance(other, (list, CompactMessageList)):
+            return False  # pragma: nocover
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+
+MessageHistory = Union[List[Message], CompactMessageList]
+
+
 class InvalidDialogueMessage(Exception):
     """Exception for adding invalid message to a dialogue."""
 
@@ -246,6 +373,7 @@ class Dialogue(metaclass=_DialogueMeta):
         "_terminal_state_callbacks",
         "_last_message_id",
         "_ordered_message_ids",
+        "_last_activity_time",
     )
 
     class Rules:
@@ -347,8 +475,8 @@ class Dialogue(metaclass=_DialogueMeta):
         self._dialogue_label = dialogue_label
         self._role = role
 
-        self._outgoing_messages = []  # type: List[Message]
-        self._incoming_messages = []  # type: List[Message]
+        self._outgoing_messages = []  # type: MessageHistory
+        self._incoming_messages = []  # type: MessageHistory
 
         enforce(
             issubclass(message_class, Message),
@@ -358,6 +486,44 @@ class Dialogue(metaclass=_DialogueMeta):
         self._terminal_state_callbacks: Set[Callable[["Dialogue"], None]] = set()
         self._last_message_id: Optional[int] = None
         self._ordered_message_ids: List[int] = []
+        self._last_activity_time = time.monotonic()
+
+    @property
+    def last_activity_time(self) -> float:
+        """Get the monotonic time of the creation of the dialogue or of its last message."""
+        return self._last_activity_time
+
+    @property
+    def is_message_history_compact(self) -> bool:
+        """Check whether the message history of the dialogue is compact."""
+        return isinstance(self._outgoing_messages, CompactMessageList)
+
+    def set_compact_message_history(self, retained_messages_number: int) -> None:
+        """
+        Keep a compact message history: only the last messages as full objects, the older ones encoded.
+
+        :param retained_messages_number: the number of last messages kept as full objects, per direction.
+        """
+        histories = []
+        for messages, sender, to in (
+            (
+                self._outgoing_messages,
+                self.self_address,
+                self.dialogue_label.dialogue_opponent_addr,
+            ),
+            (
+                self._incoming_messages,
+                self.dialogue_label.dialogue_opponent_addr,
+                self.self_address,
+            ),
+        ):
+            history = CompactMessageList(
+                self._message_class, sender, to, retained_messages_number
+            )
+            for message in messages:
+                history.append(message)
+            histories.append(history)
+        self._outgoing_messages, self._incoming_messages = histories
 
     def add_terminal_state_callback(self, fn: Callable[["Dialogue"], None]) -> None:
         """
@@ -625,6 +791,7 @@ class Dialogue(metaclass=_DialogueMeta):
 
         self._last_message_id = message.message_id
         self._ordered_message_ids.append(message.message_id)
+        self._last_activity_time = time.monotonic()
 
         if message.performative in self.rules.terminal_performatives:
             for fn in self._terminal_state_callbacks:
@@ -867,14 +1034,13 @@ class Dialogue(metaclass=_DialogueMeta):
             )
 
         # detailed target check
-        target_message = self.get_message_by_id(target)
+        target_performative = self._get_message_performative(target)
 
-        if not target_message:
+        if target_performative is None:
             return "Invalid target {}. target_message can not be found.".format(
                 target
             )  # pragma: nocover
 
-        target_performative = target_message.performative
         if performative not in self.rules.get_valid_replies(target_performative):
             return "Invalid performative. Expected one of {}. Found {}.".format(
                 self.rules.get_valid_replies(target_performative), performative
@@ -900,8 +1066,8 @@ class Dialogue(metaclass=_DialogueMeta):
 
         return None
 
-    def get_message_by_id(self, message_id: int) -> Optional[Message]:
-        """Get message by id, if not presents return None."""
+    def _get_messages_list(self, message_id: int) -> Optional[MessageHistory]:
+        """Get the list of messages holding the message id, if it can be there."""
         if self.is_empty:
             return None
 
@@ -913,14 +1079,28 @@ class Dialogue(metaclass=_DialogueMeta):
         else:
             messages_list = self._incoming_messages
 
-        if len(messages_list) == 0:
+        if abs(message_id) > len(messages_list):
             return None
+        return messages_list
 
-        if abs(message_id) > abs(messages_list[-1].message_id):
+    def get_message_by_id(self, message_id: int) -> Optional[Message]:
+        """Get message by id, if not presents return None."""
+        messages_list = self._get_messages_list(message_id)
+        if messages_list is None:
             return None
-
         return messages_list[abs(message_id) - 1]
 
+    def _get_message_performative(
+        self, message_id: int
+    ) -> Optional[Message.Performative]:
+        """Get performative of the message by id, without decoding it, if not presents return None."""
+        messages_list = self._get_messages_list(message_id)
+        if messages_list is None:
+            return None
+        if isinstance(messages_list, CompactMessageList):
+            return messages_list.get_performative(abs(message_id) - 1)
+        return messages_list[abs(message_id) - 1].performative
+
     def get_outgoing_next_message_id(self) -> int:
         """Get next outgoing message id."""
         next_message_id = Dialogue.STARTING_MESSAGE_ID
@@ -1004,6 +1184,7 @@ class DialogueStats:
         self._other_initiated = {
             e: 0 for e in end_states
         }  # type: Dict[Dialogue.EndState, int]
+        self._expired = 0
 
     @property
     def self_initiated(self) -> Dict[Dialogue.EndState, int]:
@@ -1015,6 +1196,15 @@ class DialogueStats:
         """Get the stats dictionary on other initiated dialogues."""
         return self._other_initiated
 
+    @property
+    def expired(self) -> int:
+        """Get the number of dialogues removed after being idle for longer than the dialogue time to live."""
+        return self._expired
+
+    def add_expired_dialogue(self) -> None:
+        """Count a dialogue removed on expiry."""
+        self._expired += 1
+
     def add_dialogue_endstate(
         self, end_state: Dialogue.EndState, is_self_initiated: bool
     ) -> None:
@@ -1052,17 +1242,19 @@ class BasicDialoguesStorage:
     def __init__(self, dialogues: "Dialogues") -> None:
         """Init dialogues storage."""
         self._dialogues_by_dialogue_label = {}  # type: Dict[DialogueLabel, Dialogue]
-        self._dialogue_by_address = defaultdict(
-            list
-        )  # type: Dict[Address, List[Dialogue]]
+        self._dialogue_by_address = (
+            {}
+        )  # type: Dict[Address, Dict[DialogueLabel, Dialogue]]
         self._incomplete_to_complete_dialogue_labels = (
             {}
         )  # type: Dict[DialogueLabel, DialogueLabel]
         self._dialogues = dialogues
         self._terminal_state_dialogues_labels: Set[DialogueLabel] = set()
+        self._expiry_heap: List[Tuple[float, int, DialogueLabel]] = []
+        self._expiry_counter = count()
 
     @property
-    def dialogues_in_terminal_state(self) -> List["Dialogue"]:
+    def dialogues_in_terminal_state(self) -> Iterable["Dialogue"]:
         """Get all dialogues in terminal state."""
         return list(
             filter(
@@ -1114,9 +1306,62 @@ class BasicDialoguesStorage:
         """
         dialogue.add_terminal_state_callback(self.dialogue_terminal_state_callback)
         self._dialogues_by_dialogue_label[dialogue.dialogue_label] = dialogue
-        self._dialogue_by_address[
-            dialogue.dialogue_label.dialogue_opponent_addr
-        ].append(dialogue)
+        self._dialogue_by_address.setdefault(
+            dialogue.dialogue_label.dialogue_opponent_addr, {}
+        )[dialogue.dialogue_label] = dialogue
+
+        dialogue_ttl = self._dialogues.dialogue_ttl
+        if dialogue_ttl is not None:
+            self._schedule_expiry(
+                dialogue.dialogue_label, dialogue.last_activity_time + dialogue_ttl
+            )
+
+    def _schedule_expiry(self, dialogue_label: DialogueLabel, deadline: float) -> None:
+        """
+        Schedule the expiry check of a dialogue.
+
+        :param dialogue_label: label of the dialogue
+        :param deadline: monotonic time the dialogue expires at if it stays idle
+        """
+        heapq.heappush(
+            self._expiry_heap, (deadline, next(self._expiry_counter), dialogue_label)
+        )
+
+    def pop_expired_dialogues(self, now: float) -> List[Dialogue]:
+        """
+        Remove the active dialogues idle for longer than the dialogue time to live.
+
+        Expiry checks are kept in a heap ordered by deadline, so only the dialogues due are visited.
+        Dialogues updated since their check was scheduled are rescheduled,
+        removed and terminal state ones are dropped from the heap.
+
+        :param now: the current monotonic time
+        :return: the expired dialogues
+        """
+        expired = []  # type: List[Dialogue]
+        dialogue_ttl = self._dialogues.dialogue_ttl
+        if dialogue_ttl is None:
+            self._expiry_heap.clear()
+            return expired
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, _, dialogue_label = heapq.heappop(self._expiry_heap)
+            dialogue = self._dialogues_by_dialogue_label.get(dialogue_label)
+            if (
+                dialogue is None
+                or dialogue_label in self._terminal_state_dialogues_labels
+            ):
+                continue
+            deadline = dialogue.last_activity_time + dialogue_ttl
+            if deadline > now:
+                self._schedule_expiry(dialogue_label, deadline)
+                continue
+            self.remove(dialogue_label)
+            self._incomplete_to_complete_dialogue_labels.pop(
+                dialogue.incomplete_dialogue_label, None
+            )
+            expired.append(dialogue)
+        return expired
 
     def _add_terminal_state_dialogue(self, dialogue: Dialogue) -> None:
         """
@@ -1141,9 +1386,21 @@ class BasicDialoguesStorage:
             self._terminal_state_dialogues_labels.remove(dialogue_label)
 
         if dialogue:
-            self._dialogue_by_address[dialogue_label.dialogue_opponent_addr].remove(
-                dialogue
-            )
+            self._remove_from_dialogues_by_address(dialogue_label)
+
+    def _remove_from_dialogues_by_address(self, dialogue_label: DialogueLabel) -> None:
+        """
+        Remove dialogue from the counterparty index, dropping the counterparty once it has no dialogues.
+
+        :param dialogue_label: label of the dialogue to remove
+        """
+        counterparty = dialogue_label.dialogue_opponent_addr
+        dialogues = self._dialogue_by_address.get(counterparty)
+        if dialogues is None:  # pragma: nocover
+            return
+        dialogues.pop(dialogue_label, None)
+        if not dialogues:
+            del self._dialogue_by_address[counterparty]
 
     def get(self, dialogue_label: DialogueLabel) -> Optional[Dialogue]:
         """
@@ -1161,7 +1418,7 @@ class BasicDialoguesStorage:
         :param counterparty: the counterparty
         :return: The dialogues with the counterparty.
         """
-        return self._dialogue_by_address.get(counterparty, [])
+        return list(self._dialogue_by_address.get(counterparty, {}).values())
 
     def is_in_incomplete(self, dialogue_label: DialogueLabel) -> bool:
         """Check dialogue label presents in list of incomplete."""
@@ -1197,6 +1454,8 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
 
     INCOMPLETE_DIALOGUES_OBJECT_NAME = "incomplete_dialogues"
     TERMINAL_STATE_DIALOGUES_COLLECTTION_SUFFIX = "_terminal"
+    # number of stored dialogues read at once from the storage
+    DIALOGUES_PAGE_SIZE = 100
 
     def __init__(self, dialogues: "Dialogues") -> None:
         """Init dialogues storage."""
@@ -1262,9 +1521,14 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
             self.dialogues_in_active_state, self._active_dialogues_collection
         )
         self._dump_dialogues(
-            self.dialogues_in_terminal_state, self._terminal_dialogues_collection
+            self._get_terminal_state_dialogues_to_dump(),
+            self._terminal_dialogues_collection,
         )
 
+    def _get_terminal_state_dialogues_to_dump(self) -> Iterable[Dialogue]:
+        """Get the dialogues in terminal state to dump to the generic storage."""
+        return self.dialogues_in_terminal_state
+
     def _dump_incomplete_dialogues_labels(self, collection: SyncCollection) -> None:
         """Dump incomplete labels."""
         collection.put(
@@ -1285,16 +1549,21 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
         """Load dialogues from collection."""
         if not collection:  # pragma: nocover
             return
-        for label, dialogue_data in collection.list():
+        for label, dialogue_data in collection.iter_list(self.DIALOGUES_PAGE_SIZE):
             if label == self.INCOMPLETE_DIALOGUES_OBJECT_NAME:
                 continue
             dialogue_data = cast(Dict, dialogue_data)
             yield self._dialogue_from_json(dialogue_data)
 
     def _dialogue_from_json(self, dialogue_data: dict) -> "Dialogue":
-        return self._dialogues.dialogue_class.from_json(
+        dialogue = self._dialogues.dialogue_class.from_json(
             self._dialogues.message_class, dialogue_data
         )
+        if self._dialogues.compact_message_history_size is not None:
+            dialogue.set_compact_message_history(
+                self._dialogues.compact_message_history_size
+            )
+        return dialogue
 
     @staticmethod
     def _dump_dialogues(
@@ -1365,7 +1634,52 @@ class PersistDialoguesStorage(BasicDialoguesStorage):
 
 
 class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
-    """Dialogue Storage with dialogues offloading."""
+    """
+    Dialogue Storage with dialogues offloading.
+
+    Dialogues in terminal state loaded back from the generic storage are kept in a bounded LRU cache.
+    """
+
+    DIALOGUE_OPPONENT_ADDR_FIELD = "dialogue_label.dialogue_opponent_addr"
+
+    def __init__(self, dialogues: "Dialogues") -> None:
+        """Init dialogues storage."""
+        super().__init__(dialogues)
+        self._terminal_dialogues_cache: "OrderedDict[DialogueLabel, Dialogue]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Get the statistics of the cache of dialogues loaded from the generic storage."""
+        return {
+            "size": len(self._terminal_dialogues_cache),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+        }
+
+    def _cache_terminal_state_dialogue(self, dialogue: Dialogue) -> None:
+        """
+        Add dialogue loaded from the generic storage to the cache, evicting the least recently used ones.
+
+        :param dialogue: dialogue to cache.
+        """
+        max_size = self._dialogues.terminal_dialogues_cache_size
+        if max_size <= 0:
+            return
+        self._terminal_dialogues_cache[dialogue.dialogue_label] = dialogue
+        while len(self._terminal_dialogues_cache) > max_size:
+            self._terminal_dialogues_cache.popitem(last=False)
+            self._cache_evictions += 1
+
+    def _get_collection_instance(self, col_name: str) -> Optional[SyncCollection]:
+        """Get sync collection if generic storage available, indexed by dialogue opponent address."""
+        collection = super()._get_collection_instance(col_name)
+        if collection is not None:
+            collection.ensure_index(self.DIALOGUE_OPPONENT_ADDR_FIELD)
+        return collection
 
     def dialogue_terminal_state_callback(self, dialogue: "Dialogue") -> None:
         """Call on dialogue reaches terminal state."""
@@ -1385,20 +1699,35 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
         self.remove(dialogue.dialogue_label)
 
     def get(self, dialogue_label: DialogueLabel) -> Optional[Dialogue]:
-        """Try to get dialogue by label from memory or persists storage."""
+        """Try to get dialogue by label from memory, cache or persists storage."""
         dialogue = super().get(dialogue_label)
         if dialogue:
             return dialogue
 
+        dialogue = self._terminal_dialogues_cache.get(dialogue_label)
+        if dialogue:
+            self._terminal_dialogues_cache.move_to_end(dialogue_label)
+            self._cache_hits += 1
+            return dialogue
+
+        self._cache_misses += 1
         dialogue = self._get_dialogue_from_collection(
             dialogue_label, self._terminal_dialogues_collection
         )
         if dialogue:
             # get dialogue from terminal state collection and cache it
-            self._add_terminal_state_dialogue(dialogue)
+            self._cache_terminal_state_dialogue(dialogue)
             return dialogue
         return None
 
+    def remove(self, dialogue_label: DialogueLabel) -> None:
+        """Remove dialogue from memory, cache and persistent storage."""
+        if self._terminal_dialogues_cache.pop(dialogue_label, None) is not None:
+            if self._terminal_dialogues_collection:
+                self._terminal_dialogues_collection.remove(str(dialogue_label))
+            return
+        super().remove(dialogue_label)
+
     def _get_dialogue_from_collection(
         self, dialogue_label: "DialogueLabel", collection: SyncCollection
     ) -> Optional[Dialogue]:
@@ -1435,10 +1764,18 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
             return []
 
         return [
-            self._dialogue_from_json(cast(Dict, i[1]))
-            for i in collection.find("dialogue_label.dialogue_opponent_addr", address)
+            self._cached_dialogue_from_json(cast(Dict, i[1]))
+            for i in collection.find(self.DIALOGUE_OPPONENT_ADDR_FIELD, address)
         ]
 
+    def _cached_dialogue_from_json(self, dialogue_data: dict) -> "Dialogue":
+        """Get the cached dialogue instance, if any, or a new one from json."""
+        dialogue_label = DialogueLabel.from_json(dialogue_data["dialogue_label"])
+        dialogue = self._terminal_dialogues_cache.get(dialogue_label)
+        if dialogue:
+            return dialogue
+        return self._dialogue_from_json(dialogue_data)
+
     def get_dialogues_with_counterparty(self, counterparty: Address) -> List[Dialogue]:
         """
         Get the dialogues by address.
@@ -1465,18 +1802,41 @@ class PersistDialoguesStorageWithOffloading(PersistDialoguesStorage):
         )
 
     @property
-    def dialogues_in_terminal_state(self) -> List["Dialogue"]:
-        """Get all dialogues in terminal state."""
-        dialogues = super().dialogues_in_terminal_state + list(
-            self._load_dialogues(self._terminal_dialogues_collection)
+    def dialogues_in_terminal_state(self) -> Iterator["Dialogue"]:
+        """Get all dialogues in terminal state, lazily loading the offloaded ones from the generic storage."""
+        return self._iter_dialogues_in_terminal_state()
+
+    def _iter_dialogues_in_terminal_state(self) -> Iterator["Dialogue"]:
+        """Iterate over dialogues in terminal state in memory, then over the offloaded ones."""
+        labels = set()
+        for dialogue in super().dialogues_in_terminal_state:
+            labels.add(dialogue.dialogue_label)
+            yield dialogue
+
+        collection = self._terminal_dialogues_collection
+        if not collection:  # pragma: nocover
+            return
+        for label, dialogue_data in collection.iter_list(self.DIALOGUES_PAGE_SIZE):
+            if label == self.INCOMPLETE_DIALOGUES_OBJECT_NAME:
+                continue  # pragma: nocover
+            dialogue = self._cached_dialogue_from_json(cast(Dict, dialogue_data))
+            if dialogue.dialogue_label not in labels:
+                yield dialogue
+
+    def _get_terminal_state_dialogues_to_dump(self) -> Iterable[Dialogue]:
+        """Get the dialogues in terminal state in memory or cached, the offloaded ones are already stored."""
+        return list(super().dialogues_in_terminal_state) + list(
+            self._terminal_dialogues_cache.values()
         )
-        return self._unique_dialogues_by_label(dialogues)
 
 
 class Dialogues:
     """The dialogues class keeps track of all dialogues for an agent."""
 
     _keep_terminal_state_dialogues = False
+    _terminal_dialogues_cache_size = 1000
+    _compact_message_history_size: Optional[int] = None
+    _dialogue_ttl: Optional[float] = None
 
     def __init__(
         self,
@@ -1501,6 +1861,7 @@ class Dialogues:
         self._dialogues_storage = PersistDialoguesStorageWithOffloading(self)
         self._self_address = self_address
         self._dialogue_stats = DialogueStats(end_states)
+        self._expiry_callbacks: Set[Callable[[Dialogue], None]] = set()
 
         if keep_terminal_state_dialogues is not None:
             self._keep_terminal_state_dialogues = keep_terminal_state_dialogues
@@ -1556,6 +1917,21 @@ class Dialogues:
         """Is required to keep dialogues in terminal state."""
         return self._keep_terminal_state_dialogues
 
+    @property
+    def terminal_dialogues_cache_size(self) -> int:
+        """Get the maximum number of offloaded dialogues in terminal state cached in memory when loaded back."""
+        return self._terminal_dialogues_cache_size
+
+    @property
+    def compact_message_history_size(self) -> Optional[int]:
+        """Get the number of last messages kept as full objects by dialogues with compact history, None for full history."""
+        return self._compact_message_history_size
+
+    @property
+    def dialogue_ttl(self) -> Optional[float]:
+        """Get the number of seconds after which idle dialogues not in terminal state expire, None for no expiry."""
+        return self._dialogue_ttl
+
     @property
     def self_address(self) -> Address:
         """Get the address of the agent for whom dialogues are maintained."""
@@ -1598,6 +1974,33 @@ class Dialogues:
         """
         return self._dialogues_storage.get_dialogues_with_counterparty(counterparty)
 
+    def add_expiry_callback(self, fn: Callable[[Dialogue], None]) -> None:
+        """
+        Add callback to be called with each dialogue removed on expiry.
+
+        :param fn: callback function to be called with the expired dialogue
+        """
+        self._expiry_callbacks.add(fn)
+
+    def expire_dialogues(self, now: Optional[float] = None) -> List[Dialogue]:
+        """
+        Remove the dialogues not in terminal state which are idle for longer than the dialogue time to live.
+
+        This is done on every dialogue update and creation, it can also be called periodically by the skill.
+
+        :param now: the current monotonic time, defaults to time.monotonic()
+        :return: the expired dialogues
+        """
+        if self._dialogue_ttl is None:
+            return []
+        now = time.monotonic() if now is None else now
+        expired = self._dialogues_storage.pop_expired_dialogues(now)
+        for dialogue in expired:
+            self._dialogue_stats.add_expired_dialogue()
+            for fn in self._expiry_callbacks:
+                fn(dialogue)
+        return expired
+
     def _is_message_by_self(self, message: Message) -> bool:
         """
         Check whether the message is by this agent or not.
@@ -1738,6 +2141,7 @@ class Dialogues:
             f"Message to and dialogue self address do not match. Got 'to={message.to}' expected 'to={self.self_address}'.",
         )
 
+        self.expire_dialogues()
         dialogue_reference = message.dialogue_reference
 
         is_invalid_label = (
@@ -1905,6 +2309,7 @@ class Dialogues:
             and dialogue_reference[1] == Dialogue.UNASSIGNED_DIALOGUE_REFERENCE,
             "Cannot initiate dialogue with preassigned dialogue_responder_reference!",
         )
+        self.expire_dialogues()
         incomplete_dialogue_label = DialogueLabel(
             dialogue_reference, dialogue_opponent_addr, self.self_address
         )
@@ -1982,6 +2387,8 @@ class Dialogues:
             self_address=self.self_address,
             role=role,
         )
+        if self.compact_message_history_size is not None:
+            dialogue.set_compact_message_history(self.compact_message_history_size)
         self._dialogues_storage.add(dialogue)
         return dialogue
 
@@ -499,7 +499,7 @@ class ComponentRegistry(
 class HandlerRegistry(ComponentRegistry[Handler]):
     """This class implements the handlers registry."""
 
-    __slots__ = ("_items_by_protocol_and_skill",)
+    __slots__ = ("_items_by_protocol_and_skill", "_version")
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -512,6 +512,12 @@ class HandlerRegistry(ComponentRegistry[Handler]):
         self._items_by_protocol_and_skill = PublicIdRegistry[
             PublicIdRegistry[Handler]
         ]()
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Get the version of the registry, incremented every time handlers are registered or unregistered."""
+        return self._version
 
     def register(
         self,
@@ -556,6 +562,7 @@ class HandlerRegistry(ComponentRegistry[Handler]):
         registry = cast(Registry, self._items_by_protocol_and_skill.fetch(protocol_id))
         registry.register(skill_id, item)
         super().register(item_id, item, is_dynamically_added=is_dynamically_added)
+        self._version += 1
 
     def unregister(self, item_id: Tuple[PublicId, str]) -> Handler:
         """
@@ -576,6 +583,7 @@ class HandlerRegistry(ComponentRegistry[Handler]):
         protocol_handlers_by_skill.unregister(skill_id)
         if len(protocol_handlers_by_skill.ids()) == 0:
             self._items_by_protocol_and_skill.unregister(protocol_id)
+        self._version += 1
         return handler
 
     def unregister_by_skill(self, skill_id: PublicId) -> None:
@@ -600,6 +608,7 @@ class HandlerRegistry(ComponentRegistry[Handler]):
                     self._items_by_protocol_and_skill.fetch(protocol_id),
                 )
                 skill_id_to_handler.unregister(skill_id)
+        self._version += 1
 
     def fetch_by_protocol(self, protocol_id: PublicId) -> List[Handler]:
         """
@@ -18,14 +18,14 @@
 # ------------------------------------------------------------------------------
 """This module contains registries."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from aea.configurations.base import PublicId
 from aea.helpers.async_friendly_queue import AsyncFriendlyQueue
 from aea.helpers.logging import WithLogger, get_logger
 from aea.protocols.base import Message
 from aea.registries.resources import Resources
-from aea.skills.base import Behaviour, Handler
+from aea.skills.base import Behaviour, Handler, SkillContext
 
 
 class Filter(WithLogger):
@@ -44,6 +44,9 @@ class Filter(WithLogger):
         WithLogger.__init__(self, logger=logger)
         self._resources = resources
         self._decision_maker_out_queue = decision_maker_out_queue
+        self._active_handlers_by_protocol: Dict[PublicId, List[Handler]] = {}
+        self._active_handlers_key: Optional[Tuple[int, int]] = None
+        self._active_handlers_rebuilds = 0
 
     @property
     def resources(self) -> Resources:
@@ -55,6 +58,41 @@ class Filter(WithLogger):
         """Get decision maker (out) queue."""
         return self._decision_maker_out_queue
 
+    @property
+    def active_handlers_rebuilds(self) -> int:
+        """Get the number of times the table of active handlers by protocol was rebuilt."""
+        return self._active_handlers_rebuilds
+
+    def _get_active_handlers_by_protocol(self) -> Dict[PublicId, List[Handler]]:
+        """
+        Get the table of active handlers by protocol.
+
+        The table is rebuilt only when handlers are registered or unregistered, or a skill is (de)activated.
+
+        :return: the active handlers by protocol id
+        """
+        key = (
+            self.resources.handler_registry.version,
+            SkillContext._is_active_version,  # pylint: disable=protected-access
+        )
+        if key != self._active_handlers_key:
+            protocol_ids = {
+                handler.SUPPORTED_PROTOCOL
+                for handler in self.resources.get_all_handlers()
+            }
+            self._active_handlers_by_protocol = {
+                protocol_id: [
+                    handler
+                    for handler in self.resources.get_handlers(protocol_id)
+                    if handler.context.is_active
+                ]
+                for protocol_id in protocol_ids
+                if protocol_id is not None
+            }
+            self._active_handlers_key = key
+            self._active_handlers_rebuilds += 1
+        return self._active_handlers_by_protocol
+
     def get_active_handlers(
         self, protocol_id: PublicId, skill_id: Optional[PublicId] = None
     ) -> List[Handler]:
@@ -71,9 +109,9 @@ class Filter(WithLogger):
                 [] if handler is None or not handler.context.is_active else [handler]
             )
         else:
-            handlers = self.resources.get_handlers(protocol_id)
+            # a copy, so that the callers cannot change the cached handlers
             active_handlers = list(
-                filter(lambda handler: handler.context.is_active, handlers)
+                self._get_active_handlers_by_protocol().get(protocol_id, [])
             )
         return active_handlers
 
@@ -22,7 +22,7 @@ from asyncio.events import AbstractEventLoop
 from concurrent.futures._base import CancelledError
 from contextlib import suppress
 from enum import Enum
-from typing import Dict, Optional, Type, cast
+from typing import Any, Dict, Optional, Type, cast
 
 from aea.abstract_agent import AbstractAgent
 from aea.agent_loop import (
@@ -40,7 +40,12 @@ from aea.helpers.exception_policy import ExceptionPolicyEnum
 from aea.helpers.logging import WithLogger, get_logger
 from aea.helpers.storage.generic_storage import Storage
 from aea.multiplexer import AsyncMultiplexer
-from aea.skills.tasks import ProcessTaskManager, TaskManager, ThreadedTaskManager
+from aea.skills.tasks import (
+    ProcessTaskManager,
+    TaskManager,
+    ThreadedTaskManager,
+    WarmProcessTaskManager,
+)
 
 
 class RuntimeStates(Enum):
@@ -62,7 +67,11 @@ class BaseRuntime(Runnable, WithLogger):
     }
     DEFAULT_RUN_LOOP: str = "async"
 
-    TASKMANAGERS = {"threaded": ThreadedTaskManager, "multiprocess": ProcessTaskManager}
+    TASKMANAGERS = {
+        "threaded": ThreadedTaskManager,
+        "multiprocess": ProcessTaskManager,
+        "multiprocess_warm": WarmProcessTaskManager,
+    }
     DEFAULT_TASKMANAGER = "threaded"
 
     def __init__(
@@ -73,6 +82,7 @@ class BaseRuntime(Runnable, WithLogger):
         loop: Optional[AbstractEventLoop] = None,
         threaded: bool = False,
         task_manager_mode: Optional[str] = None,
+        task_manager_options: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Init runtime.
@@ -83,6 +93,7 @@ class BaseRuntime(Runnable, WithLogger):
         :param loop: optional event loop. if not provided a new one will be created.
         :param threaded: if True, run in threaded mode, else async
         :param task_manager_mode: mode of the task manager.
+        :param task_manager_options: keyword arguments of the task manager.
         """
         Runnable.__init__(self, threaded=threaded, loop=loop if not threaded else None)
         logger = get_logger(__name__, agent.name)
@@ -95,6 +106,7 @@ class BaseRuntime(Runnable, WithLogger):
             multiplexer_options
         )
         self._task_manager_mode = task_manager_mode or self.DEFAULT_TASKMANAGER
+        self._task_manager_options = task_manager_options or {}
         self._task_manager = self._get_taskmanager_instance()
         self._decision_maker: Optional[DecisionMaker] = None
         self._storage: Optional[Storage] = self._get_storage(agent)
@@ -113,7 +125,7 @@ class BaseRuntime(Runnable, WithLogger):
                 f"Task manager mode `{self._task_manager_mode} is not supported. valid are: `{list(self.TASKMANAGERS.keys())}`"
             )
         cls = self.TASKMANAGERS[self._task_manager_mode]
-        return cls()
+        return cls(**self._task_manager_options)
 
     def _get_multiplexer_instance(
         self, multiplexer_options: Dict, threaded: bool = False
@@ -133,6 +145,7 @@ class BaseRuntime(Runnable, WithLogger):
             default_routing=multiplexer_options.get("default_routing"),
             default_connection=multiplexer_options.get("default_connection"),
             protocols=multiplexer_options.get("protocols", []),
+            batch_size=multiplexer_options.get("batch_size", 0),
         )
 
     @staticmethod
@@ -270,6 +283,7 @@ class AsyncRuntime(BaseRuntime):
         loop: Optional[AbstractEventLoop] = None,
         threaded: bool = False,
         task_manager_mode: Optional[str] = None,
+        task_manager_options: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Init runtime.
@@ -280,6 +294,7 @@ class AsyncRuntime(BaseRuntime):
         :param loop: optional event loop. if not provided a new one will be created.
         :param threaded: if True, run in threaded mode, else async
         :param task_manager_mode: mode of the task manager.
+        :param task_manager_options: keyword arguments of the task manager.
         """
         super().__init__(
             agent=agent,
@@ -288,6 +303,7 @@ class AsyncRuntime(BaseRuntime):
             loop=loop,
             threaded=threaded,
             task_manager_mode=task_manager_mode,
+            task_manager_options=task_manager_options,
         )
         self._task: Optional[asyncio.Task] = None
 
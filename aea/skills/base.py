@@ -18,12 +18,17 @@
 # ------------------------------------------------------------------------------
 """This module contains the base classes for the skills."""
 import datetime
+import hashlib
 import inspect
 import logging
+import os
 import queue
 import re
+import threading
+import time
 import types
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import copy
 from logging import Logger
 from pathlib import Path
@@ -52,6 +57,12 @@ from aea.exceptions import (
 )
 from aea.helpers.base import _get_aea_logger_name_prefix, load_module
 from aea.helpers.logging import AgentLoggerAdapter
+from aea.helpers.metrics import (
+    Histogram,
+    HistogramChild,
+    behaviour_latency,
+    handler_latency,
+)
 from aea.helpers.storage.generic_storage import Storage
 from aea.mail.base import Envelope, EnvelopeContext
 from aea.multiplexer import MultiplexerStatus, OutBox
@@ -61,10 +72,58 @@ from aea.skills.tasks import TaskManager
 
 _default_logger = logging.getLogger(__name__)
 
+SKILL_MODULE_CACHE_SIZE = 1024
+# set to "1" or "true" to share the skill modules between the agents built in the process
+SHARE_SKILL_MODULES_ENV = "AEA_SHARE_SKILL_MODULES"
+
+# the skill modules loaded, by dotted path, file path and file content hash,
+# shared by the agents built in the process when enabled with SHARE_SKILL_MODULES_ENV.
+_SkillModuleCacheKey = Tuple[str, str, bytes]
+_skill_module_cache: "OrderedDict[_SkillModuleCacheKey, types.ModuleType]" = OrderedDict()
+_skill_module_cache_lock = threading.Lock()
+
+
+def _load_skill_module(dotted_path: str, filepath: Path) -> types.ModuleType:
+    """
+    Load a skill module.
+
+    By default every skill loaded gets its own module objects, so the module and class
+    level state of a skill is not shared between agents. When sharing is enabled with
+    the SHARE_SKILL_MODULES_ENV environment variable, a module is taken from the cache
+    if its content did not change, so its module and class level state is shared by
+    the agents built in the process: only enable it for skills which keep their state
+    in the skill components or the skill context.
+
+    :param dotted_path: the dotted path of the module.
+    :param filepath: the file of the module.
+    :return: the module
+    """
+    if os.environ.get(SHARE_SKILL_MODULES_ENV, "").lower() not in ("1", "true"):
+        return load_module(dotted_path, filepath)
+    key = (
+        dotted_path,
+        str(filepath.absolute()),
+        hashlib.sha256(filepath.read_bytes()).digest(),
+    )
+    with _skill_module_cache_lock:
+        module = _skill_module_cache.get(key)
+        if module is not None:
+            _skill_module_cache.move_to_end(key)
+            return module
+    module = load_module(dotted_path, filepath)
+    with _skill_module_cache_lock:
+        _skill_module_cache[key] = module
+        if len(_skill_module_cache) > SKILL_MODULE_CACHE_SIZE:
+            _skill_module_cache.popitem(last=False)
+    return module
+
 
 class SkillContext:
     """This class implements the context of a skill."""
 
+    # incremented on every change of the active status of any skill
+    _is_active_version = 0
+
     def __init__(
         self,
         agent_context: Optional[AgentContext] = None,
@@ -132,6 +191,8 @@ class SkillContext:
     @is_active.setter
     def is_active(self, value: bool) -> None:
         """Set the status of the skill (active/not active)."""
+        if value != self._is_active:
+            SkillContext._is_active_version += 1
         self._is_active = value
         self.logger.debug(
             "New status of skill {}: is_active={}".format(
@@ -286,6 +347,8 @@ class SkillContext:
 class SkillComponent(ABC):
     """This class defines an abstract interface for skill component classes."""
 
+    _latency_metric: Optional[HistogramChild] = None
+
     def __init__(
         self,
         name: str,
@@ -321,6 +384,22 @@ class SkillComponent(ABC):
         """Get the name of the skill component."""
         return self._name
 
+    def _observe_latency(self, metric: Histogram, latency: float) -> None:
+        """
+        Record the latency of a call of the component in the framework metrics.
+
+        :param metric: the latency histogram.
+        :param latency: the latency in seconds.
+        """
+        if self._latency_metric is None:
+            try:
+                labels = (str(self.context.agent_name), str(self.skill_id), self.name)
+            except (ValueError, AttributeError):
+                # the skill context is not set up
+                return
+            self._latency_metric = metric.labels(*labels)
+        self._latency_metric.observe(latency)
+
     @property
     def context(self) -> SkillContext:
         """Get the context of the skill component."""
@@ -418,6 +497,7 @@ class Behaviour(AbstractBehaviour, ABC):
 
     def act_wrapper(self) -> None:
         """Wrap the call of the action. This method must be called only by the framework."""
+        start_time = time.perf_counter()
         try:
             self.act()
         except _StopRuntime:
@@ -427,6 +507,8 @@ class Behaviour(AbstractBehaviour, ABC):
             raise AEAActException(
                 f"An error occurred during act of behaviour {self.context.skill_id}/{type(self).__name__}:\n{e_str}"
             )
+        finally:
+            self._observe_latency(behaviour_latency, time.perf_counter() - start_time)
 
     @classmethod
     def parse_module(  # pylint: disable=arguments-differ
@@ -477,6 +559,7 @@ class Handler(SkillComponent, ABC):
 
     def handle_wrapper(self, message: Message) -> None:
         """Wrap the call of the handler. This method must be called only by the framework."""
+        start_time = time.perf_counter()
         try:
             self.handle(message)
         except _StopRuntime:
@@ -486,6 +569,8 @@ class Handler(SkillComponent, ABC):
             raise AEAHandleException(
                 f"An error occurred during handle of handler {self.context.skill_id}/{type(self).__name__}:\n{e_str}"
             )
+        finally:
+            self._observe_latency(handler_latency, time.perf_counter() - start_time)
 
     @classmethod
     def parse_module(  # pylint: disable=arguments-differ
@@ -508,12 +593,19 @@ class Handler(SkillComponent, ABC):
 class Model(SkillComponent, ABC):
     """This class implements an abstract model."""
 
+    # set on the dialogues mixed into models, typed as in the Dialogues class
+    _compact_message_history_size: Optional[int]
+    _dialogue_ttl: Optional[float]
+
     def __init__(
         self,
         name: str,
         skill_context: SkillContext,
         configuration: Optional[SkillComponentConfiguration] = None,
         keep_terminal_state_dialogues: Optional[bool] = None,
+        terminal_dialogues_cache_size: Optional[int] = None,
+        compact_message_history_size: Optional[int] = None,
+        dialogue_ttl: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -523,6 +615,9 @@ class Model(SkillComponent, ABC):
         :param configuration: the configuration for the component.
         :param skill_context: the skill context.
         :param keep_terminal_state_dialogues: specify do dialogues in terminal state should stay or not
+        :param terminal_dialogues_cache_size: maximum number of offloaded dialogues in terminal state cached when loaded back
+        :param compact_message_history_size: number of last messages kept as full objects by dialogues, to enable compact message history
+        :param dialogue_ttl: seconds after which idle dialogues not in terminal state are removed
         :param kwargs: the keyword arguments.
         """
         super().__init__(name, skill_context, configuration=configuration, **kwargs)
@@ -530,6 +625,12 @@ class Model(SkillComponent, ABC):
         # used by dialogues if mixed with the Model
         if keep_terminal_state_dialogues is not None:
             self._keep_terminal_state_dialogues = keep_terminal_state_dialogues
+        if terminal_dialogues_cache_size is not None:
+            self._terminal_dialogues_cache_size = terminal_dialogues_cache_size
+        if compact_message_history_size is not None:
+            self._compact_message_history_size = compact_message_history_size
+        if dialogue_ttl is not None:
+            self._dialogue_ttl = dialogue_ttl
 
     def setup(self) -> None:
         """Set the class up."""
@@ -939,7 +1040,7 @@ class _SkillComponentLoader:
         for module_path in module_paths:
             self.skill_context.logger.debug(f"Trying to load module {module_path}")
             module_dotted_path: str = self._compute_module_dotted_path(module_path)
-            component_module: types.ModuleType = load_module(
+            component_module: types.ModuleType = _load_skill_module(
                 module_dotted_path, self.skill_directory / module_path
             )
             classes: List[Tuple[str, Type]] = inspect.getmembers(
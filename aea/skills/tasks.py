@@ -17,20 +17,60 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the classes for tasks."""
+import asyncio
+import importlib
+import json
 import logging
+import multiprocessing
+import os
+import queue
 import signal
+import sys
 import threading
+import time
 from abc import abstractmethod
+from collections import deque
+from functools import partial
 from multiprocessing.pool import AsyncResult, Pool, ThreadPool
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    cast,
+)
 
 from aea.components.utils import _enlist_component_packages, _populate_packages
 from aea.helpers.logging import WithLogger
 
 
+try:
+    from multiprocessing import resource_tracker  # type: ignore
+    from multiprocessing.shared_memory import SharedMemory  # type: ignore
+except ImportError:  # pragma: nocover
+    SharedMemory = None  # python < 3.8
+
+
 THREAD_POOL_MODE = "multithread"
 PROCESS_POOL_MODE = "multiprocess"
 DEFAULT_WORKERS_AMOUNT = 2
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1024 * 1024
+PRELOAD_PACKAGES_ENV = "AEA_TASK_MANAGER_PRELOAD_PACKAGES"
+# seconds a stopping task manager waits for its tasks to complete before keeping its pool warm
+WARM_POOL_DRAIN_TIMEOUT = 5.0
+# seconds an idle pool is kept warm, and maximum number of idle pools kept warm
+WARM_POOL_IDLE_TIMEOUT = 300.0
+MAX_WARM_POOLS = 4
+
+# idle process pools kept warm with their timings sink and the time they were parked,
+# by start method, number of workers and packages loaded
+_warm_pools = {}  # type: Dict[Tuple, List[Tuple[Pool, Any, float]]]
+_warm_pools_lock = threading.Lock()
 
 
 class Task(WithLogger):
@@ -117,7 +157,14 @@ def init_worker() -> None:  # pragma: nocover
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
 
-def _init_worker(mode: str, packages: Dict[str, List[Dict[str, str]]]) -> None:
+_worker_timings_sink: Optional[Any] = None
+
+
+def _init_worker(
+    mode: str,
+    packages: Dict[str, List[Dict[str, str]]],
+    timings_sink: Optional[Any] = None,
+) -> None:
     """
     Initialize a worker.
 
@@ -126,10 +173,210 @@ def _init_worker(mode: str, packages: Dict[str, List[Dict[str, str]]]) -> None:
 
     :param mode: str. mode task manager runs in
     :param packages: dict with list of packages to load if needed
+    :param timings_sink: queue to put the timings of the tasks executed by a worker process
     """
     if mode == PROCESS_POOL_MODE:  # pragma: nocover
+        global _worker_timings_sink  # pylint: disable=global-statement
+        _worker_timings_sink = timings_sink
         signal.signal(signal.SIGINT, signal.SIG_IGN)
-        _populate_packages(packages)
+        _populate_packages(_not_loaded_packages(packages))
+
+
+def _not_loaded_packages(
+    packages: Dict[str, List[Dict[str, str]]]
+) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Get the packages not loaded yet, e.g. by a forked or forkserver preloaded process.
+
+    :param packages: dict with list of packages
+    :return: dict with list of packages not in sys.modules
+    """
+    return {
+        package_type: [
+            package
+            for package in package_list
+            if "packages.{author}.{package_type}.{package_name}".format(**package)
+            not in sys.modules
+        ]
+        for package_type, package_list in packages.items()
+    }
+
+
+def _preload_packages() -> None:  # pragma: nocover
+    """Load the packages listed in the environment, when imported by the forkserver process."""
+    try:
+        _populate_packages(json.loads(os.environ[PRELOAD_PACKAGES_ENV]))
+    except Exception:  # pylint: disable=broad-except
+        # the workers load the packages on initialization otherwise
+        pass
+
+
+class _SharedMemoryValue:
+    """
+    Bytes or numpy array transferred to another process through shared memory.
+
+    It is pickled as the name of the shared memory block only, and unpickled as a copy of the value.
+    """
+
+    __slots__ = ("name", "size", "shape", "dtype")
+
+    def __init__(self, value: Any) -> None:
+        """
+        Copy the value in a new shared memory block.
+
+        :param value: bytes or numpy array.
+        """
+        is_array = not isinstance(value, bytes)
+        self.size = value.nbytes if is_array else len(value)
+        self.shape = value.shape if is_array else None
+        self.dtype = value.dtype if is_array else None
+        block = SharedMemory(create=True, size=max(self.size, 1))
+        self.name = block.name
+        if is_array:
+            numpy = cast(Any, sys.modules["numpy"])
+            array = numpy.ndarray(self.shape, self.dtype, buffer=block.buf)
+            array[...] = value
+            del array
+        else:
+            block.buf[: self.size] = value
+        block.close()
+
+    def __reduce__(self) -> Tuple[Callable, Tuple]:
+        """
+        Pickle the reference to the shared memory block.
+
+        :return: the function and arguments to load the value
+        """
+        return _load_shared_memory_value, (self.name, self.size, self.shape, self.dtype)
+
+
+def _load_shared_memory_value(
+    name: str, size: int, shape: Optional[Tuple[int, ...]], dtype: Any
+) -> Any:
+    """
+    Copy a value out of a shared memory block, and release the block.
+
+    :param name: the shared memory block name.
+    :param size: the value size in bytes.
+    :param shape: the numpy array shape, None for bytes.
+    :param dtype: the numpy array dtype, None for bytes.
+    :return: the value
+    """
+    block = SharedMemory(name=name)
+    try:
+        if shape is None:
+            return bytes(block.buf[:size])
+        numpy = cast(Any, importlib.import_module("numpy"))
+        array = numpy.ndarray(shape, dtype, buffer=block.buf)
+        value = array.copy()
+        del array
+        return value
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _unlink_shared_memory(name: str) -> None:
+    """
+    Release a shared memory block if it was not loaded.
+
+    :param name: the shared memory block name.
+    """
+    try:
+        block = SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
+
+
+def _to_shared_memory(value: Any, threshold: Optional[int]) -> Any:
+    """
+    Wrap large bytes and numpy arrays to be transferred through shared memory.
+
+    :param value: the value.
+    :param threshold: minimum size in bytes to use shared memory, None to disable it.
+    :return: the wrapped value, or the value as is.
+    """
+    if threshold is None or SharedMemory is None:
+        return value
+    if isinstance(value, bytes):
+        return _SharedMemoryValue(value) if len(value) >= threshold else value
+    numpy = cast(Any, sys.modules.get("numpy"))
+    if (
+        numpy is not None
+        and type(value) is numpy.ndarray  # pylint: disable=unidiomatic-typecheck
+        and not value.dtype.hasobject
+        and value.nbytes >= threshold
+    ):
+        return _SharedMemoryValue(value)
+    return value
+
+
+class _TimedTask:
+    """Wrap a task to record, in the worker, when it started and finished."""
+
+    __slots__ = ("func", "task_id", "sink", "shared_memory_threshold")
+
+    def __init__(
+        self,
+        func: Callable,
+        task_id: int,
+        sink: Optional[Any],
+        shared_memory_threshold: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the wrapper.
+
+        :param func: the callable to execute.
+        :param task_id: the task id.
+        :param sink: queue to put the timings in, None to use the one of the worker process.
+        :param shared_memory_threshold: minimum size in bytes of a result to return it through shared memory.
+        """
+        self.func = func
+        self.task_id = task_id
+        self.sink = sink
+        self.shared_memory_threshold = shared_memory_threshold
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Execute the task and put its timings in the sink.
+
+        :param args: positional arguments forwarded to the callable.
+        :param kwargs: keyword arguments forwarded to the callable.
+        :return: the result of the callable
+        """
+        started_at = time.time()
+        try:
+            return _to_shared_memory(
+                self.func(*args, **kwargs), self.shared_memory_threshold
+            )
+        finally:
+            sink = self.sink if self.sink is not None else _worker_timings_sink
+            if sink is not None:
+                sink.put((self.task_id, started_at, time.time()))
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    """
+    Set the result of a future, unless it is already done.
+
+    :param future: the future.
+    :param result: the result.
+    """
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, exception: BaseException) -> None:
+    """
+    Set the exception of a future, unless it is already done.
+
+    :param future: the future.
+    :param exception: the exception.
+    """
+    if not future.done():
+        future.set_exception(exception)
 
 
 class TaskManager(WithLogger):
@@ -146,6 +393,12 @@ class TaskManager(WithLogger):
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
         pool_mode: str = THREAD_POOL_MODE,
+        drop_results_on_retrieval: bool = False,
+        results_ttl: Optional[float] = None,
+        max_results: Optional[int] = None,
+        start_method: Optional[str] = None,
+        keep_pool_warm: bool = False,
+        shared_memory_threshold: Optional[int] = None,
     ) -> None:
         """
         Initialize the task manager.
@@ -154,6 +407,12 @@ class TaskManager(WithLogger):
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
         :param pool_mode: str. multithread or multiprocess
+        :param drop_results_on_retrieval: drop the result of a task once it is retrieved ready with get_task_result.
+        :param results_ttl: seconds to keep the result of a task after it is ready, None to keep it.
+        :param max_results: maximum number of task results kept, the oldest are dropped first. None for no limit.
+        :param start_method: multiprocessing start method of the worker processes, None for the platform default. With forkserver, the packages loaded are preloaded by the server.
+        :param keep_pool_warm: on stop, keep the process pool to be reused by the next task manager started with the same settings and packages.
+        :param shared_memory_threshold: minimum size in bytes of the bytes and numpy arrays arguments and results transferred to and from worker processes through shared memory. None to pickle them.
         """
         WithLogger.__init__(self, logger)
         self._nb_workers = nb_workers
@@ -166,6 +425,30 @@ class TaskManager(WithLogger):
         self._results_by_task_id = {}  # type: Dict[int, Any]
         self._pool_mode = pool_mode
 
+        self._drop_results_on_retrieval = drop_results_on_retrieval
+        self._results_ttl = results_ttl
+        self._max_results = max_results
+        # results and metrics are updated by the pool result handler thread too
+        self._results_lock = threading.Lock()
+        self._tasks_done = threading.Condition(self._results_lock)
+        self._ready_results = deque()  # type: Deque[Tuple[float, int]]
+        self._futures_by_task_id = {}  # type: Dict[int, asyncio.Future]
+        self._enqueued_at = {}  # type: Dict[int, float]
+        self._timings_sink = None  # type: Optional[Any]
+        self._tasks_completed = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._run_time_total = 0.0
+        self._run_time_max = 0.0
+
+        self._start_method = start_method
+        self._keep_pool_warm = keep_pool_warm
+        self._warm_pool_key = None  # type: Optional[Tuple]
+        self._shared_memory_threshold = (
+            shared_memory_threshold if pool_mode == PROCESS_POOL_MODE else None
+        )
+        self._shared_memory_by_task_id = {}  # type: Dict[int, List[str]]
+
     @property
     def is_started(self) -> bool:
         """
@@ -184,6 +467,29 @@ class TaskManager(WithLogger):
         """
         return self._nb_workers
 
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        Get the task metrics.
+
+        Times are in seconds: the wait time is from enqueueing to the start of the execution,
+        the run time is the execution time. Pending tasks are the enqueued tasks not completed yet,
+        either waiting for a worker or running.
+
+        :return: dict of metrics
+        """
+        with self._results_lock:
+            return {
+                "enqueued": self._task_enqueued_counter,
+                "completed": self._tasks_completed,
+                "pending": len(self._enqueued_at),
+                "results_stored": len(self._results_by_task_id),
+                "wait_time_total": self._wait_time_total,
+                "wait_time_max": self._wait_time_max,
+                "run_time_total": self._run_time_total,
+                "run_time_max": self._run_time_max,
+            }
+
     def enqueue_task(
         self,
         func: Callable,
@@ -197,6 +503,65 @@ class TaskManager(WithLogger):
         :param args: the positional arguments to be passed to the function.
         :param kwargs: the keyword arguments to be passed to the function.
         :return: the task id to get the the result.
+        """
+        task_id, async_result = self._enqueue(func, args, kwargs)
+        with self._results_lock:
+            self._results_by_task_id[task_id] = async_result
+            self._prune_results()
+        if self._logger:  # pragma: nocover
+            self._logger.info(f"Task <{func}{args}> set. Task id is {task_id}")
+        return task_id
+
+    def enqueue_task_async(
+        self,
+        func: Callable,
+        args: Sequence = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> asyncio.Future:
+        """
+        Enqueue a task with the executor and get a future of its result.
+
+        The result is not stored by the task manager, the future is cancelled if the task manager stops before the task is done.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwargs: the keyword arguments to be passed to the function.
+        :param loop: the event loop the future is bound to, the current event loop by default.
+        :return: the future of the result of the task.
+        """
+        future_loop = loop or asyncio.get_event_loop()
+        future = future_loop.create_future()
+
+        def _on_result(result: Any) -> None:
+            future_loop.call_soon_threadsafe(_set_future_result, future, result)
+
+        def _on_error(exception: BaseException) -> None:
+            future_loop.call_soon_threadsafe(_set_future_exception, future, exception)
+
+        task_id, _ = self._enqueue(func, args, kwargs, _on_result, _on_error)
+        with self._results_lock:
+            if task_id in self._enqueued_at:
+                self._futures_by_task_id[task_id] = future
+        return future
+
+    def _enqueue(
+        self,
+        func: Callable,
+        args: Sequence,
+        kwargs: Optional[Dict[str, Any]],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> Tuple[int, AsyncResult]:
+        """
+        Apply the task on the pool.
+
+        :param func: the callable instance to be enqueued
+        :param args: the positional arguments to be passed to the function.
+        :param kwargs: the keyword arguments to be passed to the function.
+        :param on_result: callback called with the result of the task.
+        :param on_error: callback called with the exception raised by the task.
+        :return: the task id and the async result.
         :raises ValueError: if the task manager is not running.
         """
         with self._lock:
@@ -208,15 +573,108 @@ class TaskManager(WithLogger):
 
             self._pool = cast(Pool, self._pool)
             task_id = self._task_enqueued_counter
-            self._task_enqueued_counter += 1
+            timed_task = _TimedTask(
+                func,
+                task_id,
+                self._timings_sink if self._pool_mode == THREAD_POOL_MODE else None,
+                self._shared_memory_threshold,
+            )
+            kwargs = kwargs if kwargs is not None else {}
+            if self._shared_memory_threshold is not None:
+                args, kwargs = self._args_to_shared_memory(task_id, args, kwargs)
+            with self._results_lock:
+                self._task_enqueued_counter += 1
+                self._enqueued_at[task_id] = time.time()
             async_result = self._pool.apply_async(
-                func, args=args, kwds=kwargs if kwargs is not None else {}
+                timed_task,
+                args=args,
+                kwds=kwargs,
+                callback=partial(self._on_task_done, task_id, on_result),
+                error_callback=partial(self._on_task_done, task_id, on_error),
             )
+            return task_id, async_result
 
-            self._results_by_task_id[task_id] = async_result
-            if self._logger:  # pragma: nocover
-                self._logger.info(f"Task <{func}{args}> set. Task id is {task_id}")
-            return task_id
+    def _args_to_shared_memory(
+        self, task_id: int, args: Sequence, kwargs: Dict[str, Any]
+    ) -> Tuple[Sequence, Dict[str, Any]]:
+        """
+        Wrap the large arguments of a task to be transferred through shared memory.
+
+        :param task_id: the task id.
+        :param args: the positional arguments.
+        :param kwargs: the keyword arguments.
+        :return: the positional and keyword arguments, wrapped when large.
+        """
+        args = tuple(
+            _to_shared_memory(arg, self._shared_memory_threshold) for arg in args
+        )
+        kwargs = {
+            key: _to_shared_memory(value, self._shared_memory_threshold)
+            for key, value in kwargs.items()
+        }
+        names = [
+            value.name
+            for value in (*args, *kwargs.values())
+            if isinstance(value, _SharedMemoryValue)
+        ]
+        if names:
+            with self._results_lock:
+                self._shared_memory_by_task_id[task_id] = names
+        return args, kwargs
+
+    def _on_task_done(
+        self, task_id: int, callback: Optional[Callable[[Any], None]], value: Any,
+    ) -> None:
+        """
+        Update the metrics and the results once a task is done.
+
+        Called by the pool result handler thread.
+
+        :param task_id: the task id.
+        :param callback: the callback to forward the result or exception to.
+        :param value: the result of the task, or the exception raised.
+        """
+        with self._results_lock:
+            self._collect_timings()
+            self._enqueued_at.pop(task_id, None)
+            self._futures_by_task_id.pop(task_id, None)
+            self._tasks_completed += 1
+            if not self._enqueued_at:
+                self._tasks_done.notify_all()
+            if self._results_ttl is not None:
+                self._ready_results.append((time.monotonic(), task_id))
+            shared_memory_names = self._shared_memory_by_task_id.pop(task_id, [])
+        # arguments not loaded by the worker, e.g. if the task could not be unpickled
+        for name in shared_memory_names:
+            _unlink_shared_memory(name)
+        if callback is not None:
+            callback(value)
+
+    def _collect_timings(self) -> None:
+        """Update the time metrics with the timings put by the workers."""
+        sink = self._timings_sink
+        if sink is None:  # pragma: nocover
+            return
+        while not sink.empty():
+            task_id, started_at, finished_at = sink.get()
+            enqueued_at = self._enqueued_at.get(task_id, started_at)
+            wait_time = max(started_at - enqueued_at, 0.0)
+            run_time = finished_at - started_at
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+            self._run_time_total += run_time
+            self._run_time_max = max(self._run_time_max, run_time)
+
+    def _prune_results(self) -> None:
+        """Drop the task results exceeding the retention limits."""
+        if self._results_ttl is not None:
+            deadline = time.monotonic() - self._results_ttl
+            while self._ready_results and self._ready_results[0][0] <= deadline:
+                _, task_id = self._ready_results.popleft()
+                self._results_by_task_id.pop(task_id, None)
+        if self._max_results is not None:
+            while len(self._results_by_task_id) > self._max_results:
+                del self._results_by_task_id[next(iter(self._results_by_task_id))]
 
     def get_task_result(self, task_id: int) -> AsyncResult:
         """
@@ -225,11 +683,15 @@ class TaskManager(WithLogger):
         :param task_id: the task id
         :return: async result for task_id
         """
-        task_result = self._results_by_task_id.get(
-            task_id, None
-        )  # type: Optional[AsyncResult]
-        if task_result is None:
-            raise ValueError("Task id {} not present.".format(task_id))
+        with self._results_lock:
+            self._prune_results()
+            task_result = self._results_by_task_id.get(
+                task_id, None
+            )  # type: Optional[AsyncResult]
+            if task_result is None:
+                raise ValueError("Task id {} not present.".format(task_id))
+            if self._drop_results_on_retrieval and task_result.ready():
+                del self._results_by_task_id[task_id]
 
         return task_result
 
@@ -266,13 +728,58 @@ class TaskManager(WithLogger):
         pool_cls = self.POOL_MODES.get(self._pool_mode)
         if not pool_cls:  # pragma: nocover
             raise ValueError(f"Mode: `{self._pool_mode}` is not supported")
-        init_args = (
-            self._pool_mode,
-            _enlist_component_packages(),
-        )
-        self._pool = pool_cls(
-            self._nb_workers, initializer=_init_worker, initargs=init_args
-        )
+        packages = _enlist_component_packages()
+        if self._pool_mode == THREAD_POOL_MODE:
+            self._timings_sink = queue.SimpleQueue()
+            self._pool = pool_cls(
+                self._nb_workers,
+                initializer=_init_worker,
+                initargs=(self._pool_mode, packages, None),
+            )
+            return
+
+        if self._keep_pool_warm:
+            self._warm_pool_key = (
+                self._start_method,
+                self._nb_workers,
+                json.dumps(packages, sort_keys=True),
+            )
+            with _warm_pools_lock:
+                idle_pools = _warm_pools.get(self._warm_pool_key, [])
+                if idle_pools:
+                    self._pool, self._timings_sink, _ = idle_pools.pop()
+                    # drop the timings of the tasks of the previous task manager
+                    while not self._timings_sink.empty():
+                        self._timings_sink.get()
+                    self.logger.debug("Reuse a warm pool.")
+                    return
+
+        if self._shared_memory_threshold is not None and SharedMemory is not None:
+            # shared memory blocks created by the workers are then tracked by the same process
+            resource_tracker.ensure_running()
+        context = multiprocessing.get_context(self._start_method)
+        self._timings_sink = context.SimpleQueue()
+        init_args = (self._pool_mode, packages, self._timings_sink)
+        if self._start_method == "forkserver":
+            # the server is started once per process, with the packages loaded at that time
+            context.set_forkserver_preload([__name__])
+            os.environ[PRELOAD_PACKAGES_ENV] = json.dumps(packages)
+            try:
+                self._pool = pool_cls(
+                    self._nb_workers,
+                    initializer=_init_worker,
+                    initargs=init_args,
+                    context=context,
+                )
+            finally:
+                os.environ.pop(PRELOAD_PACKAGES_ENV, None)
+        else:
+            self._pool = pool_cls(
+                self._nb_workers,
+                initializer=_init_worker,
+                initargs=init_args,
+                context=context,
+            )
 
     def _stop_pool(self) -> None:
         """Stop internal task pool."""
@@ -281,10 +788,100 @@ class TaskManager(WithLogger):
             return
 
         self._pool = cast(Pool, self._pool)
-        self._pool.terminate()
-        self._pool.join()
+        if self._warm_pool_key is not None and self._wait_tasks_done(
+            WARM_POOL_DRAIN_TIMEOUT
+        ):
+            _park_warm_pool(self._warm_pool_key, self._pool, self._timings_sink)
+        else:
+            self._pool.terminate()
+            self._pool.join()
+        self._warm_pool_key = None
         self._pool = None
 
+        with self._results_lock:
+            self._enqueued_at.clear()
+            futures = list(self._futures_by_task_id.values())
+            self._futures_by_task_id.clear()
+            shared_memory_names = [
+                name
+                for names in self._shared_memory_by_task_id.values()
+                for name in names
+            ]
+            self._shared_memory_by_task_id.clear()
+        # the pool is terminated or without pending task, no worker can load the blocks anymore
+        for name in shared_memory_names:
+            _unlink_shared_memory(name)
+        for future in futures:
+            loop = future.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(future.cancel)
+
+    def _wait_tasks_done(self, timeout: float) -> bool:
+        """
+        Wait for the enqueued tasks to be done.
+
+        :param timeout: the maximum time to wait, in seconds.
+        :return: whether all the tasks are done
+        """
+        with self._results_lock:
+            return self._tasks_done.wait_for(lambda: not self._enqueued_at, timeout)
+
+
+def _park_warm_pool(key: Tuple, pool: Pool, timings_sink: Any) -> None:
+    """
+    Keep an idle pool warm, to be reused by the next task manager started with the same settings.
+
+    :param key: the start method, number of workers and packages loaded of the pool.
+    :param pool: the pool, without pending task.
+    :param timings_sink: the timings sink of the workers of the pool.
+    """
+    with _warm_pools_lock:
+        _warm_pools.setdefault(key, []).append((pool, timings_sink, time.monotonic()))
+    _reap_warm_pools()
+    # an agent stopped for good does not start a task manager reusing the pool
+    timer = threading.Timer(WARM_POOL_IDLE_TIMEOUT, _reap_warm_pools)
+    timer.daemon = True
+    timer.start()
+
+
+def _reap_warm_pools() -> None:
+    """Terminate the pools idle for longer than the idle timeout, and the oldest beyond the maximum number."""
+    now = time.monotonic()
+    with _warm_pools_lock:
+        parked = sorted(
+            (
+                (parked_at, key, pool, timings_sink)
+                for key, idle_pools in _warm_pools.items()
+                for pool, timings_sink, parked_at in idle_pools
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        _warm_pools.clear()
+        pools = []
+        for index, (parked_at, key, pool, timings_sink) in enumerate(parked):
+            if index < MAX_WARM_POOLS and now - parked_at < WARM_POOL_IDLE_TIMEOUT:
+                _warm_pools.setdefault(key, []).insert(
+                    0, (pool, timings_sink, parked_at)
+                )
+            else:
+                pools.append(pool)
+    for pool in pools:
+        pool.terminate()
+        pool.join()
+
+
+def shutdown_warm_pools() -> None:
+    """Terminate the process pools kept warm by the stopped task managers."""
+    with _warm_pools_lock:
+        pools = [
+            pool for idle_pools in _warm_pools.values() for pool, _, _ in idle_pools
+        ]
+        _warm_pools.clear()
+    for pool in pools:
+        pool.terminate()
+        pool.join()
+
 
 class ThreadedTaskManager(TaskManager):
     """A threaded task manager."""
@@ -294,6 +891,9 @@ class ThreadedTaskManager(TaskManager):
         nb_workers: int = DEFAULT_WORKERS_AMOUNT,
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
+        drop_results_on_retrieval: bool = False,
+        results_ttl: Optional[float] = None,
+        max_results: Optional[int] = None,
     ) -> None:
         """
         Initialize the task manager.
@@ -301,12 +901,18 @@ class ThreadedTaskManager(TaskManager):
         :param nb_workers: the number of worker processes.
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
+        :param drop_results_on_retrieval: drop the result of a task once it is retrieved ready with get_task_result.
+        :param results_ttl: seconds to keep the result of a task after it is ready, None to keep it.
+        :param max_results: maximum number of task results kept, the oldest are dropped first. None for no limit.
         """
         super().__init__(
             nb_workers=nb_workers,
             is_lazy_pool_start=is_lazy_pool_start,
             logger=logger,
             pool_mode=THREAD_POOL_MODE,
+            drop_results_on_retrieval=drop_results_on_retrieval,
+            results_ttl=results_ttl,
+            max_results=max_results,
         )
 
 
@@ -318,6 +924,12 @@ class ProcessTaskManager(TaskManager):
         nb_workers: int = DEFAULT_WORKERS_AMOUNT,
         is_lazy_pool_start: bool = True,
         logger: Optional[logging.Logger] = None,
+        drop_results_on_retrieval: bool = False,
+        results_ttl: Optional[float] = None,
+        max_results: Optional[int] = None,
+        start_method: Optional[str] = None,
+        keep_pool_warm: bool = False,
+        shared_memory_threshold: Optional[int] = None,
     ) -> None:
         """
         Initialize the task manager.
@@ -325,10 +937,74 @@ class ProcessTaskManager(TaskManager):
         :param nb_workers: the number of worker processes.
         :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
         :param logger: the logger.
+        :param drop_results_on_retrieval: drop the result of a task once it is retrieved ready with get_task_result.
+        :param results_ttl: seconds to keep the result of a task after it is ready, None to keep it.
+        :param max_results: maximum number of task results kept, the oldest are dropped first. None for no limit.
+        :param start_method: multiprocessing start method of the worker processes, None for the platform default.
+        :param keep_pool_warm: on stop, keep the process pool to be reused by the next task manager started with the same settings and packages.
+        :param shared_memory_threshold: minimum size in bytes of the bytes and numpy arrays arguments and results transferred through shared memory. None to pickle them.
         """
         super().__init__(
             nb_workers=nb_workers,
             is_lazy_pool_start=is_lazy_pool_start,
             logger=logger,
             pool_mode=PROCESS_POOL_MODE,
+            drop_results_on_retrieval=drop_results_on_retrieval,
+            results_ttl=results_ttl,
+            max_results=max_results,
+            start_method=start_method,
+            keep_pool_warm=keep_pool_warm,
+            shared_memory_threshold=shared_memory_threshold,
         )
+
+
+class WarmProcessTaskManager(ProcessTaskManager):
+    """
+    A multiprocess task manager optimized for long running agents.
+
+    The worker processes are forked from a forkserver with the packages preloaded, where available,
+    the pool is kept warm to be reused when the agent restarts, and large bytes and numpy arrays
+    are transferred through shared memory.
+    """
+
+    def __init__(
+        self,
+        nb_workers: int = DEFAULT_WORKERS_AMOUNT,
+        is_lazy_pool_start: bool = True,
+        logger: Optional[logging.Logger] = None,
+        drop_results_on_retrieval: bool = False,
+        results_ttl: Optional[float] = None,
+        max_results: Optional[int] = None,
+        shared_memory_threshold: Optional[int] = DEFAULT_SHARED_MEMORY_THRESHOLD,
+    ) -> None:
+        """
+        Initialize the task manager.
+
+        :param nb_workers: the number of worker processes.
+        :param is_lazy_pool_start: option to postpone pool creation till the first enqueue_task called.
+        :param logger: the logger.
+        :param drop_results_on_retrieval: drop the result of a task once it is retrieved ready with get_task_result.
+        :param results_ttl: seconds to keep the result of a task after it is ready, None to keep it.
+        :param max_results: maximum number of task results kept, the oldest are dropped first. None for no limit.
+        :param shared_memory_threshold: minimum size in bytes of the bytes and numpy arrays arguments and results transferred through shared memory. None to pickle them.
+        """
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else None
+        )
+        super().__init__(
+            nb_workers=nb_workers,
+            is_lazy_pool_start=is_lazy_pool_start,
+            logger=logger,
+            drop_results_on_retrieval=drop_results_on_retrieval,
+            results_ttl=results_ttl,
+            max_results=max_results,
+            start_method=start_method,
+            keep_pool_warm=True,
+            shared_memory_threshold=shared_memory_threshold,
+        )
+
+
+if PRELOAD_PACKAGES_ENV in os.environ:  # pragma: nocover
+    _preload_packages()
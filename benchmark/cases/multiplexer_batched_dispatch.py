@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Example performance test using benchmark framework.
+
+Test multiplexer throughput (envelopes sent and received back) with the
+per-envelope send/receive loops (batch_size=0) or with batched dispatch (batch_size>0).
+
+Example: compare the current loop against batches of 64 envelopes
+    python benchmark/cases/multiplexer_batched_dispatch.py 10000,0 10000,64
+"""
+import asyncio
+import time
+from typing import Any, List, Optional, Sequence
+
+from aea.configurations.base import ConnectionConfig, PublicId
+from aea.connections.base import Connection, ConnectionStates
+from aea.mail.base import Envelope
+from aea.multiplexer import Multiplexer
+from benchmark.framework.aea_test_wrapper import AEATestWrapper
+from benchmark.framework.benchmark import BenchmarkControl
+from benchmark.framework.cli import TestCli
+
+
+class LoopbackConnection(Connection):
+    """Connection that receives back every envelope sent, with batch support."""
+
+    connection_id = PublicId.from_str("fetchai/loopback:0.1.0")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the connection.
+
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        """
+        super().__init__(*args, **kwargs)
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def connect(self) -> None:
+        """Connect."""
+        self._queue = asyncio.Queue()
+        self.state = ConnectionStates.connected
+
+    async def disconnect(self) -> None:
+        """Disconnect."""
+        self.state = ConnectionStates.disconnected
+        if self._queue is not None:
+            self._queue.put_nowait(None)
+
+    async def send(self, envelope: Envelope) -> None:
+        """
+        Send an envelope back to the receiving side.
+
+        :param envelope: envelope to send.
+        """
+        if self._queue is None:  # pragma: nocover
+            raise ValueError("Connection not connected.")
+        self._queue.put_nowait(envelope)
+
+    async def send_batch(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Send a batch of envelopes back to the receiving side.
+
+        :param envelopes: envelopes to send.
+        """
+        if self._queue is None:  # pragma: nocover
+            raise ValueError("Connection not connected.")
+        for envelope in envelopes:
+            self._queue.put_nowait(envelope)
+
+    async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
+        """
+        Receive an envelope.
+
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: incoming envelope
+        """
+        if self._queue is None:  # pragma: nocover
+            raise ValueError("Connection not connected.")
+        return await self._queue.get()
+
+    async def receive_batch(self, max_size: int) -> List[Envelope]:
+        """
+        Receive a batch of envelopes.
+
+        :param max_size: the maximum number of envelopes to return.
+        :return: incoming envelopes
+        """
+        if self._queue is None:  # pragma: nocover
+            raise ValueError("Connection not connected.")
+        envelopes = [await self._queue.get()]
+        while len(envelopes) < max_size and not self._queue.empty():
+            envelopes.append(self._queue.get_nowait())
+        return [envelope for envelope in envelopes if envelope is not None]
+
+
+def multiplexer_batched_dispatch(
+    benchmark: BenchmarkControl, envelopes_num: int = 10000, batch_size: int = 0,
+) -> None:
+    """
+    Test multiplexer send and receive loops throughput.
+
+    :param benchmark: benchmark special parameter to communicate with executor
+    :param envelopes_num: number of envelopes to send and receive back
+    :param batch_size: multiplexer batch size, 0 to use per-envelope loops
+    """
+    envelope = AEATestWrapper.dummy_envelope()
+    connection = LoopbackConnection(
+        configuration=ConnectionConfig(connection_id=LoopbackConnection.connection_id),
+        data_dir="",
+    )
+    multiplexer = Multiplexer(
+        [connection],
+        protocols=[AEATestWrapper.dummy_default_message()],
+        batch_size=batch_size,
+    )
+    multiplexer.connect()
+
+    benchmark.start()
+    start_time = time.time()
+    try:
+        for _ in range(envelopes_num):
+            multiplexer.put(envelope)
+
+        for _ in range(envelopes_num):
+            multiplexer.get(block=True, timeout=10)
+    finally:
+        elapsed = time.time() - start_time
+        multiplexer.disconnect()
+
+    print(f"envelopes/sec: {envelopes_num / elapsed:.0f}")
+
+
+if __name__ == "__main__":
+    TestCli(multiplexer_batched_dispatch).run()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Removal time of dialogues with a single counterparty as the number of dialogues grows."""
+import os
+import random
+import sys
+import time
+import uuid
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.common import Address
+from aea.protocols.base import Message
+from aea.protocols.dialogue.base import BasicDialoguesStorage, Dialogue
+from benchmark.checks.utils import (  # noqa: I100
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.protocols.http.dialogues import HttpDialogue, HttpDialogues
+from packages.fetchai.protocols.http.message import HttpMessage
+
+
+ROOT_PATH = os.path.join(os.path.abspath(__file__), "..", "..")
+sys.path.append(ROOT_PATH)
+
+
+def make_dialogues(
+    dialogues_amount: int, counterparty: Address
+) -> Tuple[HttpDialogues, List[Dialogue]]:
+    """Make dialogues initiated by a single counterparty."""
+    # pylint: disable=unused-argument
+
+    def role(m: Message, addr: Address) -> Dialogue.Role:
+        return HttpDialogue.Role.SERVER
+
+    self_address = uuid.uuid4().hex
+    dialogues = HttpDialogues(self_address, role_from_first_message=role)
+    result = []
+    for _ in range(dialogues_amount):
+        message = HttpMessage(
+            dialogue_reference=HttpDialogues.new_self_initiated_dialogue_reference(),
+            performative=HttpMessage.Performative.REQUEST,
+            method="get",
+            url="some url",
+            headers="",
+            version="",
+            body=b"",
+        )
+        message.sender = counterparty
+        message.to = self_address
+        dialogue = dialogues.update(message)
+        if dialogue is None:  # pragma: nocover
+            raise ValueError("Dialogue not created.")
+        result.append(dialogue)
+    return dialogues, result
+
+
+def run(dialogues_amounts: List[int]) -> List[Tuple[str, Union[float, int]]]:
+    """Test the time to remove dialogues with a single counterparty from the dialogues storage."""
+    counterparty = uuid.uuid4().hex
+    results = []  # type: List[Tuple[str, Union[float, int]]]
+    for dialogues_amount in dialogues_amounts:
+        dialogues, dialogues_list = make_dialogues(dialogues_amount, counterparty)
+        storage = BasicDialoguesStorage(dialogues)
+        for dialogue in dialogues_list:
+            storage.add(dialogue)
+        labels = [dialogue.dialogue_label for dialogue in dialogues_list]
+        random.Random(0).shuffle(labels)
+
+        start_time = time.time()
+        for label in labels:
+            storage.remove(label)
+        elapsed = time.time() - start_time
+
+        results.append(
+            (
+                f"Removal time per dialogue with {dialogues_amount} dialogues (us)",
+                elapsed / dialogues_amount * 1e6,
+            )
+        )
+    return results
+
+
+@click.command()
+@click.option(
+    "--dialogues",
+    default="1000,10000,50000",
+    help="Comma separated numbers of dialogues with the counterparty.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(dialogues: str, number_of_runs: int, output_format: str) -> Any:
+    """Run test."""
+    parameters = {"Dialogues": dialogues, "Number of runs": number_of_runs}
+    dialogues_amounts = [int(amount) for amount in dialogues.split(",")]
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(int(number_of_runs), run, (dialogues_amounts,),)
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
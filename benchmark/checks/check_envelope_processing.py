@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Check amount of time to encode, decode and route envelopes."""
+import time
+from typing import Any, Callable, List, Tuple, Union
+from unittest.mock import MagicMock
+
+import click
+
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from aea.mail.base import Envelope
+from aea.multiplexer import AsyncMultiplexer
+from benchmark.checks.utils import (
+    GeneratorConnection,
+    make_envelope,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.protocols.default.message import DefaultMessage
+
+
+def _time_per_envelope(function: Callable[[], Any], envelopes: int) -> float:
+    """
+    Time a function called once per envelope.
+
+    :param function: the function.
+    :param envelopes: the number of envelopes.
+    :return: the time per envelope, in microseconds.
+    """
+    start_time = time.perf_counter()
+    for _ in range(envelopes):
+        function()
+    return (time.perf_counter() - start_time) / envelopes * 1e6
+
+
+def _route(multiplexer: AsyncMultiplexer, envelope: Envelope) -> None:
+    """Route an envelope as the multiplexer and the agent do."""
+    multiplexer._get_connection_id_from_envelope(  # pylint: disable=protected-access
+        envelope, envelope.protocol_specification_id
+    )
+    if not envelope.is_component_to_component_message:
+        envelope.to_as_public_id  # pylint: disable=pointless-statement
+
+
+def run(envelopes: int) -> List[Tuple[str, Union[int, float]]]:
+    """Check the time to encode, decode and route envelopes."""
+    identity = Identity("agent", address="agent", public_key="agent")
+    connection = GeneratorConnection(
+        configuration=ConnectionConfig(connection_id=GeneratorConnection.connection_id),
+        data_dir=MagicMock(),
+        identity=identity,
+    )
+    multiplexer = AsyncMultiplexer(
+        [connection],
+        default_routing={DefaultMessage.protocol_id: connection.connection_id},
+    )
+    envelope = make_envelope("sender", "agent")
+    envelope_bytes = envelope.encode()
+
+    def encode() -> None:
+        envelope.encode()
+
+    def decode() -> None:
+        Envelope.decode(envelope_bytes)
+
+    decoded_envelopes = iter(
+        [Envelope.decode(envelope_bytes) for _ in range(envelopes)]
+    )
+
+    def route() -> None:
+        _route(multiplexer, next(decoded_envelopes))
+
+    return [
+        ("encode(us/envelope)", _time_per_envelope(encode, envelopes)),
+        ("decode(us/envelope)", _time_per_envelope(decode, envelopes)),
+        ("route(us/envelope)", _time_per_envelope(route, envelopes)),
+    ]
+
+
+@click.command()
+@click.option("--envelopes", default=10000, help="Number of envelopes.")
+@number_of_runs_deco
+@output_format_deco
+def main(envelopes: int, number_of_runs: int, output_format: str) -> Any:
+    """Check the time to encode, decode and route envelopes."""
+    parameters = {"Envelopes": envelopes, "Number of runs": number_of_runs}
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(int(number_of_runs), run, (envelopes,),)
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2020 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Throughput check of the execution timeout guards."""
+import time
+from statistics import mean
+from threading import Thread
+from typing import Any, List, Tuple, Union
+
+import click
+
+from aea.agent_loop import BaseAgentLoop
+from aea.registries.resources import Resources
+from benchmark.checks.check_reactive import (  # noqa: I100
+    CONNECTION_MODES,
+    TestConnectionMixIn,
+    TestHandler,
+)
+from benchmark.checks.utils import (
+    make_agent,
+    make_skill,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+    wait_for_condition,
+)
+
+
+def run_with_mode(
+    duration: int,
+    runtime_mode: str,
+    execution_timeout: float,
+    execution_timeout_mode: str,
+) -> Tuple[float, float]:
+    """Run a reactive agent with the execution timeout guard and return its latency and rate."""
+    resources = Resources()
+    conn_cls = type("conn_cls", (TestConnectionMixIn, CONNECTION_MODES["sync"]), {})
+    connection = conn_cls.make()  # type: ignore # pylint: disable=no-member
+    resources.add_connection(connection)
+
+    agent = make_agent(
+        runtime_mode=runtime_mode,
+        resources=resources,
+        execution_timeout=execution_timeout,
+        execution_timeout_mode=execution_timeout_mode,
+    )
+    agent.resources.add_skill(make_skill(agent, handlers={"test": TestHandler}))
+    t = Thread(target=agent.start, daemon=True)
+    t.start()
+    wait_for_condition(lambda: agent.is_running, timeout=5)
+
+    connection.enable()
+    time.sleep(duration)
+    connection.disable()
+    time.sleep(0.2)  # possible race condition in stop?
+    agent.stop()
+    t.join(5)
+
+    latency = mean(map(lambda x: x[1] - x[0], zip(connection.sends, connection.recvs,)))
+    rate = len(connection.recvs) / duration
+    return latency, rate
+
+
+def run(
+    duration: int, runtime_mode: str, execution_timeout: float
+) -> List[Tuple[str, Union[int, float]]]:
+    """Test reactions rate with each execution timeout guard."""
+    # pylint: disable=import-outside-toplevel,unused-import
+    # import manually due to some lazy imports in decision_maker
+    import aea.decision_maker.default  # noqa: F401
+
+    results = []  # type: List[Tuple[str, Union[int, float]]]
+    for mode in BaseAgentLoop.EXECUTION_TIMEOUT_GUARDS:
+        latency, rate = run_with_mode(duration, runtime_mode, execution_timeout, mode)
+        results.append((f"{mode} latency(ms)", 10 ** 6 * latency))
+        results.append((f"{mode} rate(envelopes/second)", rate))
+    return results
+
+
+@click.command()
+@click.option("--duration", default=1, help="Run time in seconds.")
+@click.option(
+    "--runtime_mode", default="async", help="Runtime mode: async or threaded."
+)
+@click.option(
+    "--execution_timeout",
+    default=1.0,
+    help="Execution timeout of handlers and behaviours in seconds.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    duration: int,
+    runtime_mode: str,
+    execution_timeout: float,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Duration(seconds)": duration,
+        "Runtime mode": runtime_mode,
+        "Execution timeout(seconds)": execution_timeout,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs), run, (duration, runtime_mode, execution_timeout),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""
+Check amount of time and mem to construct many agents from one project.
+
+The agents are built as the multi agent manager does: the agent configuration is
+loaded once, and each agent gets its own builder. The first agent pays for loading
+the components, the next ones reuse the component configurations already loaded in
+the process, and the skill modules too if shared with AEA_SHARE_SKILL_MODULES set.
+"""
+import os
+import shutil
+import time
+from pathlib import Path
+from statistics import mean
+from tempfile import TemporaryDirectory
+from typing import Any, List, Tuple, Union
+
+import click
+from click.testing import CliRunner
+
+from aea.aea_builder import AEABuilder
+from aea.cli.core import cli
+from aea.skills.base import SHARE_SKILL_MODULES_ENV
+from benchmark.checks.utils import (
+    get_mem_usage_in_mb,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+
+PACKAGES = Path(__file__).parent / "../../packages"
+PROJECT_PATH = str(PACKAGES / "fetchai/agents/my_first_aea")
+
+
+def run(agents: int, share_skill_modules: bool) -> List[Tuple[str, Union[int, float]]]:
+    """Check construction time and memory usage of agents from one project."""
+    if share_skill_modules:
+        os.environ[SHARE_SKILL_MODULES_ENV] = "1"
+    else:
+        os.environ.pop(SHARE_SKILL_MODULES_ENV, None)
+    build_times = []
+    with TemporaryDirectory() as tmp_dir:
+        agent_dir = Path(tmp_dir) / "agent"
+        shutil.copytree(PROJECT_PATH, agent_dir)
+        shutil.copytree(PACKAGES, agent_dir / "vendor")
+        os.chdir(agent_dir)
+        for command in (["generate-key", "fetchai"], ["add-key", "fetchai"]):
+            if CliRunner().invoke(cli, command, catch_exceptions=False).exit_code != 0:
+                raise Exception(f"{command[0]} failed")
+        agent_config = AEABuilder.try_to_load_agent_configuration_file(agent_dir)
+        agents_list = []
+        env_mem_usage = get_mem_usage_in_mb()
+        for i in range(agents):
+            start_time = time.time()
+            builder = AEABuilder(with_default_packages=False)
+            builder.set_from_configuration(agent_config, agent_dir)
+            builder.set_name(f"agent_{i}")
+            agents_list.append(builder.build())
+            build_times.append(time.time() - start_time)
+        mem_usage = get_mem_usage_in_mb()
+
+    return [
+        ("first agent construction", build_times[0]),
+        ("avg next agents construction", mean(build_times[1:])),
+        ("agents mem usage (Mb)", mem_usage - env_mem_usage),
+    ]
+
+
+@click.command()
+@click.option("--agents", default=25, help="Amount of agents to construct.")
+@click.option(
+    "--share-skill-modules",
+    is_flag=True,
+    default=False,
+    help="Share the skill modules between the agents.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    agents: int, share_skill_modules: bool, number_of_runs: int, output_format: str
+) -> Any:
+    """Check construction time and memory usage of agents from one project."""
+    if agents < 2:
+        raise click.BadParameter("At least two agents are needed.")
+    parameters = {
+        "Agents": agents,
+        "Share skill modules": share_skill_modules,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(int(number_of_runs), run, (agents, share_skill_modules),)
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Throughput check of the TCP connection, from many clients to a server."""
+import asyncio
+import socket
+import time
+from typing import Any, List, Tuple, Union
+from unittest.mock import MagicMock
+
+import click
+
+from aea.configurations.base import ConnectionConfig
+from aea.identity.base import Identity
+from benchmark.checks.utils import (
+    make_envelope,
+    multi_run,
+    number_of_runs_deco,
+    output_format_deco,
+    print_results,
+)
+
+from packages.fetchai.connections.tcp.tcp_client import TCPClientConnection
+from packages.fetchai.connections.tcp.tcp_server import TCPServerConnection
+
+
+SERVER_ADDRESS = "server"
+
+
+def _get_unused_tcp_port() -> int:
+    """Get an unused TCP port."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+async def _run(
+    clients: int, messages: int, high_throughput: bool
+) -> List[Tuple[str, Union[int, float]]]:
+    """Send envelopes from the clients to the server, and time their reception."""
+    port = _get_unused_tcp_port()
+    connection_config = dict(
+        address="127.0.0.1", port=port, high_throughput=high_throughput
+    )
+    server = TCPServerConnection(
+        configuration=ConnectionConfig(
+            connection_id=TCPServerConnection.connection_id, **connection_config
+        ),
+        data_dir=MagicMock(),
+        identity=Identity(SERVER_ADDRESS, SERVER_ADDRESS, SERVER_ADDRESS),
+    )
+    client_connections = [
+        TCPClientConnection(
+            configuration=ConnectionConfig(
+                connection_id=TCPClientConnection.connection_id, **connection_config
+            ),
+            data_dir=MagicMock(),
+            identity=Identity(f"client_{i}", f"client_{i}", f"client_{i}"),
+        )
+        for i in range(clients)
+    ]
+    await server.connect()
+    for client in client_connections:
+        await client.connect()
+    while len(server.connections) < clients:
+        await asyncio.sleep(0.01)
+
+    async def send_all(client: TCPClientConnection) -> None:
+        envelope = make_envelope(client.address, SERVER_ADDRESS)
+        for _ in range(messages):
+            await client.send(envelope)
+
+    async def receive_all() -> None:
+        for _ in range(clients * messages):
+            await server.receive()
+
+    start_time = time.time()
+    await asyncio.gather(receive_all(), *map(send_all, client_connections))
+    duration = time.time() - start_time
+
+    for client in client_connections:
+        await client.disconnect()
+    await server.disconnect()
+    return [
+        ("envelopes received", clients * messages),
+        ("duration(seconds)", duration),
+        ("rate(envelopes/second)", clients * messages / duration),
+    ]
+
+
+def run(
+    clients: int, messages: int, high_throughput: bool
+) -> List[Tuple[str, Union[int, float]]]:
+    """Check the throughput of the TCP connection."""
+    return asyncio.new_event_loop().run_until_complete(
+        _run(clients, messages, high_throughput)
+    )
+
+
+@click.command()
+@click.option("--clients", default=10, help="Number of clients.")
+@click.option("--messages", default=1000, help="Number of envelopes per client.")
+@click.option(
+    "--high_throughput", is_flag=True, help="Use the high-throughput mode.",
+)
+@number_of_runs_deco
+@output_format_deco
+def main(
+    clients: int,
+    messages: int,
+    high_throughput: bool,
+    number_of_runs: int,
+    output_format: str,
+) -> Any:
+    """Run test."""
+    parameters = {
+        "Clients": clients,
+        "Envelopes per client": messages,
+        "High-throughput mode": high_throughput,
+        "Number of runs": number_of_runs,
+    }
+
+    def result_fn() -> List[Tuple[str, Any, Any, Any]]:
+        return multi_run(
+            int(number_of_runs), run, (clients, messages, high_throughput),
+        )
+
+    return print_results(output_format, parameters, result_fn)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
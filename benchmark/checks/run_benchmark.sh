@@ -60,3 +60,30 @@ do
 	done
 done
 # ~ 10 * 2 * 4 * 100 sec = 133.3 min
+
+chmod +x benchmark/checks/check_tcp_throughput.py
+echo -e "\nTCP throughput: number of runs: $NUM_RUNS, envelopes per client: $MESSAGES"
+echo "------------------------------------------------------------------"
+echo "mode              num_clients      value          mean        stdev"
+echo "------------------------------------------------------------------"
+for mode in "" "--high_throughput";
+do
+	for clients in 1 10 100;
+	do
+		data=`./benchmark/checks/check_tcp_throughput.py --clients=$clients --messages=$MESSAGES --number_of_runs=$NUM_RUNS $mode`
+		rate=`echo "$data"|grep rate|awk '{print $4 "    " $6}'`
+		echo -e "${mode:-default}     $clients    rate     ${rate}"
+	done
+done
+
+chmod +x benchmark/checks/check_envelope_processing.py
+echo -e "\nEnvelope processing: number of runs: $NUM_RUNS"
+echo "----------------------------------------------------"
+echo "step                         mean        stdev"
+echo "----------------------------------------------------"
+data=`./benchmark/checks/check_envelope_processing.py --number_of_runs=$NUM_RUNS`
+for step in encode decode route;
+do
+	value=`echo "$data"|grep "$step("|awk '{print $4 "    " $6}'`
+	echo -e "$step (us/envelope)    ${value}"
+done
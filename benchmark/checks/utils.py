@@ -83,6 +83,8 @@ def make_agent(
     runtime_mode: str = "threaded",
     resources: Optional[Resources] = None,
     identity: Optional[Identity] = None,
+    execution_timeout: float = 0,
+    execution_timeout_mode: Optional[str] = None,
 ) -> AEA:
     """Make AEA instance."""
     wallet = Wallet({DEFAULT_LEDGER: None})
@@ -111,7 +113,15 @@ def make_agent(
             )
         )
     )
-    return AEA(identity, wallet, resources, datadir, runtime_mode=runtime_mode)
+    return AEA(
+        identity,
+        wallet,
+        resources,
+        datadir,
+        runtime_mode=runtime_mode,
+        execution_timeout=execution_timeout,
+        execution_timeout_mode=execution_timeout_mode,
+    )
 
 
 def make_envelope(
@@ -19,23 +19,28 @@
 """HTTP client connection and channel."""
 import asyncio
 import email
+import functools
 import logging
 import ssl
+import time
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.tasks import Task
 from traceback import format_exc
-from typing import Any, Optional, Set, Tuple, cast
+from typing import Any, Dict, Optional, Set, Tuple, cast
 
 import aiohttp
 import certifi  # pylint: disable=wrong-import-order
 from aiohttp.client_reqrep import ClientResponse
 from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
+from aea.helpers.metrics import HistogramChild
+from aea.helpers.metrics import registry as agent_metrics_registry
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
@@ -56,6 +61,19 @@ RequestId = str
 
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 0
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_DNS_CACHE_TTL = 10
+RESPONSE_CHUNK_SIZE = 64 * 1024
+HEADERS_CACHE_SIZE = 256
+
+request_latency = agent_metrics_registry.histogram(
+    "aea_http_client_request_latency_seconds",
+    "Time of an HTTP request by the http client connection, until its body is read.",
+    ("agent", "host", "result"),
+)
+
 
 def headers_to_string(headers: CIMultiDictProxy) -> str:
     """
@@ -71,6 +89,17 @@ def headers_to_string(headers: CIMultiDictProxy) -> str:
     return msg.as_string()
 
 
+@functools.lru_cache(maxsize=HEADERS_CACHE_SIZE)
+def _parse_headers(headers: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse the headers of a request, the requests of an agent often having the same headers.
+
+    :param headers: the headers, as a string.
+    :return: the header names and values
+    """
+    return tuple(email.message_from_string(headers).items())
+
+
 HttpDialogue = BaseHttpDialogue
 
 
@@ -109,7 +138,17 @@ class HTTPClientAsyncChannel:
     )
 
     def __init__(
-        self, agent_address: Address, address: str, port: int, connection_id: PublicId,
+        self,
+        agent_address: Address,
+        address: str,
+        port: int,
+        connection_id: PublicId,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        max_concurrent_requests: Optional[int] = None,
+        max_response_size: Optional[int] = None,
     ):
         """
         Initialize an http client channel.
@@ -118,12 +157,27 @@ class HTTPClientAsyncChannel:
         :param address: server hostname / IP address
         :param port: server port number
         :param connection_id: the id of the connection
+        :param connection_limit: the maximum number of open connections, 0 for no limit.
+        :param connection_limit_per_host: the maximum number of open connections to a host, 0 for no limit.
+        :param keepalive_timeout: the time an idle connection is kept open, in seconds.
+        :param dns_cache_ttl: the time the DNS resolutions are cached, in seconds, None to cache them forever.
+        :param max_concurrent_requests: the maximum number of requests performed at once, the others are queued. None for no limit.
+        :param max_response_size: the maximum size of a response body, read in chunks. None for no limit.
         """
         self.agent_address = agent_address
         self.address = address
         self.port = port
         self.connection_id = connection_id
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_response_size = max_response_size
         self._dialogues = HttpDialogues()
+        self._session = None  # type: Optional[aiohttp.ClientSession]
+        self._requests_semaphore = None  # type: Optional[asyncio.Semaphore]
+        self._latency_metrics = {}  # type: Dict[Tuple[str, bool], HistogramChild]
 
         self._in_queue = None  # type: Optional[asyncio.Queue]  # pragma: no cover
         self._loop = (
@@ -143,8 +197,29 @@ class HTTPClientAsyncChannel:
         """
         self._loop = loop
         self._in_queue = asyncio.Queue()
+        if self.max_concurrent_requests is not None:
+            self._requests_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         self.is_stopped = False
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session of the channel, created on the first request.
+
+        The connections of the session are kept open and reused by the next requests.
+
+        :return: the session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
     def _get_message_and_dialogue(
         self, envelope: Envelope
     ) -> Tuple[HttpMessage, Optional[HttpDialogue]]:
@@ -179,18 +254,13 @@ class HTTPClientAsyncChannel:
             return
 
         try:
-            resp = await asyncio.wait_for(
-                self._perform_http_request(request_http_message),
-                timeout=self.DEFAULT_TIMEOUT,
-            )
+            resp, body = await self._perform_http_request(request_http_message)
             envelope = self.to_envelope(
                 request_http_message,
                 status_code=resp.status,
                 headers=resp.headers,
                 status_text=resp.reason,
-                body=resp._body  # pylint: disable=protected-access
-                if resp._body is not None  # pylint: disable=protected-access
-                else b"",
+                body=body,
                 dialogue=dialogue,
             )
         except Exception:  # pylint: disable=broad-except
@@ -208,37 +278,101 @@ class HTTPClientAsyncChannel:
 
     async def _perform_http_request(
         self, request_http_message: HttpMessage
-    ) -> ClientResponse:
+    ) -> Tuple[ClientResponse, bytes]:
         """
         Perform http request and return response.
 
+        The request waits for a slot if the maximum number of concurrent requests is reached,
+        the timeout applies to the request only, not to the wait.
+
         :param request_http_message: HttpMessage with http request constructed.
 
-        :return: aiohttp.ClientResponse
+        :return: aiohttp.ClientResponse and its body
         """
+        if self._requests_semaphore is None:
+            return await asyncio.wait_for(
+                self._perform_http_request_with_session(request_http_message),
+                timeout=self.DEFAULT_TIMEOUT,
+            )
+        async with self._requests_semaphore:
+            return await asyncio.wait_for(
+                self._perform_http_request_with_session(request_http_message),
+                timeout=self.DEFAULT_TIMEOUT,
+            )
+
+    async def _perform_http_request_with_session(
+        self, request_http_message: HttpMessage
+    ) -> Tuple[ClientResponse, bytes]:
+        """
+        Perform http request with the session of the channel, and record its latency.
+
+        :param request_http_message: HttpMessage with http request constructed.
+
+        :return: aiohttp.ClientResponse and its body
+        """
+        host = URL(request_http_message.url).host or ""
+        start_time = time.perf_counter()
         try:
             if request_http_message.is_set("headers") and request_http_message.headers:
                 headers: Optional[dict] = dict(
-                    email.message_from_string(request_http_message.headers).items()
+                    _parse_headers(request_http_message.headers)
                 )
             else:
                 headers = None
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=request_http_message.method,
-                    url=request_http_message.url,
-                    headers=headers,
-                    data=request_http_message.body,
-                    ssl=ssl_context,
-                ) as resp:
-                    await resp.read()
-                return resp
+            async with self._get_session().request(
+                method=request_http_message.method,
+                url=request_http_message.url,
+                headers=headers,
+                data=request_http_message.body,
+                ssl=ssl_context,
+            ) as resp:
+                body = await self._read_body(resp)
+            self._observe_latency(host, time.perf_counter() - start_time)
+            return resp, body
         except Exception:  # pragma: nocover # pylint: disable=broad-except
+            self._observe_latency(host, time.perf_counter() - start_time, is_error=True)
             self.logger.exception(
                 f"Exception raised during http call: {request_http_message.method} {request_http_message.url}"
             )
             raise
 
+    async def _read_body(self, resp: ClientResponse) -> bytes:
+        """
+        Read the body of a response, in chunks if its size is limited.
+
+        :param resp: the response.
+        :return: the body
+        """
+        if self.max_response_size is None:
+            return await resp.read()
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > self.max_response_size:
+                raise ValueError(
+                    f"Response body larger than {self.max_response_size} bytes."
+                )
+        return bytes(body)
+
+    def _observe_latency(
+        self, host: str, latency: float, is_error: bool = False
+    ) -> None:
+        """
+        Observe the latency of a request in the request latency metric, labelled by host.
+
+        :param host: the host of the request.
+        :param latency: the latency of the request, in seconds.
+        :param is_error: whether the request failed.
+        """
+        metric = self._latency_metrics.get((host, is_error))
+        if metric is None:
+            metric = self._latency_metrics[(host, is_error)] = request_latency.labels(
+                self.agent_address, host, "error" if is_error else "success"
+            )
+        metric.observe(latency)
+        if self.logger.isEnabledFor(logging.DEBUG):  # pragma: nocover
+            self.logger.debug(f"Request to {host} took {latency:.3f}s.")
+
     def send(self, request_envelope: Envelope) -> None:
         """
         Send an envelope with http request data to request.
@@ -358,6 +492,9 @@ class HTTPClientAsyncChannel:
             self.is_stopped = True
 
             await self._cancel_tasks()
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
 
 
 class HTTPClientConnection(Connection):
@@ -376,8 +513,22 @@ class HTTPClientConnection(Connection):
         port = cast(int, self.configuration.config.get("port"))
         if host is None or port is None:  # pragma: nocover
             raise ValueError("host and port must be set!")
+        config = self.configuration.config
         self.channel = HTTPClientAsyncChannel(
-            self.address, host, port, connection_id=self.connection_id,
+            self.address,
+            host,
+            port,
+            connection_id=self.connection_id,
+            connection_limit=config.get("connection_limit", DEFAULT_CONNECTION_LIMIT),
+            connection_limit_per_host=config.get(
+                "connection_limit_per_host", DEFAULT_CONNECTION_LIMIT_PER_HOST
+            ),
+            keepalive_timeout=config.get(
+                "keepalive_timeout", DEFAULT_KEEPALIVE_TIMEOUT
+            ),
+            dns_cache_ttl=config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+            max_concurrent_requests=config.get("max_concurrent_requests"),
+            max_response_size=config.get("max_response_size"),
         )
 
     async def connect(self) -> None:
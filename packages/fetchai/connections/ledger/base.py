@@ -80,7 +80,7 @@ class RequestDispatcher(ABC):
         dialogue: Dialogue,
     ) -> Union[Message, Task]:
         """
-        Run a function in executor.
+        Run a function in executor, or await it if it is a coroutine function.
 
         :param func: the function to execute.
         :param api: the ledger api.
@@ -89,6 +89,8 @@ class RequestDispatcher(ABC):
         :return: the return value of the function.
         """
         try:
+            if asyncio.iscoroutinefunction(func):
+                return await func(api, message, dialogue)  # type: ignore
             response = await self.loop.run_in_executor(
                 self.executor, func, api, message, dialogue
             )
@@ -97,6 +97,8 @@ class LedgerConnection(Connection):
         for task in self.receiving_tasks:
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        if self._ledger_dispatcher is not None:
+            self._ledger_dispatcher.receipt_watcher.stop()
         self._ledger_dispatcher = None
         self._contract_dispatcher = None
         self._event_new_receiving_task = None
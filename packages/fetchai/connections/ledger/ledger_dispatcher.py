@@ -18,10 +18,8 @@
 # ------------------------------------------------------------------------------
 """This module contains the implementation of the ledger API request dispatcher."""
 import logging
-import time
 from typing import Any, cast
 
-from aea.connections.base import ConnectionStates
 from aea.crypto.base import LedgerApi
 from aea.helpers.transaction.base import RawTransaction, State, TransactionDigest
 from aea.protocols.base import Address, Message
@@ -29,6 +27,7 @@ from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import Dialogues as BaseDialogues
 
 from packages.fetchai.connections.ledger.base import CONNECTION_ID, RequestDispatcher
+from packages.fetchai.connections.ledger.receipt_watcher import ReceiptWatcher
 from packages.fetchai.protocols.ledger_api.custom_types import TransactionReceipt
 from packages.fetchai.protocols.ledger_api.dialogues import LedgerApiDialogue
 from packages.fetchai.protocols.ledger_api.dialogues import (
@@ -81,6 +80,13 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
         logger = logger if logger is not None else _default_logger
         super().__init__(logger, *args, **kwargs)
         self._ledger_api_dialogues = LedgerApiDialogues()
+        self.receipt_watcher = ReceiptWatcher(
+            loop=self.loop,
+            executor=self.executor,
+            poll_interval=self.TIMEOUT,
+            timeout=self.TIMEOUT * self.MAX_ATTEMPTS,
+            logger=self.logger,
+        )
 
     def get_ledger_id(self, message: Message) -> str:
         """Get the ledger id from message."""
@@ -200,69 +206,35 @@ class LedgerApiRequestDispatcher(RequestDispatcher):
             )
         return response
 
-    def get_transaction_receipt(
+    async def get_transaction_receipt(
         self, api: LedgerApi, message: LedgerApiMessage, dialogue: LedgerApiDialogue,
     ) -> LedgerApiMessage:
         """
         Send the request 'get_transaction_receipt'.
 
+        The transaction is polled by the receipt watcher, together with the other
+        pending transactions of the ledger.
+
         :param api: the API object.
         :param message: the Ledger API message
         :param dialogue: the dialogue
         :return: the ledger api message
         """
-        is_settled = False
-        attempts = 0
-        while (
-            not is_settled
-            and attempts < self.MAX_ATTEMPTS
-            and self.connection_state.get() == ConnectionStates.connected
-        ):
-            time.sleep(self.TIMEOUT)
-            transaction_receipt = api.get_transaction_receipt(
-                message.transaction_digest.body
-            )
-            if transaction_receipt is not None:
-                is_settled = api.is_transaction_settled(transaction_receipt)
-            attempts += 1
-        attempts = 0
-        transaction = api.get_transaction(message.transaction_digest.body)
-        while (
-            transaction is None
-            and attempts < self.MAX_ATTEMPTS
-            and self.connection_state.get() == ConnectionStates.connected
-        ):
-            time.sleep(self.TIMEOUT)
-            transaction = api.get_transaction(message.transaction_digest.body)
-            attempts += 1
-        if not is_settled:  # pragma: nocover
-            response = self.get_error_message(
-                ValueError("Transaction not settled within timeout"),
-                api,
-                message,
-                dialogue,
-            )
-        elif transaction_receipt is None:  # pragma: nocover
-            response = self.get_error_message(
-                ValueError("No transaction_receipt returned"), api, message, dialogue
-            )
-        elif transaction is None:  # pragma: nocover
-            response = self.get_error_message(
-                ValueError("No transaction returned"), api, message, dialogue
-            )
-        else:
-            response = cast(
-                LedgerApiMessage,
-                dialogue.reply(
-                    performative=LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
-                    target_message=message,
-                    transaction_receipt=TransactionReceipt(
-                        message.transaction_digest.ledger_id,
-                        transaction_receipt,
-                        transaction,
-                    ),
+        transaction_receipt, transaction = await self.receipt_watcher.watch(
+            api, message.transaction_digest.ledger_id, message.transaction_digest.body
+        )
+        response = cast(
+            LedgerApiMessage,
+            dialogue.reply(
+                performative=LedgerApiMessage.Performative.TRANSACTION_RECEIPT,
+                target_message=message,
+                transaction_receipt=TransactionReceipt(
+                    message.transaction_digest.ledger_id,
+                    transaction_receipt,
+                    transaction,
                 ),
-            )
+            ),
+        )
         return response
 
     def send_signed_transaction(
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains a watcher of the receipts of the pending transactions."""
+import asyncio
+import logging
+from concurrent.futures._base import Executor
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+from aea.common import JSONLike
+from aea.crypto.base import LedgerApi
+
+
+_default_logger = logging.getLogger(
+    "aea.packages.fetchai.connections.ledger.receipt_watcher"
+)
+
+DEFAULT_POLL_INTERVAL = 3.0
+DEFAULT_MAX_POLL_INTERVAL = 24.0
+DEFAULT_BACKOFF_FACTOR = 2.0
+DEFAULT_TIMEOUT = 360.0
+
+ReceiptAndTransaction = Tuple[JSONLike, JSONLike]
+PollResult = Union[Tuple[Optional[JSONLike], bool, Optional[JSONLike]], Exception]
+
+
+class _PendingTransaction:
+    """A transaction waited for by one or more requests."""
+
+    __slots__ = ("futures", "deadline", "receipt", "is_settled")
+
+    def __init__(self, deadline: float) -> None:
+        """
+        Initialize the pending transaction.
+
+        :param deadline: the loop time after which the transaction is not waited for anymore.
+        """
+        self.futures = []  # type: List[asyncio.Future]
+        self.deadline = deadline
+        self.receipt = None  # type: Optional[JSONLike]
+        self.is_settled = False
+
+
+def _poll_transactions(
+    api: LedgerApi, transactions: List[Tuple[str, Optional[JSONLike], bool]]
+) -> Dict[str, PollResult]:
+    """
+    Poll the ledger for a batch of transactions, in one executor job.
+
+    The receipt of a transaction is requested until the transaction is settled,
+    then the transaction itself is requested.
+
+    :param api: the ledger api.
+    :param transactions: the digest, the last receipt and whether the transaction is settled, per transaction.
+    :return: the receipt, whether the transaction is settled and the transaction, or the exception raised, by digest
+    """
+    results = {}  # type: Dict[str, PollResult]
+    for digest, receipt, is_settled in transactions:
+        try:
+            transaction = None
+            if not is_settled:
+                receipt = api.get_transaction_receipt(digest)
+                is_settled = receipt is not None and api.is_transaction_settled(receipt)
+            if is_settled:
+                transaction = api.get_transaction(digest)
+            results[digest] = (receipt, is_settled, transaction)
+        except Exception as e:  # pylint: disable=broad-except
+            results[digest] = e
+    return results
+
+
+class _LedgerPoller:
+    """Poll the pending transactions of one ledger, with an adaptive interval."""
+
+    def __init__(self, watcher: "ReceiptWatcher", api: LedgerApi) -> None:
+        """
+        Initialize the poller.
+
+        :param watcher: the receipt watcher.
+        :param api: the ledger api.
+        """
+        self.watcher = watcher
+        self.api = api
+        self.interval = watcher.poll_interval
+        self.pending = {}  # type: Dict[str, _PendingTransaction]
+        self.task = None  # type: Optional[asyncio.Task]
+        self._wakeup = None  # type: Optional[asyncio.Future]
+        self._wakeup_handle = None  # type: Optional[asyncio.TimerHandle]
+
+    def add(self, digest: str, future: asyncio.Future, deadline: float) -> None:
+        """
+        Add a request for a transaction.
+
+        :param digest: the transaction digest.
+        :param future: the future to resolve with the receipt and the transaction.
+        :param deadline: the loop time after which the transaction is not waited for anymore.
+        """
+        pending = self.pending.get(digest)
+        if pending is None:
+            pending = self.pending[digest] = _PendingTransaction(deadline)
+        pending.deadline = max(pending.deadline, deadline)
+        pending.futures.append(future)
+
+        self.interval = self.watcher.poll_interval
+        if self.task is None or self.task.done():
+            self.task = self.watcher.loop.create_task(self._run())
+        elif self._wakeup_handle is not None and (
+            self._wakeup_handle.when() > self.watcher.loop.time() + self.interval
+        ):
+            self._schedule_wakeup(self.interval)
+
+    def remove(self, digest: str, future: asyncio.Future) -> None:
+        """
+        Remove a request for a transaction.
+
+        :param digest: the transaction digest.
+        :param future: the future of the request.
+        """
+        pending = self.pending.get(digest)
+        if pending is None or future not in pending.futures:
+            return
+        pending.futures.remove(future)
+        if not pending.futures:
+            self.pending.pop(digest)
+
+    def stop(self) -> None:
+        """Stop polling, and cancel the requests."""
+        if self.task is not None:
+            self.task.cancel()
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+        for pending in self.pending.values():
+            for future in pending.futures:
+                future.cancel()
+        self.pending.clear()
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        """
+        Schedule the next polling pass.
+
+        :param delay: the delay before the pass.
+        """
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+        self._wakeup_handle = self.watcher.loop.call_later(delay, self._wake)
+
+    def _wake(self) -> None:
+        """Start the next polling pass."""
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    async def _run(self) -> None:
+        """Poll all the pending transactions in one pass per interval, until none is pending."""
+        loop = self.watcher.loop
+        while self.pending:
+            self._wakeup = loop.create_future()
+            self._schedule_wakeup(self.interval)
+            await self._wakeup
+            if not self.pending:
+                break
+            transactions = [
+                (digest, pending.receipt, pending.is_settled)
+                for digest, pending in self.pending.items()
+            ]
+            try:
+                results = await loop.run_in_executor(
+                    self.watcher.executor, _poll_transactions, self.api, transactions
+                )
+            except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+                self.watcher.logger.error(f"Failed to poll the transactions: {e}")
+                results = {digest: e for digest, _, _ in transactions}
+            is_new_digest_pending = any(
+                digest not in results for digest in self.pending
+            )
+            if self._update(results) or is_new_digest_pending:
+                self.interval = self.watcher.poll_interval
+            else:
+                self.interval = min(
+                    self.interval * self.watcher.backoff_factor,
+                    self.watcher.max_poll_interval,
+                )
+
+    def _update(self, results: Dict[str, PollResult]) -> bool:
+        """
+        Update the pending transactions with the results of a polling pass.
+
+        :param results: the results of the pass, by digest.
+        :return: whether a transaction got settled or resolved during the pass
+        """
+        now = self.watcher.loop.time()
+        progress = False
+        for digest, result in results.items():
+            pending = self.pending.get(digest)
+            if pending is None:
+                continue
+            if isinstance(result, Exception):
+                self._resolve(digest, exception=result)
+                continue
+            receipt, is_settled, transaction = result
+            progress = progress or is_settled != pending.is_settled
+            pending.receipt, pending.is_settled = receipt, is_settled
+            if is_settled and transaction is not None:
+                self._resolve(digest, result=(cast(JSONLike, receipt), transaction))
+                progress = True
+            elif now >= pending.deadline:
+                message = (
+                    "No transaction returned"
+                    if is_settled
+                    else "Transaction not settled within timeout"
+                )
+                self._resolve(digest, exception=ValueError(message))
+        return progress
+
+    def _resolve(
+        self,
+        digest: str,
+        result: Optional[ReceiptAndTransaction] = None,
+        exception: Optional[Exception] = None,
+    ) -> None:
+        """
+        Resolve the requests for a transaction.
+
+        :param digest: the transaction digest.
+        :param result: the receipt and the transaction.
+        :param exception: the exception to raise to the requests, if any.
+        """
+        pending = self.pending.pop(digest)
+        for future in pending.futures:
+            if future.done():  # pragma: nocover
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+class ReceiptWatcher:
+    """
+    Watch the receipts of the pending transactions, without a thread per transaction.
+
+    The pending transactions of each ledger are polled together, in one executor job per
+    interval. The interval grows while no transaction gets settled, and is reset when a
+    transaction gets settled or is added.
+    """
+
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        executor: Optional[Executor] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: float = DEFAULT_TIMEOUT,
+        logger: logging.Logger = _default_logger,
+    ) -> None:
+        """
+        Initialize the receipt watcher.
+
+        :param loop: the asyncio loop.
+        :param executor: the executor of the polling jobs.
+        :param poll_interval: the interval between two polling passes, when transactions get settled.
+        :param max_poll_interval: the maximum interval between two polling passes.
+        :param backoff_factor: the factor of the interval after a pass without settled transactions.
+        :param timeout: the time after which a transaction is not waited for anymore.
+        :param logger: the logger.
+        """
+        self.loop = loop if loop is not None else asyncio.get_event_loop()
+        self.executor = executor
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.logger = logger
+        self._pollers = {}  # type: Dict[str, _LedgerPoller]
+
+    @property
+    def pending_digests(self) -> Dict[str, List[str]]:
+        """Get the digests of the pending transactions, by ledger id."""
+        return {
+            ledger_id: list(poller.pending)
+            for ledger_id, poller in self._pollers.items()
+            if poller.pending
+        }
+
+    async def watch(
+        self, api: LedgerApi, ledger_id: str, digest: str
+    ) -> ReceiptAndTransaction:
+        """
+        Wait for a transaction to be settled.
+
+        :param api: the ledger api.
+        :param ledger_id: the ledger id.
+        :param digest: the transaction digest.
+        :return: the receipt and the transaction
+        """
+        poller = self._pollers.get(ledger_id)
+        if poller is None:
+            poller = self._pollers[ledger_id] = _LedgerPoller(self, api)
+        poller.api = api
+        future = self.loop.create_future()
+        poller.add(digest, future, self.loop.time() + self.timeout)
+        if self.logger.isEnabledFor(logging.DEBUG):  # pragma: nocover
+            self.logger.debug(
+                f"Watching transaction {digest} on ledger {ledger_id}, {len(poller.pending)} pending."
+            )
+        try:
+            return await future
+        finally:
+            if future.cancelled():
+                poller.remove(digest, future)
+
+    def stop(self) -> None:
+        """Stop watching, and cancel the requests waiting for a transaction."""
+        for poller in self._pollers.values():
+            poller.stop()
+        self._pollers.clear()
@@ -21,15 +21,26 @@ import asyncio
 import logging
 import threading
 from asyncio import AbstractEventLoop, Queue
-from collections import defaultdict
+from bisect import bisect_left, bisect_right, insort
 from concurrent.futures import Future
+from math import asin, cos, degrees, floor, radians, sin
 from threading import Thread
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
-from aea.helpers.search.models import Description
+from aea.helpers.search.models import (
+    And,
+    Constraint,
+    ConstraintExpr,
+    ConstraintTypes,
+    Description,
+    Location,
+    Not,
+    Or,
+    Query,
+)
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -58,6 +69,7 @@ PUBLIC_ID = PublicId.from_str("fetchai/local:0.21.0")
 OefSearchDialogue = BaseOefSearchDialogue
 OEF_LOCAL_NODE_SEARCH_ADDRESS = "oef_local_node_search"
 OEF_LOCAL_NODE_ADDRESS = "oef_local_node"
+EARTH_RADIUS = 6372.8  # same average earth radius used by the haversine distance
 
 
 class OefSearchDialogues(BaseOefSearchDialogues):
@@ -86,6 +98,309 @@ class OefSearchDialogues(BaseOefSearchDialogues):
         )
 
 
+class ServiceDirectory:
+    """
+    An indexed directory of service descriptions.
+
+    Descriptions are indexed by data model name, by attribute value, by numeric
+    attribute value (kept sorted, for range constraints) and by location (on a grid,
+    for distance constraints). A query is first narrowed down to a set of candidate
+    descriptions using the indexes, then it is evaluated on the candidates only.
+    """
+
+    GRID_CELL_DEGREES = 1.0
+
+    def __init__(self) -> None:
+        """Initialize the service directory."""
+        self._next_id = 0
+        self._entries: Dict[int, Tuple[Address, Description]] = {}
+        self._ids_by_address: Dict[Address, Dict[int, None]] = {}
+        self._ids_by_model: Dict[str, Set[int]] = {}
+        self._ids_by_attribute: Dict[str, Set[int]] = {}
+        self._ids_by_value: Dict[Tuple[str, Any], Set[int]] = {}
+        self._numeric_index: Dict[str, List[Tuple[float, int]]] = {}
+        self._location_index: Dict[str, Dict[Tuple[int, int], Set[int]]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of registered descriptions."""
+        return len(self._entries)
+
+    @property
+    def addresses(self) -> List[Address]:
+        """Get the addresses with at least one registered description."""
+        return list(self._ids_by_address.keys())
+
+    @property
+    def services(self) -> Dict[Address, List[Description]]:
+        """Get the registered descriptions, by address."""
+        return {
+            address: [self._entries[id_][1] for id_ in ids]
+            for address, ids in self._ids_by_address.items()
+        }
+
+    def add(self, address: Address, description: Description) -> None:
+        """
+        Register a description.
+
+        :param address: the address of the service agent.
+        :param description: the service description.
+        """
+        id_ = self._next_id
+        self._next_id += 1
+        self._entries[id_] = (address, description)
+        self._ids_by_address.setdefault(address, {})[id_] = None
+        self._ids_by_model.setdefault(description.data_model.name, set()).add(id_)
+        for name, value in description.values.items():
+            self._ids_by_attribute.setdefault(name, set()).add(id_)
+            if isinstance(value, Location):
+                cells = self._location_index.setdefault(name, {})
+                cells.setdefault(self._cell(value), set()).add(id_)
+                continue
+            if isinstance(value, (int, float)):
+                insort(self._numeric_index.setdefault(name, []), (value, id_))
+            self._ids_by_value.setdefault((name, value), set()).add(id_)
+
+    def remove(self, address: Address, description: Description) -> bool:
+        """
+        Unregister a description.
+
+        :param address: the address of the service agent.
+        :param description: the service description.
+        :return: whether a matching description was registered.
+        """
+        for id_ in self._ids_by_address.get(address, {}):
+            if self._entries[id_][1] == description:
+                self._remove_entry(id_)
+                return True
+        return False
+
+    def remove_address(self, address: Address) -> None:
+        """
+        Unregister all the descriptions of an address.
+
+        :param address: the address of the service agent.
+        """
+        for id_ in list(self._ids_by_address.get(address, {})):
+            self._remove_entry(id_)
+
+    def search(self, query: Query) -> List[Tuple[Address, Description]]:
+        """
+        Search the descriptions that satisfy a query.
+
+        If the query specifies a data model, only descriptions with that data model are returned.
+
+        :param query: the query.
+        :return: the matching (address, description) pairs, in registration order.
+        """
+        candidates = self._query_candidates(query)
+        ids: Iterable[int] = (
+            self._entries.keys() if candidates is None else sorted(candidates)
+        )
+        entries = [
+            self._entries[id_]
+            for id_ in ids
+            if query.model is None or self._entries[id_][1].data_model == query.model
+        ]
+        matches = query.compile().filter(description for _, description in entries)
+        matching_ids = set(map(id, matches))
+        return [entry for entry in entries if id(entry[1]) in matching_ids]
+
+    def _remove_entry(self, id_: int) -> None:
+        """Remove an entry from the directory and from all the indexes."""
+        address, description = self._entries.pop(id_)
+        address_ids = self._ids_by_address[address]
+        address_ids.pop(id_)
+        if not address_ids:
+            self._ids_by_address.pop(address)
+        self._discard(self._ids_by_model, description.data_model.name, id_)
+        for name, value in description.values.items():
+            self._discard(self._ids_by_attribute, name, id_)
+            if isinstance(value, Location):
+                cells = self._location_index[name]
+                self._discard(cells, self._cell(value), id_)
+                if not cells:
+                    self._location_index.pop(name)
+                continue
+            if isinstance(value, (int, float)):
+                sorted_values = self._numeric_index[name]
+                del sorted_values[bisect_left(sorted_values, (value, id_))]
+                if not sorted_values:
+                    self._numeric_index.pop(name)
+            self._discard(self._ids_by_value, (name, value), id_)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[int]], key: Any, id_: int) -> None:
+        """Discard an id from an index entry, pruning the entry when empty."""
+        ids = index[key]
+        ids.discard(id_)
+        if not ids:
+            index.pop(key)
+
+    def _cell(self, location: Location) -> Tuple[int, int]:
+        """Get the grid cell of a location."""
+        return (
+            floor((location.latitude + 90.0) / self.GRID_CELL_DEGREES),
+            floor((location.longitude + 180.0) / self.GRID_CELL_DEGREES)
+            % self._longitude_cells,
+        )
+
+    @property
+    def _longitude_cells(self) -> int:
+        """Get the number of grid cells along a parallel."""
+        return int(round(360.0 / self.GRID_CELL_DEGREES))
+
+    def _query_candidates(self, query: Query) -> Optional[Set[int]]:
+        """
+        Get the candidate ids for a query.
+
+        :param query: the query.
+        :return: a superset of the ids that satisfy the query, or None if the indexes cannot narrow it down.
+        """
+        candidates = None  # type: Optional[Set[int]]
+        if query.model is not None:
+            candidates = self._ids_by_model.get(query.model.name, set())
+        for constraint_expr in query.constraints:
+            candidates = self._intersect(
+                candidates, self._expr_candidates(constraint_expr)
+            )
+            if candidates is not None and len(candidates) == 0:
+                break
+        return candidates
+
+    def _expr_candidates(self, constraint_expr: ConstraintExpr) -> Optional[Set[int]]:
+        """Get the candidate ids for a constraint expression."""
+        if isinstance(constraint_expr, And):
+            candidates = None  # type: Optional[Set[int]]
+            for sub_expr in constraint_expr.constraints:
+                candidates = self._intersect(
+                    candidates, self._expr_candidates(sub_expr)
+                )
+            return candidates
+        if isinstance(constraint_expr, Or):
+            union = set()  # type: Set[int]
+            for sub_expr in constraint_expr.constraints:
+                sub_candidates = self._expr_candidates(sub_expr)
+                if sub_candidates is None:
+                    return None
+                union |= sub_candidates
+            return union
+        if isinstance(constraint_expr, Constraint):
+            return self._constraint_candidates(constraint_expr)
+        # a negation matches the descriptions without the attribute too
+        if isinstance(constraint_expr, Not):
+            return None
+        return None  # pragma: nocover
+
+    def _constraint_candidates(self, constraint: Constraint) -> Set[int]:
+        """Get the candidate ids for an atomic constraint."""
+        name = constraint.attribute_name
+        type_ = constraint.constraint_type.type
+        value = constraint.constraint_type.value
+        with_attribute = self._ids_by_attribute.get(name, set())
+
+        if type_ == ConstraintTypes.EQUAL:
+            return self._ids_by_value.get((name, value), set())
+        if type_ == ConstraintTypes.IN:
+            union = set()  # type: Set[int]
+            for item in value:
+                try:
+                    union |= self._ids_by_value.get((name, item), set())
+                except TypeError:  # pragma: nocover
+                    return with_attribute
+            return union
+        if type_ == ConstraintTypes.DISTANCE:
+            return self._distance_candidates(name, value[0], value[1])
+
+        bounds = self._numeric_bounds(type_, value)
+        if bounds is None:
+            return with_attribute
+        sorted_values = self._numeric_index.get(name, [])
+        low, high = bounds
+        start = 0 if low is None else bisect_left(sorted_values, low)
+        end = len(sorted_values) if high is None else bisect_right(sorted_values, high)
+        return {id_ for _, id_ in sorted_values[start:end]}
+
+    @staticmethod
+    def _numeric_bounds(
+        type_: ConstraintTypes, value: Any
+    ) -> Optional[Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]]:
+        """
+        Get the bounds of a numeric range constraint on the sorted (value, id) index.
+
+        :param type_: the constraint type.
+        :param value: the constraint value.
+        :return: the (low, high) bounds, or None if the constraint is not a numeric range.
+        """
+        before, after = float("-inf"), float("inf")
+        if type_ == ConstraintTypes.WITHIN:
+            if not all(isinstance(v, (int, float)) for v in value):
+                return None
+            return (value[0], before), (value[1], after)
+        if not isinstance(value, (int, float)):
+            return None
+        if type_ in (ConstraintTypes.LESS_THAN, ConstraintTypes.LESS_THAN_EQ):
+            return None, (value, after)
+        if type_ in (ConstraintTypes.GREATER_THAN, ConstraintTypes.GREATER_THAN_EQ):
+            return (value, before), None
+        return None
+
+    def _distance_candidates(
+        self, name: str, center: Location, distance: float
+    ) -> Set[int]:
+        """Get the candidate ids for a distance constraint, from the grid cells around the center."""
+        cells = self._location_index.get(name, {})
+        angular_radius = distance / EARTH_RADIUS
+        lat = radians(center.latitude)
+        lat_cells = range(
+            floor(
+                (center.latitude - degrees(angular_radius) + 90.0)
+                / self.GRID_CELL_DEGREES
+            )
+            - 1,
+            floor(
+                (center.latitude + degrees(angular_radius) + 90.0)
+                / self.GRID_CELL_DEGREES
+            )
+            + 2,
+        )
+        pole_reached = abs(lat) + angular_radius >= radians(90.0)
+        if pole_reached or sin(angular_radius) >= cos(lat):
+            lon_cells = set(range(self._longitude_cells))
+        else:
+            delta_lon = degrees(asin(sin(angular_radius) / cos(lat)))
+            first = floor(
+                (center.longitude - delta_lon + 180.0) / self.GRID_CELL_DEGREES
+            )
+            last = floor(
+                (center.longitude + delta_lon + 180.0) / self.GRID_CELL_DEGREES
+            )
+            lon_cells = {i % self._longitude_cells for i in range(first - 1, last + 2)}
+
+        if len(lat_cells) * len(lon_cells) > len(cells):
+            return {
+                id_
+                for (lat_cell, lon_cell), ids in cells.items()
+                if lat_cell in lat_cells and lon_cell in lon_cells
+                for id_ in ids
+            }
+        candidates = set()  # type: Set[int]
+        for lat_cell in lat_cells:
+            for lon_cell in lon_cells:
+                candidates |= cells.get((lat_cell, lon_cell), set())
+        return candidates
+
+    @staticmethod
+    def _intersect(
+        first: Optional[Set[int]], second: Optional[Set[int]]
+    ) -> Optional[Set[int]]:
+        """Intersect two candidate sets, where None stands for all the ids."""
+        if first is None:
+            return second
+        if second is None:
+            return first
+        return first & second
+
+
 class LocalNode:
     """A light-weight local implementation of a OEF Node."""
 
@@ -99,7 +414,7 @@ class LocalNode:
         :param logger: the logger.
         """
         self._lock = threading.Lock()
-        self.services = defaultdict(lambda: [])  # type: Dict[str, List[Description]]
+        self._directory = ServiceDirectory()
         self._loop = loop if loop is not None else asyncio.new_event_loop()
         self._thread = Thread(target=self._run_loop, daemon=True)
 
@@ -111,6 +426,12 @@ class LocalNode:
         self._dialogues: Optional[OefSearchDialogues] = None
         self.logger = logger
 
+    @property
+    def services(self) -> Dict[Address, List[Description]]:
+        """Get the registered service descriptions, by address."""
+        with self._lock:
+            return self._directory.services
+
     def __enter__(self) -> "LocalNode":
         """Start the local node."""
         self.start()
@@ -265,7 +586,7 @@ class LocalNode:
         :param service_description: the description of the service agent to be registered.
         """
         with self._lock:
-            self.services[address].append(service_description)
+            self._directory.add(address, service_description)
 
     async def _unregister_service(
         self, oef_search_msg: OefSearchMessage, dialogue: OefSearchDialogue,
@@ -279,7 +600,7 @@ class LocalNode:
         service_description = oef_search_msg.service_description
         address = oef_search_msg.sender
         with self._lock:
-            if address not in self.services:
+            if address not in self._directory.addresses:
                 msg = dialogue.reply(
                     performative=OefSearchMessage.Performative.OEF_ERROR,
                     target_message=oef_search_msg,
@@ -288,9 +609,7 @@ class LocalNode:
                 envelope = Envelope(to=msg.to, sender=msg.sender, message=msg,)
                 await self._send(envelope)
             else:
-                self.services[address].remove(service_description)
-                if len(self.services[address]) == 0:
-                    self.services.pop(address)
+                self._directory.remove(address, service_description)
 
     async def _search_services(
         self, oef_search_msg: OefSearchMessage, dialogue: OefSearchDialogue,
@@ -298,22 +617,15 @@ class LocalNode:
         """
         Search the agents in the local Service Directory, and send back the result.
 
-        This is actually a dummy search, it will return all the registered agents with the specified data model.
-        If the data model is not specified, it will return all the agents.
+        It returns the agents with at least one registered description that satisfies the query
+        (and has its data model, if specified).
 
         :param oef_search_msg: the message.
         :param dialogue: the dialogue.
         """
         with self._lock:
             query = oef_search_msg.query
-            result = []  # type: List[str]
-            if query.model is None:
-                result = list(set(self.services.keys()))
-            else:
-                for agent_address, descriptions in self.services.items():
-                    for description in descriptions:
-                        if description.data_model == query.model:
-                            result.append(agent_address)
+            result = [address for address, _ in self._directory.search(query)]
 
             msg = dialogue.reply(
                 performative=OefSearchMessage.Performative.SEARCH_RESULT,
@@ -355,7 +667,7 @@ class LocalNode:
         """
         with self._lock:
             self._out_queues.pop(address, None)
-            self.services.pop(address, None)
+            self._directory.remove_address(address)
 
 
 class OEFLocalConnection(Connection):
@@ -24,10 +24,11 @@ import platform
 import subprocess  # nosec
 import sys
 from asyncio import AbstractEventLoop, CancelledError, events
+from collections import deque
 from ipaddress import ip_address
 from pathlib import Path
 from socket import gethostbyname
-from typing import Any, IO, List, Optional, Sequence, cast
+from typing import Any, Deque, IO, List, Optional, Sequence, cast
 
 from aea.configurations.base import PublicId
 from aea.configurations.constants import DEFAULT_LEDGER
@@ -128,29 +129,91 @@ class NodeClient:
 
     ACN_ACK_TIMEOUT = 5
 
-    def __init__(self, pipe: IPCChannel, agent_record: AgentRecord) -> None:
+    def __init__(
+        self,
+        pipe: IPCChannel,
+        agent_record: AgentRecord,
+        max_inflight_envelopes: int = 1,
+    ) -> None:
         """Set node client with pipe."""
         self.pipe = pipe
         self.agent_record = agent_record
         self._wait_status: Optional[asyncio.Future] = None
+        # the node acknowledges the envelopes in the order it reads them,
+        # so the acknowledgements are matched to the oldest envelope not acknowledged.
+        self._pending_acks: Deque[asyncio.Future] = deque()
+        self._inflight_slots = asyncio.Semaphore(max_inflight_envelopes)
+        self._write_lock = asyncio.Lock()
 
     async def connect(self) -> bool:
         """Connect to node with pipe."""
         return await self.pipe.connect()
 
     async def send_envelope(self, envelope: Envelope) -> None:
-        """Send envelope to node."""
-        self._wait_status = asyncio.Future()
-        buf = self.make_acn_envelope_message(envelope)
-        await self._write(buf)
+        """Send envelope to node and wait for its acknowledgement."""
+        self._wait_status = await self.write_envelope(envelope)
 
         status = await self.wait_for_status()
 
+        self.check_status(status)
+
+    async def write_envelope(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Write envelope to node, without waiting for its acknowledgement.
+
+        Wait while the maximum number of envelopes in flight are not acknowledged.
+
+        :param envelope: the envelope.
+        :return: the future of the acn status of the envelope.
+        """
+        await self._inflight_slots.acquire()
+        loop = asyncio.get_event_loop()
+        ack = loop.create_future()
+        timeout_handle = loop.call_later(
+            self.ACN_ACK_TIMEOUT, self._on_ack_timeout, ack
+        )
+        ack.add_done_callback(lambda _: timeout_handle.cancel())
+        ack.add_done_callback(lambda _: self._inflight_slots.release())
+        buf = self.make_acn_envelope_message(envelope)
+        async with self._write_lock:
+            self._pending_acks.append(ack)
+            try:
+                await self._write(buf)
+            except Exception as e:
+                self.fail_pending_acks(e)
+                ack.exception()  # the exception is raised here instead
+                raise
+        return ack
+
+    @staticmethod
+    def check_status(status: Any) -> None:
+        """
+        Check the acn status of an envelope sent.
+
+        :param status: the acn status body.
+        :raises ValueError: if the status is not a success.
+        """
         if status.code != int(AcnMessage.StatusBody.StatusCode.SUCCESS):  # type: ignore  # pylint: disable=no-member
             raise ValueError(  # pragma: nocover
                 f"failed to send envelope. got error confirmation: {status.code}"
             )
 
+    def fail_pending_acks(self, exception: Exception) -> None:
+        """
+        Fail the envelopes not acknowledged, as their acknowledgements cannot be matched anymore.
+
+        :param exception: the exception set on their acknowledgements.
+        """
+        while self._pending_acks:
+            ack = self._pending_acks.popleft()
+            if not ack.done():
+                ack.set_exception(exception)
+
+    def _on_ack_timeout(self, ack: asyncio.Future) -> None:
+        """Fail the envelopes not acknowledged when an acknowledgement is late."""
+        if not ack.done():
+            self.fail_pending_acks(ValueError("acn status await timeout!"))
+
     async def wait_for_status(self) -> Any:
         """Get status."""
         if self._wait_status is None:  # pragma: nocover
@@ -184,6 +247,7 @@ class NodeClient:
             buf = await self._read()
 
             if not buf:
+                self.fail_pending_acks(ConnectionError("Connection to node closed."))
                 return None
 
             try:
@@ -212,10 +276,10 @@ class NodeClient:
                     raise
 
             elif performative == "status":
-                if self._wait_status is not None:
-                    self._wait_status.set_result(
-                        acn_msg.status.body  # pylint: disable=no-member
-                    )
+                if self._pending_acks:
+                    ack = self._pending_acks.popleft()
+                    if not ack.done():
+                        ack.set_result(acn_msg.status.body)  # pylint: disable=no-member
             else:  # pragma: nocover
                 await self.write_acn_status_error(
                     f"Bad acn message {performative}",
@@ -443,12 +507,17 @@ class Libp2pNode:
 
         return await self.pipe.connect(timeout=self._connection_timeout)
 
-    def get_client(self) -> NodeClient:
-        """Get client instance to communicate to node."""
+    def get_client(self, max_inflight_envelopes: int = 1) -> NodeClient:
+        """
+        Get client instance to communicate to node.
+
+        :param max_inflight_envelopes: the maximum number of envelopes sent and not acknowledged.
+        :return: the node client
+        """
         if self.pipe is None:
             raise Exception("pipe was not set")  # pragma: nocover
 
-        return NodeClient(self.pipe, self.record)
+        return NodeClient(self.pipe, self.record, max_inflight_envelopes)
 
     def _child_watcher_callback(self, *_) -> None:  # type: ignore # pragma: nocover
         """Log if process was terminated before stop was called."""
@@ -651,10 +720,18 @@ class P2PLibp2pConnection(Connection):
 
     connection_id = PUBLIC_ID
     DEFAULT_MAX_RESTARTS = 5
+    DEFAULT_MAX_INFLIGHT_ENVELOPES = 1
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a p2p libp2p connection."""
         super().__init__(**kwargs)
+        self.max_inflight_envelopes = self.configuration.config.get(
+            "max_inflight_envelopes", self.DEFAULT_MAX_INFLIGHT_ENVELOPES
+        )
+        enforce(
+            self.max_inflight_envelopes >= 1,
+            "max_inflight_envelopes should be at least 1",
+        )
         ledger_id = self.configuration.config.get("ledger_id", DEFAULT_LEDGER)
         if ledger_id not in SUPPORTED_LEDGER_IDS:
             raise ValueError(  # pragma: nocover
@@ -801,6 +878,8 @@ class P2PLibp2pConnection(Connection):
 
         self._send_queue: Optional[asyncio.Queue] = None
         self._send_task: Optional[asyncio.Task] = None
+        self._acks_queue: Optional[asyncio.Queue] = None
+        self._acks_task: Optional[asyncio.Task] = None
 
     def _check_node_built(self) -> str:
         """Check node built."""
@@ -831,11 +910,14 @@ class P2PLibp2pConnection(Connection):
                 self._receive_from_node(), loop=self.loop
             )
             self._send_task = self.loop.create_task(self._send_loop())
+            if self.max_inflight_envelopes > 1:
+                self._acks_queue = asyncio.Queue()
+                self._acks_task = self.loop.create_task(self._acks_loop())
 
     async def _start_node(self) -> None:
         """Start node and set node client instance."""
         await self.node.start()
-        self._node_client = self.node.get_client()
+        self._node_client = self.node.get_client(self.max_inflight_envelopes)
 
     async def _restart_node(self) -> None:
         """Stop and start node again."""
@@ -858,6 +940,10 @@ class P2PLibp2pConnection(Connection):
                 self._send_task.cancel()
                 self._send_task = None
 
+            if self._acks_task is not None:
+                self._acks_task.cancel()
+                self._acks_task = None
+
             await self.node.stop()
             if self._in_queue is not None:
                 self._in_queue.put_nowait(None)
@@ -910,6 +996,10 @@ class P2PLibp2pConnection(Connection):
 
         try:
             if self.node.is_proccess_running():
+                # acknowledgements of the envelopes sent before are lost with the pipe
+                self._node_client.fail_pending_acks(
+                    ConnectionError("Pipe to node reconnected.")
+                )
                 await self.node.pipe.connect()
                 await self._node_client.send_envelope(envelope)
                 self.logger.debug("Envelope sent after reconnect to node")
@@ -941,7 +1031,10 @@ class P2PLibp2pConnection(Connection):
         try:
             while self.is_connected:
                 envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                if self.max_inflight_envelopes > 1:
+                    await self._write_envelope_with_node_client(envelope)
+                else:
+                    await self._send_envelope_with_node_client(envelope)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
@@ -950,6 +1043,47 @@ class P2PLibp2pConnection(Connection):
             )
             await asyncio.shield(self.disconnect())
 
+    async def _write_envelope_with_node_client(self, envelope: Envelope) -> None:
+        """Write envelope with node client, its acknowledgement is checked by the acks loop."""
+        if not self._node_client or not self._acks_queue:  # pragma: nocover
+            raise ValueError(f"Node client not set! Can not send envelope: {envelope}")
+
+        try:
+            ack = await self._node_client.write_envelope(envelope)
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise  # pragma: nocover
+        except Exception as e:  # pylint: disable=broad-except
+            ack = self.loop.create_future()
+            ack.set_exception(e)
+        self._acks_queue.put_nowait((envelope, ack))
+
+    async def _acks_loop(self) -> None:
+        """Check the acknowledgements of the envelopes written, in order, and send again the failed ones."""
+        if not self._acks_queue:  # pragma: nocover
+            self.logger.error("Acks loop not started cause not connected properly.")
+            return
+        while self.is_connected:
+            envelope, ack = await self._acks_queue.get()
+            try:
+                NodeClient.check_status(await ack)
+                continue
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"Failed to send envelope {envelope}: {e}. Try send again."
+                )
+            try:
+                await self._send_envelope_with_node_client(envelope)
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    f"Failed to send an envelope {envelope}. Stop connection."
+                )
+                await asyncio.shield(self.disconnect())
+                return
+
     async def send(self, envelope: Envelope) -> None:
         """
         Send messages.
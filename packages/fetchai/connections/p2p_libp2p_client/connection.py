@@ -26,8 +26,9 @@ import ssl
 from asyncio import CancelledError
 from asyncio.events import AbstractEventLoop
 from asyncio.streams import StreamWriter
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from asn1crypto import x509  # type: ignore
 from ecdsa.curves import SECP256k1
@@ -72,11 +73,21 @@ class NodeClient:
 
     ACN_ACK_TIMEOUT = 5.0
 
-    def __init__(self, pipe: IPCChannelClient, node_por: AgentRecord) -> None:
+    def __init__(
+        self,
+        pipe: IPCChannelClient,
+        node_por: AgentRecord,
+        max_inflight_envelopes: int = 1,
+    ) -> None:
         """Set node client with pipe."""
         self.pipe = pipe
         self._wait_status: Optional[asyncio.Future] = None
         self.agent_record = node_por
+        # the node acknowledges the envelopes in the order it reads them,
+        # so the acknowledgements are matched to the oldest envelope not acknowledged.
+        self._pending_acks: Deque[asyncio.Future] = deque()
+        self._inflight_slots = asyncio.Semaphore(max_inflight_envelopes)
+        self._write_lock = asyncio.Lock()
 
     async def wait_for_status(self) -> Any:
         """Get status."""
@@ -131,16 +142,10 @@ class NodeClient:
         return await self.pipe.connect()
 
     async def send_envelope(self, envelope: Envelope) -> None:
-        """Send envelope to node."""
-        self._wait_status = asyncio.Future()
-        buf = self.make_acn_envelope_message(envelope)
-        await self._write(buf)
+        """Send envelope to node and wait for its acknowledgement."""
+        self._wait_status = await self.write_envelope(envelope)
         try:
-            status = await self.wait_for_status()
-            if status.code != int(AcnMessage.StatusBody.StatusCode.SUCCESS):  # type: ignore  # pylint: disable=no-member
-                raise ValueError(  # pragma: nocover
-                    f"failed to send envelope. got error confirmation: {status}"
-                )
+            self.check_status(await self.wait_for_status())
         except asyncio.TimeoutError:  # pragma: nocover
             if not self._wait_status.done():  # pragma: nocover
                 self._wait_status.set_exception(Exception("Timeout"))
@@ -149,6 +154,63 @@ class NodeClient:
         finally:
             self._wait_status = None
 
+    async def write_envelope(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Write envelope to node, without waiting for its acknowledgement.
+
+        Wait while the maximum number of envelopes in flight are not acknowledged.
+
+        :param envelope: the envelope.
+        :return: the future of the acn status of the envelope.
+        """
+        await self._inflight_slots.acquire()
+        loop = asyncio.get_event_loop()
+        ack = loop.create_future()
+        timeout_handle = loop.call_later(
+            self.ACN_ACK_TIMEOUT, self._on_ack_timeout, ack
+        )
+        ack.add_done_callback(lambda _: timeout_handle.cancel())
+        ack.add_done_callback(lambda _: self._inflight_slots.release())
+        buf = self.make_acn_envelope_message(envelope)
+        async with self._write_lock:
+            self._pending_acks.append(ack)
+            try:
+                await self._write(buf)
+            except Exception as e:
+                self.fail_pending_acks(e)
+                ack.exception()  # the exception is raised here instead
+                raise
+        return ack
+
+    @staticmethod
+    def check_status(status: Any) -> None:
+        """
+        Check the acn status of an envelope sent.
+
+        :param status: the acn status body.
+        :raises ValueError: if the status is not a success.
+        """
+        if status.code != int(AcnMessage.StatusBody.StatusCode.SUCCESS):  # type: ignore  # pylint: disable=no-member
+            raise ValueError(  # pragma: nocover
+                f"failed to send envelope. got error confirmation: {status}"
+            )
+
+    def fail_pending_acks(self, exception: Exception) -> None:
+        """
+        Fail the envelopes not acknowledged, as their acknowledgements cannot be matched anymore.
+
+        :param exception: the exception set on their acknowledgements.
+        """
+        while self._pending_acks:
+            ack = self._pending_acks.popleft()
+            if not ack.done():
+                ack.set_exception(exception)
+
+    def _on_ack_timeout(self, ack: asyncio.Future) -> None:
+        """Fail the envelopes not acknowledged when an acknowledgement is late."""
+        if not ack.done():
+            self.fail_pending_acks(ValueError("acn status await timeout!"))
+
     def make_agent_record(self) -> AcnMessage.AgentRecord:  # type: ignore
         """Make acn agent record."""
         agent_record = AcnMessage.AgentRecord(
@@ -167,6 +229,7 @@ class NodeClient:
             buf = await self._read()
 
             if not buf:
+                self.fail_pending_acks(ConnectionError("Connection to node closed."))
                 return None
 
             try:
@@ -195,10 +258,10 @@ class NodeClient:
                     raise
 
             elif performative == "status":
-                if self._wait_status is not None:
-                    self._wait_status.set_result(
-                        acn_msg.status.body  # pylint: disable=no-member
-                    )
+                if self._pending_acks:
+                    ack = self._pending_acks.popleft()
+                    if not ack.done():
+                        ack.set_result(acn_msg.status.body)  # pylint: disable=no-member
             else:  # pragma: nocover
                 await self.write_acn_status_error(
                     f"Bad acn message {performative}",
@@ -261,6 +324,7 @@ class NodeClient:
 
     async def close(self) -> None:
         """Close client and pipe."""
+        self.fail_pending_acks(ConnectionError("Node client closed."))
         await self.pipe.close()
 
 
@@ -276,11 +340,19 @@ class P2PLibp2pClientConnection(Connection):
 
     DEFAULT_CONNECT_RETRIES = 3
     DEFAULT_TLS_CONNECTION_SIGNATURE_TIMEOUT = 5.0
+    DEFAULT_MAX_INFLIGHT_ENVELOPES = 1
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a libp2p client connection."""
         super().__init__(**kwargs)
 
+        self.max_inflight_envelopes = self.configuration.config.get(
+            "max_inflight_envelopes", self.DEFAULT_MAX_INFLIGHT_ENVELOPES
+        )
+        enforce(
+            self.max_inflight_envelopes >= 1,
+            "max_inflight_envelopes should be at least 1",
+        )
         self.tls_connection_signature_timeout = self.configuration.config.get(
             "tls_connection_signature_timeout",
             self.DEFAULT_TLS_CONNECTION_SIGNATURE_TIMEOUT,
@@ -363,6 +435,8 @@ class P2PLibp2pClientConnection(Connection):
 
         self._send_queue: Optional[asyncio.Queue] = None
         self._send_task: Optional[asyncio.Task] = None
+        self._acks_queue: Optional[asyncio.Queue] = None
+        self._acks_task: Optional[asyncio.Task] = None
 
     async def _send_loop(self) -> None:
         """Handle message in  the send queue."""
@@ -373,7 +447,10 @@ class P2PLibp2pClientConnection(Connection):
         try:
             while self.is_connected:
                 envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                if self.max_inflight_envelopes > 1:
+                    await self._write_envelope_with_node_client(envelope)
+                else:
+                    await self._send_envelope_with_node_client(envelope)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
@@ -397,6 +474,48 @@ class P2PLibp2pClientConnection(Connection):
             await self._perform_connection_to_node()
             await self._node_client.send_envelope(envelope)
 
+    async def _write_envelope_with_node_client(self, envelope: Envelope) -> None:
+        """Write envelope with node client, its acknowledgement is checked by the acks loop."""
+        if not self._node_client or not self._acks_queue:  # pragma: nocover
+            raise ValueError("Connection not connected to node!")
+
+        self._ensure_valid_envelope_for_external_comms(envelope)
+        try:
+            ack = await self._node_client.write_envelope(envelope)
+        except asyncio.CancelledError:  # pylint: disable=try-except-raise
+            raise  # pragma: nocover
+        except Exception as e:  # pylint: disable=broad-except
+            ack = self.loop.create_future()
+            ack.set_exception(e)
+        self._acks_queue.put_nowait((envelope, ack))
+
+    async def _acks_loop(self) -> None:
+        """Check the acknowledgements of the envelopes written, in order, and send again the failed ones."""
+        if not self._acks_queue:  # pragma: nocover
+            self.logger.error("Acks loop not started cause not connected properly.")
+            return
+        while self.is_connected:
+            envelope, ack = await self._acks_queue.get()
+            try:
+                NodeClient.check_status(await ack)
+                continue
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"Failed to send envelope {envelope}: {e}. Try send again."
+                )
+            try:
+                await self._send_envelope_with_node_client(envelope)
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    f"Failed to send an envelope {envelope}. Stop connection."
+                )
+                await asyncio.shield(self.disconnect())
+                return
+
     async def connect(self) -> None:
         """Set up the connection."""
         if self.is_connected:  # pragma: nocover
@@ -413,6 +532,9 @@ class P2PLibp2pClientConnection(Connection):
             )
             self._send_queue = asyncio.Queue()
             self._send_task = self.loop.create_task(self._send_loop())
+            if self.max_inflight_envelopes > 1:
+                self._acks_queue = asyncio.Queue()
+                self._acks_task = self.loop.create_task(self._acks_loop())
 
     async def _perform_connection_to_node(self) -> None:
         """Connect to node with retries."""
@@ -440,7 +562,9 @@ class P2PLibp2pClientConnection(Connection):
                         f"Pipe connection error: {pipe.last_exception or ''}"
                     )
 
-                self._node_client = NodeClient(pipe, self.node_por)
+                self._node_client = NodeClient(
+                    pipe, self.node_por, self.max_inflight_envelopes
+                )
                 await self._setup_connection()
 
                 self.logger.info(
@@ -491,6 +615,11 @@ class P2PLibp2pClientConnection(Connection):
                 self._send_task.cancel()
             self._send_task = None
 
+        if self._acks_task is not None:
+            if not self._acks_task.done():
+                self._acks_task.cancel()
+            self._acks_task = None
+
         try:
             self.logger.debug("disconnecting libp2p node client connection...")
             if self._node_client is not None:
@@ -73,12 +73,15 @@ class NodeClient:
 
     NO_ENVELOPES_SLEEP_TIME: float = 2.0
 
-    def __init__(self, node_uri: Uri, node_por: AgentRecord) -> None:
+    def __init__(
+        self, node_uri: Uri, node_por: AgentRecord, max_inflight_envelopes: int = 1
+    ) -> None:
         """Set node client with pipe."""
         self.node_uri = node_uri
         self.agent_record = node_por
         self._session_token: Optional[str] = None
         self.ssl_ctx = Optional[ssl.SSLContext]
+        self._inflight_slots = asyncio.Semaphore(max_inflight_envelopes)
 
     async def connect(self) -> bool:
         """Connect to node with pipe."""
@@ -107,6 +110,20 @@ class NodeClient:
             text = await response.text()
             raise ValueError(f"Bad response code: {response.status} {text}")
 
+    async def write_envelope(self, envelope: Envelope) -> asyncio.Future:
+        """
+        Send envelope to node, without waiting for the response.
+
+        Wait while the maximum number of envelopes in flight are not answered.
+
+        :param envelope: the envelope.
+        :return: the future of the sending of the envelope, failed if the node did not accept it.
+        """
+        await self._inflight_slots.acquire()
+        ack = asyncio.ensure_future(self.send_envelope(envelope))
+        ack.add_done_callback(lambda _: self._inflight_slots.release())
+        return ack
+
     async def _perform_http_request(
         self, method: str, url: str, **kwargs: Any
     ) -> Tuple[ClientResponse, bytes]:
@@ -194,11 +211,19 @@ class P2PLibp2pMailboxConnection(Connection):
 
     DEFAULT_CONNECT_RETRIES = 3
     DEFAULT_TLS_CONNECTION_SIGNATURE_TIMEOUT = 5.0
+    DEFAULT_MAX_INFLIGHT_ENVELOPES = 1
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a libp2p client connection."""
         super().__init__(**kwargs)
 
+        self.max_inflight_envelopes = self.configuration.config.get(
+            "max_inflight_envelopes", self.DEFAULT_MAX_INFLIGHT_ENVELOPES
+        )
+        enforce(
+            self.max_inflight_envelopes >= 1,
+            "max_inflight_envelopes should be at least 1",
+        )
         self.tls_connection_signature_timeout = self.configuration.config.get(
             "tls_connection_signature_timeout",
             self.DEFAULT_TLS_CONNECTION_SIGNATURE_TIMEOUT,
@@ -281,6 +306,8 @@ class P2PLibp2pMailboxConnection(Connection):
 
         self._send_queue: Optional[asyncio.Queue] = None
         self._send_task: Optional[asyncio.Task] = None
+        self._acks_queue: Optional[asyncio.Queue] = None
+        self._acks_task: Optional[asyncio.Task] = None
 
     async def _send_loop(self) -> None:
         """Handle message in  the send queue."""
@@ -291,7 +318,10 @@ class P2PLibp2pMailboxConnection(Connection):
         try:
             while self.is_connected:
                 envelope = await self._send_queue.get()
-                await self._send_envelope_with_node_client(envelope)
+                if self.max_inflight_envelopes > 1:
+                    await self._write_envelope_with_node_client(envelope)
+                else:
+                    await self._send_envelope_with_node_client(envelope)
         except asyncio.CancelledError:  # pylint: disable=try-except-raise
             raise  # pragma: nocover
         except Exception:  # pylint: disable=broad-except # pragma: nocover
@@ -315,6 +345,42 @@ class P2PLibp2pMailboxConnection(Connection):
             await self._perform_connection_to_node()
             await self._node_client.send_envelope(envelope)
 
+    async def _write_envelope_with_node_client(self, envelope: Envelope) -> None:
+        """Send envelope with node client, its response is checked by the acks loop."""
+        if not self._node_client or not self._acks_queue:  # pragma: nocover
+            raise ValueError("Connection not connected to node!")
+
+        self._ensure_valid_envelope_for_external_comms(envelope)
+        ack = await self._node_client.write_envelope(envelope)
+        self._acks_queue.put_nowait((envelope, ack))
+
+    async def _acks_loop(self) -> None:
+        """Check the responses of the envelopes sent, in order, and send again the failed ones."""
+        if not self._acks_queue:  # pragma: nocover
+            self.logger.error("Acks loop not started cause not connected properly.")
+            return
+        while self.is_connected:
+            envelope, ack = await self._acks_queue.get()
+            try:
+                await ack
+                continue
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"Failed to send envelope {envelope}: {e}. Try send again."
+                )
+            try:
+                await self._send_envelope_with_node_client(envelope)
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise  # pragma: nocover
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception(
+                    f"Failed to send an envelope {envelope}. Stop connection."
+                )
+                await asyncio.shield(self.disconnect())
+                return
+
     async def connect(self) -> None:
         """Set up the connection."""
         if self.is_connected:  # pragma: nocover
@@ -331,6 +397,9 @@ class P2PLibp2pMailboxConnection(Connection):
             )
             self._send_queue = asyncio.Queue()
             self._send_task = self.loop.create_task(self._send_loop())
+            if self.max_inflight_envelopes > 1:
+                self._acks_queue = asyncio.Queue()
+                self._acks_task = self.loop.create_task(self._acks_loop())
 
     async def _perform_connection_to_node(self) -> None:
         """Connect to node with retries."""
@@ -347,7 +416,9 @@ class P2PLibp2pMailboxConnection(Connection):
                         str(self.node_uri), attempt + 1
                     )
                 )
-                self._node_client = NodeClient(self.node_uri, self.node_por)
+                self._node_client = NodeClient(
+                    self.node_uri, self.node_por, self.max_inflight_envelopes
+                )
                 await self._setup_connection()
 
                 self.logger.info(
@@ -398,6 +469,11 @@ class P2PLibp2pMailboxConnection(Connection):
                 self._send_task.cancel()
             self._send_task = None
 
+        if self._acks_task is not None:
+            if not self._acks_task.done():
+                self._acks_task.cancel()
+            self._acks_task = None
+
         try:
             self.logger.debug("disconnecting libp2p node client connection...")
             if self._node_client is not None:
@@ -23,12 +23,15 @@ import asyncio
 import logging
 from typing import Any, Dict, Optional, Tuple, Union, cast
 
+import aiohttp.web
 import aioprometheus  # type: ignore
+from aioprometheus.renderer import render  # type: ignore
 
 from aea.common import Address
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
+from aea.helpers.metrics import registry as agent_metrics_registry
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
@@ -77,6 +80,23 @@ class PrometheusDialogues(BasePrometheusDialogues):
         )
 
 
+class AgentMetricsService(aioprometheus.Service):
+    """A prometheus service which also exposes the metrics of the framework."""
+
+    async def handle_metrics(
+        self, request: aiohttp.web.Request  # pylint: disable=unused-argument
+    ) -> aiohttp.web.Response:
+        """
+        Handle a request to the metrics route, in the text format.
+
+        :param request: the request.
+        :return: the response
+        """
+        content, http_headers = render(self.registry, [])
+        content += agent_metrics_registry.render().encode("utf-8")
+        return aiohttp.web.Response(body=content, headers=http_headers)
+
+
 class PrometheusChannel:
     """A wrapper for interacting with a prometheus server."""
 
@@ -86,6 +106,7 @@ class PrometheusChannel:
         host: str,
         port: int,
         logger: Union[logging.Logger, logging.LoggerAdapter],
+        agent_metrics: bool = False,
     ):
         """
         Initialize a prometheus channel.
@@ -94,6 +115,7 @@ class PrometheusChannel:
         :param host: The host at which to expose the metrics.
         :param port: The port at which to expose the metrics.
         :param logger: The logger.
+        :param agent_metrics: whether to also expose the metrics of the framework.
         """
         self.address = address
         self.metrics = {}  # type: Dict[str, aioprometheus.Collector]
@@ -103,7 +125,9 @@ class PrometheusChannel:
         self._dialogues = PrometheusDialogues()
         self._host = host
         self._port = port
-        self._service = aioprometheus.Service()
+        self._service = (
+            AgentMetricsService() if agent_metrics else aioprometheus.Service()
+        )
 
     def _get_message_and_dialogue(
         self, envelope: Envelope
@@ -282,8 +306,11 @@ class PrometheusConnection(Connection):
 
         self.host = cast(str, self.configuration.config.get("host", DEFAULT_HOST))
         self.port = cast(int, self.configuration.config.get("port", DEFAULT_PORT))
+        agent_metrics = cast(
+            bool, self.configuration.config.get("agent_metrics", False)
+        )
         self.channel = PrometheusChannel(
-            self.address, self.host, self.port, self.logger
+            self.address, self.host, self.port, self.logger, agent_metrics
         )
 
     async def connect(self) -> None:
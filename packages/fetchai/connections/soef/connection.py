@@ -22,24 +22,26 @@ import copy
 import logging
 import os
 import re
+import ssl
 import urllib
 from asyncio import CancelledError
 from concurrent.futures._base import CancelledError as ConcurrentCancelledError
-from concurrent.futures.thread import ThreadPoolExecutor
 from contextlib import suppress
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union, cast
 from urllib import parse
 from uuid import uuid4
 
+import aiohttp
+import certifi  # pylint: disable=wrong-import-order
 from defusedxml import ElementTree  # pylint: disable=wrong-import-order
 
 from aea.common import Address, JSONLike
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.exceptions import enforce
-from aea.helpers import http_requests as requests
+from aea.helpers.constants import NETWORK_REQUEST_DEFAULT_TIMEOUT
 from aea.helpers.search.models import (
     Constraint,
     ConstraintTypes,
@@ -70,6 +72,10 @@ PUBLIC_ID = PublicId.from_str("fetchai/soef:0.27.0")
 
 NOT_SPECIFIED = object()
 
+ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+AgentsInfoBody = Dict[str, Dict[str, Union[str, Dict[str, str]]]]
+
 PERSONALITY_PIECES_KEYS = [
     "genus",
     "classification",
@@ -205,6 +211,7 @@ class SOEFChannel:
 
     PING_PERIOD = 30 * 60  # 30 minutes
     FIND_AROUND_ME_REQUEST_DELAY = 2  # seconds
+    FIND_AROUND_ME_CACHE_TTL = 5  # seconds
 
     def __init__(
         self,
@@ -267,12 +274,18 @@ class SOEFChannel:
         self._unique_page_address = None  # type: Optional[str]
         self.agent_location = None  # type: Optional[Location]
         self.in_queue = None  # type: Optional[asyncio.Queue]
-        self._executor_pool: Optional[ThreadPoolExecutor] = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self.chain_identifier: str = chain_identifier or self.DEFAULT_CHAIN_IDENTIFIER
         self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
         self._ping_periodic_task: Optional[asyncio.Task] = None
         self._find_around_me_queue: Optional[asyncio.Queue] = None
         self._find_around_me_processor_task: Optional[asyncio.Task] = None
+        # searches waiting for the result of a same request, by request key
+        self._find_around_me_waiters: Dict[
+            Hashable, List[Tuple[OefSearchMessage, OefSearchDialogue]]
+        ] = {}
+        # expiry time and result of the last requests, by request key
+        self._find_around_me_cache: Dict[Hashable, Tuple[float, AgentsInfoBody]] = {}
         self.logger = logger
         self._unregister_lock: Optional[asyncio.Lock] = None
 
@@ -314,50 +327,89 @@ class SOEFChannel:
 
     async def _find_around_me_processor(self) -> None:
         """Process find me around requests in background task."""
-        while self._find_around_me_queue is not None:
-            try:
-                task = await self._find_around_me_queue.get()
-                oef_message, oef_search_dialogue, radius, params = task
-            except (
-                asyncio.CancelledError,
-                CancelledError,
-                GeneratorExit,
-            ):  # pylint: disable=try-except-raise  # pragma: nocover
-                return
-            except Exception:  # pragma: nocover
-                self.logger.exception(
-                    "Error on reading messages queue for find around me!"
-                )
-                raise
+        try:
+            while self._find_around_me_queue is not None:
+                try:
+                    key, radius, params = await self._find_around_me_queue.get()
+                except Exception:  # pragma: nocover
+                    self.logger.exception(
+                        "Error on reading messages queue for find around me!"
+                    )
+                    raise
+                await self._process_find_around_me_request(key, radius, params)
+        except (
+            asyncio.CancelledError,
+            CancelledError,
+            GeneratorExit,
+        ):  # pylint: disable=try-except-raise
+            self.logger.debug("_find_around_me_processor exited")
 
-            try:
-                await self._find_around_me_handle_request(
-                    oef_message, oef_search_dialogue, radius, params
-                )
-                await asyncio.sleep(self.FIND_AROUND_ME_REQUEST_DELAY)
-            except (
-                asyncio.CancelledError,
-                CancelledError,
-                GeneratorExit,
-            ):  # pylint: disable=try-except-raise
-                return
-            except SOEFException:  # pragma: nocover
-                await self._send_error_response(
-                    oef_message,
-                    oef_search_dialogue,
-                    oef_error_operation=OefSearchMessage.OefErrorOperation.OTHER,
-                )
-            except Exception as e:  # pylint: disable=broad-except  # pragma: nocover
+    async def _process_find_around_me_request(
+        self, key: Hashable, radius: float, params: Dict[str, List[str]]
+    ) -> None:
+        """
+        Send a find around me request, and its result or an error to the searches waiting for it.
+
+        :param key: the key of the request.
+        :param radius: the radius in which to search
+        :param params: the parameters for the query
+        """
+        # the searches not answered yet, taken once the request is done, so that
+        # the same searches sent during the request wait for its result
+        waiters: Optional[List[Tuple[OefSearchMessage, OefSearchDialogue]]] = None
+        cancelled = False
+        try:
+            agents = await self._find_around_me_request(radius, params)
+            self._cache_find_around_me_result(key, agents)
+            waiters = self._find_around_me_waiters.pop(key, [])
+            while waiters:
+                oef_message, oef_search_dialogue = waiters[0]
+                await self._send_search_result(oef_message, oef_search_dialogue, agents)
+                waiters.pop(0)
+        except (asyncio.CancelledError, CancelledError, GeneratorExit):
+            cancelled = True
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            if not isinstance(e, SOEFException):
                 self.logger.exception(
                     f"Exception occurred in  _find_around_me_processor: {e}"
                 )
+            unanswered = (
+                waiters
+                if waiters is not None
+                else self._find_around_me_waiters.pop(key, [])
+            )
+            for oef_message, oef_search_dialogue in unanswered:
                 await self._send_error_response(
                     oef_message,
                     oef_search_dialogue,
                     oef_error_operation=OefSearchMessage.OefErrorOperation.OTHER,
                 )
-            finally:
-                self.logger.debug("_find_around_me_processor exited")
+        finally:
+            if not cancelled:
+                # the requests are rate limited, the failed ones too
+                await asyncio.sleep(self.FIND_AROUND_ME_REQUEST_DELAY)
+
+    def _cache_find_around_me_result(
+        self, key: Hashable, agents: AgentsInfoBody
+    ) -> None:
+        """
+        Cache the result of a find around me request, and drop the expired results.
+
+        :param key: the key of the request.
+        :param agents: the agents found.
+        """
+        now = self.loop.time()
+        self._find_around_me_cache = {
+            cached_key: cached
+            for cached_key, cached in self._find_around_me_cache.items()
+            if cached[0] > now
+        }
+        if self.FIND_AROUND_ME_CACHE_TTL > 0:
+            self._find_around_me_cache[key] = (
+                now + self.FIND_AROUND_ME_CACHE_TTL,
+                agents,
+            )
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -441,27 +493,62 @@ class SOEFChannel:
         """
         await self.process_envelope(envelope)
 
-    async def _request_text(self, *args: Any, **kwargs: Any) -> str:
-        """Perform and http request and return text of response."""
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session of the channel, which reuses the connections to the SOEF.
 
-        def _do_request() -> requests.Response:
-            return requests.request(*args, **kwargs)
+        :return: the session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=ssl_context),
+                timeout=aiohttp.ClientTimeout(total=NETWORK_REQUEST_DEFAULT_TIMEOUT),
+            )
+        return self._session
+
+    async def _request_text(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Union[str, List[str]]]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Perform and http request and return text of response.
 
+        :param method: the http method.
+        :param url: the url.
+        :param params: the query parameters, a list value being sent as repeated parameters.
+        :param timeout: the timeout of the request, in seconds.
+        :return: the text of the response
+        """
+        query = [
+            (name, value)
+            for name, values in (params or {}).items()
+            for value in (values if isinstance(values, list) else [values])
+        ]
         try:
-            response = await self.loop.run_in_executor(self._executor_pool, _do_request)
-        except requests.ConnectionError as e:
+            async with self._get_session().request(
+                method,
+                url,
+                params=query,
+                timeout=aiohttp.ClientTimeout(total=timeout) if timeout else None,
+            ) as response:
+                status_code = response.status
+                text = await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
             raise SOEFNetworkConnectionError(e) from e
 
-        if response.status_code < 200 or response.status_code >= 300:
+        if status_code < 200 or status_code >= 300:
             raise SOEFServerBadResponseError(
-                f"Bad server response: code {response.status_code} when 2XX expected. Request data: ({args}, {kwargs}) Response content: `{response.text}`"
+                f"Bad server response: code {status_code} when 2XX expected. Request data: ({method}, {url}, {params}) Response content: `{text}`"
             )
-        if not response.text:
+        if not text:
             raise SOEFServerBadResponseError(
-                f"Bad server response: empty response. Request data: ({args}, {kwargs})"
+                f"Bad server response: empty response. Request data: ({method}, {url}, {params})"
             )
 
-        return response.text
+        return text
 
     async def process_envelope(self, envelope: Envelope) -> None:
         """
@@ -1087,13 +1174,13 @@ class SOEFChannel:
                 reachable_check_count = self.connection_check_max_retries
             except Exception as e:  # pylint: disable=broad-except # pragma: nocover
                 if reachable_check_count == self.connection_check_max_retries:
+                    await self._close_session()
                     raise e
                 self.logger.debug(f"Exception during SOEF reachability check: {e}.")
 
         self.in_queue = asyncio.Queue()
         self._find_around_me_queue = asyncio.Queue()
         self._unregister_lock = asyncio.Lock()
-        self._executor_pool = ThreadPoolExecutor(max_workers=10)
         self._find_around_me_processor_task = self._loop.create_task(
             self._find_around_me_processor()
         )
@@ -1126,6 +1213,15 @@ class SOEFChannel:
 
         await self.in_queue.put(None)
         self._find_around_me_queue = None
+        self._find_around_me_waiters.clear()
+        self._find_around_me_cache.clear()
+        await self._close_session()
+
+    async def _close_session(self) -> None:
+        """Close the session of the channel, and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def search_services(
         self, oef_message: OefSearchMessage, oef_search_dialogue: OefSearchDialogue
@@ -1177,6 +1273,9 @@ class SOEFChannel:
         """
         Add find agent task to queue to process in dedicated loop respectful to timeouts.
 
+        A search same as a cached one is answered from the cache, a search same as a
+        queued one waits for the result of the queued one.
+
         :param oef_message: OefSearchMessage
         :param oef_search_dialogue: OefSearchDialogue
         :param radius: the radius in which to search
@@ -1184,33 +1283,55 @@ class SOEFChannel:
         """
         if not self._find_around_me_queue:
             raise ValueError("SOEFChannel not started.")  # pragma: nocover
-        await self._find_around_me_queue.put(
-            (oef_message, oef_search_dialogue, radius, params)
+        key = self._find_around_me_key(radius, params)
+        cached = self._find_around_me_cache.get(key)
+        if cached is not None and cached[0] > self.loop.time():
+            await self._send_search_result(oef_message, oef_search_dialogue, cached[1])
+            return
+        waiters = self._find_around_me_waiters.get(key)
+        if waiters is not None:
+            waiters.append((oef_message, oef_search_dialogue))
+            return
+        self._find_around_me_waiters[key] = [(oef_message, oef_search_dialogue)]
+        await self._find_around_me_queue.put((key, radius, params))
+
+    def _find_around_me_key(
+        self, radius: float, params: Dict[str, List[str]]
+    ) -> Hashable:
+        """
+        Get the key of a find around me request, same for the same searches.
+
+        :param radius: the radius in which to search
+        :param params: the parameters for the query
+        :return: the key
+        """
+        location = (
+            None
+            if self.agent_location is None
+            else (self.agent_location.latitude, self.agent_location.longitude)
+        )
+        return (
+            location,
+            str(radius),
+            tuple(sorted((name, tuple(values)) for name, values in params.items())),
         )
 
-    async def _find_around_me_handle_request(
-        self,
-        oef_message: OefSearchMessage,
-        oef_search_dialogue: OefSearchDialogue,
-        radius: float,
-        params: Dict[str, List[str]],
-    ) -> None:
+    async def _find_around_me_request(
+        self, radius: float, params: Dict[str, List[str]]
+    ) -> AgentsInfoBody:
         """
-        Find agents around me.
+        Request the agents around me to the SOEF.
 
-        :param oef_message: OefSearchMessage
-        :param oef_search_dialogue: OefSearchDialogue
         :param radius: the radius in which to search
         :param params: the parameters for the query
+        :return: the information of the agents found, by address
         """
-        if self.in_queue is None:
-            raise ValueError("Inqueue not set!")  # pragma: nocover
         self.logger.debug("Searching in radius={} of myself".format(radius))
 
         root = await self._generic_oef_command(
             "find_around_me", {"range_in_km": [str(radius)], **params}
         )
-        agents = {}  # type: Dict[str, Dict[str, Union[str, Dict[str, str]]]]
+        agents = {}  # type: AgentsInfoBody
         for agent in root.findall(path=".//agent"):
             chain_identifier = ""
             for identities in agent.findall("identities"):
@@ -1237,7 +1358,23 @@ class SOEFChannel:
                                     "longitude": location.find("longitude").text,
                                     "latitude": location.find("latitude").text,
                                 }
+        return agents
 
+    async def _send_search_result(
+        self,
+        oef_message: OefSearchMessage,
+        oef_search_dialogue: OefSearchDialogue,
+        agents: AgentsInfoBody,
+    ) -> None:
+        """
+        Send the result of a search.
+
+        :param oef_message: OefSearchMessage
+        :param oef_search_dialogue: OefSearchDialogue
+        :param agents: the information of the agents found, by address
+        """
+        if self.in_queue is None:
+            raise ValueError("Inqueue not set!")  # pragma: nocover
         message = oef_search_dialogue.reply(
             performative=OefSearchMessage.Performative.SEARCH_RESULT,
             target_message=oef_message,
@@ -26,7 +26,7 @@ from asyncio import CancelledError
 from asyncio.tasks import Task
 from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, AsyncIterable, List, Optional
+from typing import Any, AsyncIterable, IO, List, Optional
 
 from aea.configurations.base import PublicId
 from aea.configurations.constants import (
@@ -34,19 +34,118 @@ from aea.configurations.constants import (
     DEFAULT_OUTPUT_FILE_NAME,
 )
 from aea.connections.base import Connection, ConnectionStates
-from aea.helpers.file_io import envelope_from_bytes, lock_file, write_envelope
+from aea.helpers.file_io import (
+    _encode,
+    envelope_from_bytes,
+    lock_file,
+    write_envelope,
+    write_with_lock,
+)
 from aea.mail.base import Envelope
 
 
+try:
+    from watchdog.observers.inotify_c import Inotify, InotifyConstants
+
+    IS_INOTIFY_AVAILABLE = True
+except Exception:  # pragma: nocover  # pylint: disable=broad-except
+    # watchdog not installed, or not on Linux
+    IS_INOTIFY_AVAILABLE = False
+
+
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.stub")
 
 INPUT_FILE_KEY = "input_file"
 OUTPUT_FILE_KEY = "output_file"
+APPEND_ONLY_KEY = "append_only"
 SEPARATOR = b","
+FRAME_HEADER_SEPARATOR = b":"
+FRAME_TERMINATOR = b"\n"
+MAX_FRAME_HEADER_SIZE = 20
+INOTIFY_BUFFER_SIZE = 64 * 1024
 
 PUBLIC_ID = PublicId.from_str("fetchai/stub:0.21.0")
 
 
+def frame_envelope(envelope: Envelope, separator: bytes = SEPARATOR) -> bytes:
+    r"""
+    Encode an envelope in a length-prefixed record, as read and written in append-only mode.
+
+    The record is the length of the encoded envelope, a colon, the encoded envelope
+    and a new line, e.g.:
+
+        75:recipient_agent,sender_agent,fetchai/default:1.0.0,...,\n
+
+    :param envelope: the envelope.
+    :param separator: the separator of the envelope fields.
+    :return: the record
+    """
+    encoded_envelope = _encode(envelope, separator=separator)
+    return (
+        str(len(encoded_envelope)).encode("ascii")
+        + FRAME_HEADER_SEPARATOR
+        + encoded_envelope
+        + FRAME_TERMINATOR
+    )
+
+
+def write_framed_envelopes(
+    envelopes: List[Envelope], file_pointer: IO[bytes], separator: bytes = SEPARATOR
+) -> None:
+    """
+    Append envelopes to a file read in append-only mode, with one write.
+
+    :param envelopes: the envelopes.
+    :param file_pointer: the file, opened in append mode.
+    :param separator: the separator of the envelope fields.
+    """
+    write_with_lock(
+        file_pointer,
+        b"".join(frame_envelope(envelope, separator) for envelope in envelopes),
+    )
+
+
+def split_framed_messages(
+    buffer: bytearray, logger: logging.Logger = _default_logger
+) -> List[bytes]:
+    """
+    Take the complete records out of a buffer, leaving an incomplete last record in it.
+
+    A malformed record is dropped up to the next new line.
+
+    :param buffer: the bytes read and not yet split.
+    :param logger: the logger.
+    :return: the encoded envelopes of the records
+    """
+    messages = []  # type: List[bytes]
+    start = 0
+    while start < len(buffer):
+        header_end = buffer.find(
+            FRAME_HEADER_SEPARATOR, start, start + MAX_FRAME_HEADER_SIZE
+        )
+        header = bytes(buffer[start:header_end])
+        if header_end == -1 or not header.isdigit():
+            if header_end == -1 and len(buffer) - start < MAX_FRAME_HEADER_SIZE:
+                break  # the header is not complete
+            next_start = buffer.find(FRAME_TERMINATOR, start) + 1
+            next_start = next_start or len(buffer)
+            logger.error(f"Bad formatted record: {bytes(buffer[start:next_start])!r}")
+            start = next_start
+            continue
+        end = header_end + 1 + int(header)
+        if len(buffer) <= end:
+            break  # the record is not complete
+        if buffer[end : end + 1] != FRAME_TERMINATOR:
+            next_start = buffer.find(FRAME_TERMINATOR, end) + 1 or len(buffer)
+            logger.error(f"Bad formatted record: {bytes(buffer[start:next_start])!r}")
+            start = next_start
+            continue
+        messages.append(bytes(buffer[header_end + 1 : end]))
+        start = end + 1
+    del buffer[:start]
+    return messages
+
+
 class StubConnection(Connection):
     r"""A stub connection.
 
@@ -73,6 +172,12 @@ class StubConnection(Connection):
         #>>> fp.write(b"...\n")
 
     It is discouraged adding a message with a text editor since the outcome depends on the actual text editor used.
+
+    With the `append_only` configuration set, the input file is never truncated: it is
+    tailed from a read offset, and the envelopes are length-prefixed records as made by
+    `frame_envelope`, so that records written in bursts are split as they arrive.
+    The envelopes sent are buffered and appended to the output file in batches, in the
+    same format.
     """
 
     connection_id = PUBLIC_ID
@@ -82,6 +187,9 @@ class StubConnection(Connection):
     )
 
     read_delay = 0.001
+    max_read_delay = 0.1
+    watched_read_delay = 1.0
+    write_buffer_size = 1000
 
     def __init__(self, **kwargs: Any):
         """Initialize a stub connection."""
@@ -103,6 +211,9 @@ class StubConnection(Connection):
 
         self.input_file_path = input_file_path
         self.output_file_path = output_file_path
+        self.append_only: bool = bool(
+            self.configuration.config.get(APPEND_ONLY_KEY, False)
+        )
 
         self.input_file: Optional[typing.IO] = None
         self.output_file: Optional[typing.IO] = None
@@ -110,14 +221,23 @@ class StubConnection(Connection):
         self.in_queue = None  # type: Optional[asyncio.Queue]
 
         self._read_envelopes_task: Optional[Task] = None
+        self._input_event: Optional[asyncio.Event] = None
+        self._inotify: Optional[Any] = None
+        self._write_buffer: List[bytes] = []
+        self._write_buffer_task: Optional[Task] = None
+        self._write_error: Optional[Exception] = None
         self._write_pool = ThreadPoolExecutor(
             max_workers=1, thread_name_prefix="stub_connection_writer_"
         )  # sequential write only! but threaded!
 
     def _open_files(self) -> None:
         """Open file to read and write."""
-        self.input_file = open(self.input_file_path, "rb+")
-        self.output_file = open(self.output_file_path, "wb+")
+        if self.append_only:
+            self.input_file = open(self.input_file_path, "rb")
+            self.output_file = open(self.output_file_path, "ab")
+        else:
+            self.input_file = open(self.input_file_path, "rb+")
+            self.output_file = open(self.output_file_path, "wb+")
 
     def _close_files(self) -> None:
         """Close opened files."""
@@ -127,6 +247,64 @@ class StubConnection(Connection):
         if self.output_file:
             self.output_file.close()
 
+    def _start_watching_input_file(self) -> None:
+        """Watch the input file for changes with inotify, from the event loop, if available."""
+        self._input_event = asyncio.Event()
+        if not IS_INOTIFY_AVAILABLE:
+            return
+        try:
+            inotify = Inotify(
+                os.fsencode(os.path.abspath(self.input_file_path)),
+                event_mask=InotifyConstants.IN_MODIFY,
+            )
+        except OSError as e:  # pragma: nocover
+            self.logger.debug(f"Cannot watch the input file, polling it: {e}")
+            return
+        self.loop.add_reader(inotify.fd, self._on_input_file_changed)
+        self._inotify = inotify
+
+    def _on_input_file_changed(self) -> None:
+        """Consume the inotify events and wake up the reader."""
+        if self._inotify is None or self._input_event is None:  # pragma: nocover
+            return
+        os.read(self._inotify.fd, INOTIFY_BUFFER_SIZE)
+        self._input_event.set()
+
+    def _stop_watching_input_file(self) -> None:
+        """Stop watching the input file."""
+        if self._inotify is None:
+            return
+        self.loop.remove_reader(self._inotify.fd)
+        self._inotify.close()
+        self._inotify = None
+
+    async def _wait_for_input(self, delay: float) -> float:
+        """
+        Wait for the input file to change, or for a delay.
+
+        When the input file is watched, the delay is `watched_read_delay`, as a safety
+        net. Otherwise the input file is polled: every `read_delay`, or in append-only
+        mode with a delay doubling while the file does not change, up to `max_read_delay`.
+
+        :param delay: the delay of this wait.
+        :return: the delay of the next wait
+        """
+        if self._input_event is None or (
+            self._inotify is None and not self.append_only
+        ):
+            await asyncio.sleep(delay)
+            return delay
+        if self._inotify is not None:
+            delay = self.watched_read_delay
+        # not asyncio.wait_for, that can ignore a cancellation when the event is set
+        timeout_handle = self.loop.call_later(delay, self._input_event.set)
+        try:
+            await self._input_event.wait()
+        finally:
+            timeout_handle.cancel()
+        self._input_event.clear()
+        return min(delay * 2, self.max_read_delay)
+
     async def _file_read_and_trunc(self, delay: float = 0.001) -> AsyncIterable[bytes]:
         """
         Generate input file read chunks and truncate data already read.
@@ -137,6 +315,7 @@ class StubConnection(Connection):
         if not self.input_file:  # pragma: nocover
             raise ValueError("Input file not opened! Call Connection.connect first.")
 
+        next_delay = delay
         while True:
             if self.input_file.closed:  # pragma: nocover
                 return
@@ -147,9 +326,36 @@ class StubConnection(Connection):
                     self.input_file.seek(0)
 
             if data:
+                next_delay = delay
                 yield data
             else:
-                await asyncio.sleep(delay)
+                next_delay = await self._wait_for_input(next_delay)
+
+    async def _file_tail(self, delay: float = 0.001) -> AsyncIterable[bytes]:
+        """
+        Generate the bytes appended to the input file, from the last read offset.
+
+        The file is read from the start again if it is truncated.
+
+        :param delay: float, delay on empty read.
+        :yield: async generator return file read bytes.
+        """
+        if not self.input_file:  # pragma: nocover
+            raise ValueError("Input file not opened! Call Connection.connect first.")
+
+        next_delay = delay
+        while True:
+            if self.input_file.closed:  # pragma: nocover
+                return
+            if os.fstat(self.input_file.fileno()).st_size < self.input_file.tell():
+                self.logger.debug("Input file truncated, reading it from the start.")
+                self.input_file.seek(0)
+            data = self.input_file.read()
+            if data:
+                next_delay = delay
+                yield data
+            else:
+                next_delay = await self._wait_for_input(next_delay)
 
     async def read_envelopes(self) -> None:
         """Read envelopes from input file, decode and put into in_queue."""
@@ -158,6 +364,9 @@ class StubConnection(Connection):
             raise ValueError("Input queue not initialized.")
 
         self.logger.debug("Read messages!")
+        if self.append_only:
+            await self._read_framed_envelopes()
+            return
         async for data in self._file_read_and_trunc(delay=self.read_delay):
             lines = self._split_messages(data)
             for line in lines:
@@ -169,6 +378,20 @@ class StubConnection(Connection):
                 self.logger.debug(f"Add envelope {envelope}")
                 await self.in_queue.put(envelope)
 
+    async def _read_framed_envelopes(self) -> None:
+        """Read the records appended to the input file, decode and put into in_queue."""
+        if self.in_queue is None:  # pragma: nocover
+            raise ValueError("Input queue not initialized.")
+        buffer = bytearray()
+        async for data in self._file_tail(delay=self.read_delay):
+            buffer += data
+            for message in split_framed_messages(buffer, self.logger):
+                envelope = envelope_from_bytes(message, SEPARATOR, self.logger)
+                if envelope is None:
+                    continue
+                self.logger.debug(f"Add envelope {envelope}")
+                await self.in_queue.put(envelope)
+
     @classmethod
     def _split_messages(cls, data: bytes) -> List[bytes]:
         """
@@ -202,8 +425,10 @@ class StubConnection(Connection):
             return
 
         with self._connect_context():
+            self._write_error = None
             self.in_queue = asyncio.Queue()
             self._open_files()
+            self._start_watching_input_file()
             self._read_envelopes_task = self.loop.create_task(self.read_envelopes())
 
     async def _stop_read_envelopes(self) -> None:
@@ -241,24 +466,36 @@ class StubConnection(Connection):
 
         self.state = ConnectionStates.disconnecting
         await self._stop_read_envelopes()
+        self._stop_watching_input_file()
+        if self._write_buffer_task is not None:
+            await self._write_buffer_task  # wait buffered envelopes to be written
         self._write_pool.shutdown(wait=True)  # wait write operation to complete
         self.in_queue.put_nowait(None)
         self._close_files()
         self.state = ConnectionStates.disconnected
+        self._raise_write_error()
 
     async def send(self, envelope: Envelope) -> None:
         """
         Send messages.
 
+        In append-only mode, an error raised writing the envelopes buffered before is
+        raised by the next send, or by the disconnection.
+
         :param envelope: the envelope
         """
         self._ensure_connected()
         self._ensure_valid_envelope_for_external_comms(envelope)
+        self._raise_write_error()
         if not self.output_file:  # pragma: nocover
             raise ValueError(
                 "output_file file not opened! Call Connection.connect first."
             )
 
+        if self.append_only:
+            await self._send_buffered(envelope)
+            return
+
         await self.loop.run_in_executor(
             self._write_pool,
             write_envelope,
@@ -267,3 +504,41 @@ class StubConnection(Connection):
             SEPARATOR,
             self.logger,
         )
+
+    async def _send_buffered(self, envelope: Envelope) -> None:
+        """
+        Buffer an envelope, to be appended to the output file with the envelopes sent meanwhile.
+
+        The sender waits for the buffer to be written only when it is full.
+
+        :param envelope: the envelope
+        """
+        self._write_buffer.append(frame_envelope(envelope, SEPARATOR))
+        if self._write_buffer_task is None or self._write_buffer_task.done():
+            self._write_buffer_task = self.loop.create_task(self._write_buffered())
+        if len(self._write_buffer) >= self.write_buffer_size:
+            await asyncio.shield(self._write_buffer_task)
+
+    async def _write_buffered(self) -> None:
+        """Write the buffered envelopes in batches, until the buffer is empty."""
+        while self._write_buffer:
+            data = b"".join(self._write_buffer)
+            self._write_buffer = []
+            try:
+                await self.loop.run_in_executor(
+                    self._write_pool,
+                    write_with_lock,
+                    self.output_file,
+                    data,
+                    self.logger,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.debug(f"Stub connection write error: {e}")
+                if self._write_error is None:
+                    self._write_error = e
+
+    def _raise_write_error(self) -> None:
+        """Raise the error of a failed write of the buffered envelopes, if any."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
@@ -18,11 +18,13 @@
 # ------------------------------------------------------------------------------
 
 """Base classes for TCP communication."""
+import asyncio
 import logging
 import struct
 from abc import ABC, abstractmethod
-from asyncio import CancelledError, StreamReader, StreamWriter
-from typing import Any, Optional
+from asyncio import CancelledError, IncompleteReadError, StreamReader, StreamWriter
+from asyncio.tasks import Task
+from typing import Any, List, Optional, Tuple, Union
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
@@ -33,6 +35,78 @@ _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp")
 
 PUBLIC_ID = PublicId.from_str("fetchai/tcp:0.17.0")
 
+HIGH_THROUGHPUT_KEY = "high_throughput"
+MAX_BUFFERED_FRAMES_KEY = "max_buffered_frames"
+DEFAULT_MAX_BUFFERED_FRAMES = 1024
+READ_CHUNK_SIZE = 256 * 1024
+FRAME_HEADER = struct.Struct("I")
+
+Frame = Union[bytes, memoryview]
+
+
+class TCPPeer:
+    """
+    A peer of a TCP connection in high-throughput mode.
+
+    The frames received from the peer and not yet taken by the connection, and the
+    frames to send to the peer, are bounded: reading from the peer stops while its
+    received frames are not taken, and sending to the peer waits while its frames
+    are not written.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        reader: StreamReader,
+        writer: StreamWriter,
+        max_buffered_frames: int,
+    ) -> None:
+        """
+        Initialize the peer.
+
+        :param address: the address of the peer.
+        :param reader: the stream reader.
+        :param writer: the stream writer.
+        :param max_buffered_frames: the maximum number of frames buffered in each direction.
+        """
+        self.address = address
+        self.reader = reader
+        self.writer = writer
+        self.received_frames_slots = asyncio.Semaphore(max_buffered_frames)
+        self.frames_to_send = asyncio.Queue(
+            maxsize=max_buffered_frames
+        )  # type: asyncio.Queue
+        self.read_task = None  # type: Optional[Task]
+        self.write_task = None  # type: Optional[Task]
+        self.is_closed = False
+
+    def close(self) -> None:
+        """Stop reading from the peer, and close the stream once the frames to send are written."""
+        self.is_closed = True
+        for task in (self.read_task, self.write_task):
+            if task is not None and not task.done():
+                task.cancel()
+        frames = []  # type: List[bytes]
+        while not self.frames_to_send.empty():
+            frames.append(self.frames_to_send.get_nowait())
+        if frames and not self.writer.is_closing():
+            self.writer.writelines(_frame_parts(frames))
+        self.writer.close()  # the transport writes its buffer before closing
+
+
+def _frame_parts(frames: List[bytes]) -> List[bytes]:
+    """
+    Get the parts to write for frames, the header of each frame followed by its data.
+
+    :param frames: the frames data.
+    :return: the parts
+    """
+    parts = []  # type: List[bytes]
+    for data in frames:
+        parts.append(FRAME_HEADER.pack(len(data)))
+        parts.append(data)
+    return parts
+
 
 class TCPConnection(Connection, ABC):
     """Abstract TCP connection."""
@@ -52,6 +126,15 @@ class TCPConnection(Connection, ABC):
         # for the client, the server address/port
         self.host = host
         self.port = port
+        self.high_throughput = bool(
+            self.configuration.config.get(HIGH_THROUGHPUT_KEY, False)
+        )
+        self.max_buffered_frames = int(
+            self.configuration.config.get(
+                MAX_BUFFERED_FRAMES_KEY, DEFAULT_MAX_BUFFERED_FRAMES
+            )
+        )
+        self._received_frames = None  # type: Optional[asyncio.Queue]
 
     @abstractmethod
     async def setup(self) -> None:
@@ -70,6 +153,17 @@ class TCPConnection(Connection, ABC):
         :return: the stream writer to communicate with the recipient. None if it cannot be determined.
         """
 
+    def select_peer_from_envelope(  # pylint: disable=no-self-use
+        self, envelope: Envelope  # pylint: disable=unused-argument
+    ) -> Optional[TCPPeer]:
+        """
+        Select the destination peer in high-throughput mode, given the envelope.
+
+        :param envelope: the envelope to be sent.
+        :return: the peer to communicate with the recipient. None if it cannot be determined.
+        """
+        return None  # pragma: nocover
+
     async def connect(self) -> None:
         """Set up the connection."""
         if self.is_connected:  # pragma: nocover
@@ -77,6 +171,8 @@ class TCPConnection(Connection, ABC):
             return
 
         self.state = ConnectionStates.connecting
+        if self.high_throughput:
+            self._received_frames = asyncio.Queue()
         try:
             await self.setup()
             self.state = ConnectionStates.connected
@@ -118,13 +214,131 @@ class TCPConnection(Connection, ABC):
         except CancelledError:
             return None
 
+    def _start_peer(
+        self, address: str, reader: StreamReader, writer: StreamWriter
+    ) -> TCPPeer:
+        """
+        Start reading and writing the frames of a peer, in high-throughput mode.
+
+        :param address: the address of the peer.
+        :param reader: the stream reader.
+        :param writer: the stream writer.
+        :return: the peer
+        """
+        peer = TCPPeer(address, reader, writer, self.max_buffered_frames)
+        peer.read_task = self.loop.create_task(self._read_frames(peer))
+        peer.write_task = self.loop.create_task(self._write_frames(peer))
+        return peer
+
+    def _on_peer_closed(self, peer: TCPPeer) -> None:  # pylint: disable=no-self-use
+        """
+        Handle the end of the stream of a peer.
+
+        :param peer: the peer.
+        """
+        peer.close()
+
+    async def _read_frames(self, peer: TCPPeer) -> None:
+        """
+        Read the frames of a peer in chunks, and put them in the received frames.
+
+        The frames are views of the chunks read; only a frame split between chunks is copied.
+
+        :param peer: the peer.
+        """
+        if self._received_frames is None:  # pragma: nocover
+            raise ValueError("Connection not set up.")
+        buffer = b""
+        try:
+            while True:
+                chunk = await peer.reader.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buffer = buffer + chunk if buffer else chunk
+                if len(buffer) >= FRAME_HEADER.size:
+                    (size,) = FRAME_HEADER.unpack_from(buffer)
+                    missing = FRAME_HEADER.size + size - len(buffer)
+                    if missing > 0:
+                        buffer += await peer.reader.readexactly(missing)
+                view = memoryview(buffer)
+                offset = 0
+                while len(buffer) - offset >= FRAME_HEADER.size:
+                    (size,) = FRAME_HEADER.unpack_from(buffer, offset)
+                    end = offset + FRAME_HEADER.size + size
+                    if end > len(buffer):
+                        break
+                    await peer.received_frames_slots.acquire()
+                    self._received_frames.put_nowait(
+                        (peer, view[offset + FRAME_HEADER.size : end])
+                    )
+                    offset = end
+                buffer = buffer[offset:]
+        except (IncompleteReadError, ConnectionError) as e:
+            self.logger.debug(f"[{self.address}] Stream of {peer.address} ended: {e}")
+        finally:
+            self._on_peer_closed(peer)
+
+    async def _write_frames(self, peer: TCPPeer) -> None:
+        """
+        Write the frames to send to a peer, all the frames waiting with one write.
+
+        :param peer: the peer.
+        """
+        while True:
+            frames = [await peer.frames_to_send.get()]
+            while not peer.frames_to_send.empty():
+                frames.append(peer.frames_to_send.get_nowait())
+            try:
+                peer.writer.writelines(_frame_parts(frames))
+                await peer.writer.drain()
+            except ConnectionError as e:
+                self.logger.error(
+                    f"[{self.address}] Cannot send to {peer.address}: {e}"
+                )
+
+    async def _receive_frame(self) -> Optional[Tuple[TCPPeer, Frame]]:
+        """
+        Take a received frame, in high-throughput mode.
+
+        :return: the peer and the frame, or None if the connection is not set up or the stream of a peer ended.
+        """
+        if self._received_frames is None:  # pragma: nocover
+            return None
+        received = await self._received_frames.get()
+        if received is None:
+            return None
+        peer, frame = received
+        peer.received_frames_slots.release()
+        return peer, frame
+
     async def send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
 
+        In high-throughput mode, the envelope is queued to be written with the other
+        envelopes sent meanwhile, and the sender waits only if the queue of the
+        recipient is full.
+
         :param envelope: the envelope to send.
+        :raises ConnectionError: if the stream of the recipient is closed, in high-throughput mode.
         """
         self._ensure_valid_envelope_for_external_comms(envelope)
+        if self.high_throughput:
+            peer = self.select_peer_from_envelope(envelope)
+            if peer is None:
+                self.logger.error(
+                    "[{}]: Cannot send envelope {}".format(self.address, envelope)
+                )
+                return
+            if not peer.is_closed:
+                await peer.frames_to_send.put(envelope.encode())
+            if peer.is_closed:
+                # the frames queued once the peer is closed are never written
+                self.logger.error(
+                    f"[{self.address}]: Cannot send envelope {envelope}, the stream of {peer.address} is closed."
+                )
+                raise ConnectionError(f"Stream of {peer.address} closed.")
+            return
         writer = self.select_writer_from_envelope(envelope)
         if writer is not None:
             data = envelope.encode()
@@ -32,7 +32,7 @@ from typing import Any, Optional, cast
 from aea.configurations.base import ConnectionConfig
 from aea.mail.base import Envelope
 
-from packages.fetchai.connections.tcp.base import TCPConnection
+from packages.fetchai.connections.tcp.base import TCPConnection, TCPPeer
 
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp.tcp_client")
@@ -59,15 +59,25 @@ class TCPClientConnection(TCPConnection):
             None,
             None,
         )  # type: Optional[StreamReader], Optional[StreamWriter]
+        self._peer = None  # type: Optional[TCPPeer]
 
     async def setup(self) -> None:
         """Set the connection up."""
         self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
         address_bytes = self.address.encode("utf-8")
         await self._send(self._writer, address_bytes)
+        if self.high_throughput:
+            self._peer = self._start_peer(
+                f"{self.host}:{self.port}", self._reader, self._writer
+            )
 
     async def teardown(self) -> None:
         """Tear the connection down."""
+        if self._peer is not None:
+            self._peer.close()
+            self._peer = None
+            await asyncio.sleep(0.0)
+            return
         if self._reader is not None:
             self._reader.feed_eof()
         if self._writer is None:  # pragma: nocover
@@ -90,6 +100,9 @@ class TCPClientConnection(TCPConnection):
         :return: the received envelope, or None if an error occurred.
         """
         try:
+            if self.high_throughput:
+                received = await self._receive_frame()
+                return Envelope.decode(received[1]) if received is not None else None
             if self._reader is None:
                 raise ValueError("Reader not set.")  # pragma: nocover
             data = await self._recv(self._reader)
@@ -112,6 +125,20 @@ class TCPClientConnection(TCPConnection):
             self.logger.exception(e)
             raise
 
+    def _on_peer_closed(self, peer: TCPPeer) -> None:
+        """
+        Close the stream of the server once it ended, and wake the receivers up.
+
+        :param peer: the server.
+        """
+        super()._on_peer_closed(peer)
+        if self._received_frames is not None:
+            self._received_frames.put_nowait(None)
+
     def select_writer_from_envelope(self, envelope: Envelope) -> Optional[StreamWriter]:
         """Select the destination, given the envelope."""
         return self._writer
+
+    def select_peer_from_envelope(self, envelope: Envelope) -> Optional[TCPPeer]:
+        """Select the destination peer in high-throughput mode, given the envelope."""
+        return self._peer
@@ -28,7 +28,7 @@ from aea.common import Address
 from aea.configurations.base import ConnectionConfig
 from aea.mail.base import Envelope
 
-from packages.fetchai.connections.tcp.base import TCPConnection
+from packages.fetchai.connections.tcp.base import TCPConnection, TCPPeer
 
 
 _default_logger = logging.getLogger("aea.packages.fetchai.connections.tcp.tcp_server")
@@ -55,6 +55,7 @@ class TCPServerConnection(TCPConnection):
         self.connections = {}  # type: Dict[str, Tuple[StreamReader, StreamWriter]]
 
         self._read_tasks_to_address = dict()  # type: Dict[Future, Address]
+        self.peers = {}  # type: Dict[Address, TCPPeer]
 
     async def handle(self, reader: StreamReader, writer: StreamWriter) -> None:
         """
@@ -70,6 +71,9 @@ class TCPServerConnection(TCPConnection):
             address = address_bytes.decode("utf-8")
             self.logger.debug("Public key of the client: {}".format(address))
             self.connections[address] = (reader, writer)
+            if self.high_throughput:
+                self.peers[address] = self._start_peer(address, reader, writer)
+                return
             read_task = asyncio.ensure_future(self._recv(reader), loop=self.loop)
             self._read_tasks_to_address[read_task] = address
 
@@ -81,6 +85,9 @@ class TCPServerConnection(TCPConnection):
         :param kwargs: keyword arguments
         :return: the received envelope, or None if an error occurred.
         """
+        if self.high_throughput:
+            return await self._receive_high_throughput()
+
         if len(self._read_tasks_to_address) == 0:
             self.logger.warning(
                 "Tried to read from the TCP server. However, there is no open connection to read from."
@@ -110,6 +117,35 @@ class TCPServerConnection(TCPConnection):
             self.logger.error("Error in the receiving loop: {}".format(str(e)))
             return None
 
+    async def _receive_high_throughput(self) -> Optional["Envelope"]:
+        """
+        Receive an envelope from the frames read from all the clients.
+
+        :return: the received envelope, or None if an error occurred.
+        """
+        try:
+            received = await self._receive_frame()
+            if received is None:  # pragma: nocover
+                return None
+            return Envelope.decode(received[1])
+        except asyncio.CancelledError:
+            self.logger.debug("Receiving loop cancelled.")
+            return None
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error("Error in the receiving loop: {}".format(str(e)))
+            return None
+
+    def _on_peer_closed(self, peer: TCPPeer) -> None:
+        """
+        Forget a client, once its stream ended.
+
+        :param peer: the client.
+        """
+        if self.peers.get(peer.address) is peer:
+            self.peers.pop(peer.address)
+            self.connections.pop(peer.address, None)
+            peer.close()
+
     async def setup(self) -> None:
         """Set the connection up."""
         self._server = await asyncio.start_server(
@@ -125,6 +161,10 @@ class TCPServerConnection(TCPConnection):
         for t in self._read_tasks_to_address:
             t.cancel()
 
+        for peer in list(self.peers.values()):
+            peer.close()
+        self.peers = {}
+
         if self._server is None:  # pragma: nocover
             raise ValueError("Server not set!")
 
@@ -138,3 +178,7 @@ class TCPServerConnection(TCPConnection):
             return None
         _, writer = self.connections[to]
         return writer
+
+    def select_peer_from_envelope(self, envelope: Envelope) -> Optional[TCPPeer]:
+        """Select the destination peer in high-throughput mode, given the envelope."""
+        return self.peers.get(envelope.to)
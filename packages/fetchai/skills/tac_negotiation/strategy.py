@@ -360,11 +360,7 @@ class Strategy(Model):
         :return: a description
         """
         candidate_proposals = self._generate_candidate_proposals(is_seller)
-        proposals = []
-        for proposal in candidate_proposals:
-            if not query.check(proposal):
-                continue  # pragma: nocover
-            proposals.append(proposal)
+        proposals = query.compile().filter(candidate_proposals)
         if not proposals:
             return None  # pragma: nocover
         return random.choice(proposals)  # nosec
@@ -318,7 +318,7 @@ def compute_fingerprint(  # pylint: disable=unsubscriptable-object
     :return: the fingerprint
     """
     fingerprint = _compute_fingerprint(
-        package_path, ignore_patterns=fingerprint_ignore_patterns,
+        package_path, ignore_patterns=fingerprint_ignore_patterns, persist_cache=True,
     )
     assert_hash_consistency(fingerprint, package_path, client)
     return fingerprint
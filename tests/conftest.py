@@ -882,9 +882,14 @@ def _make_oef_connection(
     return oef_connection
 
 
-def _make_tcp_server_connection(address: str, public_key: str, host: str, port: int):
+def _make_tcp_server_connection(
+    address: str, public_key: str, host: str, port: int, **config
+):
     configuration = ConnectionConfig(
-        address=host, port=port, connection_id=TCPServerConnection.connection_id
+        address=host,
+        port=port,
+        connection_id=TCPServerConnection.connection_id,
+        **config,
     )
     tcp_connection = TCPServerConnection(
         configuration=configuration,
@@ -897,9 +902,14 @@ def _make_tcp_server_connection(address: str, public_key: str, host: str, port:
     return tcp_connection
 
 
-def _make_tcp_client_connection(address: str, public_key: str, host: str, port: int):
+def _make_tcp_client_connection(
+    address: str, public_key: str, host: str, port: int, **config
+):
     configuration = ConnectionConfig(
-        address=host, port=port, connection_id=TCPClientConnection.connection_id
+        address=host,
+        port=port,
+        connection_id=TCPClientConnection.connection_id,
+        **config,
     )
     tcp_connection = TCPClientConnection(
         configuration=configuration,
@@ -179,7 +179,7 @@ def _get_labels(dialogues: List[Dialogue]) -> Set[DialogueLabel]:
 
 def _storage_all_dialogues_labels(storage: BasicDialoguesStorage) -> Set[DialogueLabel]:
     return _get_labels(
-        storage.dialogues_in_active_state + storage.dialogues_in_terminal_state
+        storage.dialogues_in_active_state + list(storage.dialogues_in_terminal_state)
     )
 
 
@@ -23,7 +23,7 @@ import time
 import unittest
 from pathlib import Path
 from threading import Thread
-from typing import Callable
+from typing import Callable, Optional
 from unittest.case import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -797,6 +797,7 @@ class BaseTimeExecutionCase(TestCase):
     """Base Test case for code execute timeout."""
 
     BASE_TIMEOUT = 0.35
+    EXECUTION_TIMEOUT_MODE: Optional[str] = None
 
     @classmethod
     def setUpClass(cls) -> None:
@@ -820,6 +821,7 @@ class BaseTimeExecutionCase(TestCase):
         builder = AEABuilder()
         builder.set_name(agent_name)
         builder.add_private_key(DEFAULT_LEDGER, FETCHAI_PRIVATE_KEY_PATH)
+        builder.set_execution_timeout_mode(self.EXECUTION_TIMEOUT_MODE)
 
         self.function_finished = False
 
@@ -922,6 +924,18 @@ class ActTimeoutExecutionCase(BaseTimeExecutionCase):
         )
 
 
+class HandleTimeoutExecutionDeadlineGuardCase(HandleTimeoutExecutionCase):
+    """Test handle envelope timeout with the deadline guard."""
+
+    EXECUTION_TIMEOUT_MODE = "deadline_guard"
+
+
+class ActTimeoutExecutionDeadlineGuardCase(ActTimeoutExecutionCase):
+    """Test act timeout with the deadline guard."""
+
+    EXECUTION_TIMEOUT_MODE = "deadline_guard"
+
+
 def test_skill2skill_message():
     """Tests message can be sent directly to any skill."""
     with tempfile.TemporaryDirectory() as dir_name:
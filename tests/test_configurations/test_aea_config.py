@@ -213,6 +213,18 @@ class TestExecutionTimeoutConfigVariable(BaseConfigTestVariable):
     AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_EXECUTION_TIMEOUT
 
 
+class TestExecutionTimeoutModeConfigVariable(BaseConfigTestVariable):
+    """Test `execution_timeout_mode` aea config option."""
+
+    OPTION_NAME = "execution_timeout_mode"
+    CONFIG_ATTR_NAME = "execution_timeout_mode"
+    GOOD_VALUES = ["thread_guard", "deadline_guard"]
+    INCORRECT_VALUES = [None, "sTrING?", -1]
+    REQUIRED = False
+    AEA_ATTR_NAME = "_execution_timeout_mode"
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_EXECUTION_TIMEOUT_MODE
+
+
 class TestMaxReactionsConfigVariable(BaseConfigTestVariable):
     """Test `max_reactions` aea config option."""
 
@@ -225,6 +237,26 @@ class TestMaxReactionsConfigVariable(BaseConfigTestVariable):
     AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_MAX_REACTIONS
 
 
+class TestBatchSizeConfigVariable(BaseConfigTestVariable):
+    """Test `batch_size` aea config option."""
+
+    OPTION_NAME = "batch_size"
+    CONFIG_ATTR_NAME = "batch_size"
+    GOOD_VALUES = [0, 10]
+    INCORRECT_VALUES = ["sTrING?", -1, 1.1]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_BATCH_SIZE
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the batch size of the AEA multiplexer.
+
+        :param aea: AEA instance to get attribute value from.
+
+        :return: value of attribute.
+        """
+        return aea.runtime.multiplexer.batch_size
+
+
 class TestLoopModeConfigVariable(BaseConfigTestVariable):
     """Test `loop_mode` aea config option."""
 
@@ -462,3 +494,40 @@ class TestTaskManagerModeConfigVariable(BaseConfigTestVariable):
     REQUIRED = False
     AEA_ATTR_NAME = "_task_manager_mode"
     AEA_DEFAULT_VALUE = AEABuilder.DEFAULT_TASKMANAGER_MODE
+
+
+class TestTaskManagerOptionsConfigVariable(BaseConfigTestVariable):
+    """Test `task_manager_options` aea config option."""
+
+    OPTION_NAME = "task_manager_options"
+    CONFIG_ATTR_NAME = "task_manager_options"
+    GOOD_VALUES = [
+        {"drop_results_on_retrieval": True, "results_ttl": 60.0, "max_results": 100},
+        {"drop_results_on_retrieval": False, "results_ttl": None, "max_results": 10},
+    ]
+    INCORRECT_VALUES = [None, "sTrING?", {"max_results": -1}, {"results_ttl": "1"}]
+    REQUIRED = False
+    AEA_DEFAULT_VALUE = {
+        "drop_results_on_retrieval": False,
+        "results_ttl": None,
+        "max_results": None,
+    }
+
+    def test_no_variable_passed(self) -> None:
+        """Test option not specified in cofig."""
+        configuration = self._make_configuration(NotSet)
+        assert configuration.task_manager_options == {}
+
+    def _get_aea_value(self, aea: AEA) -> Any:
+        """Get the result options of the AEA task manager.
+
+        :param aea: AEA instance to get attribute value from.
+
+        :return: value of attribute.
+        """
+        task_manager = aea.runtime.task_manager
+        return {
+            "drop_results_on_retrieval": task_manager._drop_results_on_retrieval,
+            "results_ttl": task_manager._results_ttl,
+            "max_results": task_manager._max_results,
+        }
@@ -57,6 +57,7 @@ from aea.configurations.constants import (
     DEFAULT_PYPI_INDEX_URL,
     DEFAULT_SKILL_CONFIG_FILE,
 )
+from aea.configurations.data_types import PUBLIC_ID_CACHE_SIZE, _parse_public_id
 from aea.configurations.loader import ConfigLoaders, load_component_configuration
 
 from tests.conftest import (
@@ -617,6 +618,18 @@ def test_public_id_from_string_with_version_string_latest():
     assert public_id.version == "latest"
 
 
+def test_public_id_from_string_interned():
+    """Test the public ids parsed from the same string are the same object."""
+    public_id = PublicId.from_str("author/package:0.1.0")
+    assert PublicId.from_str("author/package:0.1.0") is public_id
+    assert PublicId.try_from_str("author/package:0.1.0") is public_id
+    assert PublicId.try_from_str("not a public id") is None
+    assert PublicId.from_str("author/package") is not public_id
+    assert _parse_public_id.cache_info().maxsize == PUBLIC_ID_CACHE_SIZE
+    assert str(public_id) == "author/package:0.1.0"
+    assert hash(public_id) == hash(PublicId("author", "package", "0.1.0"))
+
+
 def test_public_id_from_uri_path():
     """Test PublicId.from_uri_path"""
     result = PublicId.from_uri_path("author/package_name/0.1.0")
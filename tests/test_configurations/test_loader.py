@@ -20,6 +20,7 @@
 
 """This module contains the tests for the aea.configurations.loader module."""
 import os
+import shutil
 from io import StringIO
 from pathlib import Path
 from unittest import mock
@@ -29,13 +30,13 @@ import pytest
 import yaml
 
 import aea
-from aea.configurations.base import PackageType, ProtocolSpecification
-from aea.configurations.loader import ConfigLoader
+from aea.configurations.base import ComponentType, PackageType, ProtocolSpecification
+from aea.configurations.loader import ConfigLoader, load_component_configuration
 from aea.configurations.validation import make_jsonschema_base_uri
 from aea.exceptions import AEAEnforceError
 from aea.protocols.generator.common import load_protocol_specification
 
-from tests.conftest import protocol_specification_files
+from tests.conftest import ROOT_DIR, protocol_specification_files
 
 
 def test_windows_uri_path():
@@ -149,3 +150,40 @@ def test_load_package_configuration_with_incompatible_aea_version(*_mocks):
         match=f"AEA version in use '0.1.0' is not compatible with the specifier set '{specifier_set}'.",
     ):
         config_loader.load(file)
+
+
+def test_load_component_configuration_cached(tmp_path):
+    """Test component configurations are loaded once per file content, and copied."""
+    package_dir = tmp_path / "default"
+    shutil.copytree(
+        Path(ROOT_DIR, "packages", "fetchai", "protocols", "default"), package_dir
+    )
+    with mock.patch.object(
+        ConfigLoader, "load", side_effect=ConfigLoader.load, autospec=True
+    ) as load_mock:
+        first = load_component_configuration(
+            ComponentType.PROTOCOL, package_dir, skip_consistency_check=True
+        )
+        second = load_component_configuration(
+            ComponentType.PROTOCOL, package_dir, skip_consistency_check=True
+        )
+        assert load_mock.call_count == 1
+        assert first is not second
+        assert first.json == second.json
+
+        first.description = "changed in memory"
+        third = load_component_configuration(
+            ComponentType.PROTOCOL, package_dir, skip_consistency_check=True
+        )
+        assert third.description == second.description
+        assert load_mock.call_count == 1
+
+        config_path = package_dir / "protocol.yaml"
+        config_path.write_text(
+            config_path.read_text().replace(second.description, "changed on disk")
+        )
+        fourth = load_component_configuration(
+            ComponentType.PROTOCOL, package_dir, skip_consistency_check=True
+        )
+        assert fourth.description == "changed on disk"
+        assert load_mock.call_count == 2
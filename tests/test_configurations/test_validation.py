@@ -17,11 +17,21 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for the aea.configurations.validation module."""
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
 from aea.configurations.validation import (
+    ConfigValidator,
     SAME_MARK,
     filter_data,
     validate_data_with_pattern,
 )
+from aea.exceptions import AEAValidationError
+from aea.helpers.yaml_utils import yaml_load
+
+from tests.conftest import ROOT_DIR
 
 
 def test_compare_data_pattern():
@@ -72,3 +82,33 @@ def test_filter_data():
         3: {2: 3},
         0: 0,
     }
+
+
+def test_validators_shared_and_valid_documents_not_validated_again():
+    """Test the validators are built once per schema, and skip the documents already found valid."""
+    validator = ConfigValidator("skill-config_schema.json")
+    assert (
+        ConfigValidator("skill-config_schema.json")._validator is validator._validator
+    )
+    assert (
+        ConfigValidator("skill-config_schema.json", env_vars_friendly=True)._validator
+        is not validator._validator
+    )
+
+    with open(Path(ROOT_DIR, "tests", "data", "dummy_skill", "skill.yaml")) as f:
+        configuration = yaml_load(f)
+    validator.validate(configuration)
+    with mock.patch.object(
+        validator._validator, "iter_errors", wraps=validator._validator.iter_errors
+    ) as iter_errors_mock:
+        validator.validate(configuration)
+        iter_errors_mock.assert_not_called()
+
+        invalid_configuration = dict(configuration, version=1)
+        for _ in range(2):
+            with pytest.raises(AEAValidationError):
+                validator.validate(invalid_configuration)
+        documents_validated = [
+            call for call in iter_errors_mock.call_args_list if "instance" in call[1]
+        ]
+        assert len(documents_validated) == 2
@@ -28,6 +28,7 @@ import pytest
 
 from aea.helpers.exec_timeout import (
     BaseExecTimeout,
+    ExecTimeoutDeadlineGuard,
     ExecTimeoutSigAlarm,
     ExecTimeoutThreadGuard,
     TimeoutException,
@@ -182,3 +183,35 @@ def test_supervisor_not_started():
         TestThreadGuard.slow_function(sleep_time)
 
     assert not exec_limit.is_cancelled_by_timeout()
+
+
+class TestDeadlineGuard(TestThreadGuard):
+    """Test code execution timeout using deadlines checked by a supervisor thread."""
+
+    EXEC_TIMEOUT_CLASS = ExecTimeoutDeadlineGuard
+
+    def test_nested_guards(self):
+        """Test the enclosing guard deadline is restored when a nested guard exits."""
+        with pytest.raises(TimeoutException):
+            with self.EXEC_TIMEOUT_CLASS(0.2) as outer_limit:
+                with self.EXEC_TIMEOUT_CLASS(1) as inner_limit:
+                    self.slow_function(0.1)
+                assert not inner_limit.is_cancelled_by_timeout()
+                self.slow_function(0.5)
+
+        assert outer_limit.is_cancelled_by_timeout()
+        assert ExecTimeoutDeadlineGuard._deadlines == {}
+
+
+def test_deadline_guard_supervisor_not_started():
+    """Test that ExecTimeoutDeadlineGuard supervisor thread not started."""
+    timeout = 0.1
+    sleep_time = 0.5
+
+    exec_limiter = ExecTimeoutDeadlineGuard(timeout)
+
+    with exec_limiter as exec_limit:
+        assert not ExecTimeoutDeadlineGuard._deadlines
+        TestThreadGuard.slow_function(sleep_time)
+
+    assert not exec_limit.is_cancelled_by_timeout()
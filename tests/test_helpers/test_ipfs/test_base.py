@@ -20,9 +20,12 @@
 """This module contains the tests for the ipfs helper module."""
 
 import os
+import tracemalloc
 from unittest.mock import patch
 
-from aea.helpers.ipfs.base import IPFSHashOnly, _is_text
+import pytest
+
+from aea.helpers.ipfs.base import IPFSHashOnly, _is_text, _read
 
 from tests.conftest import CUR_PATH
 
@@ -52,3 +55,45 @@ def test_hash_for_big_file():
     data = b"1" * int(IPFSHashOnly.DEFAULT_CHUNK_SIZE * 1.5)
     my_hash = IPFSHashOnly._generate_hash(data)
     assert my_hash == VALID_HASH
+
+
+def _in_memory_hash(file_path: str) -> str:
+    """Get the hash of a file read in memory at once."""
+    return IPFSHashOnly._generate_hash(_read(file_path))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"a" * IPFSHashOnly.DEFAULT_CHUNK_SIZE,
+        b"a" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE - 1) + b"\r\n" + b"b" * 10,
+        b"a" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE - 1) + b"\r\r\n" * 3,
+        b"line\r\n" * IPFSHashOnly.DEFAULT_CHUNK_SIZE,
+        b"line\r\n" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE // 6) + b"\r",
+        b"\xff\r\n" * IPFSHashOnly.DEFAULT_CHUNK_SIZE,
+        b"\xc3\xa9" * IPFSHashOnly.DEFAULT_CHUNK_SIZE + b"\xc3",
+    ],
+)
+def test_streaming_hash_is_the_same(tmp_path, content):
+    """Test the hashes computed in streaming mode are the same as the ones computed in memory."""
+    file_path = str(tmp_path / "file")
+    with open(file_path, "wb") as file:
+        file.write(content)
+    expected = _in_memory_hash(file_path)
+    assert IPFSHashOnly.get_streaming(file_path) == expected
+    assert IPFSHashOnly().get(file_path) == expected
+
+
+def test_streaming_hash_memory(tmp_path):
+    """Test the memory used to hash a big file in streaming mode is bounded by a few chunks."""
+    file_path = str(tmp_path / "file")
+    with open(file_path, "wb") as file:
+        file.write(b"line\r\n" * (2 * 1024 * 1024))
+    tracemalloc.start()
+    try:
+        IPFSHashOnly().get(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * IPFSHashOnly.DEFAULT_CHUNK_SIZE
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the ipfs hash cache module."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from aea.configurations.base import _compute_fingerprint
+from aea.helpers.ipfs.base import IPFSHashOnly
+from aea.helpers.ipfs.cache import (
+    FINGERPRINT_CACHE_ENV_VAR,
+    FileHashCache,
+    get_default_file_hash_cache,
+    hash_files,
+)
+
+
+def _write_old_file(path: Path, content: bytes) -> None:
+    """Write a file with a modification time old enough to be cached."""
+    path.write_bytes(content)
+    os.utime(str(path), ns=(10 ** 18, 10 ** 18))
+
+
+def test_hashes_are_cached_and_persisted(tmp_path):
+    """Test unchanged files are not hashed again, also when the cache is reloaded."""
+    files = [tmp_path / f"file_{i}.txt" for i in range(3)]
+    for i, file in enumerate(files):
+        _write_old_file(file, f"content {i}".encode())
+    file_paths = [str(file) for file in files]
+    expected = [IPFSHashOnly().get(path) for path in file_paths]
+    cache_path = str(tmp_path / "cache" / "fingerprints.json")
+
+    cache = FileHashCache(cache_path)
+    assert cache.get_hashes(file_paths) == expected
+    cache.save()
+    assert os.path.exists(cache_path)
+
+    reloaded = FileHashCache(cache_path)
+    with mock.patch("aea.helpers.ipfs.cache._hash_file") as hash_file_mock:
+        assert reloaded.get_hashes(file_paths) == expected
+    hash_file_mock.assert_not_called()
+
+
+def test_changed_files_are_hashed_again(tmp_path):
+    """Test a file is hashed again when it is changed, even if its modification time is restored."""
+    file = tmp_path / "file.txt"
+    _write_old_file(file, b"content")
+    cache = FileHashCache(None)
+    assert cache.get_hashes([str(file)]) == [IPFSHashOnly().get(str(file))]
+
+    _write_old_file(file, b"changed")
+    assert cache.get_hashes([str(file)]) == [IPFSHashOnly().get(str(file))]
+
+
+def test_recently_modified_files_are_not_cached(tmp_path):
+    """Test files modified just before being hashed are not cached."""
+    file = tmp_path / "file.txt"
+    file.write_bytes(b"content")
+    cache = FileHashCache(None)
+    cache.get_hashes([str(file)])
+    with mock.patch(
+        "aea.helpers.ipfs.cache._hash_file", return_value="hash"
+    ) as hash_file_mock:
+        assert cache.get_hashes([str(file)]) == ["hash"]
+    hash_file_mock.assert_called_once()
+
+
+def test_least_recently_used_entries_dropped(tmp_path):
+    """Test the least recently used entries are dropped when the cache is saved."""
+    files = [tmp_path / f"file_{i}.txt" for i in range(3)]
+    for i, file in enumerate(files):
+        _write_old_file(file, f"content {i}".encode())
+    cache = FileHashCache(str(tmp_path / "cache.json"), max_entries=2)
+    for index, file in enumerate(files):
+        with mock.patch("aea.helpers.ipfs.cache.time.time", return_value=2e9 + index):
+            cache.get_hashes([str(file)])
+    cache.save()
+
+    reloaded = FileHashCache(cache.path)
+    reloaded._load()
+    assert set(reloaded._entries) == {str(files[1]), str(files[2])}
+
+
+def test_invalid_cache_file_ignored(tmp_path):
+    """Test an invalid cache file is ignored."""
+    file = tmp_path / "file.txt"
+    _write_old_file(file, b"content")
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_text("not json")
+    cache = FileHashCache(str(cache_path))
+    assert cache.get_hashes([str(file)]) == [IPFSHashOnly().get(str(file))]
+
+
+def test_parallel_hashing(tmp_path):
+    """Test the hashes computed with a process pool are in the order of the files."""
+    files = [tmp_path / f"file_{i}.txt" for i in range(4)]
+    for i, file in enumerate(files):
+        file.write_bytes(f"content {i}".encode())
+    file_paths = [str(file) for file in files]
+    with mock.patch("os.cpu_count", return_value=2), mock.patch(
+        "aea.helpers.ipfs.cache.PARALLEL_HASHING_MIN_SIZE", 0
+    ), mock.patch(
+        "aea.helpers.ipfs.cache.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+    ) as executor_mock:
+        hashes = hash_files(file_paths)
+    executor_mock.assert_called_once_with(max_workers=2)
+    assert hashes == [IPFSHashOnly().get(path) for path in file_paths]
+
+
+def test_compute_fingerprint_with_default_cache(tmp_path):
+    """Test the fingerprint of a package uses the cache set by the environment variable."""
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    _write_old_file(package_dir / "__init__.py", b'"""A package."""\n')
+    cache_path = str(tmp_path / "cache.json")
+
+    with mock.patch.dict(
+        os.environ, {FINGERPRINT_CACHE_ENV_VAR: cache_path}
+    ), mock.patch("aea.helpers.ipfs.cache.atexit.register") as register_mock:
+        fingerprint = _compute_fingerprint(package_dir)
+        cache = get_default_file_hash_cache()
+        assert cache.path == cache_path
+        register_mock.assert_not_called()
+
+        assert _compute_fingerprint(package_dir, persist_cache=True) == fingerprint
+        assert _compute_fingerprint(package_dir, persist_cache=True) == fingerprint
+        register_mock.assert_called_once_with(cache.save)
+        cache.save()
+    assert os.path.exists(cache_path)
+    assert fingerprint == _compute_fingerprint(package_dir, use_cache=False)
+
+
+def test_default_cache_in_memory(tmp_path):
+    """Test the cache of the process is kept in memory, without the environment variable."""
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    _write_old_file(package_dir / "__init__.py", b'"""A package."""\n')
+
+    with mock.patch.dict(os.environ), mock.patch(
+        "aea.helpers.ipfs.cache.atexit.register"
+    ) as register_mock:
+        os.environ.pop(FINGERPRINT_CACHE_ENV_VAR, None)
+        fingerprint = _compute_fingerprint(package_dir, persist_cache=True)
+        cache = get_default_file_hash_cache()
+        assert cache.path is None
+        with mock.patch("aea.helpers.ipfs.cache._hash_file") as hash_file_mock:
+            assert _compute_fingerprint(package_dir) == fingerprint
+        hash_file_mock.assert_not_called()
+    register_mock.assert_not_called()
+    assert os.listdir(str(tmp_path)) == ["package"]
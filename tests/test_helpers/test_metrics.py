@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests for the helpers/metrics module."""
+import math
+
+import pytest
+
+from aea.helpers.metrics import MetricsRegistry
+
+
+def test_counter_render():
+    """Test the counters are rendered with their labels."""
+    registry = MetricsRegistry()
+    counter = registry.counter("some_total", "Some counter.", ("agent",))
+    counter.labels("agent_1").inc()
+    counter.labels("agent_1").inc(2)
+    counter.labels('agent "2"').inc()
+
+    assert registry.render() == (
+        "# HELP some_total Some counter.\n"
+        "# TYPE some_total counter\n"
+        'some_total{agent="agent_1"} 3\n'
+        'some_total{agent="agent \\"2\\""} 1\n'
+    )
+
+
+def test_histogram_render():
+    """Test the histograms are rendered with cumulative buckets."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram(
+        "some_seconds", "Some histogram.", ("agent",), buckets=(1.0, 0.1)
+    )
+    child = histogram.labels("agent_1")
+    for value in (0.05, 0.1, 0.5, 2.0):
+        child.observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'some_seconds_bucket{agent="agent_1",le="0.1"} 2',
+        'some_seconds_bucket{agent="agent_1",le="1.0"} 3',
+        'some_seconds_bucket{agent="agent_1",le="+Inf"} 4',
+        'some_seconds_sum{agent="agent_1"} 2.65',
+        'some_seconds_count{agent="agent_1"} 4',
+    ]
+
+
+def test_gauge_render():
+    """Test the gauges are computed when rendered, and can be removed."""
+    registry = MetricsRegistry()
+    gauge = registry.gauge("some_depth", "Some gauge.", ("queue",))
+    values = [1]
+    gauge.set_function(("in",), lambda: values[0])
+    gauge.set_function(("out",), lambda: math.inf)
+    values[0] = 5
+
+    lines = registry.render().splitlines()
+    assert 'some_depth{queue="in"} 5' in lines
+    assert 'some_depth{queue="out"} +Inf' in lines
+
+    gauge.remove(("in",))
+    gauge.remove(("out",))
+    assert registry.render().splitlines()[2:] == []
+
+
+def test_registry_get_or_create():
+    """Test the registry returns the existing metrics, and checks their type and labels."""
+    registry = MetricsRegistry()
+    counter = registry.counter("some_total", "Some counter.", ("agent",))
+    assert registry.counter("some_total", "Some counter.", ("agent",)) is counter
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("some_total", "Some gauge.", ("agent",))
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("some_total", "Some counter.", ("skill",))
+
+    assert MetricsRegistry().render() == ""
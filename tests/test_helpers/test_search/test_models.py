@@ -18,12 +18,15 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the tests for the helpers.search.models."""
+import random
 import re
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 from aea.exceptions import AEAEnforceError
+from aea.helpers.search import models
 from aea.helpers.search.models import (
     And,
     Attribute,
@@ -622,3 +625,95 @@ def test_query():
     assert query_pb.query_bytes is not None
     query = Query.decode(query_pb)
     assert "author" in query.model.attributes_by_name
+
+
+def _random_description(rng: random.Random) -> Description:
+    """Generate a random description, with possibly missing or mistyped attributes."""
+    values = {}
+    if rng.random() < 0.9:
+        values["price"] = rng.choice([rng.randint(0, 100), float(rng.randint(0, 100))])
+    if rng.random() < 0.9:
+        values["rating"] = rng.uniform(0.0, 5.0)
+    if rng.random() < 0.9:
+        values["city"] = rng.choice(["Cambridge", "London", "Paris"])
+    if rng.random() < 0.9:
+        values["delivery"] = rng.choice([True, False])
+    if rng.random() < 0.9:
+        values["location"] = Location(rng.uniform(50, 54), rng.uniform(-2, 2))
+    return Description(values)
+
+
+COMPILE_TEST_QUERIES = [
+    Query([]),
+    Query([Constraint("price", ConstraintType("<", 50))]),
+    Query([Constraint("price", ConstraintType("==", 42.0))]),
+    Query([Constraint("price", ConstraintType("!=", 42))]),
+    Query([Constraint("rating", ConstraintType("within", (1.5, 3.5)))]),
+    Query([Constraint("price", ConstraintType("within", (10, 20)))]),
+    Query([Constraint("city", ConstraintType("in", ("London", "Paris")))]),
+    Query([Constraint("price", ConstraintType("not_in", (1, 2, 3)))]),
+    Query([Constraint("delivery", ConstraintType("==", True))]),
+    Query([Constraint("city", ConstraintType(">=", "London"))]),
+    Query(
+        [
+            Constraint(
+                "location", ConstraintType("distance", (Location(52.2, 0.1), 100.0))
+            )
+        ]
+    ),
+    Query(
+        [
+            Or(
+                [
+                    And(
+                        [
+                            Constraint("price", ConstraintType(">", 20)),
+                            Not(Constraint("rating", ConstraintType("<=", 2.5))),
+                        ]
+                    ),
+                    Constraint("city", ConstraintType("==", "Cambridge")),
+                ]
+            ),
+            Not(
+                Constraint(
+                    "location", ConstraintType("distance", (Location(51.5, 0.0), 50.0))
+                )
+            ),
+        ]
+    ),
+]
+
+
+@pytest.mark.parametrize("query", COMPILE_TEST_QUERIES)
+@pytest.mark.parametrize("vectorised", [True, False])
+def test_query_compile(query, vectorised):
+    """Test the compiled query agrees with Query.check, with and without NumPy."""
+    rng = random.Random(0)
+    descriptions = [_random_description(rng) for _ in range(500)]
+    expected = [d for d in descriptions if query.check(d)]
+
+    with mock.patch.object(models, "np", models.np if vectorised else None):
+        compiled = query.compile()
+        assert [d for d in descriptions if compiled.check(d)] == expected
+        assert [d for d in descriptions if compiled(d)] == expected
+        assert compiled.filter(descriptions) == expected
+        assert compiled.filter(descriptions[:10]) == [
+            d for d in descriptions[:10] if query.check(d)
+        ]
+
+
+def test_query_compile_large_integers():
+    """Test the compiled query falls back to exact comparisons for large integers."""
+    threshold = 2 ** 60
+    query = Query([Constraint("id", ConstraintType(">", threshold))])
+    descriptions = [Description({"id": threshold + i % 2}) for i in range(100)]
+    assert query.compile().filter(descriptions) == descriptions[1::2]
+
+    query = Query([Constraint("id", ConstraintType("<", 10))])
+    assert query.compile().filter(descriptions) == []
+
+
+def test_query_compile_empty_set():
+    """Test the compiled query does not match any description against an empty set."""
+    query = Query([Constraint("city", ConstraintType("in", ()))])
+    assert query.compile().filter([Description({"city": "London"})]) == []
@@ -17,11 +17,17 @@
 #
 # ------------------------------------------------------------------------------
 """This module contains the tests for aea helpers storage code."""
+import asyncio
 import os
+import sqlite3
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
+from aea.helpers.storage.backends.base import AbstractStorageBackend
+from aea.helpers.storage.backends.sqlite import SqliteStorageBackend
 from aea.helpers.storage.generic_storage import Storage
 
 
@@ -38,6 +44,7 @@ class TestAsyncCollection:
 
         col = await s.get_collection("test_col")
         col2 = await s.get_collection("another_collection")
+        await col.ensure_index("a")
         obj_id = "1"
         obj_body = {"a": 12}
         await col.put(obj_id, {"x": 13})
@@ -52,6 +59,13 @@ class TestAsyncCollection:
         await col.remove(obj_id)
         assert await col.get(obj_id) is None
 
+        await col.put_many([("2", {"b": 2}), ("3", [3])])
+        assert await col.get_many(["3", "not exists", "2"]) == [[3], None, {"b": 2}]
+
+        assert await col.list_page(limit=1) == [("2", {"b": 2})]
+        assert await col.list_page(after="2", limit=5) == [("3", [3])]
+        assert await col.list_page(after="3") == []
+
         s.stop()
         await s.wait_completed()
 
@@ -72,6 +86,7 @@ class TestSyncCollection:
 
         col = s.get_sync_collection("test_col")
         col2 = s.get_sync_collection("another_collection")
+        col.ensure_index("a")
         col.put(obj_id, {"x": 13})
         col.put(obj_id, obj_body)
         assert col.find("a", 12) == [(obj_id, obj_body)]
@@ -83,10 +98,229 @@ class TestSyncCollection:
         col.remove(obj_id)
         assert col.get(obj_id) is None
 
+        col.put_many([("2", {"b": 2}), ("3", [3])])
+        assert col.get_many(["3", "not exists", "2"]) == [[3], None, {"b": 2}]
+
+        assert col.list_page(after="2") == [("3", [3])]
+        col.put_many([(str(i), {"i": i}) for i in range(4, 9)])
+        with patch.object(col, "list_page", wraps=col.list_page) as list_page:
+            assert list(col.iter_list(page_size=2)) == [
+                ("2", {"b": 2}),
+                ("3", [3]),
+                ("4", {"i": 4}),
+                ("5", {"i": 5}),
+                ("6", {"i": 6}),
+                ("7", {"i": 7}),
+                ("8", {"i": 8}),
+            ]
+        assert list_page.call_count == 4
+
         s.stop()
         s.wait_completed(sync=True, timeout=5)
 
 
+class TestWriteBehind:
+    """Test sqlite backend write-behind mode."""
+
+    @staticmethod
+    def _read_committed(fname, collection_name):
+        """Read the objects committed to the database file."""
+        con = sqlite3.connect(fname)
+        try:
+            return dict(
+                con.execute(f"SELECT object_id, object_body FROM {collection_name};")
+            )
+        except sqlite3.OperationalError:
+            return {}
+        finally:
+            con.close()
+
+    @pytest.mark.asyncio
+    async def test_writes_are_coalesced_and_flushed(self, tmp_path):
+        """Test puts and removes are queued, readable and flushed in batches."""
+        fname = str(tmp_path / "storage.db")
+        backend = SqliteStorageBackend(
+            f"sqlite://{fname}?mode=write_behind&flush_interval=1000&batch_size=10"
+        )
+        assert backend.is_write_behind
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            await backend.put("col", "1", {"a": 1})
+            await backend.put("col", "1", {"a": 2})
+            await backend.put_many("col", [("2", {"a": 3}), ("3", {"a": 4})])
+            await backend.remove("col", "3")
+
+            assert self._read_committed(fname, "col") == {}
+            assert await backend.get("col", "1") == {"a": 2}
+            assert await backend.get("col", "3") is None
+            assert await backend.get_many("col", ["2", "3"]) == [{"a": 3}, None]
+
+            assert await backend.find("col", "a", 3) == [("2", {"a": 3})]
+            assert self._read_committed(fname, "col") == {
+                "1": '{"a": 2}',
+                "2": '{"a": 3}',
+            }
+
+            await backend.put_many("col", [(str(i), i) for i in range(10)])
+            assert len(self._read_committed(fname, "col")) == 10
+
+            await backend.remove("col", "9")
+        finally:
+            await backend.disconnect()
+        assert "9" not in self._read_committed(fname, "col")
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self, tmp_path):
+        """Test the write-behind queue is flushed every flush interval."""
+        fname = str(tmp_path / "storage.db")
+        backend = SqliteStorageBackend(
+            f"sqlite://{fname}?mode=write_behind&flush_interval=0.01"
+        )
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            await backend.put("col", "1", {"a": 1})
+            for _ in range(100):
+                if self._read_committed(fname, "col"):
+                    break
+                await asyncio.sleep(0.01)
+            assert self._read_committed(fname, "col") == {"1": '{"a": 1}'}
+        finally:
+            await backend.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_during_periodic_flush(self, tmp_path):
+        """Test disconnecting during a periodic flush does not lose the writes."""
+        fname = str(tmp_path / "storage.db")
+        backend = SqliteStorageBackend(
+            f"sqlite://{fname}?mode=write_behind&flush_interval=0.01"
+        )
+        await backend.connect()
+        await backend.ensure_collection("col")
+        write_sync = backend._write_sync
+        writing = threading.Event()
+
+        def slow_write_sync(writes):
+            writing.set()
+            time.sleep(0.1)
+            write_sync(writes)
+
+        with patch.object(backend, "_write_sync", side_effect=slow_write_sync):
+            await backend.put("col", "1", {"a": 1})
+            while not writing.is_set():
+                await asyncio.sleep(0.005)
+            await backend.put("col", "2", {"a": 2})
+            flush_task = backend._flush_task
+            await backend.disconnect()
+
+        assert flush_task.done() and not flush_task.cancelled()
+        assert self._read_committed(fname, "col") == {
+            "1": '{"a": 1}',
+            "2": '{"a": 2}',
+        }
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_requeues_writes(self, tmp_path):
+        """Test the writes of a cancelled flush are queued again, unless superseded."""
+        fname = str(tmp_path / "storage.db")
+        backend = SqliteStorageBackend(
+            f"sqlite://{fname}?mode=write_behind&flush_interval=1000"
+        )
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            await backend.put_many("col", [("1", {"a": 1}), ("2", {"a": 2})])
+            with patch.object(
+                backend, "_write_sync", side_effect=lambda _: time.sleep(0.05)
+            ):
+                flush_task = asyncio.ensure_future(backend.flush())
+                await asyncio.sleep(0.01)
+                await backend.put("col", "2", {"a": 3})
+                flush_task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await flush_task
+            assert backend._pending_writes == {
+                "col": {"1": '{"a": 1}', "2": '{"a": 3}'}
+            }
+            assert backend._pending_writes_count == 2
+        finally:
+            await backend.disconnect()
+        assert self._read_committed(fname, "col") == {
+            "1": '{"a": 1}',
+            "2": '{"a": 3}',
+        }
+
+    def test_invalid_mode(self):
+        """Test unsupported mode raises exception."""
+        with pytest.raises(ValueError, match="Invalid sqlite storage mode"):
+            SqliteStorageBackend("sqlite://:memory:?mode=bad")
+
+
+class TestIndexes:
+    """Test sqlite backend expression indexes."""
+
+    @pytest.mark.asyncio
+    async def test_find_uses_index(self):
+        """Test find uses the index on the field."""
+        backend = SqliteStorageBackend("sqlite://:memory:")
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            await backend.put_many(
+                "col", [(str(i), {"parent": {"field": i % 3}}) for i in range(10)]
+            )
+            sql, args = backend._get_find_sql("col", "parent.field", 1)
+            plan = await backend._executute_sql(f"EXPLAIN QUERY PLAN {sql}", args)
+            assert "USING INDEX" not in str(plan)
+
+            await backend.ensure_index("col", "parent.field")
+            await backend.ensure_index("col", "$.parent.field")
+            plan = await backend._executute_sql(f"EXPLAIN QUERY PLAN {sql}", args)
+            assert "USING INDEX" in str(plan)
+
+            found = await backend.find("col", "parent.field", 1)
+            assert sorted(object_id for object_id, _ in found) == ["1", "4", "7"]
+            assert await backend.find("col", "parent.field", 5) == []
+        finally:
+            await backend.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_invalid_index_field(self):
+        """Test bad index field name raises exception."""
+        backend = SqliteStorageBackend("sqlite://:memory:")
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            with pytest.raises(ValueError, match="Invalid index field:"):
+                await backend.ensure_index("col", "parent.field') --")
+        finally:
+            await backend.disconnect()
+
+
+class TestListPage:
+    """Test listing collections by pages."""
+
+    @pytest.mark.asyncio
+    async def test_default_list_page(self):
+        """Test the default implementation of the backends pages the full list."""
+        backend = SqliteStorageBackend("sqlite://:memory:")
+        await backend.connect()
+        try:
+            await backend.ensure_collection("col")
+            await backend.put_many("col", [("b", [2]), ("c", [3]), ("a", [1])])
+            pages = [
+                await AbstractStorageBackend.list_page(backend, "col", after, 2)
+                for after in (None, "b", "c")
+            ]
+            assert pages == [[("a", [1]), ("b", [2])], [("c", [3])], []]
+            assert pages == [
+                await backend.list_page("col", after, 2) for after in (None, "b", "c")
+            ]
+        finally:
+            await backend.disconnect()
+
+
 class TestMisc:
     """Various tests."""
 
@@ -318,6 +318,23 @@ def test_envelope_to_as_public_id():
     assert env.to_as_public_id is not None
 
 
+def test_envelope_addresses_parsed_again_when_set():
+    """Test the addresses of an envelope are parsed as public ids again when they are set."""
+    env = Envelope(
+        to="agent_1",
+        sender="agent_2",
+        message=b"message",
+        protocol_specification_id=PublicId("author", "name", "0.1.0"),
+    )
+    assert not env.is_component_to_component_message
+    assert env.to_as_public_id is None
+    env.to = "some_author/some_name:0.1.0"
+    env.sender = "some_author/other_name:0.1.0"
+    assert env.is_component_to_component_message
+    assert env.to_as_public_id == PublicId("some_author", "some_name", "0.1.0")
+    assert env.sender_as_public_id == PublicId("some_author", "other_name", "0.1.0")
+
+
 def test_envelope_constructor():
     """Test Envelope constructor checks."""
     Envelope(
@@ -37,7 +37,10 @@ import aea
 from aea.cli.core import cli
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.connections.base import ConnectionStates
+from aea.exceptions import AEAEnforceError
 from aea.helpers.exception_policy import ExceptionPolicyEnum
+from aea.helpers.metrics import connection_envelopes_received, connection_envelopes_sent
+from aea.helpers.metrics import registry as metrics_registry
 from aea.identity.base import Identity
 from aea.mail.base import AEAConnectionError, Envelope, EnvelopeContext
 from aea.multiplexer import AsyncMultiplexer, InBox, Multiplexer, OutBox
@@ -63,7 +66,7 @@ from .conftest import (
     logger,
 )
 from tests.common.pexpect_popen import PexpectWrapper
-from tests.common.utils import wait_for_condition
+from tests.common.utils import wait_for_condition, wait_for_condition_async
 
 
 UnknownProtocolMock = Mock()
@@ -1122,3 +1125,151 @@ async def test_stops_on_connectionerror_during_connect():
             await multiplexer.connect()
 
     assert multiplexer.connection_status.is_disconnected
+
+
+def _make_default_envelope(to: str = "to", sender: str = "sender") -> Envelope:
+    """Make an envelope with a default protocol message."""
+    msg = DefaultMessage(performative=DefaultMessage.Performative.BYTES, content=b"",)
+    msg.to = to
+    msg.sender = sender
+    return Envelope(to=to, sender=sender, message=msg)
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_falls_back_to_per_envelope_calls():
+    """Test batched mode works with connections without batch support."""
+    connection = _make_dummy_connection()
+    assert not connection.supports_send_batch
+    assert not connection.supports_receive_batch
+    multiplexer = AsyncMultiplexer(
+        [connection], loop=asyncio.get_event_loop(), batch_size=16
+    )
+    assert multiplexer.is_batched
+    envelopes = [_make_default_envelope() for _ in range(10)]
+    try:
+        await multiplexer.connect()
+        for envelope in envelopes:
+            multiplexer.put(envelope)
+        received = [
+            await asyncio.wait_for(multiplexer.async_get(), timeout=5)
+            for _ in envelopes
+        ]
+        assert received == envelopes
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_uses_batch_api():
+    """Test batched mode hands batches to connections implementing the batch api."""
+    connection = _make_dummy_connection()
+    sent_batches = []
+    received_batches = []
+
+    async def send_batch(envelopes):
+        sent_batches.append(list(envelopes))
+        for envelope in envelopes:
+            connection.put(envelope)
+
+    async def receive_batch(max_size):
+        envelopes = [await connection._queue.get()]
+        while len(envelopes) < max_size and not connection._queue.empty():
+            envelopes.append(connection._queue.get_nowait())
+        envelopes = [e for e in envelopes if e is not None]
+        received_batches.append(envelopes)
+        return envelopes
+
+    batch_size = 4
+    envelopes = [_make_default_envelope() for _ in range(10)]
+    with patch.object(type(connection), "supports_send_batch", True), patch.object(
+        type(connection), "supports_receive_batch", True
+    ), patch.object(connection, "send_batch", side_effect=send_batch), patch.object(
+        connection, "receive_batch", side_effect=receive_batch
+    ):
+        multiplexer = AsyncMultiplexer(
+            [connection], loop=asyncio.get_event_loop(), batch_size=batch_size
+        )
+        try:
+            await multiplexer.connect()
+            for envelope in envelopes:
+                multiplexer.out_queue.put_nowait(envelope)
+            received = [
+                await asyncio.wait_for(multiplexer.async_get(), timeout=5)
+                for _ in envelopes
+            ]
+        finally:
+            await multiplexer.disconnect()
+
+    assert received == envelopes
+    assert [e for batch in sent_batches for e in batch] == envelopes
+    assert all(0 < len(batch) <= batch_size for batch in sent_batches)
+    assert len(sent_batches) < len(envelopes)
+    assert all(len(batch) <= batch_size for batch in received_batches)
+
+
+@pytest.mark.parametrize("batch_size", [0, 4])
+@pytest.mark.asyncio
+async def test_multiplexer_metrics(batch_size):
+    """Test the multiplexer counts the envelopes per connection and exposes its queue depths."""
+    connection = _make_dummy_connection()
+    agent_name = f"metrics_agent_{batch_size}"
+    multiplexer = AsyncMultiplexer(
+        [connection],
+        loop=asyncio.get_event_loop(),
+        agent_name=agent_name,
+        batch_size=batch_size,
+    )
+    labels = (agent_name, str(connection.connection_id))
+    sent = connection_envelopes_sent.labels(*labels)
+    received = connection_envelopes_received.labels(*labels)
+    sent_before, received_before = sent.value, received.value
+    envelopes = [_make_default_envelope() for _ in range(5)]
+    try:
+        await multiplexer.connect()
+        assert f'aea_multiplexer_queue_depth{{agent="{agent_name}",queue="in"}} 0' in (
+            metrics_registry.render()
+        )
+        for envelope in envelopes:
+            multiplexer.put(envelope)
+        await wait_for_condition_async(
+            lambda: received.value - received_before == len(envelopes), timeout=5
+        )
+        assert (
+            f'aea_multiplexer_queue_depth{{agent="{agent_name}",queue="in"}} {len(envelopes)}'
+            in metrics_registry.render()
+        )
+    finally:
+        await multiplexer.disconnect()
+
+    assert sent.value - sent_before == len(envelopes)
+    assert f'agent="{agent_name}",queue=' not in metrics_registry.render()
+
+
+@pytest.mark.asyncio
+async def test_batched_mode_send_error_is_handled_by_policy():
+    """Test batched mode applies the exception policy to send errors."""
+    connection = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection],
+        loop=asyncio.get_event_loop(),
+        exception_policy=ExceptionPolicyEnum.just_log,
+        batch_size=8,
+    )
+    try:
+        await multiplexer.connect()
+        with patch.object(
+            connection, "send", side_effect=Exception("expected")
+        ) as send_mock, patch.object(multiplexer.logger, "exception") as log_mock:
+            multiplexer.put(_make_default_envelope())
+            await asyncio.sleep(0.1)
+        send_mock.assert_called_once()
+        log_mock.assert_called_once()
+        assert multiplexer.is_connected
+    finally:
+        await multiplexer.disconnect()
+
+
+def test_negative_batch_size():
+    """Test a negative batch size is rejected."""
+    with pytest.raises(AEAEnforceError, match="Batch size must be non-negative."):
+        AsyncMultiplexer(batch_size=-1)
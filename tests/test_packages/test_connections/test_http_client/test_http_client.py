@@ -20,11 +20,12 @@
 import asyncio
 import logging
 from asyncio import CancelledError
-from typing import cast
+from typing import List, cast
 from unittest.mock import MagicMock, Mock, patch
 
 import aiohttp
 import pytest
+from aiohttp import web
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig
@@ -32,7 +33,11 @@ from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
-from packages.fetchai.connections.http_client.connection import HTTPClientConnection
+from packages.fetchai.connections.http_client.connection import (
+    HTTPClientAsyncChannel,
+    HTTPClientConnection,
+    request_latency,
+)
 from packages.fetchai.protocols.http.dialogues import HttpDialogue
 from packages.fetchai.protocols.http.dialogues import HttpDialogues as BaseHttpDialogues
 from packages.fetchai.protocols.http.message import HttpMessage
@@ -267,7 +272,7 @@ class TestHTTPClientConnect:
         response_mock.reason = "OK"
         response_mock._body = b"Some content"
         response_mock.read.return_value = asyncio.Future()
-        response_mock.read.return_value.set_result("")
+        response_mock.read.return_value.set_result(b"Some content")
 
         with patch.object(
             aiohttp.ClientSession, "request", return_value=_MockRequest(response_mock),
@@ -350,3 +355,137 @@ class TestHTTPClientConnect:
         message = cast(HttpMessage, envelope.message)
         assert message.performative == HttpMessage.Performative.RESPONSE
         assert b"expected exception" in message.body
+
+
+@pytest.mark.asyncio
+class TestHTTPClientPooledSession:
+    """Tests the http client connection's session with a local server."""
+
+    async def _start_server(self) -> None:
+        """Start a local server, which counts the requests performed at once."""
+        self.active_requests = 0
+        self.max_active_requests = 0
+
+        async def handle(request: web.Request) -> web.Response:
+            self.active_requests += 1
+            self.max_active_requests = max(
+                self.max_active_requests, self.active_requests
+            )
+            await asyncio.sleep(float(request.query.get("delay", "0.01")))
+            self.active_requests -= 1
+            return web.Response(body=b"x" * int(request.query.get("size", "10")))
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        self.port = get_unused_tcp_port()
+        await web.TCPSite(self.runner, "127.0.0.1", self.port).start()
+
+    def _make_connection(self, **config) -> HTTPClientConnection:
+        """Make a connection, with an extra configuration."""
+        configuration = ConnectionConfig(
+            host="127.0.0.1",
+            port=self.port,
+            connection_id=HTTPClientConnection.connection_id,
+            **config,
+        )
+        return HTTPClientConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+            identity=Identity("name", address="some string", public_key="some key"),
+        )
+
+    async def _request(
+        self,
+        connection: HTTPClientConnection,
+        count: int,
+        size: int = 10,
+        delay: float = 0.01,
+    ) -> List[HttpMessage]:
+        """Send requests to the local server, and get the responses."""
+        http_dialogues = HttpDialogues("some/skill:0.1.0")
+        for _ in range(count):
+            request_http_message, _ = http_dialogues.create(
+                counterparty=str(connection.connection_id),
+                performative=HttpMessage.Performative.REQUEST,
+                method="get",
+                url=f"http://127.0.0.1:{self.port}/?size={size}&delay={delay}",
+                headers="Accept: */*\n",
+                version="",
+                body=b"",
+            )
+            await connection.send(
+                Envelope(
+                    to=request_http_message.to,
+                    sender=request_http_message.sender,
+                    message=request_http_message,
+                )
+            )
+        responses = []
+        for _ in range(count):
+            envelope = await asyncio.wait_for(connection.receive(), timeout=10)
+            responses.append(cast(HttpMessage, envelope.message))
+        return responses
+
+    async def test_session_reused(self):
+        """Test the requests share one session, and their latency is recorded."""
+        await self._start_server()
+        connection = self._make_connection()
+        latency = request_latency.labels("some string", "127.0.0.1", "success")
+        count, total = latency.count, latency.sum
+        await connection.connect()
+        try:
+            responses = await self._request(connection, 5)
+            session = connection.channel._session
+            responses += await self._request(connection, 5)
+            assert connection.channel._session is session
+            assert [r.status_code for r in responses] == [200] * 10
+            assert all(r.body == b"x" * 10 for r in responses)
+            assert latency.count == count + 10
+            assert latency.sum > total
+        finally:
+            await connection.disconnect()
+            await self.runner.cleanup()
+        assert session.closed
+
+    async def test_max_concurrent_requests(self):
+        """Test the requests beyond the maximum number of concurrent requests are queued."""
+        await self._start_server()
+        connection = self._make_connection(max_concurrent_requests=2)
+        await connection.connect()
+        try:
+            responses = await self._request(connection, 6)
+        finally:
+            await connection.disconnect()
+            await self.runner.cleanup()
+        assert [r.status_code for r in responses] == [200] * 6
+        assert self.max_active_requests == 2
+
+    async def test_queued_requests_not_timed_out(self):
+        """Test the wait of the queued requests does not count in the timeout of the requests."""
+        await self._start_server()
+        connection = self._make_connection(max_concurrent_requests=1)
+        await connection.connect()
+        try:
+            with patch.object(connection.channel, "DEFAULT_TIMEOUT", 0.5):
+                responses = await self._request(connection, 4, delay=0.2)
+        finally:
+            await connection.disconnect()
+            await self.runner.cleanup()
+        assert [r.status_code for r in responses] == [200] * 4
+
+    async def test_max_response_size(self):
+        """Test the requests with a body larger than the maximum response size fail."""
+        await self._start_server()
+        connection = self._make_connection(max_response_size=200 * 1024)
+        await connection.connect()
+        try:
+            (small,) = await self._request(connection, 1, size=150 * 1024)
+            (large,) = await self._request(connection, 1, size=300 * 1024)
+        finally:
+            await connection.disconnect()
+            await self.runner.cleanup()
+        assert small.status_code == 200 and len(small.body) == 150 * 1024
+        assert large.status_code == HTTPClientAsyncChannel.DEFAULT_EXCEPTION_CODE
+        assert b"Response body larger than" in large.body
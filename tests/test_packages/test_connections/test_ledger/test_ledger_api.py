@@ -422,8 +422,11 @@ async def test_attempts_get_transaction_receipt():
     assert dialogue is not None
     mock_api.get_transaction.return_value = None
     mock_api.is_transaction_settled.return_value = True
-    with patch.object(dispatcher, "MAX_ATTEMPTS", 2):
-        with patch.object(dispatcher, "TIMEOUT", 0.001):
-            msg = dispatcher.get_transaction_receipt(mock_api, message, dialogue)
+    with patch.object(dispatcher.receipt_watcher, "poll_interval", 0.001):
+        with patch.object(dispatcher.receipt_watcher, "timeout", 0.002):
+            msg = await dispatcher.run_async(
+                dispatcher.get_transaction_receipt, mock_api, message, dialogue
+            )
 
     assert msg.performative == LedgerApiMessage.Performative.ERROR
+    assert msg.message == "No transaction returned"
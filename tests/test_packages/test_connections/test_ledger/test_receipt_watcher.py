@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests of the receipt watcher of the ledger connection."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+import pytest
+
+from aea.helpers.async_utils import AsyncState
+from aea.helpers.transaction.base import TransactionDigest
+
+from packages.fetchai.connections.ledger.ledger_dispatcher import (
+    LedgerApiRequestDispatcher,
+)
+from packages.fetchai.connections.ledger.receipt_watcher import ReceiptWatcher
+from packages.fetchai.protocols.ledger_api.message import LedgerApiMessage
+
+
+LEDGER_ID = "fake"
+
+
+class FakeLedgerApi:
+    """A ledger api settling the transactions after a number of receipt requests."""
+
+    def __init__(self, receipt_requests_to_settle: int = 2) -> None:
+        """Initialize the fake ledger api."""
+        self.receipt_requests_to_settle = receipt_requests_to_settle
+        self.receipt_requests = {}  # type: Dict[str, int]
+        self.never_settled = set()  # type: Set[str]
+        self.failing = set()  # type: Set[str]
+        self.threads = set()  # type: Set[int]
+
+    def get_transaction_receipt(self, tx_digest: str) -> Optional[dict]:
+        """Get the receipt of a transaction."""
+        self.threads.add(threading.get_ident())
+        if tx_digest in self.failing:
+            raise ConnectionError("ledger unavailable")
+        self.receipt_requests[tx_digest] = self.receipt_requests.get(tx_digest, 0) + 1
+        if self.receipt_requests[tx_digest] < self.receipt_requests_to_settle:
+            return None
+        return {"digest": tx_digest, "settled": tx_digest not in self.never_settled}
+
+    @staticmethod
+    def is_transaction_settled(tx_receipt: dict) -> bool:
+        """Check whether a transaction is settled."""
+        return tx_receipt["settled"]
+
+    @staticmethod
+    def get_transaction(tx_digest: str) -> dict:
+        """Get a transaction."""
+        return {"digest": tx_digest}
+
+
+@pytest.mark.asyncio
+async def test_transactions_watched_in_batches():
+    """Test many transactions are polled together, without a thread per transaction."""
+    api = FakeLedgerApi()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        watcher = ReceiptWatcher(executor=executor, poll_interval=0.01)
+        digests = [f"digest_{i}" for i in range(20)]
+        results = await asyncio.wait_for(
+            asyncio.gather(*(watcher.watch(api, LEDGER_ID, d) for d in digests)), 5
+        )
+
+    assert results == [({"digest": d, "settled": True}, {"digest": d}) for d in digests]
+    assert api.receipt_requests == {d: 2 for d in digests}
+    assert len(api.threads) == 1
+    assert watcher.pending_digests == {}
+
+
+@pytest.mark.asyncio
+async def test_transaction_not_settled_within_timeout():
+    """Test a transaction never settled fails after the timeout, the others are resolved."""
+    api = FakeLedgerApi(receipt_requests_to_settle=1)
+    api.never_settled.add("unsettled")
+    api.failing.add("failing")
+    watcher = ReceiptWatcher(poll_interval=0.01, timeout=0.05)
+
+    results = await asyncio.gather(
+        watcher.watch(api, LEDGER_ID, "unsettled"),
+        watcher.watch(api, LEDGER_ID, "failing"),
+        watcher.watch(api, LEDGER_ID, "settled"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert str(results[0]) == "Transaction not settled within timeout"
+    assert isinstance(results[1], ConnectionError)
+    assert results[2] == ({"digest": "settled", "settled": True}, {"digest": "settled"})
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_backoff():
+    """Test the poll interval grows while nothing is settled, and is reset by a new transaction."""
+    api = FakeLedgerApi(receipt_requests_to_settle=4)
+    watcher = ReceiptWatcher(poll_interval=0.01, max_poll_interval=0.03)
+    task = asyncio.ensure_future(watcher.watch(api, LEDGER_ID, "first"))
+    while api.receipt_requests.get("first", 0) < 3:
+        await asyncio.sleep(0.005)
+    poller = watcher._pollers[LEDGER_ID]
+    assert poller.interval == 0.03
+
+    second = asyncio.ensure_future(watcher.watch(api, LEDGER_ID, "second"))
+    await asyncio.sleep(0)
+    assert poller.interval == 0.01
+    assert watcher.pending_digests == {LEDGER_ID: ["first", "second"]}
+    await asyncio.wait_for(asyncio.gather(task, second), 5)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_requests_not_watched():
+    """Test cancelled requests are not watched anymore, and stop cancels the requests."""
+    api = FakeLedgerApi(receipt_requests_to_settle=1000)
+    watcher = ReceiptWatcher(poll_interval=0.01)
+    task = asyncio.ensure_future(watcher.watch(api, LEDGER_ID, "first"))
+    other = asyncio.ensure_future(watcher.watch(api, LEDGER_ID, "second"))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    await asyncio.sleep(0)
+    assert watcher.pending_digests == {LEDGER_ID: ["second"]}
+
+    watcher.stop()
+    with pytest.raises(asyncio.CancelledError):
+        await other
+    assert watcher.pending_digests == {}
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_get_transaction_receipt():
+    """Test the dispatcher replies with the receipt and the transaction of the watcher."""
+    dispatcher = LedgerApiRequestDispatcher(AsyncState())
+    dispatcher.receipt_watcher.poll_interval = 0.01
+    message = LedgerApiMessage(
+        performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
+        dialogue_reference=dispatcher.dialogues.new_self_initiated_dialogue_reference(),
+        transaction_digest=TransactionDigest(LEDGER_ID, "digest"),
+    )
+    message.to = dispatcher.dialogues.self_address
+    message.sender = "test"
+    dialogue = dispatcher.dialogues.update(message)
+    assert dialogue is not None
+
+    msg = await dispatcher.run_async(
+        dispatcher.get_transaction_receipt, FakeLedgerApi(), message, dialogue
+    )
+
+    assert msg.performative == LedgerApiMessage.Performative.TRANSACTION_RECEIPT
+    assert msg.transaction_receipt.ledger_id == LEDGER_ID
+    assert msg.transaction_receipt.receipt == {"digest": "digest", "settled": True}
+    assert msg.transaction_receipt.transaction == {"digest": "digest"}
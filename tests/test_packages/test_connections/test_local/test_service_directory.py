@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2018-2021 Fetch.AI Limited
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""This module contains the tests of the indexed service directory of the local node."""
+import random
+
+import pytest
+
+from aea.helpers.search.models import (
+    And,
+    Attribute,
+    Constraint,
+    ConstraintType,
+    DataModel,
+    Description,
+    Location,
+    Not,
+    Or,
+    Query,
+)
+
+from packages.fetchai.connections.local.connection import ServiceDirectory
+
+
+DATA_MODEL = DataModel(
+    "service",
+    [
+        Attribute("price", int, True),
+        Attribute("rating", float, True),
+        Attribute("city", str, True),
+        Attribute("location", Location, True),
+    ],
+)
+OTHER_DATA_MODEL = DataModel("other", [Attribute("price", int, True)])
+CITIES = ("Cambridge", "London", "Paris", "Berlin")
+
+
+def _make_directory(size: int = 500) -> ServiceDirectory:
+    """Make a directory with random descriptions."""
+    rng = random.Random(0)
+    directory = ServiceDirectory()
+    for i in range(size):
+        description = Description(
+            {
+                "price": rng.randint(0, 100),
+                "rating": rng.uniform(0.0, 5.0),
+                "city": rng.choice(CITIES),
+                "location": Location(rng.uniform(-89, 89), rng.uniform(-180, 180)),
+            },
+            data_model=DATA_MODEL,
+        )
+        directory.add(f"address_{i % 50}", description)
+    directory.add("other_address", Description({"price": 10}, OTHER_DATA_MODEL))
+    return directory
+
+
+def _brute_force(directory: ServiceDirectory, query: Query) -> list:
+    """Evaluate a query on every registered description."""
+    return [
+        (address, description)
+        for address, descriptions in directory.services.items()
+        for description in descriptions
+        if (query.model is None or description.data_model == query.model)
+        and query.check(description)
+    ]
+
+
+def _same(first: list, second: list) -> bool:
+    """Compare search results regardless of the order."""
+    return sorted(map(str, first)) == sorted(map(str, second))
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        Query([Constraint("price", ConstraintType("==", 10))]),
+        Query([Constraint("price", ConstraintType("<", 10))], model=DATA_MODEL),
+        Query([Constraint("price", ConstraintType(">=", 90))]),
+        Query([Constraint("rating", ConstraintType("within", (1.0, 1.5)))]),
+        Query([Constraint("city", ConstraintType("in", ("Paris", "Berlin")))]),
+        Query([Constraint("city", ConstraintType("!=", "Paris"))]),
+        Query([Constraint("city", ConstraintType("<", "C"))]),
+        Query(
+            [
+                Constraint(
+                    "location", ConstraintType("distance", (Location(52, 0), 1000.0))
+                )
+            ]
+        ),
+        Query(
+            [
+                Constraint(
+                    "location", ConstraintType("distance", (Location(88, 179), 500.0))
+                )
+            ]
+        ),
+        Query(
+            [
+                And(
+                    [
+                        Constraint("price", ConstraintType(">", 50)),
+                        Constraint("city", ConstraintType("==", "London")),
+                    ]
+                ),
+                Or(
+                    [
+                        Constraint("rating", ConstraintType("<=", 2.0)),
+                        Constraint("price", ConstraintType("==", 99)),
+                    ]
+                ),
+            ]
+        ),
+        Query([Not(Constraint("city", ConstraintType("==", "London")))]),
+        Query([], model=OTHER_DATA_MODEL),
+    ],
+)
+def test_search_matches_query_check(query: Query):
+    """Test the indexed search returns exactly the descriptions satisfying the query."""
+    directory = _make_directory()
+    result = directory.search(query)
+    assert _same(result, _brute_force(directory, query))
+
+
+def test_remove_keeps_indexes_consistent():
+    """Test removal of descriptions and addresses updates the indexes."""
+    directory = _make_directory()
+    query = Query([Constraint("price", ConstraintType("<=", 50))])
+    for address, description in directory.search(query)[:50]:
+        assert directory.remove(address, description)
+    directory.remove_address("address_0")
+
+    assert "address_0" not in directory.addresses
+    assert _same(directory.search(query), _brute_force(directory, query))
+    assert not directory.remove("unknown", Description({"price": 1}))
+
+    for address in directory.addresses:
+        directory.remove_address(address)
+    assert len(directory) == 0
+    assert directory.services == {}
+    assert directory.search(Query([])) == []
@@ -28,6 +28,7 @@ import pytest
 
 from aea.configurations.base import ConnectionConfig
 from aea.configurations.constants import DEFAULT_LEDGER
+from aea.connections.base import ConnectionStates
 from aea.crypto.registries import make_crypto
 from aea.helpers.base import CertRequest
 from aea.identity.base import Identity
@@ -251,6 +252,92 @@ async def test_reconnect_on_send_fail():
             connect_mock.assert_called()
 
 
+class _Pipe:
+    """A pipe keeping the data written, and reading the data put in its queue."""
+
+    def __init__(self):
+        """Initialize the pipe."""
+        self.written = []
+        self.to_read = asyncio.Queue()
+
+    async def write(self, data):
+        """Write data."""
+        self.written.append(data)
+
+    async def read(self):
+        """Read data."""
+        return await self.to_read.get()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_send():
+    """Test envelopes are written before the previous ones are acknowledged, and acknowledged in order."""
+    pipe = _Pipe()
+    node_client = NodeClient(pipe, Mock(), max_inflight_envelopes=2)
+    await node_client.write_acn_status_ok()
+    await node_client.write_acn_status_error("error")
+    status_ok, status_error = pipe.written
+    pipe.written.clear()
+
+    with patch.object(
+        node_client, "make_acn_envelope_message", side_effect=[b"1", b"2", b"3"]
+    ):
+        ack_1 = await node_client.write_envelope(Mock())
+        ack_2 = await node_client.write_envelope(Mock())
+        write_3 = asyncio.ensure_future(node_client.write_envelope(Mock()))
+        await asyncio.sleep(0.01)
+        assert pipe.written == [b"1", b"2"]
+        assert not write_3.done()
+
+        read_task = asyncio.ensure_future(node_client.read_envelope())
+        pipe.to_read.put_nowait(status_ok)
+        pipe.to_read.put_nowait(status_error)
+        ack_3 = await write_3
+        assert pipe.written == [b"1", b"2", b"3"]
+
+    NodeClient.check_status(await ack_1)
+    with pytest.raises(ValueError, match="got error confirmation"):
+        NodeClient.check_status(await ack_2)
+    pipe.to_read.put_nowait(None)
+    assert await read_task is None
+    with pytest.raises(ConnectionError):
+        await ack_3
+
+
+@pytest.mark.asyncio
+async def test_pipelined_send_timeout():
+    """Test the envelopes not acknowledged fail when an acknowledgement is late."""
+    node_client = NodeClient(_Pipe(), Mock(), max_inflight_envelopes=2)
+    node_client.ACN_ACK_TIMEOUT = 0.1
+    with patch.object(node_client, "make_acn_envelope_message", return_value=b""):
+        acks = [await node_client.write_envelope(Mock()) for _ in range(2)]
+    for ack in acks:
+        with pytest.raises(ValueError, match="acn status await timeout!"):
+            await ack
+
+
+@pytest.mark.asyncio
+async def test_acks_loop_sends_failed_envelopes_again():
+    """Test the acks loop sends again the envelopes not acknowledged."""
+    with tempfile.TemporaryDirectory() as dirname:
+        con = _make_libp2p_client_connection(
+            data_dir=dirname, peer_public_key=make_crypto(DEFAULT_LEDGER).public_key
+        )
+    con.state = ConnectionStates.connected
+    con._acks_queue = asyncio.Queue()
+    failed_ack = Future()
+    failed_ack.set_exception(ConnectionError("oops"))
+    failed_envelope = Mock()
+    con._acks_queue.put_nowait((failed_envelope, failed_ack))
+    with patch.object(
+        con, "_send_envelope_with_node_client", return_value=done_future
+    ) as send_mock:
+        acks_task = asyncio.ensure_future(con._acks_loop())
+        await asyncio.sleep(0.01)
+        acks_task.cancel()
+    send_mock.assert_called_once_with(failed_envelope)
+
+
 @pytest.mark.asyncio
 async def test_acn_decode_error_on_read():
     """Test nodeclient send fails on read."""
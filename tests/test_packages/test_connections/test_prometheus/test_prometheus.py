@@ -21,11 +21,14 @@ import asyncio
 from typing import cast
 from unittest.mock import MagicMock, Mock
 
+import aiohttp
+import aioprometheus  # type: ignore
 import pytest
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig, PublicId
 from aea.exceptions import AEAEnforceError
+from aea.helpers.metrics import connection_envelopes_sent
 from aea.identity.base import Identity
 from aea.mail.base import Envelope, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
@@ -244,3 +247,40 @@ class TestPrometheusConnection:
         assert (
             self.prometheus_con.state == ConnectionStates.disconnected
         ), "should be disconnected"
+
+
+@pytest.mark.asyncio
+async def test_agent_metrics_exposed():
+    """Test the metrics of the framework are exposed along with the prometheus ones."""
+    configuration = ConnectionConfig(
+        connection_id=PrometheusConnection.connection_id, port=9091, agent_metrics=True,
+    )
+    identity = Identity("name", address="my_address", public_key="my_public_key")
+    prometheus_con = PrometheusConnection(
+        identity=identity, configuration=configuration, data_dir=MagicMock()
+    )
+    counter = connection_envelopes_sent.labels("name", "some/connection:0.1.0")
+    counter.inc()
+    await prometheus_con.connect()
+    try:
+        prometheus_con.channel.metrics["some_metric"] = aioprometheus.Gauge(
+            "some_metric", "some description"
+        )
+        prometheus_con.channel._service.register(
+            prometheus_con.channel.metrics["some_metric"]
+        )
+        prometheus_con.channel.metrics["some_metric"].set({}, 1.0)
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                "http://127.0.0.1:9091/metrics",
+                headers={"Accept": "application/vnd.google.protobuf"},
+            ) as response:
+                assert response.status == 200
+                text = await response.text()
+    finally:
+        await prometheus_con.disconnect()
+    assert "some_metric 1" in text
+    assert (
+        'aea_connection_envelopes_sent_total{agent="name",connection="some/connection:0.1.0"}'
+        in text
+    )
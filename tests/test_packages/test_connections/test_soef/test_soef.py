@@ -21,11 +21,13 @@ import asyncio
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, List
 from unittest.mock import MagicMock, patch
 
 import pytest
+from aiohttp import web
 
 from aea.common import Address
 from aea.configurations.base import ConnectionConfig
@@ -51,7 +53,6 @@ from packages.fetchai.connections.soef.connection import (
     SOEFException,
     SOEFNetworkConnectionError,
     SOEFServerBadResponseError,
-    requests,
 )
 from packages.fetchai.protocols.oef_search.dialogues import OefSearchDialogue
 from packages.fetchai.protocols.oef_search.dialogues import (
@@ -59,7 +60,7 @@ from packages.fetchai.protocols.oef_search.dialogues import (
 )
 from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 
-from tests.conftest import UNKNOWN_PROTOCOL_PUBLIC_ID
+from tests.conftest import UNKNOWN_PROTOCOL_PUBLIC_ID, get_unused_tcp_port
 from tests.test_packages.test_connections.test_soef import models
 
 
@@ -501,57 +502,6 @@ class TestSoef:
     @pytest.mark.asyncio
     async def test_find_around_me(self):
         """Test internal method find around me."""
-        agent_location = Location(52.2057092, 2.1183431)
-        radius = 0.1
-        close_to_my_service = Constraint(
-            "location", ConstraintType("distance", (agent_location, radius))
-        )
-        personality_filters = [
-            Constraint("genus", ConstraintType("==", "vehicle")),
-            Constraint(
-                "classification", ConstraintType("==", "mobility.railway.train")
-            ),
-        ]
-        service_key_filters = [
-            Constraint("custom_key", ConstraintType("==", "custom_value")),
-        ]
-        closeness_query = Query(
-            [close_to_my_service] + personality_filters + service_key_filters
-        )
-
-        message_1, sending_dialogue = self.oef_search_dialogues.create(
-            counterparty=str(SOEFConnection.connection_id.to_any()),
-            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
-            query=closeness_query,
-        )
-
-        internal_dialogue_1 = self.connection.channel.oef_search_dialogues.update(
-            message_1
-        )
-        assert internal_dialogue_1 is not None
-
-        message_2, sending_dialogue = self.oef_search_dialogues.create(
-            counterparty=str(SOEFConnection.connection_id.to_any()),
-            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
-            query=closeness_query,
-        )
-
-        internal_dialogue_2 = self.connection.channel.oef_search_dialogues.update(
-            message_2
-        )
-        assert internal_dialogue_2 is not None
-
-        message_3, sending_dialogue = self.oef_search_dialogues.create(
-            counterparty=str(SOEFConnection.connection_id.to_any()),
-            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
-            query=closeness_query,
-        )
-
-        internal_dialogue_3 = self.connection.channel.oef_search_dialogues.update(
-            message_3
-        )
-        assert internal_dialogue_3 is not None
-
         with patch.object(
             self.connection.channel,
             "_request_text",
@@ -562,18 +512,16 @@ class TestSoef:
                 wrap_future(self.search_fail_response),
             ],
         ):
-            await self.connection.channel._find_around_me_handle_request(
-                message_1, internal_dialogue_1, 1, {}
-            )
-            await self.connection.channel._find_around_me_handle_request(
-                message_2, internal_dialogue_2, 1, {}
-            )
+            assert await self.connection.channel._find_around_me_request(1, {}) == {}
+            agents = await self.connection.channel._find_around_me_request(1, {})
+            assert set(agents) == {
+                "2ayYmgrCg76R1mzr2zWCmivzJG31hXtFVwQvR4XrXrD88Rc3sT",
+                "2DvN8QNXKE2tjnKgMKvBy9ZFyC6JaFYFrcLyWSS4A9RDWeTP4k",
+            }
             with pytest.raises(
                 SOEFException, match=r".* `find_around_me` .*Exception: .*"
             ):
-                await self.connection.channel._find_around_me_handle_request(
-                    message_3, internal_dialogue_3, 1, {}
-                )
+                await self.connection.channel._find_around_me_request(1, {})
 
     @pytest.mark.asyncio
     async def test_register_agent(self):
@@ -632,55 +580,6 @@ class TestSoef:
             ):
                 await self.connection.channel._check_server_reachable()
 
-    @pytest.mark.asyncio
-    async def test_request_text_ok(self):
-        """Test internal method request_text works ok."""
-        resp = MagicMock()
-        resp.status_code = 200
-        resp.text = "<a></a>"
-        with patch("aea.helpers.http_requests.request", return_value=resp):
-            await self.connection.channel._request_text("get", "http://not-exists.com")
-
-    @pytest.mark.asyncio
-    async def test_request_text_fail(self):
-        """Test internal method request_text fails."""
-        resp = MagicMock()
-        resp.status_code = 400
-        resp.text = "<a></a>"
-        with pytest.raises(
-            SOEFServerBadResponseError,
-            match="<SOEF Server Bad Response Error: Bad server response: code 400 when 2XX expected.",
-        ):
-            with patch("aea.helpers.http_requests.request", return_value=resp):
-                await self.connection.channel._request_text(
-                    "get", "http://not-exists.com"
-                )
-
-        resp.status_code = 200
-        resp.text = ""
-        with pytest.raises(
-            SOEFServerBadResponseError,
-            match="SOEF Server Bad Response Error: Bad server response: empty response. Request data:",
-        ):
-            with patch("aea.helpers.http_requests.request", return_value=resp):
-                await self.connection.channel._request_text(
-                    "get", "http://not-exists.com"
-                )
-
-        resp.status_code = 200
-        resp.text = ""
-        with pytest.raises(
-            SOEFNetworkConnectionError,
-            match="SOEF Network Connection Error:.*expected!",
-        ):
-            with patch(
-                "aea.helpers.http_requests.request",
-                side_effect=requests.ConnectionError("expected!"),
-            ):
-                await self.connection.channel._request_text(
-                    "get", "http://not-exists.com"
-                )
-
     @pytest.mark.asyncio
     async def test_set_location(self):
         """Test internal method set location."""
@@ -832,3 +731,240 @@ class TestSoef:
                 assert self.connection.channel._ping_periodic_task is not None
                 await asyncio.sleep(0.3)
                 assert mocked_ping.call_count > 1
+
+
+class TestSoefLocalServer:
+    """Tests of the soef connection with a local stand-in of the SOEF."""
+
+    search_response = TestSoef.search_success_response
+    generic_success_response = TestSoef.generic_success_response
+
+    async def _start_server(self) -> None:
+        """Start a local stand-in of the SOEF, which records the search requests."""
+        self.searches = []
+        self.search_status = 200
+
+        async def handle(request: web.Request) -> web.Response:
+            command = request.query.get("command")
+            if request.path == "/" and command is None:
+                return web.Response(text="<response></response>")
+            if request.path == "/bad_request":
+                return web.Response(status=400, text="<response></response>")
+            if request.path == "/empty":
+                return web.Response(text="")
+            if command == "unregister":
+                return web.Response(
+                    text="<response><message>Goodbye!</message></response>"
+                )
+            if command == "find_around_me":
+                self.searches.append(request.query)
+                await asyncio.sleep(0.1)
+                return web.Response(
+                    status=self.search_status, text=self.search_response
+                )
+            return web.Response(text=self.generic_success_response)
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        self.port = get_unused_tcp_port()
+        await web.TCPSite(self.runner, "127.0.0.1", self.port).start()
+
+        self.oef_search_dialogues = OefSearchDialogues("some_author/some_skill:0.1.0")
+        crypto = make_crypto(DEFAULT_LEDGER)
+        configuration = ConnectionConfig(
+            api_key="TwiCIriSl0mLahw17pyqoA",
+            soef_addr="127.0.0.1",
+            soef_port=self.port,
+            is_https=False,
+            restricted_to_protocols={OefSearchMessage.protocol_specification_id},
+            connection_id=SOEFConnection.connection_id,
+        )
+        self.connection = SOEFConnection(
+            configuration=configuration,
+            data_dir=MagicMock(),
+            identity=Identity(
+                "identity", address=crypto.address, public_key=crypto.public_key
+            ),
+        )
+        await self.connection.connect()
+        self.connection.channel.unique_page_address = "page"
+
+    async def _stop_server(self) -> None:
+        """Disconnect from the local stand-in of the SOEF, and stop it."""
+        await self.connection.disconnect()
+        await self.runner.cleanup()
+
+    def _make_search(self, radius: float) -> Envelope:
+        """Make a search envelope."""
+        query = Query(
+            [
+                Constraint(
+                    "location",
+                    ConstraintType(
+                        "distance", (Location(52.2057092, 2.1183431), radius)
+                    ),
+                ),
+                Constraint("genus", ConstraintType("==", "vehicle")),
+            ]
+        )
+        message, _ = self.oef_search_dialogues.create(
+            counterparty=str(SOEFConnection.connection_id.to_any()),
+            performative=OefSearchMessage.Performative.SEARCH_SERVICES,
+            query=query,
+        )
+        return Envelope(to=message.to, sender=message.sender, message=message)
+
+    async def _search(self, radiuses: List[float]) -> List[OefSearchMessage]:
+        """Send searches at once, and get their responses in order."""
+        envelopes = [self._make_search(radius) for radius in radiuses]
+        for envelope in envelopes:
+            await self.connection.send(envelope)
+        responses = {}
+        for _ in envelopes:
+            response = await asyncio.wait_for(self.connection.receive(), timeout=5)
+            responses[response.message.dialogue_reference[0]] = response.message
+        return [
+            responses[envelope.message.dialogue_reference[0]] for envelope in envelopes
+        ]
+
+    @pytest.mark.asyncio
+    async def test_request_text(self):
+        """Test the requests to the SOEF, and their errors."""
+        await self._start_server()
+        channel = self.connection.channel
+        try:
+            text = await channel._request_text(
+                "get",
+                f"{channel.base_url}/page",
+                params={"command": "ping", "ppfilter": ["a,1", "b,2"]},
+            )
+            assert text == self.generic_success_response
+
+            with pytest.raises(
+                SOEFServerBadResponseError,
+                match="<SOEF Server Bad Response Error: Bad server response: code 400 when 2XX expected.",
+            ):
+                await channel._request_text("get", f"{channel.base_url}/bad_request")
+
+            with pytest.raises(
+                SOEFServerBadResponseError,
+                match="SOEF Server Bad Response Error: Bad server response: empty response. Request data:",
+            ):
+                await channel._request_text("get", f"{channel.base_url}/empty")
+
+            with pytest.raises(
+                SOEFNetworkConnectionError, match="SOEF Network Connection Error:"
+            ):
+                await channel._request_text(
+                    "get", f"http://127.0.0.1:{get_unused_tcp_port()}"
+                )
+        finally:
+            await self._stop_server()
+
+    @pytest.mark.asyncio
+    async def test_same_searches_coalesced(self):
+        """Test the same searches are sent once to the SOEF, and all get the result."""
+        await self._start_server()
+        try:
+            with patch.object(
+                self.connection.channel, "FIND_AROUND_ME_REQUEST_DELAY", 0
+            ):
+                responses = await self._search([0.1, 0.1, 0.1, 0.2])
+        finally:
+            await self._stop_server()
+
+        assert [r.performative for r in responses] == [
+            OefSearchMessage.Performative.SEARCH_RESULT
+        ] * 4
+        assert all(len(r.agents) == 2 for r in responses)
+        assert [search["range_in_km"] for search in self.searches] == ["0.1", "0.2"]
+        assert self.searches[0].getall("ppfilter") == [
+            "architecture,agentframework",
+            "genus,vehicle",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_results_cached(self):
+        """Test the results of the searches are reused until they expire."""
+        await self._start_server()
+        channel = self.connection.channel
+        try:
+            with patch.object(channel, "FIND_AROUND_ME_REQUEST_DELAY", 0), patch.object(
+                channel, "FIND_AROUND_ME_CACHE_TTL", 0.5
+            ):
+                await self._search([0.1])
+                (cached,) = await self._search([0.1])
+                assert len(self.searches) == 1
+                assert len(cached.agents) == 2
+                await asyncio.sleep(0.5)
+                await self._search([0.1])
+                assert len(self.searches) == 2
+        finally:
+            await self._stop_server()
+
+    @pytest.mark.asyncio
+    async def test_search_error_sent_to_coalesced_searches(self):
+        """Test a failed search sends an error to all the same searches."""
+        await self._start_server()
+        self.search_status = 500
+        try:
+            responses = await self._search([0.1, 0.1])
+        finally:
+            await self._stop_server()
+
+        assert len(self.searches) == 1
+        assert [r.performative for r in responses] == [
+            OefSearchMessage.Performative.OEF_ERROR
+        ] * 2
+
+    @pytest.mark.asyncio
+    async def test_search_error_sent_to_unanswered_searches(self):
+        """Test an error sending a search result sends an error to the same searches not answered yet."""
+        await self._start_server()
+        channel = self.connection.channel
+        send_search_result = channel._send_search_result
+        calls = []
+
+        async def send_first_search_result(*args):
+            calls.append(args)
+            if len(calls) > 1:
+                raise ValueError("oops")
+            await send_search_result(*args)
+
+        try:
+            with patch.object(channel, "FIND_AROUND_ME_REQUEST_DELAY", 0), patch.object(
+                channel, "_send_search_result", side_effect=send_first_search_result
+            ):
+                responses = await self._search([0.1, 0.1, 0.1])
+        finally:
+            await self._stop_server()
+
+        assert len(self.searches) == 1
+        assert [r.performative for r in responses] == [
+            OefSearchMessage.Performative.SEARCH_RESULT,
+            OefSearchMessage.Performative.OEF_ERROR,
+            OefSearchMessage.Performative.OEF_ERROR,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_search_delays_next_request(self):
+        """Test the requests after a failed one are delayed too."""
+        await self._start_server()
+        self.search_status = 500
+        try:
+            with patch.object(
+                self.connection.channel, "FIND_AROUND_ME_REQUEST_DELAY", 0.5
+            ):
+                start = time.time()
+                responses = await self._search([0.1, 0.2])
+                elapsed = time.time() - start
+        finally:
+            await self._stop_server()
+
+        assert len(self.searches) == 2
+        assert [r.performative for r in responses] == [
+            OefSearchMessage.Performative.OEF_ERROR
+        ] * 2
+        assert elapsed >= 0.5
@@ -28,7 +28,7 @@ from unittest import mock
 
 import pytest
 
-from aea.configurations.base import PublicId
+from aea.configurations.base import ConnectionConfig, PublicId
 from aea.crypto.wallet import CryptoStore
 from aea.helpers.file_io import write_with_lock
 from aea.identity.base import Identity
@@ -38,8 +38,11 @@ from aea.multiplexer import Multiplexer
 from packages.fetchai.connections.stub.connection import (
     StubConnection,
     envelope_from_bytes,
+    frame_envelope,
     lock_file,
+    split_framed_messages,
     write_envelope,
+    write_framed_envelopes,
 )
 from packages.fetchai.protocols.default.message import DefaultMessage
 from packages.fetchai.protocols.oef_search.message import OefSearchMessage
@@ -380,6 +383,132 @@ async def test_load_from_dir():
     )
 
 
+def test_split_framed_messages():
+    """Test records are split as they arrive, and malformed records are dropped."""
+    envelope = make_test_envelope()
+    record = frame_envelope(envelope)
+    buffer = bytearray(record + record[:10])
+    messages = split_framed_messages(buffer)
+    assert len(messages) == 1
+    assert frame_envelope(envelope_from_bytes(messages[0])) == record
+    assert buffer == record[:10]
+
+    buffer += record[10:]
+    assert len(split_framed_messages(buffer)) == 1
+    assert buffer == b""
+
+    buffer += b"not a record\n" + record[:-1] + b"x\n" + record
+    with mock.patch(
+        "packages.fetchai.connections.stub.connection._default_logger.error"
+    ) as error_mock:
+        messages = split_framed_messages(buffer)
+    assert error_mock.call_count == 2
+    assert [frame_envelope(envelope_from_bytes(m)) for m in messages] == [record]
+    assert buffer == b""
+
+
+@pytest.mark.asyncio
+async def test_append_only(tmp_path):
+    """Test the input file is tailed and the envelopes sent are appended in batches."""
+    input_file_path = tmp_path / "input_file"
+    output_file_path = tmp_path / "output_file"
+    output_file_path.write_bytes(b"")
+    configuration = ConnectionConfig(
+        input_file=str(input_file_path),
+        output_file=str(output_file_path),
+        append_only=True,
+        connection_id=StubConnection.connection_id,
+    )
+    connection = StubConnection(configuration=configuration, data_dir=mock.MagicMock())
+    await connection.connect()
+    try:
+        num_envelopes = 10
+        with open(input_file_path, "ab") as f:
+            write_framed_envelopes([make_test_envelope()] * num_envelopes, f)
+            record = frame_envelope(make_test_envelope())
+            f.write(record[:10])
+            f.flush()
+            for _ in range(num_envelopes):
+                envelope = await asyncio.wait_for(connection.receive(), timeout=3)
+                assert frame_envelope(envelope) == record
+            f.write(record[10:])
+            f.flush()
+            assert await asyncio.wait_for(connection.receive(), timeout=3)
+        assert input_file_path.read_bytes() != b""
+
+        with mock.patch(
+            "packages.fetchai.connections.stub.connection.write_with_lock",
+            wraps=write_with_lock,
+        ) as write_mock:
+            for _ in range(num_envelopes):
+                await connection.send(make_test_envelope())
+            await connection._write_buffer_task
+        write_mock.assert_called_once()
+    finally:
+        await connection.disconnect()
+    assert output_file_path.read_bytes() == record * num_envelopes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("append_only", [False, True])
+async def test_input_file_polled_without_inotify(tmp_path, append_only):
+    """Test the input file is polled when it cannot be watched, with a backoff only in append-only mode."""
+    input_file_path = tmp_path / "input_file"
+    configuration = ConnectionConfig(
+        input_file=str(input_file_path),
+        output_file=str(tmp_path / "output_file"),
+        append_only=append_only,
+        connection_id=StubConnection.connection_id,
+    )
+    connection = StubConnection(configuration=configuration, data_dir=mock.MagicMock())
+    with mock.patch(
+        "packages.fetchai.connections.stub.connection.IS_INOTIFY_AVAILABLE", False
+    ):
+        await connection.connect()
+    try:
+        assert connection._inotify is None
+        delay = connection.read_delay
+        expected_delay = delay * 2 if append_only else delay
+        assert await connection._wait_for_input(delay) == expected_delay
+
+        envelope = make_test_envelope()
+        with open(input_file_path, "ab") as f:
+            if append_only:
+                write_framed_envelopes([envelope], f)
+            else:
+                write_envelope(envelope, f)
+        received = await asyncio.wait_for(connection.receive(), timeout=3)
+        assert frame_envelope(received) == frame_envelope(envelope)
+    finally:
+        await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_append_only_write_error_raised(tmp_path):
+    """Test an error writing the buffered envelopes is raised by the next send or the disconnection."""
+    configuration = ConnectionConfig(
+        input_file=str(tmp_path / "input_file"),
+        output_file=str(tmp_path / "output_file"),
+        append_only=True,
+        connection_id=StubConnection.connection_id,
+    )
+    connection = StubConnection(configuration=configuration, data_dir=mock.MagicMock())
+    await connection.connect()
+    with mock.patch(
+        "packages.fetchai.connections.stub.connection.write_with_lock",
+        side_effect=OSError("disk full"),
+    ):
+        await connection.send(make_test_envelope())
+        await connection._write_buffer_task
+        with pytest.raises(OSError, match="disk full"):
+            await connection.send(make_test_envelope())
+
+        await connection.send(make_test_envelope())
+        with pytest.raises(OSError, match="disk full"):
+            await connection.disconnect()
+    assert connection.is_disconnected
+
+
 class TestFileLock:
     """Test for filelocks."""
 
@@ -40,6 +40,8 @@ from tests.conftest import (
 class TestTCPCommunication:
     """Test that TCP Server and TCP Client can communicate."""
 
+    config = {}  # type: dict
+
     @classmethod
     def setup_class(cls):
         """Set up the test class."""
@@ -54,13 +56,13 @@ class TestTCPCommunication:
         cls.client_public_key_2 = "client_public_key_2"
 
         cls.server_conn = _make_tcp_server_connection(
-            cls.server_addr, cls.server_public_key, cls.host, cls.port,
+            cls.server_addr, cls.server_public_key, cls.host, cls.port, **cls.config
         )
         cls.client_conn_1 = _make_tcp_client_connection(
-            cls.client_addr_1, cls.client_public_key_1, cls.host, cls.port,
+            cls.client_addr_1, cls.client_public_key_1, cls.host, cls.port, **cls.config
         )
         cls.client_conn_2 = _make_tcp_client_connection(
-            cls.client_addr_2, cls.client_public_key_2, cls.host, cls.port,
+            cls.client_addr_2, cls.client_public_key_2, cls.host, cls.port, **cls.config
         )
 
         cls.server_multiplexer = Multiplexer([cls.server_conn])
@@ -168,6 +170,127 @@ class TestTCPCommunication:
         cls.client_2_multiplexer.disconnect()
 
 
+class TestTCPCommunicationHighThroughput(TestTCPCommunication):
+    """Test that TCP Server and TCP Client can communicate in high-throughput mode."""
+
+    config = {"high_throughput": True}
+
+
+@pytest.mark.asyncio
+async def test_high_throughput_backpressure():
+    """Test the frames of a client are read only while its buffer is not full."""
+    host, port = "127.0.0.1", get_unused_tcp_port()
+    config = {"high_throughput": True, "max_buffered_frames": 2}
+    server = _make_tcp_server_connection("server", "server_pk", host, port, **config)
+    client = _make_tcp_client_connection("client", "client_pk", host, port, **config)
+    await server.connect()
+    await client.connect()
+    try:
+        num_envelopes = 10
+        for i in range(num_envelopes):
+            msg = DefaultMessage(
+                dialogue_reference=("", ""),
+                message_id=i + 1,
+                target=0,
+                performative=DefaultMessage.Performative.BYTES,
+                content=b"hello",
+            )
+            await client.send(Envelope(to="server", sender="client", message=msg))
+        await asyncio.sleep(0.5)
+        assert server._received_frames.qsize() == 2
+
+        for i in range(num_envelopes):
+            envelope = await asyncio.wait_for(server.receive(), timeout=3)
+            msg = DefaultMessage.serializer.decode(envelope.message)
+            assert msg.message_id == i + 1
+    finally:
+        await client.disconnect()
+        await server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_high_throughput_send_to_closed_peer():
+    """Test sending to a closed peer fails, also for the senders waiting for the peer."""
+    host, port = "127.0.0.1", get_unused_tcp_port()
+    config = {"high_throughput": True, "max_buffered_frames": 1}
+    server = _make_tcp_server_connection("server", "server_pk", host, port, **config)
+    client = _make_tcp_client_connection("client", "client_pk", host, port, **config)
+    await server.connect()
+    await client.connect()
+    try:
+        while "client" not in server.peers:
+            await asyncio.sleep(0.01)
+        peer = server.peers["client"]
+        peer.write_task.cancel()
+
+        def make_envelope(to: str, sender: str) -> Envelope:
+            msg = DefaultMessage(
+                dialogue_reference=("", ""),
+                message_id=1,
+                target=0,
+                performative=DefaultMessage.Performative.BYTES,
+                content=b"hello",
+            )
+            return Envelope(to=to, sender=sender, message=msg)
+
+        await server.send(make_envelope("client", "server"))
+        blocked_send = asyncio.ensure_future(
+            server.send(make_envelope("client", "server"))
+        )
+        await asyncio.sleep(0.1)
+        assert not blocked_send.done()
+
+        with unittest.mock.patch.object(server.logger, "error") as mock_logger:
+            server._on_peer_closed(peer)
+            with pytest.raises(ConnectionError, match="Stream of client closed."):
+                await blocked_send
+            mock_logger.assert_called_once()
+        assert peer.is_closed
+
+        client_peer = client.select_peer_from_envelope(
+            make_envelope("server", "client")
+        )
+        client_peer.close()
+        with pytest.raises(ConnectionError):
+            await client.send(make_envelope("server", "client"))
+        assert client_peer.frames_to_send.empty()
+    finally:
+        await client.disconnect()
+        await server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_high_throughput_server_disconnects():
+    """Test the client sees the end of the stream of the server, when it disconnects."""
+    host, port = "127.0.0.1", get_unused_tcp_port()
+    config = {"high_throughput": True}
+    server = _make_tcp_server_connection("server", "server_pk", host, port, **config)
+    client = _make_tcp_client_connection("client", "client_pk", host, port, **config)
+    await server.connect()
+    await client.connect()
+    try:
+        while "client" not in server.peers:
+            await asyncio.sleep(0.01)
+        receive_task = asyncio.ensure_future(client.receive())
+        await asyncio.sleep(0.1)
+        assert not receive_task.done()
+
+        await server.disconnect()
+        assert await asyncio.wait_for(receive_task, timeout=5) is None
+        assert client._peer.is_closed
+        msg = DefaultMessage(
+            dialogue_reference=("", ""),
+            message_id=1,
+            target=0,
+            performative=DefaultMessage.Performative.BYTES,
+            content=b"hello",
+        )
+        with pytest.raises(ConnectionError):
+            await client.send(Envelope(to="server", sender="client", message=msg))
+    finally:
+        await client.disconnect()
+
+
 class TestTCPClientConnection:
     """Test TCP Client code."""
 
@@ -19,6 +19,7 @@
 """This module contains the tests for the dialogue/base.py module."""
 import re
 import sys
+import time
 from typing import FrozenSet, Tuple, Type, cast
 from unittest import mock
 from unittest.mock import Mock, patch
@@ -289,6 +290,14 @@ class TestDialogueBase:
         assert str(Dialogue.EndState.SUCCESSFUL) == "0"
         assert str(Dialogue.EndState.FAILED) == "1"
 
+    def test_base_dialogue_with_slots(self):
+        """Test the base dialogue class can be created, without an instance dictionary."""
+        dialogue = BaseDialogue(
+            self.dialogue_label, DefaultMessage, self.agent_address, None
+        )
+        assert not hasattr(dialogue, "__dict__")
+        assert dialogue.last_activity_time <= time.monotonic()
+
     def test_dialogue_properties(self):
         """Test dialogue properties."""
         assert self.dialogue.dialogue_label == self.dialogue_label
@@ -552,6 +561,71 @@ class TestDialogueBase:
         assert str(cm.value) == "The target message does not exist in this dialogue."
         assert self.dialogue.last_message.message_id == 1
 
+    def _exchange_messages(self, dialogue: Dialogue, rounds: int) -> None:
+        """Exchange 'rounds' pairs of messages in a self initiated dialogue."""
+        dialogue._update(self.valid_message_1_by_self)
+        for i in range(1, rounds + 1):
+            incoming = DefaultMessage(
+                dialogue_reference=(str(1), str(1)),
+                message_id=-i,
+                target=i,
+                performative=DefaultMessage.Performative.BYTES,
+                content=b"Hello back %d" % i,
+            )
+            incoming.sender = self.opponent_address
+            incoming.to = self.agent_address
+            dialogue._update(incoming)
+            dialogue.reply(
+                target=-i,
+                performative=DefaultMessage.Performative.BYTES,
+                content=b"Hello %d" % i,
+            )
+
+    def test_compact_message_history(self):
+        """Test the compact message history keeps the dialogue behaviour."""
+        full_dialogue = Dialogue(dialogue_label=self.dialogue_label)
+        compact_dialogue = Dialogue(dialogue_label=self.dialogue_label)
+        compact_dialogue.set_compact_message_history(2)
+        assert compact_dialogue.is_message_history_compact
+        assert not full_dialogue.is_message_history_compact
+
+        self._exchange_messages(full_dialogue, 10)
+        self._exchange_messages(compact_dialogue, 10)
+
+        assert compact_dialogue == full_dialogue
+        assert compact_dialogue.json() == full_dialogue.json()
+        assert compact_dialogue.last_message == full_dialogue.last_message
+        for message_id in list(range(1, 12)) + list(range(-10, 0)):
+            message = compact_dialogue.get_message_by_id(message_id)
+            expected = full_dialogue.get_message_by_id(message_id)
+            assert message == expected
+            assert message.sender == expected.sender
+            assert message.to == expected.to
+        assert compact_dialogue.get_message_by_id(12) is None
+        assert compact_dialogue.get_message_by_id(-11) is None
+
+        compact_dialogue.reply(
+            target=-1,
+            performative=DefaultMessage.Performative.ERROR,
+            error_code=DefaultMessage.ErrorCode.INVALID_MESSAGE,
+            error_msg="error",
+            error_data={},
+        )
+        assert compact_dialogue.last_message.target == -1
+
+    def test_set_compact_message_history_converts_messages(self):
+        """Test existing messages are kept when the history is made compact."""
+        full_dialogue = Dialogue(dialogue_label=self.dialogue_label)
+        self._exchange_messages(full_dialogue, 5)
+        self._exchange_messages(self.dialogue, 5)
+
+        self.dialogue.set_compact_message_history(1)
+        assert self.dialogue == full_dialogue
+        assert self.dialogue.get_message_by_id(1) == self.valid_message_1_by_self
+
+        with pytest.raises(AEAEnforceError, match="must be positive"):
+            self.dialogue.set_compact_message_history(0)
+
     def test_is_valid_next_message_positive(self):
         """Positive test for the 'validate_next_message' method"""
         self.dialogue._update(self.valid_message_1_by_self)
@@ -1124,6 +1198,104 @@ class TestDialoguesBase:
             len(self.own_dialogues._dialogues_storage._dialogues_by_dialogue_label) == 1
         )
 
+    def test_create_with_compact_message_history(self):
+        """Test the 'create' method with a compact message history configured."""
+        assert self.own_dialogues.compact_message_history_size is None
+        self.own_dialogues._compact_message_history_size = 2
+        _, dialogue = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        assert dialogue.is_message_history_compact
+        assert len(dialogue._outgoing_messages) == 1
+
+    def test_expire_dialogues(self):
+        """Test idle dialogues not in terminal state are removed on expiry."""
+        assert self.own_dialogues.dialogue_ttl is None
+        assert self.own_dialogues.expire_dialogues(now=time.monotonic() + 100) == []
+
+        self.own_dialogues._dialogue_ttl = 10
+        expired_dialogues = []
+        self.own_dialogues.add_expiry_callback(expired_dialogues.append)
+        _, dialogue = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        message_by_other = DefaultMessage(
+            dialogue_reference=(str(2), ""),
+            performative=DefaultMessage.Performative.BYTES,
+            content=b"Hello",
+        )
+        message_by_other.sender = self.opponent_address
+        message_by_other.to = self.agent_address
+        dialogue_by_other = self.own_dialogues.update(message_by_other)
+        assert dialogue_by_other is not None
+        storage = self.own_dialogues._dialogues_storage
+        assert storage._incomplete_to_complete_dialogue_labels
+
+        start = dialogue.last_activity_time
+        assert self.own_dialogues.expire_dialogues(now=start + 5) == []
+
+        dialogue_by_other._last_activity_time = start + 5
+        assert self.own_dialogues.expire_dialogues(now=start + 11) == [dialogue]
+        assert expired_dialogues == [dialogue]
+        assert len(storage._expiry_heap) == 1
+
+        assert self.own_dialogues.expire_dialogues(now=start + 16) == [
+            dialogue_by_other
+        ]
+        assert self.own_dialogues.dialogue_stats.expired == 2
+        assert storage._dialogues_by_dialogue_label == {}
+        assert storage._incomplete_to_complete_dialogue_labels == {}
+        assert (
+            self.own_dialogues.get_dialogues_with_counterparty(self.opponent_address)
+            == []
+        )
+        assert storage._expiry_heap == []
+
+    def test_dialogues_by_address_pruned_on_remove(self):
+        """Test the counterparty index drops counterparties without dialogues."""
+        storage = self.own_dialogues._dialogues_storage
+        msg_1, dialogue_1 = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        _, dialogue_2 = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        assert self.own_dialogues.get_dialogues_with_counterparty(
+            self.opponent_address
+        ) == [dialogue_1, dialogue_2]
+
+        dialogue_1.reply(
+            target_message=msg_1,
+            performative=DefaultMessage.Performative.ERROR,
+            error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+            error_msg="oops",
+            error_data={},
+        )
+        assert self.own_dialogues.get_dialogues_with_counterparty(
+            self.opponent_address
+        ) == [dialogue_2]
+
+        storage.remove(dialogue_2.dialogue_label)
+        assert storage._dialogue_by_address == {}
+
+    def test_expire_dialogues_in_terminal_state_kept(self):
+        """Test dialogues in terminal state are not removed on expiry."""
+        self.own_dialogues._dialogue_ttl = 10
+        self.own_dialogues._keep_terminal_state_dialogues = True
+        msg, dialogue = self.own_dialogues.create(
+            self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hello"
+        )
+        dialogue.reply(
+            target_message=msg,
+            performative=DefaultMessage.Performative.ERROR,
+            error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+            error_msg="oops",
+            error_data={},
+        )
+        now = dialogue.last_activity_time + 11
+        assert self.own_dialogues.expire_dialogues(now=now) == []
+        assert self.own_dialogues.get_dialogue_from_label(dialogue.dialogue_label)
+
     def test_create_negative_incorrect_performative_content_combination(self):
         """Negative test for the 'create' method: invalid performative and content combination (i.e. invalid message)."""
         assert (
@@ -1852,7 +2024,7 @@ class TestPersistDialoguesStorageOffloading:
             error_msg="oops",
             error_data={},
         )
-        assert dialogues_storage.dialogues_in_terminal_state
+        assert list(dialogues_storage.dialogues_in_terminal_state)
         assert dialogues_storage.dialogues_in_active_state
         assert dialogues_storage._dialogue_by_address
         assert dialogues_storage._incomplete_to_complete_dialogue_labels
@@ -1895,7 +2067,9 @@ class TestPersistDialoguesStorageOffloading:
             ]
         )
 
-        dialogue_label = dialogues_storage.dialogues_in_terminal_state[0].dialogue_label
+        dialogue_label = next(
+            iter(dialogues_storage.dialogues_in_terminal_state)
+        ).dialogue_label
 
         assert len(dialogues_by_addr) == len(
             dialogues_storage_restored.get_dialogues_with_counterparty(
@@ -1905,7 +2079,8 @@ class TestPersistDialoguesStorageOffloading:
         # check get and cache
         assert not dialogues_storage_restored._terminal_state_dialogues_labels
         assert dialogues_storage_restored.get(dialogue_label) is not None
-        assert dialogues_storage_restored._terminal_state_dialogues_labels
+        assert not dialogues_storage_restored._terminal_state_dialogues_labels
+        assert dialogues_storage_restored.cache_stats["size"] == 1
 
         # test remove from storage on storeage.remove
         assert dialogues_storage_restored._terminal_dialogues_collection
@@ -1924,6 +2099,56 @@ class TestPersistDialoguesStorageOffloading:
         )
         assert dialogues_storage_restored.get(dialogue_label) is None
 
+    def test_terminal_dialogues_cache(self):
+        """Test offloaded dialogues loaded back are kept in a bounded LRU cache."""
+        dialogues_storage = PersistDialoguesStorageWithOffloading(self.dialogues)
+        dialogues_storage._skill_component = self.skill_component
+        self.dialogues._dialogues_storage = dialogues_storage
+        self.dialogues._terminal_dialogues_cache_size = 2
+
+        labels = []
+        for _ in range(3):
+            msg, dialogue = self.dialogues.create(
+                self.opponent_address, DefaultMessage.Performative.BYTES, content=b"Hi"
+            )
+            dialogue.reply(
+                target_message=msg,
+                performative=DefaultMessage.Performative.ERROR,
+                error_code=ErrorCode.UNSUPPORTED_PROTOCOL,
+                error_msg="oops",
+                error_data={},
+            )
+            labels.append(dialogue.dialogue_label)
+        assert not dialogues_storage._dialogues_by_dialogue_label
+
+        for label in labels:
+            assert dialogues_storage.get(label).dialogue_label == label
+        assert dialogues_storage.cache_stats == {
+            "size": 2,
+            "hits": 0,
+            "misses": 3,
+            "evictions": 1,
+        }
+
+        cached = dialogues_storage.get(labels[1])
+        assert dialogues_storage.cache_stats["hits"] == 1
+        assert cached in dialogues_storage.get_dialogues_with_counterparty(
+            self.opponent_address
+        )
+
+        dialogues_storage.TERMINAL_STATE_DIALOGUES_PAGE_SIZE = 2
+        collection = dialogues_storage._terminal_dialogues_collection
+        with patch.object(collection, "list", side_effect=AssertionError):
+            dialogues_in_terminal_state = dialogues_storage.dialogues_in_terminal_state
+            assert not isinstance(dialogues_in_terminal_state, list)
+            assert {d.dialogue_label for d in dialogues_in_terminal_state} == set(
+                labels
+            )
+
+        dialogues_storage.remove(labels[1])
+        assert dialogues_storage.cache_stats["size"] == 1
+        assert dialogues_storage.get(labels[1]) is None
+
 
 class TestBaseDialoguesStorage:
     """Test PersistDialoguesStorage."""
@@ -1961,7 +2186,7 @@ class TestBaseDialoguesStorage:
         cls.valid_message_1_by_self.sender = cls.agent_address
         cls.valid_message_1_by_self.to = cls.opponent_address
 
-        cls.storage = BasicDialoguesStorage(Mock())
+        cls.storage = BasicDialoguesStorage(Mock(dialogue_ttl=None))
 
     def test_dialogues_in_terminal_state_kept(self):
         """Test dialogues in terminal state handled properly."""
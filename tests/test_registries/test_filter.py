@@ -67,6 +67,43 @@ class TestFilter:
         )
         assert len(active_handlers) == 0
 
+    def test_get_active_handlers_table_rebuilt_on_changes(self):
+        """Test the active handlers table is only rebuilt when handlers or skill status change."""
+        skill = Skill(
+            SkillConfig("name", "author", "0.1.0"),
+            handlers={},
+            behaviours={},
+            models={},
+        )
+        self.resources.add_skill(skill)
+        handler = DummyHandler(name="dummy2", skill_context=skill.skill_context)
+        protocol_id = DummyHandler.SUPPORTED_PROTOCOL
+        try:
+            self.filter.get_active_handlers(protocol_id)
+            rebuilds = self.filter.active_handlers_rebuilds
+            assert self.filter.get_active_handlers(protocol_id) == []
+            assert self.filter.active_handlers_rebuilds == rebuilds
+
+            self.resources.handler_registry.register(
+                (skill.public_id, handler.name), handler
+            )
+            assert self.filter.get_active_handlers(protocol_id) == [handler]
+            self.filter.get_active_handlers(protocol_id).clear()
+            assert self.filter.get_active_handlers(protocol_id) == [handler]
+            assert self.filter.active_handlers_rebuilds == rebuilds + 1
+
+            skill.skill_context.is_active = False
+            assert self.filter.get_active_handlers(protocol_id) == []
+            skill.skill_context.is_active = True
+            assert self.filter.get_active_handlers(protocol_id) == [handler]
+            assert self.filter.active_handlers_rebuilds == rebuilds + 3
+
+            self.resources.handler_registry.unregister((skill.public_id, handler.name))
+            assert self.filter.get_active_handlers(protocol_id) == []
+            assert self.filter.active_handlers_rebuilds == rebuilds + 4
+        finally:
+            self.resources.remove_skill(skill.public_id)
+
     def test_get_active_behaviours(self):
         """Test get active behaviours."""
         active_behaviours = self.filter.get_active_behaviours()
@@ -34,12 +34,14 @@ import aea
 from aea.aea import AEA
 from aea.common import Address
 from aea.configurations.base import PublicId, SkillComponentConfiguration, SkillConfig
+from aea.configurations.constants import DEFAULT_SKILL_CONFIG_FILE
 from aea.configurations.data_types import ComponentType
 from aea.configurations.loader import load_component_configuration
 from aea.crypto.wallet import Wallet
 from aea.decision_maker.gop import DecisionMakerHandler as GOPDecisionMakerHandler
 from aea.decision_maker.gop import GoalPursuitReadiness, OwnershipState, Preferences
 from aea.exceptions import AEAHandleException, _StopRuntime
+from aea.helpers.ipfs.base import IPFSHashOnly
 from aea.identity.base import Identity
 from aea.multiplexer import MultiplexerStatus
 from aea.protocols.base import Message
@@ -49,6 +51,7 @@ from aea.skills.base import (
     Behaviour,
     Handler,
     Model,
+    SHARE_SKILL_MODULES_ENV,
     Skill,
     SkillComponent,
     SkillContext,
@@ -815,3 +818,54 @@ class TestSkillLoadingWarningMessages(BaseAEATestCase):
         # note: we do want the mock assert to fail
         with pytest.raises(AssertionError):
             self.skill_context_mock.logger.warning.assert_any_call(not_expected_message)
+
+
+def test_skill_modules_isolated_between_agents(tmp_path):
+    """Test each skill loaded gets its own modules by default, so class state is not shared."""
+    skill_dir = tmp_path / "dummy_skill"
+    shutil.copytree(
+        Path(ROOT_DIR, "tests", "data", "dummy_skill"),
+        skill_dir,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    first = Skill.from_dir(str(skill_dir), agent_context=MagicMock(agent_name="first"))
+    second = Skill.from_dir(
+        str(skill_dir), agent_context=MagicMock(agent_name="second")
+    )
+    first_handler_cls = type(first.handlers["dummy"])
+    second_handler_cls = type(second.handlers["dummy"])
+    assert first_handler_cls is not second_handler_cls
+
+    first_handler_cls.shared_counter = 1
+    assert not hasattr(second_handler_cls, "shared_counter")
+
+
+def test_skill_modules_shared_between_agents(tmp_path, monkeypatch):
+    """Test the skill modules are loaded once per file content, and shared by the skills loaded when enabled."""
+    monkeypatch.setenv(SHARE_SKILL_MODULES_ENV, "1")
+    skill_dir = tmp_path / "dummy_skill"
+    shutil.copytree(
+        Path(ROOT_DIR, "tests", "data", "dummy_skill"),
+        skill_dir,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    first = Skill.from_dir(str(skill_dir), agent_context=MagicMock(agent_name="first"))
+    second = Skill.from_dir(
+        str(skill_dir), agent_context=MagicMock(agent_name="second")
+    )
+    first_handler = first.handlers["dummy"]
+    second_handler = second.handlers["dummy"]
+    assert first_handler is not second_handler
+    assert type(first_handler) is type(second_handler)
+
+    handlers_path = skill_dir / "handlers.py"
+    old_hash = IPFSHashOnly().get(str(handlers_path))
+    handlers_path.write_text(handlers_path.read_text() + "\n# changed\n")
+    config_path = skill_dir / DEFAULT_SKILL_CONFIG_FILE
+    config_path.write_text(
+        config_path.read_text().replace(
+            old_hash, IPFSHashOnly().get(str(handlers_path))
+        )
+    )
+    third = Skill.from_dir(str(skill_dir), agent_context=MagicMock(agent_name="third"))
+    assert type(third.handlers["dummy"]) is not type(first_handler)
@@ -18,11 +18,27 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the tests for the tasks module."""
-
+import asyncio
+import time
+from multiprocessing.shared_memory import SharedMemory
 from unittest import TestCase, mock
 from unittest.mock import Mock, patch
 
-from aea.skills.tasks import Task, TaskManager
+import numpy as np
+import pytest
+
+from aea.skills.tasks import (
+    ProcessTaskManager,
+    Task,
+    TaskManager,
+    WarmProcessTaskManager,
+    _SharedMemoryValue,
+    _not_loaded_packages,
+    _reap_warm_pools,
+    _to_shared_memory,
+    _warm_pools,
+    shutdown_warm_pools,
+)
 
 
 def _raise_exception(self, *args, **kwargs):
@@ -205,3 +221,265 @@ class TestTaskPoolManagementManager(TestCase):
         self.task_manager.enqueue_task(print)
 
         assert self.task_manager._pool is pool
+
+
+class TestTaskResultsRetention(TestCase):
+    """Tests for the retention of the task results."""
+
+    def tearDown(self):
+        """Stop task manager. assumed it's created on each test."""
+        self.task_manager.stop()
+
+    def test_drop_results_on_retrieval(self) -> None:
+        """Test the result is dropped once retrieved ready."""
+        self.task_manager = TaskManager(drop_results_on_retrieval=True)
+        self.task_manager.start()
+        event = mock.Mock()
+        task_id = self.task_manager.enqueue_task(time.sleep, args=(0.5,))
+        assert not self.task_manager.get_task_result(task_id).ready()
+        task_id = self.task_manager.enqueue_task(event)
+        self.task_manager.get_task_result(task_id).wait(5)
+        self.task_manager.get_task_result(task_id)
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_id)
+        assert self.task_manager.metrics["results_stored"] == 1
+
+    def test_results_ttl(self) -> None:
+        """Test the results are dropped once ready for longer than the ttl."""
+        self.task_manager = TaskManager(results_ttl=0.1)
+        self.task_manager.start()
+        task_id = self.task_manager.enqueue_task(print)
+        self.task_manager.get_task_result(task_id).wait(5)
+        self.task_manager.get_task_result(task_id)
+        time.sleep(0.2)
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_id)
+
+    def test_max_results(self) -> None:
+        """Test the oldest results are dropped over the limit."""
+        self.task_manager = TaskManager(max_results=2)
+        self.task_manager.start()
+        task_ids = [self.task_manager.enqueue_task(print) for _ in range(3)]
+        with pytest.raises(ValueError, match="not present"):
+            self.task_manager.get_task_result(task_ids[0])
+        for task_id in task_ids[1:]:
+            assert self.task_manager.get_task_result(task_id).wait(5) is None
+
+
+class TestTaskManagerAsync(TestCase):
+    """Tests for the tasks enqueued with futures."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.loop = asyncio.new_event_loop()
+        self.task_manager = TaskManager()
+        self.task_manager.start()
+
+    def tearDown(self):
+        """Tear down the test."""
+        self.task_manager.stop()
+        self.loop.close()
+
+    def test_enqueue_task_async(self) -> None:
+        """Test the future is set with the result of the task."""
+        future = self.task_manager.enqueue_task_async(
+            sum, args=([1, 2],), loop=self.loop
+        )
+        assert self.loop.run_until_complete(asyncio.wait_for(future, 5)) == 3
+        assert self.task_manager.metrics["results_stored"] == 0
+
+    def test_enqueue_task_async_exception(self) -> None:
+        """Test the future is set with the exception raised by the task."""
+        future = self.task_manager.enqueue_task_async(
+            int, args=("not an int",), loop=self.loop
+        )
+        with pytest.raises(ValueError):
+            self.loop.run_until_complete(asyncio.wait_for(future, 5))
+
+    def test_enqueue_task_async_cancelled_on_stop(self) -> None:
+        """Test the future is cancelled if the task manager stops before the task is done."""
+        future = self.task_manager.enqueue_task_async(
+            time.sleep, args=(1,), loop=self.loop
+        )
+        self.task_manager.stop()
+        with pytest.raises(asyncio.CancelledError):
+            self.loop.run_until_complete(asyncio.wait_for(future, 5))
+
+
+@pytest.mark.parametrize("task_manager_class", [TaskManager, ProcessTaskManager])
+def test_task_metrics(task_manager_class) -> None:
+    """Test the task metrics."""
+    task_manager = task_manager_class(nb_workers=1)
+    # packages loaded by other tests may not exist anymore to be loaded by the workers
+    with patch("aea.skills.tasks._enlist_component_packages", return_value={}):
+        task_manager.start()
+        try:
+            task_ids = [
+                task_manager.enqueue_task(time.sleep, args=(0.1,)) for _ in range(3)
+            ]
+            assert task_manager.metrics["pending"] > 0
+            for task_id in task_ids:
+                task_manager.get_task_result(task_id).wait(10)
+            time.sleep(0.1)
+            metrics = task_manager.metrics
+        finally:
+            task_manager.stop()
+
+    assert metrics["enqueued"] == 3
+    assert metrics["completed"] == 3
+    assert metrics["pending"] == 0
+    assert metrics["run_time_total"] >= 0.3
+    assert 0.1 <= metrics["run_time_max"] < 1
+    # the last task waits for the first two with a single worker
+    assert metrics["wait_time_max"] >= 0.2
+
+
+def test_not_loaded_packages() -> None:
+    """Test the packages already loaded are not loaded again by the workers."""
+    packages = {
+        "skills": [
+            {"author": "fetchai", "package_type": "skills", "package_name": "echo"},
+            {"author": "fetchai", "package_type": "skills", "package_name": "missing"},
+        ]
+    }
+    with patch.dict("sys.modules", {"packages.fetchai.skills.echo": Mock()}):
+        assert _not_loaded_packages(packages) == {"skills": [packages["skills"][1]]}
+
+
+def test_to_shared_memory_threshold() -> None:
+    """Test only large bytes and arrays are transferred through shared memory."""
+    assert _to_shared_memory(b"data", None) == b"data"
+    assert _to_shared_memory(b"data", 5) == b"data"
+    assert _to_shared_memory("data" * 10, 5) == "data" * 10
+    array = np.arange(10)
+    assert _to_shared_memory(array, array.nbytes + 1) is array
+    assert _to_shared_memory(np.array([None] * 10), 1).dtype.hasobject
+
+    value = _to_shared_memory(b"data", 4)
+    assert isinstance(value, _SharedMemoryValue)
+    loader, args = value.__reduce__()
+    assert loader(*args) == b"data"
+
+
+class TestProcessTaskManagerSharedMemory(TestCase):
+    """Tests for the transfer of task arguments and results through shared memory."""
+
+    def setUp(self):
+        """Set up the test."""
+        self.task_manager = ProcessTaskManager(nb_workers=1, shared_memory_threshold=1)
+        # packages loaded by other tests may not exist anymore to be loaded by the workers
+        with patch("aea.skills.tasks._enlist_component_packages", return_value={}):
+            self.task_manager.start()
+            self.task_manager._start_pool()
+
+    def tearDown(self):
+        """Tear down the test."""
+        self.task_manager.stop()
+
+    def test_bytes(self) -> None:
+        """Test bytes arguments and results."""
+        data = b"data" * 1000
+        task_id = self.task_manager.enqueue_task(bytes, args=(data,))
+        assert self.task_manager.get_task_result(task_id).get(10) == data
+
+    def test_array(self) -> None:
+        """Test numpy arrays arguments and results."""
+        data = np.arange(1000, dtype=np.float64).reshape((10, 100))
+        task_id = self.task_manager.enqueue_task(np.negative, args=(data[:, ::2],))
+        result = self.task_manager.get_task_result(task_id).get(10)
+        assert result.dtype == data.dtype
+        assert (result == -data[:, ::2]).all()
+        assert not self.task_manager._shared_memory_by_task_id
+
+    def test_not_loaded_arguments_released(self) -> None:
+        """Test the shared memory of the arguments of a failed task is released."""
+        task_id = self.task_manager.enqueue_task(_raise_exception, args=(None, b"data"))
+        assert not self.task_manager.get_task_result(task_id).wait(10)
+        assert not self.task_manager._shared_memory_by_task_id
+
+
+def test_warm_pool_reused() -> None:
+    """Test the pool of a stopped warm task manager is reused by the next one."""
+    try:
+        with patch("aea.skills.tasks._enlist_component_packages", return_value={}):
+            task_manager = WarmProcessTaskManager(nb_workers=1)
+            task_manager.start()
+            task_id = task_manager.enqueue_task(sum, args=([1, 2],))
+            assert task_manager.get_task_result(task_id).get(30) == 3
+            pool = task_manager._pool
+            task_manager.stop()
+
+            task_manager = WarmProcessTaskManager(nb_workers=1)
+            task_manager.start()
+            task_id = task_manager.enqueue_task(sum, args=([1, 2],))
+            assert task_manager.get_task_result(task_id).get(30) == 3
+            assert task_manager._pool is pool
+            task_manager.stop()
+    finally:
+        shutdown_warm_pools()
+    with pytest.raises(ValueError):
+        pool.apply_async(sum, args=([1, 2],))
+
+
+def test_warm_pool_drained_before_kept() -> None:
+    """Test a stopping warm task manager waits for its tasks before keeping its pool warm."""
+    try:
+        with patch("aea.skills.tasks._enlist_component_packages", return_value={}):
+            task_manager = WarmProcessTaskManager(nb_workers=1)
+            task_manager.start()
+            task_id = task_manager.enqueue_task(time.sleep, args=(0.5,))
+            result = task_manager.get_task_result(task_id)
+            pool = task_manager._pool
+            task_manager.stop()
+            assert result.ready()
+            assert [p for p, _, _ in _warm_pools[next(iter(_warm_pools))]] == [pool]
+    finally:
+        shutdown_warm_pools()
+
+
+def test_warm_pool_with_running_tasks_terminated() -> None:
+    """Test the pool of a warm task manager stopped with running tasks is terminated."""
+    try:
+        with patch(
+            "aea.skills.tasks._enlist_component_packages", return_value={}
+        ), patch("aea.skills.tasks.WARM_POOL_DRAIN_TIMEOUT", 0.1):
+            task_manager = WarmProcessTaskManager(nb_workers=1)
+            task_manager.start()
+            task_manager.enqueue_task(time.sleep, args=(30,))
+            task_id = task_manager.enqueue_task(len, args=(b"x" * 2048 * 1024,))
+            (name,) = task_manager._shared_memory_by_task_id[task_id]
+            pool = task_manager._pool
+            task_manager.stop()
+            assert not _warm_pools
+        with pytest.raises(ValueError):
+            pool.apply_async(sum, args=([1, 2],))
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+    finally:
+        shutdown_warm_pools()
+
+
+def test_warm_pools_reaped() -> None:
+    """Test the idle pools beyond the maximum number, or idle for too long, are terminated."""
+    try:
+        with patch("aea.skills.tasks._enlist_component_packages", return_value={}):
+            pools = []
+            for nb_workers in (1, 2):
+                task_manager = WarmProcessTaskManager(
+                    nb_workers=nb_workers, is_lazy_pool_start=False
+                )
+                task_manager.start()
+                pools.append(task_manager._pool)
+                with patch("aea.skills.tasks.MAX_WARM_POOLS", 1):
+                    task_manager.stop()
+            assert [p for ps in _warm_pools.values() for p, _, _ in ps] == [pools[1]]
+            with pytest.raises(ValueError):
+                pools[0].apply_async(sum, args=([1, 2],))
+
+            with patch("aea.skills.tasks.WARM_POOL_IDLE_TIMEOUT", 0):
+                _reap_warm_pools()
+            assert not _warm_pools
+            with pytest.raises(ValueError):
+                pools[1].apply_async(sum, args=([1, 2],))
+    finally:
+        shutdown_warm_pools()